@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+
+from sightcall_transcript_to_tutorial.domain.entities import TutorialGenerationJob
+from sightcall_transcript_to_tutorial.domain.repositories import (
+    TranscriptRepositoryInterface,
+    TutorialGenerationJobRepositoryInterface,
+)
+from sightcall_transcript_to_tutorial.domain.value_objects import TranscriptId, UserId
+
+
+class EnqueueTutorialGenerationBatchCommand:
+    def __init__(self, transcript_ids: list[str], user_id: UserId):
+        self.transcript_ids = transcript_ids
+        self.user_id = user_id
+
+
+@dataclass(frozen=True)
+class EnqueuedTutorialGeneration:
+    """Outcome of one transcript of a batch: its queued job, or why none was queued."""
+
+    transcript_id: str
+    job: TutorialGenerationJob | None = None
+    error: str | None = None
+
+
+class EnqueueTutorialGenerationBatchCommandHandler:
+    """
+    Queue one generation job per transcript of a batch, in the order given and once per transcript.
+    Transcripts are checked in one query and jobs saved in one transaction, whatever the size of the batch; the worker
+    pool then generates the tutorials, as many at a time as it has workers.
+    """
+
+    def __init__(
+        self,
+        transcript_repository: TranscriptRepositoryInterface,
+        job_repository: TutorialGenerationJobRepositoryInterface,
+    ):
+        self._transcript_repository = transcript_repository
+        self._job_repository = job_repository
+
+    def handle(self, command: EnqueueTutorialGenerationBatchCommand) -> list[EnqueuedTutorialGeneration]:
+        transcript_ids = [TranscriptId(transcript_id) for transcript_id in dict.fromkeys(command.transcript_ids)]
+        existing_ids = self._transcript_repository.find_existing_ids(transcript_ids)
+        results = []
+        for transcript_id in transcript_ids:
+            if transcript_id in existing_ids:
+                job = TutorialGenerationJob.create(transcript_id=transcript_id, user_id=command.user_id)
+                results.append(EnqueuedTutorialGeneration(transcript_id.value, job=job))
+            else:
+                results.append(
+                    EnqueuedTutorialGeneration(
+                        transcript_id.value, error=f"Transcript with id {transcript_id.value} not found"
+                    )
+                )
+        jobs = [result.job for result in results if result.job]
+        if jobs:
+            self._job_repository.save_many(jobs)
+        return results
@@ -0,0 +1,30 @@
+from sightcall_transcript_to_tutorial.domain.entities import TutorialGenerationJob
+from sightcall_transcript_to_tutorial.domain.repositories import (
+    TranscriptRepositoryInterface,
+    TutorialGenerationJobRepositoryInterface,
+)
+from sightcall_transcript_to_tutorial.domain.value_objects import TranscriptId, UserId
+
+
+class EnqueueTutorialGenerationCommand:
+    def __init__(self, transcript_id: str, user_id: UserId):
+        self.transcript_id = transcript_id
+        self.user_id = user_id
+
+
+class EnqueueTutorialGenerationCommandHandler:
+    def __init__(
+        self,
+        transcript_repository: TranscriptRepositoryInterface,
+        job_repository: TutorialGenerationJobRepositoryInterface,
+    ):
+        self._transcript_repository = transcript_repository
+        self._job_repository = job_repository
+
+    def handle(self, command: EnqueueTutorialGenerationCommand) -> TutorialGenerationJob:
+        transcript_id = TranscriptId(command.transcript_id)
+        if not self._transcript_repository.find_by_id(transcript_id):
+            raise ValueError(f"Transcript with id {command.transcript_id} not found")
+        job = TutorialGenerationJob.create(transcript_id=transcript_id, user_id=command.user_id)
+        self._job_repository.save(job)
+        return job
@@ -1,38 +1,189 @@
+import asyncio
+from collections.abc import Callable
+
+from sightcall_transcript_to_tutorial.domain.entities.transcript import Transcript
 from sightcall_transcript_to_tutorial.domain.entities.tutorial import Tutorial
+from sightcall_transcript_to_tutorial.domain.exceptions.tutorial_generation_error import TutorialSaveVetoedError
+from sightcall_transcript_to_tutorial.domain.gateways.tutorial_generation_lock_interface import (
+    TutorialGenerationLockInterface,
+)
 from sightcall_transcript_to_tutorial.domain.gateways.tutorial_generator_gateway_interface import (
     TutorialGeneratorGatewayInterface,
 )
+from sightcall_transcript_to_tutorial.domain.repositories.generated_tutorial_cache_repository_interface import (
+    GeneratedTutorialCacheRepositoryInterface,
+)
 from sightcall_transcript_to_tutorial.domain.repositories.transcript_repository_interface import (
     TranscriptRepositoryInterface,
 )
 from sightcall_transcript_to_tutorial.domain.repositories.tutorial_repository_interface import (
     TutorialRepositoryInterface,
 )
+from sightcall_transcript_to_tutorial.domain.value_objects.generated_tutorial import GeneratedTutorial
 from sightcall_transcript_to_tutorial.domain.value_objects.transcript_id import TranscriptId
+from sightcall_transcript_to_tutorial.domain.value_objects.tutorial_id import TutorialId
 from sightcall_transcript_to_tutorial.domain.value_objects.user_id import UserId
 
 
 class GenerateTutorialCommand:
-    def __init__(self, transcript_id: str, user_id: UserId):
+    def __init__(self, transcript_id: str, user_id: UserId, before_save: Callable[[], bool] | None = None):
         self.transcript_id = transcript_id
         self.user_id = user_id
+        self.before_save = before_save
 
 
 class GenerateTutorialCommandHandler:
+    """
+    Generate a tutorial from a stored transcript and save it for the user.
+    With a generation cache, a transcript already turned into a tutorial under the same generator settings (see
+    `TutorialGeneratorGatewayInterface.cache_key`) gets a copy of that tutorial instead of a new AI call.
+    With a generation lock, concurrent generations of the same tutorial are coalesced, with or without a cache: the
+    first one calls the AI while the others wait, then get its tutorial handed over. A waiter of the same user, e.g.
+    after a double click, returns that very tutorial instead of saving a second one; other users save a copy.
+    The command's `before_save`, when given, is called right before saving and can veto it by returning False, e.g.
+    once a generation job's claim is lost: TutorialSaveVetoedError is then raised and nothing is saved.
+    """
+
     def __init__(
         self,
         transcript_repository: TranscriptRepositoryInterface,
         generate_tutorial_gateway: TutorialGeneratorGatewayInterface,
         tutorial_repository: TutorialRepositoryInterface,
+        generated_tutorial_cache: GeneratedTutorialCacheRepositoryInterface | None = None,
+        generation_lock: TutorialGenerationLockInterface | None = None,
     ):
         self.transcript_repository = transcript_repository
         self.generate_tutorial_gateway = generate_tutorial_gateway
         self.tutorial_repository = tutorial_repository
+        self.generated_tutorial_cache = generated_tutorial_cache
+        self.generation_lock = generation_lock
 
     def handle(self, command: GenerateTutorialCommand) -> Tutorial:
+        transcript, cache_key, cached = self._find_transcript_and_cached_tutorial(command)
+        if cached or not self.generation_lock:
+            return self._save_for(command, transcript, cache_key, cached)
+        lock_key = generation_lock_key(transcript, cache_key)
+        handed_over = self.generation_lock.acquire(lock_key)
+        tutorial: Tutorial | None = None
+        try:
+            if handed_over and handed_over.user_id == command.user_id:
+                tutorial = handed_over
+            else:
+                # A concurrent generation of the same tutorial may have been cached while this one was waiting.
+                tutorial = self._save_for(
+                    command, transcript, cache_key, handed_over or self._find_cached_tutorial(cache_key)
+                )
+        finally:
+            self.generation_lock.release(lock_key, tutorial)
+        return tutorial
+
+    async def handle_async(self, command: GenerateTutorialCommand) -> Tutorial:
+        """
+        Same as `handle`, awaiting the gateway's async generation. Repositories, the cache and the generation lock
+        are synchronous: their calls run in a worker thread to keep the event loop free.
+        """
+        transcript, cache_key, cached = await asyncio.to_thread(self._find_transcript_and_cached_tutorial, command)
+        if cached or not self.generation_lock:
+            return await self._save_for_async(command, transcript, cache_key, cached)
+        lock_key = generation_lock_key(transcript, cache_key)
+        handed_over = await acquire_generation_lock_async(self.generation_lock, lock_key)
+        tutorial: Tutorial | None = None
+        try:
+            if handed_over and handed_over.user_id == command.user_id:
+                tutorial = handed_over
+            else:
+                # A concurrent generation of the same tutorial may have been cached while this one was waiting.
+                source: GeneratedTutorial | Tutorial | None = handed_over
+                if source is None:
+                    source = await asyncio.to_thread(self._find_cached_tutorial, cache_key)
+                tutorial = await self._save_for_async(command, transcript, cache_key, source)
+        finally:
+            await asyncio.to_thread(self.generation_lock.release, lock_key, tutorial)
+        return tutorial
+
+    def _find_transcript_and_cached_tutorial(
+        self, command: GenerateTutorialCommand
+    ) -> tuple[Transcript, str | None, GeneratedTutorial | None]:
         transcript = self.transcript_repository.find_by_id(TranscriptId(command.transcript_id))
         if not transcript:
             raise ValueError(f"Transcript with id {command.transcript_id} not found")
-        tutorial = self.generate_tutorial_gateway.generate_tutorial(transcript, command.user_id)
-        self.tutorial_repository.save(tutorial)
+        cache_key = (
+            self.generate_tutorial_gateway.cache_key(transcript)
+            if self.generated_tutorial_cache or self.generation_lock
+            else None
+        )
+        return transcript, cache_key, self._find_cached_tutorial(cache_key)
+
+    def _save_for(
+        self,
+        command: GenerateTutorialCommand,
+        transcript: Transcript,
+        cache_key: str | None,
+        source: GeneratedTutorial | Tutorial | None,
+    ) -> Tutorial:
+        """Save a copy of `source` for the user, or a tutorial generated from the transcript without one."""
+        if source:
+            tutorial = self._copy(source, command.user_id)
+        else:
+            tutorial = self.generate_tutorial_gateway.generate_tutorial(transcript, command.user_id)
+            self._cache(cache_key, tutorial)
+        self._save(command, tutorial)
         return tutorial
+
+    async def _save_for_async(
+        self,
+        command: GenerateTutorialCommand,
+        transcript: Transcript,
+        cache_key: str | None,
+        source: GeneratedTutorial | Tutorial | None,
+    ) -> Tutorial:
+        if source:
+            tutorial = self._copy(source, command.user_id)
+        else:
+            tutorial = await self.generate_tutorial_gateway.generate_tutorial_async(transcript, command.user_id)
+            await asyncio.to_thread(self._cache, cache_key, tutorial)
+        await asyncio.to_thread(self._save, command, tutorial)
+        return tutorial
+
+    def _save(self, command: GenerateTutorialCommand, tutorial: Tutorial) -> None:
+        if command.before_save and not command.before_save():
+            raise TutorialSaveVetoedError(f"Saving the tutorial of transcript {command.transcript_id} was vetoed")
+        self.tutorial_repository.save(tutorial)
+
+    def _find_cached_tutorial(self, cache_key: str | None) -> GeneratedTutorial | None:
+        if not self.generated_tutorial_cache or not cache_key:
+            return None
+        return self.generated_tutorial_cache.find_by_key(cache_key)
+
+    def _copy(self, source: GeneratedTutorial | Tutorial, user_id: UserId) -> Tutorial:
+        return Tutorial(tutorial_id=TutorialId.generate(), title=source.title, content=source.content, user_id=user_id)
+
+    def _cache(self, cache_key: str | None, tutorial: Tutorial) -> None:
+        if self.generated_tutorial_cache and cache_key:
+            self.generated_tutorial_cache.save(cache_key, GeneratedTutorial(tutorial.title, tutorial.content))
+
+
+def generation_lock_key(transcript: Transcript, cache_key: str | None) -> str:
+    """
+    Key generations of a transcript are coalesced under: its cache key, which also covers the generator settings,
+    or the transcript id for gateways without one. It does not depend on a generation cache being configured.
+    """
+    return cache_key or f"transcript:{transcript.transcript_id.value}"
+
+
+async def acquire_generation_lock_async(
+    generation_lock: TutorialGenerationLockInterface, lock_key: str
+) -> Tutorial | None:
+    """Acquire a generation lock in a worker thread, returning the tutorial handed over, as `acquire` does."""
+    acquiring = asyncio.ensure_future(asyncio.to_thread(generation_lock.acquire, lock_key))
+    try:
+        return await asyncio.shield(acquiring)
+    except asyncio.CancelledError:
+        # The worker thread still waits for the lock, e.g. after the client went away: release it once it is held.
+        loop = asyncio.get_running_loop()
+        acquiring.add_done_callback(
+            lambda future: None
+            if future.cancelled() or future.exception()
+            else loop.run_in_executor(None, generation_lock.release, lock_key)
+        )
+        raise
@@ -0,0 +1,90 @@
+import asyncio
+import logging
+import threading
+
+from sightcall_transcript_to_tutorial.application.commands.generate_tutorial_command import (
+    GenerateTutorialCommand,
+    GenerateTutorialCommandHandler,
+)
+from sightcall_transcript_to_tutorial.domain.entities import TutorialGenerationJob
+from sightcall_transcript_to_tutorial.domain.repositories import TutorialGenerationJobRepositoryInterface
+
+DEFAULT_JOB_LEASE_SECONDS = 600
+# How many times the lease of a running job is renewed per lease period, so that a late renewal does not lose it.
+LEASE_RENEWALS_PER_LEASE = 3
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessNextTutorialGenerationJobCommand:
+    def __init__(self, lease_seconds: int = DEFAULT_JOB_LEASE_SECONDS):
+        self.lease_seconds = lease_seconds
+
+
+class ProcessNextTutorialGenerationJobCommandHandler:
+    """
+    Claim the next queued generation job, run it and record its outcome.
+    Return the claimed job, or None when the queue is empty.
+    While the job runs, its lease is renewed in the background through `lease_repository` (which needs a session of
+    its own, the generation using the other one), so that no other worker claims it again; should that still happen,
+    the outcome recorded is the one of the worker holding the latest claim. The claim is checked, and its lease
+    renewed, right before the tutorial is saved, so that a worker that lost it does not save a second tutorial.
+    The tutorial is generated on the gateway's async client, the repositories' calls running in a worker thread.
+    """
+
+    def __init__(
+        self,
+        job_repository: TutorialGenerationJobRepositoryInterface,
+        generate_tutorial_handler: GenerateTutorialCommandHandler,
+        lease_repository: TutorialGenerationJobRepositoryInterface | None = None,
+    ):
+        self._job_repository = job_repository
+        self._generate_tutorial_handler = generate_tutorial_handler
+        self._lease_repository = lease_repository or job_repository
+
+    async def handle(self, command: ProcessNextTutorialGenerationJobCommand) -> TutorialGenerationJob | None:
+        job = await asyncio.to_thread(self._job_repository.claim_next, command.lease_seconds)
+        if job is None:
+            return None
+        claim_token = job.claim_token
+        if claim_token is None:
+            raise ValueError(f"Generation job {job.job_id} was claimed without a claim token")
+        finished = threading.Event()
+        lease_renewer = threading.Thread(
+            target=self._renew_lease_until,
+            args=(job, claim_token, finished, command.lease_seconds / LEASE_RENEWALS_PER_LEASE),
+            name=f"tutorial-generation-lease-{job.job_id.value}",
+            daemon=True,
+        )
+        lease_renewer.start()
+        try:
+            try:
+                tutorial = await self._generate_tutorial_handler.handle_async(
+                    GenerateTutorialCommand(
+                        transcript_id=job.transcript_id.value,
+                        user_id=job.user_id,
+                        before_save=lambda: self._job_repository.renew_lease(job.job_id, claim_token),
+                    )
+                )
+            except Exception as e:
+                recorded = await asyncio.to_thread(self._job_repository.mark_failed, job.job_id, claim_token, str(e))
+            else:
+                recorded = await asyncio.to_thread(
+                    self._job_repository.mark_succeeded, job.job_id, claim_token, tutorial.tutorial_id
+                )
+        finally:
+            finished.set()
+            await asyncio.to_thread(lease_renewer.join)
+        if not recorded:
+            logger.warning("Generation job %s was claimed again by another worker, dropping its outcome", job.job_id)
+        return job
+
+    def _renew_lease_until(
+        self, job: TutorialGenerationJob, claim_token: str, finished: threading.Event, interval_seconds: float
+    ) -> None:
+        while not finished.wait(interval_seconds):
+            try:
+                if not self._lease_repository.renew_lease(job.job_id, claim_token):
+                    return
+            except Exception:
+                logger.exception("Could not renew the lease of generation job %s", job.job_id)
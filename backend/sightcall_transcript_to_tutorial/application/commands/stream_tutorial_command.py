@@ -0,0 +1,164 @@
+import asyncio
+from collections.abc import AsyncGenerator, Callable
+from contextlib import AbstractAsyncContextManager, AbstractContextManager, aclosing, nullcontext
+
+from sightcall_transcript_to_tutorial.application.commands.generate_tutorial_command import (
+    acquire_generation_lock_async,
+    generation_lock_key,
+)
+from sightcall_transcript_to_tutorial.domain.entities.transcript import Transcript
+from sightcall_transcript_to_tutorial.domain.entities.tutorial import Tutorial
+from sightcall_transcript_to_tutorial.domain.gateways.tutorial_generation_lock_interface import (
+    TutorialGenerationLockInterface,
+)
+from sightcall_transcript_to_tutorial.domain.gateways.tutorial_generator_gateway_interface import (
+    TutorialGeneratorGatewayInterface,
+)
+from sightcall_transcript_to_tutorial.domain.repositories.async_transcript_repository_interface import (
+    AsyncTranscriptRepositoryInterface,
+)
+from sightcall_transcript_to_tutorial.domain.repositories.async_tutorial_repository_interface import (
+    AsyncTutorialRepositoryInterface,
+)
+from sightcall_transcript_to_tutorial.domain.repositories.generated_tutorial_cache_repository_interface import (
+    GeneratedTutorialCacheRepositoryInterface,
+)
+from sightcall_transcript_to_tutorial.domain.value_objects.generated_tutorial import GeneratedTutorial
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_id import TranscriptId
+from sightcall_transcript_to_tutorial.domain.value_objects.tutorial_id import TutorialId
+from sightcall_transcript_to_tutorial.domain.value_objects.user_id import UserId
+
+
+class StreamTutorialCommand:
+    def __init__(self, transcript_id: str, user_id: UserId):
+        self.transcript_id = transcript_id
+        self.user_id = user_id
+
+
+class StreamTutorialCommandHandler:
+    """
+    Generate a tutorial while streaming its content, then save it and yield it last.
+    The transcript is looked up when handling the command, so a missing transcript is reported before streaming starts.
+    The stream outlives the request's dependencies, so it opens the tutorial repository and the generation cache it
+    saves to itself, through `open_tutorial_repository` and `open_generated_tutorial_cache`, and closes them when it
+    ends.
+    The generation cache and lock are shared with GenerateTutorialCommandHandler, under the same keys: a tutorial
+    generated either way is streamed from the cache in one piece, and concurrent generations are coalesced, a waiter
+    of the same user streaming the tutorial handed over instead of saving a second one. The cache and the lock are
+    synchronous, so their calls run in a worker thread.
+    """
+
+    def __init__(
+        self,
+        transcript_repository: AsyncTranscriptRepositoryInterface,
+        generate_tutorial_gateway: TutorialGeneratorGatewayInterface,
+        open_tutorial_repository: Callable[[], AbstractAsyncContextManager[AsyncTutorialRepositoryInterface]],
+        open_generated_tutorial_cache: (
+            Callable[[], AbstractContextManager[GeneratedTutorialCacheRepositoryInterface]] | None
+        ) = None,
+        generation_lock: TutorialGenerationLockInterface | None = None,
+    ):
+        self.transcript_repository = transcript_repository
+        self.generate_tutorial_gateway = generate_tutorial_gateway
+        self.open_tutorial_repository = open_tutorial_repository
+        self.open_generated_tutorial_cache = open_generated_tutorial_cache
+        self.generation_lock = generation_lock
+
+    async def handle(self, command: StreamTutorialCommand) -> AsyncGenerator[str | Tutorial, None]:
+        transcript = await self.transcript_repository.find_by_id(TranscriptId(command.transcript_id))
+        if not transcript:
+            raise ValueError(f"Transcript with id {command.transcript_id} not found")
+        return self._stream(transcript, command.user_id)
+
+    async def _stream(self, transcript: Transcript, user_id: UserId) -> AsyncGenerator[str | Tutorial, None]:
+        async with self.open_tutorial_repository() as tutorial_repository:
+            with (
+                self.open_generated_tutorial_cache() if self.open_generated_tutorial_cache else nullcontext(None)
+            ) as generated_tutorial_cache:
+                stream = _TutorialStream(
+                    self.generate_tutorial_gateway, tutorial_repository, generated_tutorial_cache, self.generation_lock
+                )
+                async with aclosing(stream.stream(transcript, user_id)) as items:
+                    async for item in items:
+                        yield item
+
+
+class _TutorialStream:
+    """One stream of StreamTutorialCommandHandler, on the repositories opened for it."""
+
+    def __init__(
+        self,
+        generate_tutorial_gateway: TutorialGeneratorGatewayInterface,
+        tutorial_repository: AsyncTutorialRepositoryInterface,
+        generated_tutorial_cache: GeneratedTutorialCacheRepositoryInterface | None,
+        generation_lock: TutorialGenerationLockInterface | None,
+    ):
+        self.generate_tutorial_gateway = generate_tutorial_gateway
+        self.tutorial_repository = tutorial_repository
+        self.generated_tutorial_cache = generated_tutorial_cache
+        self.generation_lock = generation_lock
+
+    async def stream(self, transcript: Transcript, user_id: UserId) -> AsyncGenerator[str | Tutorial, None]:
+        cache_key = (
+            self.generate_tutorial_gateway.cache_key(transcript)
+            if self.generated_tutorial_cache or self.generation_lock
+            else None
+        )
+        cached = await self._find_cached_tutorial(cache_key)
+        if cached or not self.generation_lock:
+            async for item in self._save_for(user_id, transcript, cache_key, cached):
+                yield item
+            return
+        lock_key = generation_lock_key(transcript, cache_key)
+        handed_over = await acquire_generation_lock_async(self.generation_lock, lock_key)
+        tutorial: Tutorial | None = None
+        try:
+            if handed_over and handed_over.user_id == user_id:
+                tutorial = handed_over
+                yield tutorial.content
+                yield tutorial
+            else:
+                # A concurrent generation of the same tutorial may have been cached while this one was waiting.
+                source = handed_over or await self._find_cached_tutorial(cache_key)
+                async for item in self._save_for(user_id, transcript, cache_key, source):
+                    if isinstance(item, Tutorial):
+                        tutorial = item
+                    yield item
+        finally:
+            await asyncio.to_thread(self.generation_lock.release, lock_key, tutorial)
+
+    async def _save_for(
+        self,
+        user_id: UserId,
+        transcript: Transcript,
+        cache_key: str | None,
+        source: GeneratedTutorial | Tutorial | None,
+    ) -> AsyncGenerator[str | Tutorial, None]:
+        """Save and stream a copy of `source` for the user, or a tutorial generated from the transcript without one."""
+        if source is None:
+            async for item in self._generate(transcript, cache_key, user_id):
+                yield item
+            return
+        tutorial = Tutorial(
+            tutorial_id=TutorialId.generate(), title=source.title, content=source.content, user_id=user_id
+        )
+        await self.tutorial_repository.save(tutorial)
+        yield tutorial.content
+        yield tutorial
+
+    async def _generate(
+        self, transcript: Transcript, cache_key: str | None, user_id: UserId
+    ) -> AsyncGenerator[str | Tutorial, None]:
+        async for item in self.generate_tutorial_gateway.stream_tutorial(transcript, user_id):
+            if isinstance(item, Tutorial):
+                await self.tutorial_repository.save(item)
+                if self.generated_tutorial_cache and cache_key:
+                    await asyncio.to_thread(
+                        self.generated_tutorial_cache.save, cache_key, GeneratedTutorial(item.title, item.content)
+                    )
+            yield item
+
+    async def _find_cached_tutorial(self, cache_key: str | None) -> GeneratedTutorial | None:
+        if not self.generated_tutorial_cache or not cache_key:
+            return None
+        return await asyncio.to_thread(self.generated_tutorial_cache.find_by_key, cache_key)
@@ -1,7 +1,7 @@
 from typing import Optional
 
 from sightcall_transcript_to_tutorial.domain.entities import Tutorial
-from sightcall_transcript_to_tutorial.domain.repositories import TutorialRepositoryInterface
+from sightcall_transcript_to_tutorial.domain.repositories import AsyncTutorialRepositoryInterface
 from sightcall_transcript_to_tutorial.domain.value_objects import TutorialId, UserId
 
 
@@ -16,11 +16,11 @@ class UpdateTutorialCommand:
 
 
 class UpdateTutorialCommandHandler:
-    def __init__(self, tutorial_repository: TutorialRepositoryInterface):
+    def __init__(self, tutorial_repository: AsyncTutorialRepositoryInterface):
         self._tutorial_repository = tutorial_repository
 
-    def handle(self, command: UpdateTutorialCommand) -> Optional[Tutorial]:
-        return self._tutorial_repository.update_tutorial(
+    async def handle(self, command: UpdateTutorialCommand) -> Optional[Tutorial]:
+        return await self._tutorial_repository.update_tutorial(
             tutorial_id=command.tutorial_id,
             user_id=command.user_id,
             title=command.title,
@@ -0,0 +1,83 @@
+from collections.abc import Iterable
+from typing import Any
+
+from sightcall_transcript_to_tutorial.domain.repositories.transcript_repository_interface import (
+    TranscriptRepositoryInterface,
+)
+from sightcall_transcript_to_tutorial.domain.validators.transcript_stream_validator import TranscriptStreamValidator
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_content import MAX_TRANSCRIPT_SIZE_BYTES
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_id import TranscriptId
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_phrases_builder import TranscriptPhrasesBuilder
+
+TRANSCRIPT_SEGMENT_MAX_BYTES = 256 * 1024  # 256KB
+# Bytes a phrase takes in the numeric columns of a segment, besides its display text.
+_PHRASE_COLUMNS_BYTES = 38
+
+
+class UploadTranscriptInSegmentsCommand:
+    def __init__(self, chunks: Iterable[bytes]):
+        self.chunks = chunks
+
+
+class UploadTranscriptInSegmentsCommandHandler:
+    """
+    Ingest a transcript of any length from a stream of byte chunks.
+    Each chunk is validated as it arrives and phrases are persisted in segments of bounded size, in the same columns
+    as single-shot uploads, so memory stays flat however long the call was. A single phrase may not exceed the
+    single-shot upload limit.
+    """
+
+    def __init__(
+        self,
+        transcript_repository: TranscriptRepositoryInterface,
+        segment_max_bytes: int = TRANSCRIPT_SEGMENT_MAX_BYTES,
+    ):
+        self._repo = transcript_repository
+        self._segment_max_bytes = segment_max_bytes
+
+    def handle(self, command: UploadTranscriptInSegmentsCommand) -> TranscriptId:
+        transcript_id = TranscriptId.generate()
+        segment_writer = _SegmentWriter(self._repo, transcript_id, self._segment_max_bytes)
+        validator = TranscriptStreamValidator(
+            on_phrase=segment_writer.append, max_token_size=MAX_TRANSCRIPT_SIZE_BYTES
+        )
+        try:
+            for chunk in command.chunks:
+                validator.feed(chunk)
+            data = validator.close()
+            segment_writer.flush()
+            self._repo.save_segmented(
+                transcript_id, data["timestamp"], data["duration_in_ticks"], segment_writer.segment_count
+            )
+        except Exception:
+            self._repo.discard_segmented(transcript_id)
+            raise
+        return transcript_id
+
+
+class _SegmentWriter:
+    def __init__(self, repository: TranscriptRepositoryInterface, transcript_id: TranscriptId, max_bytes: int):
+        self._repo = repository
+        self._transcript_id = transcript_id
+        self._max_bytes = max_bytes
+        self._pending = TranscriptPhrasesBuilder()
+        self._pending_count = 0
+        self._pending_size = 0
+        self.segment_count = 0
+
+    def append(self, phrase: dict[str, Any]) -> None:
+        self._pending.append(phrase)
+        self._pending_count += 1
+        # Display texts are counted in characters: close enough to their UTF-8 size to bound a segment.
+        self._pending_size += _PHRASE_COLUMNS_BYTES + len(phrase["display"])
+        if self._pending_size >= self._max_bytes:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending_count:
+            return
+        self._repo.save_segment(self._transcript_id, self.segment_count, self._pending.build())
+        self.segment_count += 1
+        self._pending = TranscriptPhrasesBuilder()
+        self._pending_count = 0
+        self._pending_size = 0
@@ -1,7 +1,7 @@
 from typing import Optional
 
 from sightcall_transcript_to_tutorial.domain.entities import Tutorial
-from sightcall_transcript_to_tutorial.domain.repositories import TutorialRepositoryInterface
+from sightcall_transcript_to_tutorial.domain.repositories import AsyncTutorialRepositoryInterface
 from sightcall_transcript_to_tutorial.domain.value_objects import TutorialId, UserId
 
 
@@ -12,11 +12,11 @@ class GetTutorialByIdQuery:
 
 
 class GetTutorialByIdQueryHandler:
-    def __init__(self, tutorial_repository: TutorialRepositoryInterface):
+    def __init__(self, tutorial_repository: AsyncTutorialRepositoryInterface):
         self._tutorial_repository = tutorial_repository
 
-    def handle(self, query: GetTutorialByIdQuery) -> Optional[Tutorial]:
-        tutorial = self._tutorial_repository.find_by_id(query.tutorial_id)
+    async def handle(self, query: GetTutorialByIdQuery) -> Optional[Tutorial]:
+        tutorial = await self._tutorial_repository.find_by_id(query.tutorial_id)
         if not tutorial or tutorial.user_id != query.user_id:
             return None
         return tutorial
@@ -0,0 +1,20 @@
+from sightcall_transcript_to_tutorial.domain.entities import TutorialGenerationJob
+from sightcall_transcript_to_tutorial.domain.repositories import TutorialGenerationJobRepositoryInterface
+from sightcall_transcript_to_tutorial.domain.value_objects import JobId, UserId
+
+
+class GetTutorialGenerationJobQuery:
+    def __init__(self, job_id: JobId, user_id: UserId):
+        self.job_id = job_id
+        self.user_id = user_id
+
+
+class GetTutorialGenerationJobQueryHandler:
+    def __init__(self, job_repository: TutorialGenerationJobRepositoryInterface):
+        self._job_repository = job_repository
+
+    def handle(self, query: GetTutorialGenerationJobQuery) -> TutorialGenerationJob | None:
+        job = self._job_repository.find_by_id(query.job_id)
+        if not job or job.user_id != query.user_id:
+            return None
+        return job
@@ -1,8 +1,7 @@
-from typing import Any, List, Optional
+from typing import Any, Optional
 
-from sightcall_transcript_to_tutorial.domain.entities import Tutorial
-from sightcall_transcript_to_tutorial.domain.repositories import TutorialRepositoryInterface
-from sightcall_transcript_to_tutorial.domain.value_objects import UserId
+from sightcall_transcript_to_tutorial.domain.repositories import AsyncTutorialRepositoryInterface, TutorialPage
+from sightcall_transcript_to_tutorial.domain.value_objects import TutorialCursor, UserId
 
 
 class GetTutorialsQuery:
@@ -13,23 +12,26 @@ class GetTutorialsQuery:
         page: int = 1,
         page_size: int = 20,
         search: Optional[str] = None,
+        after: Optional[TutorialCursor] = None,
     ):
         self.user_id = user_id
         self.filters = filters
         self.page = page
         self.page_size = page_size
         self.search = search
+        self.after = after
 
 
 class GetTutorialsQueryHandler:
-    def __init__(self, tutorial_repository: TutorialRepositoryInterface):
+    def __init__(self, tutorial_repository: AsyncTutorialRepositoryInterface):
         self._tutorial_repository = tutorial_repository
 
-    def handle(self, query: GetTutorialsQuery) -> List[Tutorial]:
-        return self._tutorial_repository.list_tutorials(
+    async def handle(self, query: GetTutorialsQuery) -> TutorialPage:
+        return await self._tutorial_repository.list_tutorial_page(
             user_id=query.user_id,
             filters=query.filters,
             page=query.page,
             page_size=query.page_size,
             search=query.search,
+            after=query.after,
         )
@@ -1,16 +1,56 @@
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
+from sightcall_transcript_to_tutorial.domain.config.tutorial_title_mode import TutorialTitleMode
+
 
 class Settings(BaseSettings):
     database_url: str = Field(validation_alias="DATABASE_URL")
+    database_pool_size: int = Field(default=5, validation_alias="DATABASE_POOL_SIZE")
+    database_max_overflow: int = Field(default=10, validation_alias="DATABASE_MAX_OVERFLOW")
+    database_pool_timeout_seconds: float = Field(default=30.0, validation_alias="DATABASE_POOL_TIMEOUT_SECONDS")
+    database_pool_recycle_seconds: int = Field(default=1800, validation_alias="DATABASE_POOL_RECYCLE_SECONDS")
+    database_pool_pre_ping: bool = Field(default=True, validation_alias="DATABASE_POOL_PRE_PING")
+    database_pool_warm_up: bool = Field(default=True, validation_alias="DATABASE_POOL_WARM_UP")
+    database_statement_timeout_milliseconds: int = Field(
+        default=30_000, validation_alias="DATABASE_STATEMENT_TIMEOUT_MILLISECONDS"
+    )
     github_client_id: str = Field(validation_alias="GITHUB_CLIENT_ID")
     github_client_secret: str = Field(validation_alias="GITHUB_CLIENT_SECRET")
     github_callback_url: str = Field(validation_alias="GITHUB_CALLBACK_URL")
     frontend_url: str = Field(validation_alias="FRONTEND_URL")
     jwt_secret: str = Field(validation_alias="JWT_SECRET")
     jwt_algorithm: str = Field(validation_alias="JWT_ALGORITHM")
+    jwt_cache_max_entries: int = Field(default=10_000, validation_alias="JWT_CACHE_MAX_ENTRIES")
+    user_cache_ttl_seconds: float = Field(default=60.0, validation_alias="USER_CACHE_TTL_SECONDS")
+    user_cache_max_entries: int = Field(default=10_000, validation_alias="USER_CACHE_MAX_ENTRIES")
+    trust_token_claims_on_reads: bool = Field(default=False, validation_alias="TRUST_TOKEN_CLAIMS_ON_READS")
     openai_api_key: str = Field(validation_alias="OPENAI_API_KEY")
+    tutorial_title_mode: TutorialTitleMode = Field(
+        default=TutorialTitleMode.STRUCTURED, validation_alias="TUTORIAL_TITLE_MODE"
+    )
+    transcript_prompt_compaction: bool = Field(default=True, validation_alias="TRANSCRIPT_PROMPT_COMPACTION")
+    transcript_prompt_min_confidence: float = Field(default=0.4, validation_alias="TRANSCRIPT_PROMPT_MIN_CONFIDENCE")
+    transcript_map_reduce_threshold_tokens: int = Field(
+        default=60_000, validation_alias="TRANSCRIPT_MAP_REDUCE_THRESHOLD_TOKENS"
+    )
+    transcript_chunk_max_tokens: int = Field(default=8_000, validation_alias="TRANSCRIPT_CHUNK_MAX_TOKENS")
+    transcript_chunk_window_seconds: int = Field(default=900, validation_alias="TRANSCRIPT_CHUNK_WINDOW_SECONDS")
+    transcript_map_concurrency: int = Field(default=4, validation_alias="TRANSCRIPT_MAP_CONCURRENCY")
+    openai_requests_per_minute: int = Field(default=500, validation_alias="OPENAI_REQUESTS_PER_MINUTE")
+    openai_tokens_per_minute: int = Field(default=200_000, validation_alias="OPENAI_TOKENS_PER_MINUTE")
+    openai_max_concurrency: int = Field(default=16, validation_alias="OPENAI_MAX_CONCURRENCY")
+    openai_max_retries: int = Field(default=5, validation_alias="OPENAI_MAX_RETRIES")
+    tutorial_generation_workers: int = Field(default=2, validation_alias="TUTORIAL_GENERATION_WORKERS")
+    tutorial_generation_poll_interval_seconds: float = Field(
+        default=1.0, validation_alias="TUTORIAL_GENERATION_POLL_INTERVAL_SECONDS"
+    )
+    tutorial_generation_job_lease_seconds: int = Field(
+        default=600, validation_alias="TUTORIAL_GENERATION_JOB_LEASE_SECONDS"
+    )
+    tutorial_cache_ttl_seconds: int = Field(default=7 * 24 * 3600, validation_alias="TUTORIAL_CACHE_TTL_SECONDS")
+    tutorial_cache_max_entries: int = Field(default=10_000, validation_alias="TUTORIAL_CACHE_MAX_ENTRIES")
+    tutorial_cache_memory_max_entries: int = Field(default=256, validation_alias="TUTORIAL_CACHE_MEMORY_MAX_ENTRIES")
 
     model_config = {
         "env_file": ".env",
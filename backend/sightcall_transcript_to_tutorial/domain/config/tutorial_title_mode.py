@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class TutorialTitleMode(Enum):
+    # One structured-output completion returns both the title and the content.
+    STRUCTURED = "structured"
+    # The content is generated first, then a second completion names it.
+    SEPARATE_CALL = "separate_call"
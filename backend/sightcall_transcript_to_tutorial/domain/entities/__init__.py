@@ -1,6 +1,8 @@
 from .authenticated_user import AuthenticatedUser
+from .job_status import JobStatus
 from .transcript import Transcript
 from .tutorial import Tutorial
+from .tutorial_generation_job import TutorialGenerationJob
 from .user import User
 
-__all__ = ["Transcript", "Tutorial", "User", "AuthenticatedUser"]
+__all__ = ["Transcript", "Tutorial", "User", "AuthenticatedUser", "JobStatus", "TutorialGenerationJob"]
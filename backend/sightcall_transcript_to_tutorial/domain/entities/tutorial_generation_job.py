@@ -0,0 +1,93 @@
+from datetime import datetime, timezone
+from typing import Any
+
+from sightcall_transcript_to_tutorial.domain.entities.job_status import JobStatus
+from sightcall_transcript_to_tutorial.domain.value_objects import JobId, TranscriptId, TutorialId, UserId
+
+
+class TutorialGenerationJob:
+    def __init__(
+        self,
+        job_id: JobId,
+        transcript_id: TranscriptId,
+        user_id: UserId,
+        status: JobStatus = JobStatus.PENDING,
+        tutorial_id: TutorialId | None = None,
+        error: str | None = None,
+        created_at: datetime | None = None,
+        updated_at: datetime | None = None,
+        claim_token: str | None = None,
+    ):
+        now = datetime.now(timezone.utc)
+        self._job_id = job_id
+        self._transcript_id = transcript_id
+        self._user_id = user_id
+        self._status = status
+        self._tutorial_id = tutorial_id
+        self._error = error
+        self._created_at = created_at or now
+        self._updated_at = updated_at or now
+        # Set when a worker claims the job, so that only that worker may renew its lease and record its outcome.
+        self._claim_token = claim_token
+
+    @staticmethod
+    def create(transcript_id: TranscriptId, user_id: UserId) -> "TutorialGenerationJob":
+        return TutorialGenerationJob(job_id=JobId.generate(), transcript_id=transcript_id, user_id=user_id)
+
+    @property
+    def job_id(self) -> JobId:
+        return self._job_id
+
+    @property
+    def transcript_id(self) -> TranscriptId:
+        return self._transcript_id
+
+    @property
+    def user_id(self) -> UserId:
+        return self._user_id
+
+    @property
+    def status(self) -> JobStatus:
+        return self._status
+
+    @property
+    def tutorial_id(self) -> TutorialId | None:
+        return self._tutorial_id
+
+    @property
+    def error(self) -> str | None:
+        return self._error
+
+    @property
+    def created_at(self) -> datetime:
+        return self._created_at
+
+    @property
+    def updated_at(self) -> datetime:
+        return self._updated_at
+
+    @property
+    def claim_token(self) -> str | None:
+        return self._claim_token
+
+    @property
+    def is_finished(self) -> bool:
+        return self._status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, TutorialGenerationJob):
+            return False
+        return (
+            self.job_id == other.job_id
+            and self.transcript_id == other.transcript_id
+            and self.user_id == other.user_id
+            and self.status == other.status
+            and self.tutorial_id == other.tutorial_id
+            and self.error == other.error
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"TutorialGenerationJob(job_id={self.job_id!r}, transcript_id={self.transcript_id!r}, "
+            f"user_id={self.user_id!r}, status={self.status}, tutorial_id={self.tutorial_id!r}, error={self.error!r})"
+        )
@@ -8,3 +8,9 @@ class InvalidTranscriptError(TutorialGenerationError):
     """Raised when a transcript upload is invalid (bad JSON, missing fields, size, etc)."""
 
     pass
+
+
+class TutorialSaveVetoedError(Exception):
+    """Raised when a generated tutorial is not saved because the caller no longer wants it, e.g. a lost job claim."""
+
+    pass
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+
+from sightcall_transcript_to_tutorial.domain.entities.tutorial import Tutorial
+
+
+class TutorialGenerationLockInterface(ABC):
+    """
+    Mutual exclusion between generations of the same tutorial, so that concurrent callers run the AI call once and
+    the others wait for its result instead of paying for it again.
+    """
+
+    @abstractmethod
+    def acquire(self, key: str) -> Tutorial | None:
+        """
+        Block until no other generation holds `key`, then hold it.
+        Return the tutorial a previous holder handed over on release while this one was waiting, if any.
+        """
+        pass
+
+    @abstractmethod
+    def release(self, key: str, tutorial: Tutorial | None = None) -> None:
+        """
+        Let the next generation waiting for `key` go, handing it `tutorial` when given.
+        May be called from another thread than `acquire`.
+        """
+        pass
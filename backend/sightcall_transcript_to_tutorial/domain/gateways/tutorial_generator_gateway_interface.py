@@ -1,4 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 from sightcall_transcript_to_tutorial.domain.entities.transcript import Transcript
 from sightcall_transcript_to_tutorial.domain.entities.tutorial import Tutorial
@@ -10,3 +12,23 @@ class TutorialGeneratorGatewayInterface(ABC):
     def generate_tutorial(self, transcript: Transcript, user_id: UserId) -> Tutorial:
         """Generate a tutorial from a transcript using an AI service."""
         pass
+
+    async def generate_tutorial_async(self, transcript: Transcript, user_id: UserId) -> Tutorial:
+        """Async variant of `generate_tutorial`. By default the sync method runs in a worker thread."""
+        return await asyncio.to_thread(self.generate_tutorial, transcript, user_id)
+
+    async def stream_tutorial(self, transcript: Transcript, user_id: UserId) -> AsyncIterator[str | Tutorial]:
+        """
+        Generate a tutorial, yielding pieces of its content as they are produced, then the complete tutorial last.
+        By default the content is yielded in one piece once generated, `generate_tutorial` running in a worker thread.
+        """
+        tutorial = await asyncio.to_thread(self.generate_tutorial, transcript, user_id)
+        yield tutorial.content
+        yield tutorial
+
+    def cache_key(self, transcript: Transcript) -> str | None:
+        """
+        Return a key identifying what `generate_tutorial` would produce for this transcript, so that the result can be
+        reused, or None when results must not be cached.
+        """
+        return None
@@ -1,5 +1,20 @@
+from .async_transcript_repository_interface import AsyncTranscriptRepositoryInterface
+from .async_tutorial_repository_interface import AsyncTutorialRepositoryInterface
+from .async_user_repository_interface import AsyncUserRepositoryInterface
+from .generated_tutorial_cache_repository_interface import GeneratedTutorialCacheRepositoryInterface
 from .transcript_repository_interface import TranscriptRepositoryInterface
-from .tutorial_repository_interface import TutorialRepositoryInterface
+from .tutorial_generation_job_repository_interface import TutorialGenerationJobRepositoryInterface
+from .tutorial_repository_interface import TutorialPage, TutorialRepositoryInterface
 from .user_repository_interface import UserRepositoryInterface
 
-__all__ = ["TranscriptRepositoryInterface", "TutorialRepositoryInterface", "UserRepositoryInterface"]
+__all__ = [
+    "AsyncTranscriptRepositoryInterface",
+    "AsyncTutorialRepositoryInterface",
+    "AsyncUserRepositoryInterface",
+    "GeneratedTutorialCacheRepositoryInterface",
+    "TranscriptRepositoryInterface",
+    "TutorialGenerationJobRepositoryInterface",
+    "TutorialPage",
+    "TutorialRepositoryInterface",
+    "UserRepositoryInterface",
+]
@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+
+from sightcall_transcript_to_tutorial.domain.entities import Transcript
+from sightcall_transcript_to_tutorial.domain.value_objects import TranscriptId
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_phrases import TranscriptPhrases
+
+
+class AsyncTranscriptRepositoryInterface(ABC):
+    """Same as TranscriptRepositoryInterface, for callers running on an event loop."""
+
+    @abstractmethod
+    async def find_by_id(self, transcript_id: TranscriptId) -> Transcript | None:
+        pass
+
+    @abstractmethod
+    async def find_existing_ids(self, transcript_ids: list[TranscriptId]) -> set[TranscriptId]:
+        pass
+
+    @abstractmethod
+    async def save(self, transcript: Transcript) -> None:
+        pass
+
+    @abstractmethod
+    async def save_segment(self, transcript_id: TranscriptId, position: int, phrases: TranscriptPhrases) -> None:
+        pass
+
+    @abstractmethod
+    async def save_segmented(
+        self, transcript_id: TranscriptId, timestamp: str, duration_in_ticks: int | float, segment_count: int
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def discard_segmented(self, transcript_id: TranscriptId) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, transcript_id: TranscriptId) -> None:
+        pass
@@ -0,0 +1,61 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from sightcall_transcript_to_tutorial.domain.entities import Tutorial
+from sightcall_transcript_to_tutorial.domain.repositories.tutorial_repository_interface import TutorialPage
+from sightcall_transcript_to_tutorial.domain.value_objects import TutorialCursor, TutorialId, UserId
+
+
+class AsyncTutorialRepositoryInterface(ABC):
+    """Same as TutorialRepositoryInterface, for callers running on an event loop."""
+
+    @abstractmethod
+    async def find_by_id(self, tutorial_id: TutorialId) -> Tutorial | None:
+        pass
+
+    @abstractmethod
+    async def save(self, tutorial: Tutorial) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, tutorial_id: TutorialId) -> None:
+        pass
+
+    @abstractmethod
+    async def list_tutorials(
+        self,
+        user_id: UserId,
+        filters: Optional[dict[str, Any]] = None,
+        page: int = 1,
+        page_size: int = 20,
+        search: Optional[str] = None,
+        after: Optional[TutorialCursor] = None,
+    ) -> list[Tutorial]:
+        pass
+
+    @abstractmethod
+    async def list_tutorial_page(
+        self,
+        user_id: UserId,
+        filters: Optional[dict[str, Any]] = None,
+        page: int = 1,
+        page_size: int = 20,
+        search: Optional[str] = None,
+        after: Optional[TutorialCursor] = None,
+    ) -> TutorialPage:
+        pass
+
+    @abstractmethod
+    async def update_tutorial(
+        self,
+        tutorial_id: TutorialId,
+        user_id: UserId,
+        title: Optional[str] = None,
+        content: Optional[str] = None,
+        updated_at: Any = None,
+    ) -> Tutorial | None:
+        pass
+
+    @abstractmethod
+    async def validate_ownership(self, tutorial_id: TutorialId, user_id: UserId) -> bool:
+        pass
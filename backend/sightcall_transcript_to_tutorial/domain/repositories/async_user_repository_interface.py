@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+
+from sightcall_transcript_to_tutorial.domain.entities import User
+from sightcall_transcript_to_tutorial.domain.value_objects import UserId
+
+
+class AsyncUserRepositoryInterface(ABC):
+    """Same as UserRepositoryInterface, for callers running on an event loop."""
+
+    @abstractmethod
+    async def find_by_id(self, user_id: UserId) -> User | None:
+        pass
+
+    @abstractmethod
+    async def save(self, user: User) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, user_id: UserId) -> None:
+        pass
+
+    @abstractmethod
+    async def find_by_github_id(self, github_id: int) -> User | None:
+        pass
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+from sightcall_transcript_to_tutorial.domain.value_objects import GeneratedTutorial
+
+
+class GeneratedTutorialCacheRepositoryInterface(ABC):
+    @abstractmethod
+    def find_by_key(self, cache_key: str) -> GeneratedTutorial | None:
+        """Find the tutorial generated for a cache key, or None when it was never stored, expired or was evicted."""
+        pass
+
+    @abstractmethod
+    def save(self, cache_key: str, generated_tutorial: GeneratedTutorial) -> None:
+        """Store a generated tutorial under its cache key, evicting old entries as needed."""
+        pass
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 
 from sightcall_transcript_to_tutorial.domain.entities import Transcript
 from sightcall_transcript_to_tutorial.domain.value_objects import TranscriptId
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_phrases import TranscriptPhrases
 
 
 class TranscriptRepositoryInterface(ABC):
@@ -9,10 +10,35 @@ class TranscriptRepositoryInterface(ABC):
     def find_by_id(self, transcript_id: TranscriptId) -> Transcript | None:
         pass
 
+    @abstractmethod
+    def find_existing_ids(self, transcript_ids: list[TranscriptId]) -> set[TranscriptId]:
+        """Return which of the given transcripts exist, without loading their content."""
+        pass
+
     @abstractmethod
     def save(self, transcript: Transcript) -> None:
         pass
 
+    @abstractmethod
+    def save_segment(self, transcript_id: TranscriptId, position: int, phrases: TranscriptPhrases) -> None:
+        """Persist one segment of a transcript ingested in chunks: consecutive, already validated phrases."""
+        pass
+
+    @abstractmethod
+    def save_segmented(
+        self, transcript_id: TranscriptId, timestamp: str, duration_in_ticks: int | float, segment_count: int
+    ) -> None:
+        """Make a transcript ingested in chunks visible once all its segments have been saved."""
+        pass
+
+    @abstractmethod
+    def discard_segmented(self, transcript_id: TranscriptId) -> None:
+        """
+        Remove what a transcript ingested in chunks saved before its upload failed, whatever state the failure left
+        the repository in.
+        """
+        pass
+
     @abstractmethod
     def delete(self, transcript_id: TranscriptId) -> None:
         pass
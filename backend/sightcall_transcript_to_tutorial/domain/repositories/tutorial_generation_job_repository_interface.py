@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+
+from sightcall_transcript_to_tutorial.domain.entities import TutorialGenerationJob
+from sightcall_transcript_to_tutorial.domain.value_objects import JobId, TutorialId
+
+
+class TutorialGenerationJobRepositoryInterface(ABC):
+    @abstractmethod
+    def find_by_id(self, job_id: JobId) -> TutorialGenerationJob | None:
+        """Find a job by its ID."""
+        pass
+
+    @abstractmethod
+    def save(self, job: TutorialGenerationJob) -> None:
+        """Save a new job."""
+        pass
+
+    @abstractmethod
+    def save_many(self, jobs: list[TutorialGenerationJob]) -> None:
+        """Save new jobs at once, in a single transaction."""
+        pass
+
+    @abstractmethod
+    def claim_next(self, lease_seconds: int) -> TutorialGenerationJob | None:
+        """
+        Atomically move the oldest pending job to running and return it, or None when there is nothing to do.
+        A running job whose lease expired (its worker died or stopped renewing it) is claimed again, under a new claim
+        token. Concurrent workers never get the same job.
+        """
+        pass
+
+    @abstractmethod
+    def renew_lease(self, job_id: JobId, claim_token: str) -> bool:
+        """Restart the lease of a running job, and tell whether the claim is still held."""
+        pass
+
+    @abstractmethod
+    def mark_succeeded(self, job_id: JobId, claim_token: str, tutorial_id: TutorialId) -> bool:
+        """Record the tutorial produced by a running job, unless it was claimed again since: then return False."""
+        pass
+
+    @abstractmethod
+    def mark_failed(self, job_id: JobId, claim_token: str, error: str) -> bool:
+        """Record why a running job failed, unless it was claimed again since: then return False."""
+        pass
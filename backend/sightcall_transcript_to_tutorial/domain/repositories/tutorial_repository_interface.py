@@ -1,8 +1,18 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Any, Optional
 
 from sightcall_transcript_to_tutorial.domain.entities import Tutorial
-from sightcall_transcript_to_tutorial.domain.value_objects import TutorialId, UserId
+from sightcall_transcript_to_tutorial.domain.value_objects import TutorialCursor, TutorialId, UserId
+
+
+@dataclass(frozen=True)
+class TutorialPage:
+    """A page of tutorials and how many tutorials match in total, which may be the planner's estimate on large sets."""
+
+    tutorials: list[Tutorial]
+    total: int
+    total_is_estimate: bool = False
 
 
 class TutorialRepositoryInterface(ABC):
@@ -29,9 +39,28 @@ class TutorialRepositoryInterface(ABC):
         page: int = 1,
         page_size: int = 20,
         search: Optional[str] = None,
+        after: Optional[TutorialCursor] = None,
     ) -> list[Tutorial]:
         """
-        List tutorials for a user, with optional filters (date, etc), pagination, and search by title.
+        List tutorials for a user, newest first, with optional filters (date, etc), pagination, and search by title.
+        With `after`, the page starts right after that cursor and `page` is ignored: unlike an offset, a cursor costs
+        the same whatever the depth of the page.
+        With `search`, tutorials whose title or content match are ranked by relevance instead, and only paged by offset.
+        """
+        pass
+
+    @abstractmethod
+    def list_tutorial_page(
+        self,
+        user_id: UserId,
+        filters: Optional[dict[str, Any]] = None,
+        page: int = 1,
+        page_size: int = 20,
+        search: Optional[str] = None,
+        after: Optional[TutorialCursor] = None,
+    ) -> TutorialPage:
+        """
+        Same as `list_tutorials`, along with the number of tutorials matching the filters and search across all pages.
         """
         pass
 
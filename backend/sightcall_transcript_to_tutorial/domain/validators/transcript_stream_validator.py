@@ -0,0 +1,339 @@
+import codecs
+import json
+import re
+from enum import Enum
+from typing import Any, Callable
+
+from sightcall_transcript_to_tutorial.domain.exceptions.tutorial_generation_error import InvalidTranscriptError
+
+REQUIRED_TRANSCRIPT_FIELDS: tuple[str, ...] = ("timestamp", "duration_in_ticks", "phrases")
+REQUIRED_PHRASE_FIELDS: tuple[tuple[str, type | tuple[type, ...], str], ...] = (
+    ("offset_milliseconds", int, "int"),
+    ("duration_in_ticks", (int, float), "int, float"),
+    ("display", str, "str"),
+    ("speaker", int, "int"),
+    ("locale", str, "str"),
+    ("confidence", float, "float"),
+)
+
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_SELF_DELIMITING_TYPES = (dict, list, str)
+_JSON_VALUE_FIRST_CHARACTERS = '[{"-0123456789tfn'
+# A token that fails to decode this close to the end of the buffer may just be cut by a chunk boundary.
+_TRUNCATED_TOKEN_TOLERANCE = 6
+# Phrases arrays buffered in full are decoded in one call only up to this many characters: beyond, decoding them all
+# before validating the first would cost as much as the whole upload when that phrase is already invalid.
+_BULK_DECODE_MAX_CHARACTERS = 64 * 1024
+
+
+class _ParserState(Enum):
+    EXPECT_OBJECT_START = "expect_object_start"
+    EXPECT_FIRST_KEY = "expect_first_key"
+    EXPECT_KEY = "expect_key"
+    EXPECT_COLON = "expect_colon"
+    EXPECT_VALUE = "expect_value"
+    EXPECT_PHRASES_START = "expect_phrases_start"
+    EXPECT_FIRST_PHRASE = "expect_first_phrase"
+    EXPECT_PHRASE = "expect_phrase"
+    EXPECT_PHRASE_SEPARATOR = "expect_phrase_separator"
+    EXPECT_FIELD_SEPARATOR = "expect_field_separator"
+    DONE = "done"
+
+
+_PHRASE_STATES = (
+    _ParserState.EXPECT_FIRST_PHRASE,
+    _ParserState.EXPECT_PHRASE,
+    _ParserState.EXPECT_PHRASE_SEPARATOR,
+)
+
+
+class _NeedMoreData(Exception):
+    pass
+
+
+class TranscriptStreamValidator:
+    """
+    Incremental, single-pass validator for SightCall transcript JSON.
+    Checks size, top-level shape and each phrase's schema as the bytes arrive, failing on the first invalid phrase
+    without decoding the rest of the document. Valid phrases are handed to `on_phrase` (or collected when omitted).
+    `max_token_size` bounds the text held back while waiting for the end of a single value, such as one phrase, so
+    memory stays flat however long the streamed document is.
+    """
+
+    def __init__(
+        self,
+        on_phrase: Callable[[dict[str, Any]], None] | None = None,
+        max_size_bytes: int | None = None,
+        max_token_size: int | None = None,
+    ):
+        self._collected_phrases: list[dict[str, Any]] = []
+        self._on_phrase = on_phrase or self._collected_phrases.append
+        self._max_size_bytes = max_size_bytes
+        self._max_token_size = max_token_size
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._size_bytes = 0
+        self._state = _ParserState.EXPECT_OBJECT_START
+        self._current_key = ""
+        self._fields: dict[str, Any] = {}
+        self._phrase_count = 0
+        self._bulk_decode_attempted = False
+
+    @property
+    def phrase_count(self) -> int:
+        """Return the number of phrases validated so far."""
+        return self._phrase_count
+
+    def feed(self, chunk: bytes) -> None:
+        """Validate the next chunk of UTF-8 encoded transcript bytes."""
+        self._size_bytes += len(chunk)
+        if self._max_size_bytes is not None and self._size_bytes > self._max_size_bytes:
+            raise InvalidTranscriptError(
+                f"Transcript content exceeds maximum allowed size ({self._max_size_bytes} bytes)."
+            )
+        try:
+            text = self._decoder.decode(chunk)
+        except UnicodeDecodeError:
+            raise InvalidTranscriptError("Transcript content must be valid UTF-8.")
+        self.feed_text(text)
+
+    def feed_text(self, text: str) -> None:
+        """Validate the next piece of already decoded transcript text."""
+        self._buffer = self._buffer[self._position :] + text if self._position else self._buffer + text
+        self._position = 0
+        self._parse(final=False)
+        if self._max_token_size is not None and len(self._buffer) - self._position > self._max_token_size:
+            raise InvalidTranscriptError(
+                f"Transcript contains a value exceeding the maximum allowed size ({self._max_token_size} characters)."
+            )
+
+    def close(self) -> dict[str, Any]:
+        """
+        Finish validation once all input has been fed.
+        Return the transcript's top-level fields, with 'phrases' holding the collected phrases (empty when an
+        `on_phrase` callback consumed them).
+        """
+        try:
+            self._buffer = self._buffer[self._position :] + self._decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            raise InvalidTranscriptError("Transcript content must be valid UTF-8.")
+        self._position = 0
+        self._parse(final=True)
+        if self._state is not _ParserState.DONE:
+            raise InvalidTranscriptError("Transcript content must be valid JSON.")
+        for data_field in REQUIRED_TRANSCRIPT_FIELDS:
+            if data_field not in self._fields:
+                raise InvalidTranscriptError(f"Missing required field: '{data_field}'.")
+        return {
+            "timestamp": self._fields["timestamp"],
+            "duration_in_ticks": self._fields["duration_in_ticks"],
+            "phrases": self._collected_phrases,
+        }
+
+    def _parse(self, final: bool) -> None:
+        try:
+            while self._state is not _ParserState.DONE:
+                self._step(final)
+        except _NeedMoreData:
+            if final:
+                raise InvalidTranscriptError("Transcript content must be valid JSON.")
+            return
+        if self._next_significant_character(final=True) is not None:
+            raise InvalidTranscriptError("Transcript content must be valid JSON.")
+
+    def _step(self, final: bool) -> None:
+        state = self._state
+        if state is _ParserState.EXPECT_OBJECT_START:
+            self._expect_object_start(final)
+        elif state is _ParserState.EXPECT_FIRST_KEY or state is _ParserState.EXPECT_KEY:
+            self._expect_key(final)
+        elif state is _ParserState.EXPECT_COLON:
+            self._consume_character(":", final)
+            self._state = (
+                _ParserState.EXPECT_PHRASES_START if self._current_key == "phrases" else _ParserState.EXPECT_VALUE
+            )
+        elif state is _ParserState.EXPECT_VALUE:
+            self._fields[self._current_key] = self._decode_value(final)
+            self._validate_field(self._current_key)
+            self._state = _ParserState.EXPECT_FIELD_SEPARATOR
+        elif state is _ParserState.EXPECT_PHRASES_START:
+            self._expect_phrases_start(final)
+        elif state in _PHRASE_STATES:
+            self._consume_phrases(final)
+        elif state is _ParserState.EXPECT_FIELD_SEPARATOR:
+            character = self._take_significant_character(final)
+            if character == ",":
+                self._state = _ParserState.EXPECT_KEY
+            elif character == "}":
+                self._state = _ParserState.DONE
+            else:
+                raise InvalidTranscriptError("Transcript content must be valid JSON.")
+
+    def _expect_object_start(self, final: bool) -> None:
+        character = self._take_significant_character(final)
+        if character == "{":
+            self._state = _ParserState.EXPECT_FIRST_KEY
+        elif character in _JSON_VALUE_FIRST_CHARACTERS:
+            raise InvalidTranscriptError("Transcript JSON must be a JSON object at the top level.")
+        else:
+            raise InvalidTranscriptError("Transcript content must be valid JSON.")
+
+    def _expect_key(self, final: bool) -> None:
+        character = self._next_significant_character(final)
+        if character == "}" and self._state is _ParserState.EXPECT_FIRST_KEY:
+            self._position += 1
+            self._state = _ParserState.DONE
+            return
+        if character != '"':
+            raise InvalidTranscriptError("Transcript content must be valid JSON.")
+        key = self._decode_value(final)
+        if key == "phrases" and "phrases" in self._fields:
+            raise InvalidTranscriptError("Duplicate field: 'phrases'.")
+        self._current_key = key
+        self._state = _ParserState.EXPECT_COLON
+
+    def _expect_phrases_start(self, final: bool) -> None:
+        character = self._next_significant_character(final)
+        if character != "[":
+            raise InvalidTranscriptError("'phrases' must be a non-empty list.")
+        self._fields["phrases"] = 0
+        self._state = _ParserState.EXPECT_FIRST_PHRASE
+
+    def _try_bulk_decode_phrases(self) -> bool:
+        # When the whole array is already buffered, one C-level decode beats a Python call per phrase.
+        # Attempted once only, so a large streamed array is not rescanned on every chunk.
+        self._bulk_decode_attempted = True
+        if len(self._buffer) - self._position > _BULK_DECODE_MAX_CHARACTERS:
+            self._position += 1
+            return False
+        try:
+            phrases, end = self._json_decoder.raw_decode(self._buffer, self._position)
+        except json.JSONDecodeError:
+            self._position += 1
+            return False
+        if not phrases:
+            raise InvalidTranscriptError("'phrases' must be a non-empty list.")
+        for phrase in phrases:
+            _validate_phrase(phrase, self._phrase_count)
+            self._on_phrase(phrase)
+            self._phrase_count += 1
+        self._position = end
+        self._fields["phrases"] = self._phrase_count
+        self._state = _ParserState.EXPECT_FIELD_SEPARATOR
+        return True
+
+    def _consume_phrases(self, final: bool) -> None:
+        if not self._bulk_decode_attempted and self._try_bulk_decode_phrases():
+            return
+        # Hot loop: one iteration per phrase, kept free of per-token state dispatch.
+        buffer = self._buffer
+        length = len(buffer)
+        raw_decode = self._json_decoder.raw_decode
+        while True:
+            position = self._skip_whitespace(self._position)
+            if position >= length:
+                raise _NeedMoreData()
+            if self._state is _ParserState.EXPECT_PHRASE_SEPARATOR:
+                character = buffer[position]
+                self._position = position + 1
+                if character == "]":
+                    self._fields["phrases"] = self._phrase_count
+                    self._state = _ParserState.EXPECT_FIELD_SEPARATOR
+                    return
+                if character != ",":
+                    raise InvalidTranscriptError("Transcript content must be valid JSON.")
+                self._state = _ParserState.EXPECT_PHRASE
+                continue
+            if self._state is _ParserState.EXPECT_FIRST_PHRASE and buffer[position] == "]":
+                raise InvalidTranscriptError("'phrases' must be a non-empty list.")
+            try:
+                phrase, end = raw_decode(buffer, position)
+            except json.JSONDecodeError as error:
+                if not final and self._is_truncated(error):
+                    raise _NeedMoreData()
+                raise InvalidTranscriptError("Transcript content must be valid JSON.")
+            _validate_phrase(phrase, self._phrase_count)
+            self._position = end
+            self._on_phrase(phrase)
+            self._phrase_count += 1
+            self._state = _ParserState.EXPECT_PHRASE_SEPARATOR
+
+    def _validate_field(self, data_field: str) -> None:
+        value = self._fields[data_field]
+        if data_field == "timestamp" and not (isinstance(value, str) and value.strip()):
+            raise InvalidTranscriptError("'timestamp' must be a non-empty string.")
+        if data_field == "duration_in_ticks" and not isinstance(value, (int, float)):
+            raise InvalidTranscriptError("'duration_in_ticks' must be a number.")
+
+    def _decode_value(self, final: bool) -> Any:
+        self._next_significant_character(final)
+        try:
+            value, end = self._json_decoder.raw_decode(self._buffer, self._position)
+        except json.JSONDecodeError as error:
+            if not final and self._is_truncated(error):
+                raise _NeedMoreData()
+            raise InvalidTranscriptError("Transcript content must be valid JSON.")
+        # Numbers and literals are not self-delimiting: wait until the following delimiter has arrived.
+        if (
+            not final
+            and not isinstance(value, _SELF_DELIMITING_TYPES)
+            and self._skip_whitespace(end) >= len(self._buffer)
+        ):
+            raise _NeedMoreData()
+        self._position = end
+        return value
+
+    def _consume_character(self, expected: str, final: bool) -> None:
+        if self._take_significant_character(final) != expected:
+            raise InvalidTranscriptError("Transcript content must be valid JSON.")
+
+    def _take_significant_character(self, final: bool) -> str:
+        character = self._next_significant_character(final)
+        if character is None:
+            raise _NeedMoreData()
+        self._position += 1
+        return character
+
+    def _next_significant_character(self, final: bool) -> str | None:
+        self._position = self._skip_whitespace(self._position)
+        if self._position >= len(self._buffer):
+            if not final:
+                raise _NeedMoreData()
+            return None
+        return self._buffer[self._position]
+
+    def _skip_whitespace(self, position: int) -> int:
+        return _JSON_WHITESPACE.match(self._buffer, position).end()  # type: ignore[union-attr]
+
+    def _is_truncated(self, error: json.JSONDecodeError) -> bool:
+        return (
+            error.msg.startswith("Unterminated string") or error.pos >= len(self._buffer) - _TRUNCATED_TOKEN_TOLERANCE
+        )
+
+
+def _validate_phrase(phrase: Any, idx: int) -> None:
+    if (
+        type(phrase) is dict
+        and isinstance(phrase.get("offset_milliseconds"), int)
+        and isinstance(phrase.get("duration_in_ticks"), (int, float))
+        and isinstance(phrase.get("display"), str)
+        and isinstance(phrase.get("speaker"), int)
+        and isinstance(phrase.get("locale"), str)
+        and isinstance(phrase.get("confidence"), float)
+    ):
+        return
+    _raise_phrase_error(phrase, idx)
+
+
+def _raise_phrase_error(phrase: Any, idx: int) -> None:
+    if not isinstance(phrase, dict):
+        raise InvalidTranscriptError(f"Each phrase must be a JSON object (error at index {idx}).")
+    for phrase_field, expected_type, type_name in REQUIRED_PHRASE_FIELDS:
+        if phrase_field not in phrase:
+            raise InvalidTranscriptError(f"Phrase at index {idx} missing required field: '{phrase_field}'.")
+        if not isinstance(phrase[phrase_field], expected_type):
+            raise InvalidTranscriptError(
+                f"Phrase field '{phrase_field}' at index {idx} has wrong type (expected {type_name})."
+            )
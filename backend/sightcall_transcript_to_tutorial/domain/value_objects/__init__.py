@@ -1,5 +1,8 @@
+from .generated_tutorial import GeneratedTutorial
+from .job_id import JobId
 from .transcript_id import TranscriptId
+from .tutorial_cursor import TutorialCursor
 from .tutorial_id import TutorialId
 from .user_id import UserId
 
-__all__ = ["TranscriptId", "TutorialId", "UserId"]
+__all__ = ["GeneratedTutorial", "JobId", "TranscriptId", "TutorialCursor", "TutorialId", "UserId"]
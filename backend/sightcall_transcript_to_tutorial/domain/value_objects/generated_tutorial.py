@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class GeneratedTutorial:
+    """Title and content produced by the tutorial generator, before they become a user's tutorial."""
+
+    title: str
+    content: str
@@ -0,0 +1,11 @@
+import uuid
+
+from .base_id import BaseId
+
+
+class JobId(BaseId):
+    _type_name = "JobId"
+
+    @staticmethod
+    def generate() -> "JobId":
+        return JobId(str(uuid.uuid4()))
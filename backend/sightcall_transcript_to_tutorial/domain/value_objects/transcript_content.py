@@ -1,32 +1,85 @@
 import json
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
 from typing import Any
 
 from sightcall_transcript_to_tutorial.domain.exceptions.tutorial_generation_error import InvalidTranscriptError
+from sightcall_transcript_to_tutorial.domain.validators.transcript_stream_validator import TranscriptStreamValidator
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_phrases import TranscriptPhrases
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_phrases_builder import TranscriptPhrasesBuilder
 
 MAX_TRANSCRIPT_SIZE_BYTES = 100 * 1024  # 100KB
+# Version of the validation rules below: bump it whenever they change, so that transcripts stored under older rules
+# are validated again when loaded instead of going through `from_trusted`.
+TRANSCRIPT_SCHEMA_VERSION = 1
 
 
-@dataclass(frozen=True, eq=True)
+@dataclass(frozen=True, eq=False)
 class TranscriptContent:
     """
     Value object representing the validated content of a transcript upload.
     Encapsulates parsing, validation, and access to transcript metadata and phrases.
+    Two contents are equal when their fields and phrases are, whatever the JSON formatting they came from.
+    Only the columnar phrases are kept once validated: the JSON text of the upload is dropped, and rendered again
+    from the phrases whenever it is asked for.
     """
 
-    _raw_content: str = field(repr=False)
-    _data: dict = field(init=False, repr=False, compare=False)
+    _raw_content: InitVar[str]
+    _data: dict = field(init=False, repr=False)
 
-    def __post_init__(self):
-        object.__setattr__(self, "_data", self._parse_and_validate(self._raw_content))
+    def __post_init__(self, _raw_content: str) -> None:
+        object.__setattr__(self, "_data", self._parse_and_validate(_raw_content))
+
+    @classmethod
+    def from_bytes(cls, raw_content: bytes) -> "TranscriptContent":
+        """
+        Build a TranscriptContent from the raw bytes of an upload.
+        The size limit is checked on the bytes themselves, so the content is never re-encoded just to be measured.
+        """
+        if len(raw_content) > MAX_TRANSCRIPT_SIZE_BYTES:
+            raise InvalidTranscriptError(
+                f"Transcript content exceeds maximum allowed size ({MAX_TRANSCRIPT_SIZE_BYTES} bytes)."
+            )
+        try:
+            content = raw_content.decode("utf-8")
+        except UnicodeDecodeError:
+            raise InvalidTranscriptError("Transcript content must be valid UTF-8.")
+        TranscriptContent._validate_not_empty(content)
+        return cls._from_sized_content(content)
+
+    @classmethod
+    def from_trusted(
+        cls, timestamp: str, duration_in_ticks: int | float, phrases: TranscriptPhrases
+    ) -> "TranscriptContent":
+        """
+        Build a TranscriptContent from parts that were validated when the transcript was uploaded, such as a decoded
+        stored transcript. No validation is performed.
+        """
+        transcript_content = object.__new__(cls)
+        object.__setattr__(
+            transcript_content,
+            "_data",
+            {"timestamp": timestamp, "duration_in_ticks": duration_in_ticks, "phrases": phrases},
+        )
+        return transcript_content
+
+    def revalidate(self) -> "TranscriptContent":
+        """
+        Return this content checked against the current validation rules, e.g. when it was trusted from storage
+        written under an older TRANSCRIPT_SCHEMA_VERSION. The size limit only bounds uploads and is not applied.
+        """
+        return self._from_sized_content(str(self))
+
+    @classmethod
+    def _from_sized_content(cls, content: str) -> "TranscriptContent":
+        transcript_content = object.__new__(cls)
+        object.__setattr__(transcript_content, "_data", TranscriptContent._validate_schema(content))
+        return transcript_content
 
     @staticmethod
     def _parse_and_validate(raw_content: str) -> dict:
         TranscriptContent._validate_not_empty(raw_content)
         TranscriptContent._validate_size_limit(raw_content)
-        data = TranscriptContent._parse_json(raw_content)
-        TranscriptContent._validate_schema(data)
-        return data
+        return TranscriptContent._validate_schema(raw_content)
 
     @staticmethod
     def _validate_not_empty(content: str) -> None:
@@ -35,65 +88,23 @@ class TranscriptContent:
 
     @staticmethod
     def _validate_size_limit(content: str) -> None:
-        if len(content.encode("utf-8")) > MAX_TRANSCRIPT_SIZE_BYTES:
+        # A UTF-8 character takes between 1 and 4 bytes: only encode when the length alone cannot decide.
+        if len(content) * 4 <= MAX_TRANSCRIPT_SIZE_BYTES:
+            return
+        if len(content) > MAX_TRANSCRIPT_SIZE_BYTES or len(content.encode("utf-8")) > MAX_TRANSCRIPT_SIZE_BYTES:
             raise InvalidTranscriptError(
                 f"Transcript content exceeds maximum allowed size ({MAX_TRANSCRIPT_SIZE_BYTES} bytes)."
             )
 
     @staticmethod
-    def _parse_json(content: str) -> dict:
-        try:
-            data = json.loads(content)
-        except Exception:
-            raise InvalidTranscriptError("Transcript content must be valid JSON.")
-        if not isinstance(data, dict):
-            raise InvalidTranscriptError("Transcript JSON must be a JSON object at the top level.")
+    def _validate_schema(content: str) -> dict:
+        phrases_builder = TranscriptPhrasesBuilder()
+        validator = TranscriptStreamValidator(on_phrase=phrases_builder.append)
+        validator.feed_text(content)
+        data = validator.close()
+        data["phrases"] = phrases_builder.build()
         return data
 
-    @staticmethod
-    def _validate_schema(data: dict) -> None:
-        required_fields = ["timestamp", "duration_in_ticks", "phrases"]
-        for data_field in required_fields:
-            if data_field not in data:
-                raise InvalidTranscriptError(f"Missing required field: '{data_field}'.")
-        if not TranscriptContent._is_non_empty_str(data["timestamp"]):
-            raise InvalidTranscriptError("'timestamp' must be a non-empty string.")
-        if not TranscriptContent._is_number(data["duration_in_ticks"]):
-            raise InvalidTranscriptError("'duration_in_ticks' must be a number.")
-        if not TranscriptContent._is_non_empty_list(data["phrases"]):
-            raise InvalidTranscriptError("'phrases' must be a non-empty list.")
-        for idx, phrase in enumerate(data["phrases"]):
-            TranscriptContent._validate_phrase(phrase, idx)
-
-    @staticmethod
-    def _validate_phrase(phrase: Any, idx: int) -> None:
-        if not isinstance(phrase, dict):
-            raise InvalidTranscriptError(f"Each phrase must be a JSON object (error at index {idx}).")
-        required_phrase_fields: list[tuple[str, type | tuple[type, ...]]] = [
-            ("offset_milliseconds", int),
-            ("duration_in_ticks", (int, float)),
-            ("display", str),
-            ("speaker", int),
-            ("locale", str),
-            ("confidence", float),
-        ]
-        for phrase_field, expected_type in required_phrase_fields:
-            if phrase_field not in phrase:
-                raise InvalidTranscriptError(f"Phrase at index {idx} missing required field: '{phrase_field}'.")
-            if not isinstance(phrase[phrase_field], expected_type):
-                type_name = TranscriptContent._type_name(expected_type)
-                raise InvalidTranscriptError(
-                    f"Phrase field '{phrase_field}' at index {idx} has wrong type (expected {type_name})."
-                )
-
-    @staticmethod
-    def _type_name(expected_type: type | tuple[type, ...]) -> str:
-        if isinstance(expected_type, tuple):
-            return ", ".join(t.__name__ for t in expected_type if isinstance(t, type))
-        if isinstance(expected_type, type):
-            return expected_type.__name__
-        return str(expected_type)
-
     @property
     def timestamp(self) -> str:
         """Return the transcript's timestamp as a string."""
@@ -105,22 +116,29 @@ class TranscriptContent:
         return self._data["duration_in_ticks"]
 
     @property
-    def phrases(self) -> list:
-        """Return the list of phrase dictionaries in the transcript."""
+    def phrases(self) -> TranscriptPhrases:
+        """Return the transcript's phrases, a read-only sequence of phrase dictionaries."""
         return self._data["phrases"]
 
     def __str__(self) -> str:
-        """Return the original raw JSON string for storage or serialization."""
-        return self._raw_content
+        """
+        Return the content as a JSON string, rendered from the phrases on every call: keep the result only as long
+        as it is needed.
+        """
+        return self._render_json()
 
-    @staticmethod
-    def _is_number(value: Any) -> bool:
-        return isinstance(value, (int, float))
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, TranscriptContent) and self._data == other._data
+
+    def __hash__(self) -> int:
+        return hash((self.timestamp, self.duration_in_ticks, len(self.phrases)))
+
+    def _render_json(self) -> str:
+        return json.dumps(
+            {"timestamp": self.timestamp, "duration_in_ticks": self.duration_in_ticks, "phrases": list(self.phrases)},
+            ensure_ascii=False,
+        )
 
     @staticmethod
     def _is_non_empty_str(value: Any) -> bool:
         return isinstance(value, str) and bool(value.strip())
-
-    @staticmethod
-    def _is_non_empty_list(value: Any) -> bool:
-        return isinstance(value, list) and len(value) > 0
@@ -0,0 +1,224 @@
+import struct
+import sys
+from array import array
+from collections.abc import Iterator, Sequence
+from typing import Any, overload
+
+# Column type codes in serialization order, see `to_bytes`. Durations are either integers ("q") or floats ("d"), the
+# type code of their column is serialized with the counts.
+_COLUMN_TYPECODES = ("q", None, "i", "H", "d", "q")
+_COUNTS = struct.Struct("<IH")
+_DURATIONS_TYPECODE = struct.Struct("<c")
+_LOCALE_LENGTH = struct.Struct("<H")
+
+
+class TranscriptPhrases(Sequence[dict[str, Any]]):
+    """
+    Read-only, columnar storage for the phrases of a transcript.
+    Numeric fields live in typed arrays, locales are interned and display texts share one joined string, so a long
+    call costs a few buffers instead of thousands of small dicts. Indexing still returns a phrase dict, built on
+    access, so callers can keep treating it as a list of phrases.
+    """
+
+    __slots__ = (
+        "_offsets_milliseconds",
+        "_durations_in_ticks",
+        "_speakers",
+        "_locale_indexes",
+        "_locales",
+        "_confidences",
+        "_display_text",
+        "_display_ends",
+    )
+
+    def __init__(
+        self,
+        offsets_milliseconds: array,
+        durations_in_ticks: array,
+        speakers: array,
+        locale_indexes: array,
+        locales: tuple[str, ...],
+        confidences: array,
+        display_text: str,
+        display_ends: array,
+    ):
+        self._offsets_milliseconds = offsets_milliseconds
+        self._durations_in_ticks = durations_in_ticks
+        self._speakers = speakers
+        self._locale_indexes = locale_indexes
+        self._locales = locales
+        self._confidences = confidences
+        self._display_text = display_text
+        self._display_ends = display_ends
+
+    def __len__(self) -> int:
+        return len(self._display_ends)
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if isinstance(index, slice):
+            return [self._phrase_at(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("phrase index out of range")
+        return self._phrase_at(index)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for index in range(len(self)):
+            yield self._phrase_at(index)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TranscriptPhrases):
+            return NotImplemented
+        return (
+            self._display_text == other._display_text
+            and self._display_ends == other._display_ends
+            and self._offsets_milliseconds == other._offsets_milliseconds
+            and self._durations_in_ticks == other._durations_in_ticks
+            and self._speakers == other._speakers
+            and self._confidences == other._confidences
+            and [self._locales[i] for i in self._locale_indexes] == [other._locales[i] for i in other._locale_indexes]
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"TranscriptPhrases(<{len(self)} phrases>)"
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the columns to a compact little-endian layout: phrase and locale counts, the type code of the
+        durations, the length-prefixed locales, each numeric column as raw array bytes, then the UTF-8 display text.
+        """
+        parts = [
+            _COUNTS.pack(len(self), len(self._locales)),
+            _DURATIONS_TYPECODE.pack(self._durations_in_ticks.typecode.encode("ascii")),
+        ]
+        for locale in self._locales:
+            encoded_locale = locale.encode("utf-8")
+            parts.append(_LOCALE_LENGTH.pack(len(encoded_locale)))
+            parts.append(encoded_locale)
+        for column in self._columns():
+            if sys.byteorder == "big":
+                column = array(column.typecode, column)
+                column.byteswap()
+            parts.append(column.tobytes())
+        parts.append(self._display_text.encode("utf-8"))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, durations_typecode: str | None = None) -> "TranscriptPhrases":
+        """
+        Rebuild phrases serialized by `to_bytes`, without validating them again.
+        `durations_typecode` reads data serialized before the type code of the durations was, with that type code.
+        """
+        count, locale_count = _COUNTS.unpack_from(data)
+        position = _COUNTS.size
+        if durations_typecode is None:
+            (encoded_typecode,) = _DURATIONS_TYPECODE.unpack_from(data, position)
+            durations_typecode = encoded_typecode.decode("ascii")
+            position += _DURATIONS_TYPECODE.size
+        locales = []
+        for _ in range(locale_count):
+            (length,) = _LOCALE_LENGTH.unpack_from(data, position)
+            position += _LOCALE_LENGTH.size
+            locales.append(data[position : position + length].decode("utf-8"))
+            position += length
+        columns = []
+        for typecode in _COLUMN_TYPECODES:
+            column = array(typecode or durations_typecode)
+            end = position + count * column.itemsize
+            column.frombytes(data[position:end])
+            if sys.byteorder == "big":
+                column.byteswap()
+            columns.append(column)
+            position = end
+        offsets_milliseconds, durations_in_ticks, speakers, locale_indexes, confidences, display_ends = columns
+        return cls(
+            offsets_milliseconds=offsets_milliseconds,
+            durations_in_ticks=durations_in_ticks,
+            speakers=speakers,
+            locale_indexes=locale_indexes,
+            locales=tuple(locales),
+            confidences=confidences,
+            display_text=data[position:].decode("utf-8"),
+            display_ends=display_ends,
+        )
+
+    @classmethod
+    def concatenate(cls, parts: Sequence["TranscriptPhrases"]) -> "TranscriptPhrases":
+        """
+        Join consecutive parts of a transcript's phrases, such as the segments of a chunked upload, column by column.
+        Durations stay integers unless a part holds float durations.
+        """
+        durations_typecode = "d" if any(part._durations_in_ticks.typecode == "d" for part in parts) else "q"
+        offsets_milliseconds, durations_in_ticks = array("q"), array(durations_typecode)
+        speakers, locale_indexes, confidences, display_ends = array("i"), array("H"), array("d"), array("q")
+        locale_index_by_name: dict[str, int] = {}
+        display_texts = []
+        display_length = 0
+        for part in parts:
+            offsets_milliseconds.extend(part._offsets_milliseconds)
+            durations_in_ticks.extend(
+                part._durations_in_ticks
+                if part._durations_in_ticks.typecode == durations_typecode
+                else array(durations_typecode, part._durations_in_ticks)
+            )
+            speakers.extend(part._speakers)
+            confidences.extend(part._confidences)
+            index_map = [
+                locale_index_by_name.setdefault(locale, len(locale_index_by_name)) for locale in part._locales
+            ]
+            if index_map == list(range(len(index_map))):
+                locale_indexes.extend(part._locale_indexes)
+            else:
+                locale_indexes.extend(array("H", [index_map[index] for index in part._locale_indexes]))
+            display_ends.extend(array("q", [end + display_length for end in part._display_ends]))
+            display_texts.append(part._display_text)
+            display_length += len(part._display_text)
+        return cls(
+            offsets_milliseconds=offsets_milliseconds,
+            durations_in_ticks=durations_in_ticks,
+            speakers=speakers,
+            locale_indexes=locale_indexes,
+            locales=tuple(locale_index_by_name),
+            confidences=confidences,
+            display_text="".join(display_texts),
+            display_ends=display_ends,
+        )
+
+    @property
+    def display_length(self) -> int:
+        """Total length of the display texts, in characters."""
+        return len(self._display_text)
+
+    def display(self, index: int) -> str:
+        """Return the display text of one phrase without building its dict."""
+        start = self._display_ends[index - 1] if index > 0 else 0
+        return self._display_text[start : self._display_ends[index]]
+
+    def _columns(self) -> tuple[array, ...]:
+        return (
+            self._offsets_milliseconds,
+            self._durations_in_ticks,
+            self._speakers,
+            self._locale_indexes,
+            self._confidences,
+            self._display_ends,
+        )
+
+    def _phrase_at(self, index: int) -> dict[str, Any]:
+        return {
+            "offset_milliseconds": self._offsets_milliseconds[index],
+            "duration_in_ticks": self._durations_in_ticks[index],
+            "display": self.display(index),
+            "speaker": self._speakers[index],
+            "locale": self._locales[self._locale_indexes[index]],
+            "confidence": self._confidences[index],
+        }
@@ -0,0 +1,60 @@
+from array import array
+from typing import Any
+
+from sightcall_transcript_to_tutorial.domain.exceptions.tutorial_generation_error import InvalidTranscriptError
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_phrases import TranscriptPhrases
+
+
+class TranscriptPhrasesBuilder:
+    """
+    Accumulate already validated phrase dicts into the columns of a TranscriptPhrases.
+    Meant to be used as the `on_phrase` callback of the transcript validator, so no phrase dict outlives parsing.
+    Durations are kept as integers, like the offsets, until a phrase has a float duration: the column then switches
+    to floats for the whole transcript.
+    """
+
+    def __init__(self) -> None:
+        self._offsets_milliseconds = array("q")
+        # Integers until the first float duration, see `append`.
+        self._durations_in_ticks: array[Any] = array("q")
+        self._speakers = array("i")
+        self._locale_indexes = array("H")
+        self._locale_index_by_name: dict[str, int] = {}
+        self._confidences = array("d")
+        self._displays: list[str] = []
+        self._display_ends = array("q")
+        self._display_length = 0
+
+    def append(self, phrase: dict[str, Any]) -> None:
+        """Add one validated phrase."""
+        locale_index = self._locale_index_by_name.setdefault(phrase["locale"], len(self._locale_index_by_name))
+        display = phrase["display"]
+        duration_in_ticks = phrase["duration_in_ticks"]
+        if isinstance(duration_in_ticks, float) and self._durations_in_ticks.typecode == "q":
+            self._durations_in_ticks = array("d", self._durations_in_ticks)
+        try:
+            self._offsets_milliseconds.append(phrase["offset_milliseconds"])
+            self._durations_in_ticks.append(duration_in_ticks)
+            self._speakers.append(phrase["speaker"])
+            self._locale_indexes.append(locale_index)
+            self._confidences.append(phrase["confidence"])
+        except OverflowError:
+            raise InvalidTranscriptError(
+                f"Phrase at index {len(self._display_ends)} has a numeric field out of the supported range."
+            )
+        self._display_length += len(display)
+        self._displays.append(display)
+        self._display_ends.append(self._display_length)
+
+    def build(self) -> TranscriptPhrases:
+        """Return the accumulated phrases; the builder should not be reused afterwards."""
+        return TranscriptPhrases(
+            offsets_milliseconds=self._offsets_milliseconds,
+            durations_in_ticks=self._durations_in_ticks,
+            speakers=self._speakers,
+            locale_indexes=self._locale_indexes,
+            locales=tuple(self._locale_index_by_name),
+            confidences=self._confidences,
+            display_text="".join(self._displays),
+            display_ends=self._display_ends,
+        )
@@ -0,0 +1,30 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class TutorialCursor:
+    """
+    Position in a list of tutorials ordered from newest to oldest: the creation date and id of the last tutorial of a
+    page. Shared with clients as an opaque token.
+    """
+
+    created_at: datetime
+    tutorial_id: str
+
+    def encode(self) -> str:
+        payload = json.dumps([self.created_at.isoformat(), self.tutorial_id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def decode(token: str) -> "TutorialCursor":
+        """Raise ValueError when the token was not produced by `encode`."""
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            created_at, tutorial_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            return TutorialCursor(datetime.fromisoformat(created_at), str(tutorial_id))
+        except (binascii.Error, UnicodeError, TypeError, ValueError) as error:
+            raise ValueError("Invalid tutorial cursor") from error
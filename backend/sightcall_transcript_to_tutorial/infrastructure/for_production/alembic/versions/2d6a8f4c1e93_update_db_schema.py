@@ -0,0 +1,27 @@
+"""Update DB schema
+
+Revision ID: 2d6a8f4c1e93
+Revises: c5d1f7a3e862
+Create Date: 2026-10-17 18:12:45.208313
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2d6a8f4c1e93"
+down_revision: Union[str, Sequence[str], None] = "c5d1f7a3e862"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_tutorials_user_id_created_at_id", "tutorials", ["user_id", "created_at", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_tutorials_user_id_created_at_id", table_name="tutorials")
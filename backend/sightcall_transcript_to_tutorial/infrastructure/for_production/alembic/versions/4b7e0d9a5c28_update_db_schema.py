@@ -0,0 +1,65 @@
+"""Update DB schema
+
+Revision ID: 4b7e0d9a5c28
+Revises: f3a9c2e6b7d1
+Create Date: 2026-10-17 20:26:51.917340
+
+Adding the STORED search_vector column rewrites the whole tutorials table under an ACCESS EXCLUSIVE lock, which
+blocks reads and writes for a time proportional to the size of the table: run it in a maintenance window on large
+databases. The GIN indexes are then built concurrently, outside of the migration transaction, so that they do not
+block writes while they are built.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "4b7e0d9a5c28"
+down_revision: Union[str, Sequence[str], None] = "f3a9c2e6b7d1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        "tutorials",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', title), 'A') || setweight(to_tsvector('english', content), 'B')",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+    )
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tutorials_search_vector",
+            "tutorials",
+            ["search_vector"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_tutorials_title_trgm",
+            "tutorials",
+            ["title"],
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_tutorials_title_trgm", table_name="tutorials", postgresql_concurrently=True)
+        op.drop_index("ix_tutorials_search_vector", table_name="tutorials", postgresql_concurrently=True)
+    op.drop_column("tutorials", "search_vector")
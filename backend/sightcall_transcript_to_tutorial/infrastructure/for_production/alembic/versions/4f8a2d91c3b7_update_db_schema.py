@@ -0,0 +1,196 @@
+"""Update DB schema
+
+Revision ID: 4f8a2d91c3b7
+Revises: 9c1e4b7d2a60
+Create Date: 2026-10-17 11:02:18.640127
+
+"""
+
+import json
+import struct
+import sys
+import zlib
+from array import array
+from typing import Any, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4f8a2d91c3b7"
+down_revision: Union[str, Sequence[str], None] = "9c1e4b7d2a60"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 500
+
+# Frozen copy of version 1 of the stored transcript format (see the transcript_content_codec module as of this
+# revision), so that replaying this migration does not depend on how the application encodes transcripts later on.
+_MAGIC = b"STC"
+_FORMAT_VERSION = 1
+_COMPRESSION_LEVEL = 6
+_DURATION_KIND = struct.Struct("<B")
+_INT_DURATION = struct.Struct("<q")
+_FLOAT_DURATION = struct.Struct("<d")
+_TIMESTAMP_LENGTH = struct.Struct("<I")
+_INT_KIND = 0
+_FLOAT_KIND = 1
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+_COUNTS = struct.Struct("<IH")
+_LOCALE_LENGTH = struct.Struct("<H")
+# Phrase columns in stored order: offsets, durations, speakers, locale indexes, confidences, display ends.
+_COLUMN_TYPECODES = ("q", "d", "i", "H", "d", "q")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("transcripts", sa.Column("encoded_content", sa.LargeBinary(), nullable=True))
+    transcripts = _transcripts_table(sa.String(), sa.LargeBinary(), "content", "encoded_content")
+    _backfill(transcripts, "content", "encoded_content", _encode_row)
+    op.drop_column("transcripts", "content")
+    op.alter_column("transcripts", "encoded_content", new_column_name="content", nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column("transcripts", sa.Column("json_content", sa.String(), nullable=True))
+    transcripts = _transcripts_table(sa.LargeBinary(), sa.String(), "content", "json_content")
+    _backfill(transcripts, "content", "json_content", _decode_row)
+    op.drop_column("transcripts", "content")
+    op.alter_column("transcripts", "json_content", new_column_name="content", nullable=False)
+
+
+def _transcripts_table(source_type: sa.types.TypeEngine, target_type: sa.types.TypeEngine, source: str, target: str):
+    return sa.table(
+        "transcripts",
+        sa.column("id", sa.String()),
+        sa.column("segment_count", sa.Integer()),
+        sa.column(source, source_type),
+        sa.column(target, target_type),
+    )
+
+
+def _backfill(transcripts: sa.TableClause, source: str, target: str, convert) -> None:
+    # Converted in batches so that large tables are never loaded at once.
+    connection = op.get_bind()
+    while True:
+        rows = connection.execute(
+            sa.select(transcripts.c.id, transcripts.c.segment_count, transcripts.c[source])
+            .where(transcripts.c[target].is_(None))
+            .order_by(transcripts.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+        for transcript_id, segment_count, value in rows:
+            connection.execute(
+                transcripts.update()
+                .where(transcripts.c.id == transcript_id)
+                .values({target: convert(value, segment_count)})
+            )
+
+
+def _encode_row(content: str, segment_count: int) -> bytes:
+    document = json.loads(content)
+    # Segmented transcripts keep only their top-level fields here, their phrases live in the segments table.
+    phrases = [] if segment_count else document["phrases"]
+    return _encode(document["timestamp"], document["duration_in_ticks"], phrases)
+
+
+def _decode_row(content: bytes, segment_count: int) -> str:
+    timestamp, duration_in_ticks, phrases = _decode(content)
+    if segment_count:
+        return json.dumps({"timestamp": timestamp, "duration_in_ticks": duration_in_ticks})
+    return json.dumps(
+        {"timestamp": timestamp, "duration_in_ticks": duration_in_ticks, "phrases": phrases}, ensure_ascii=False
+    )
+
+
+def _encode(timestamp: str, duration_in_ticks: int | float, phrases: list[dict[str, Any]]) -> bytes:
+    if isinstance(duration_in_ticks, int) and _INT64_MIN <= duration_in_ticks <= _INT64_MAX:
+        duration = _DURATION_KIND.pack(_INT_KIND) + _INT_DURATION.pack(duration_in_ticks)
+    else:
+        duration = _DURATION_KIND.pack(_FLOAT_KIND) + _FLOAT_DURATION.pack(duration_in_ticks)
+    encoded_timestamp = timestamp.encode("utf-8")
+    payload = b"".join(
+        [duration, _TIMESTAMP_LENGTH.pack(len(encoded_timestamp)), encoded_timestamp, _encode_phrases(phrases)]
+    )
+    return _MAGIC + bytes([_FORMAT_VERSION]) + zlib.compress(payload, _COMPRESSION_LEVEL)
+
+
+def _encode_phrases(phrases: list[dict[str, Any]]) -> bytes:
+    columns = tuple(array(typecode) for typecode in _COLUMN_TYPECODES)
+    offsets, durations, speakers, locale_indexes, confidences, display_ends = columns
+    locale_index_by_name: dict[str, int] = {}
+    displays = []
+    display_length = 0
+    for phrase in phrases:
+        offsets.append(phrase["offset_milliseconds"])
+        durations.append(phrase["duration_in_ticks"])
+        speakers.append(phrase["speaker"])
+        locale_indexes.append(locale_index_by_name.setdefault(phrase["locale"], len(locale_index_by_name)))
+        confidences.append(phrase["confidence"])
+        displays.append(phrase["display"])
+        display_length += len(phrase["display"])
+        display_ends.append(display_length)
+    parts = [_COUNTS.pack(len(phrases), len(locale_index_by_name))]
+    for locale in locale_index_by_name:
+        encoded_locale = locale.encode("utf-8")
+        parts.append(_LOCALE_LENGTH.pack(len(encoded_locale)))
+        parts.append(encoded_locale)
+    for column in columns:
+        if sys.byteorder == "big":
+            column.byteswap()
+        parts.append(column.tobytes())
+    parts.append("".join(displays).encode("utf-8"))
+    return b"".join(parts)
+
+
+def _decode(data: bytes) -> tuple[str, int | float, list[dict[str, Any]]]:
+    if data[: len(_MAGIC)] != _MAGIC or data[len(_MAGIC)] != _FORMAT_VERSION:
+        raise ValueError("Unsupported transcript storage format.")
+    payload = zlib.decompress(data[len(_MAGIC) + 1 :])
+    (kind,) = _DURATION_KIND.unpack_from(payload)
+    position = _DURATION_KIND.size
+    duration_struct = _INT_DURATION if kind == _INT_KIND else _FLOAT_DURATION
+    (duration_in_ticks,) = duration_struct.unpack_from(payload, position)
+    position += duration_struct.size
+    (timestamp_length,) = _TIMESTAMP_LENGTH.unpack_from(payload, position)
+    position += _TIMESTAMP_LENGTH.size
+    timestamp = payload[position : position + timestamp_length].decode("utf-8")
+    position += timestamp_length
+    return timestamp, duration_in_ticks, _decode_phrases(payload[position:])
+
+
+def _decode_phrases(data: bytes) -> list[dict[str, Any]]:
+    count, locale_count = _COUNTS.unpack_from(data)
+    position = _COUNTS.size
+    locales = []
+    for _ in range(locale_count):
+        (length,) = _LOCALE_LENGTH.unpack_from(data, position)
+        position += _LOCALE_LENGTH.size
+        locales.append(data[position : position + length].decode("utf-8"))
+        position += length
+    columns = []
+    for typecode in _COLUMN_TYPECODES:
+        column = array(typecode)
+        end = position + count * column.itemsize
+        column.frombytes(data[position:end])
+        if sys.byteorder == "big":
+            column.byteswap()
+        columns.append(column)
+        position = end
+    offsets, durations, speakers, locale_indexes, confidences, display_ends = columns
+    display_text = data[position:].decode("utf-8")
+    return [
+        {
+            "offset_milliseconds": offsets[index],
+            "duration_in_ticks": durations[index],
+            "display": display_text[display_ends[index - 1] if index > 0 else 0 : display_ends[index]],
+            "speaker": speakers[index],
+            "locale": locales[locale_indexes[index]],
+            "confidence": confidences[index],
+        }
+        for index in range(count)
+    ]
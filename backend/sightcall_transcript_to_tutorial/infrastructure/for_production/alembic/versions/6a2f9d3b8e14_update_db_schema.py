@@ -0,0 +1,28 @@
+"""Update DB schema
+
+Revision ID: 6a2f9d3b8e14
+Revises: 4b7e0d9a5c28
+Create Date: 2026-10-17 22:14:37.508193
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6a2f9d3b8e14"
+down_revision: Union[str, Sequence[str], None] = "4b7e0d9a5c28"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("tutorial_generation_jobs", sa.Column("claim_token", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("tutorial_generation_jobs", "claim_token")
@@ -0,0 +1,43 @@
+"""Update DB schema
+
+Revision ID: 7b3e9c05a1d8
+Revises: e27b5c0f9d14
+Create Date: 2026-10-17 15:12:41.603527
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7b3e9c05a1d8"
+down_revision: Union[str, Sequence[str], None] = "e27b5c0f9d14"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "tutorial_generation_jobs",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("transcript_id", sa.String(), nullable=False),
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("tutorial_id", sa.String(), nullable=True),
+        sa.Column("error", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_tutorial_generation_jobs_status_created_at", "tutorial_generation_jobs", ["status", "created_at"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_tutorial_generation_jobs_status_created_at", table_name="tutorial_generation_jobs")
+    op.drop_table("tutorial_generation_jobs")
@@ -0,0 +1,37 @@
+"""Update DB schema
+
+Revision ID: 8e4b1c7d2f05
+Revises: 2d6a8f4c1e93
+Create Date: 2026-10-17 19:03:27.541806
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8e4b1c7d2f05"
+down_revision: Union[str, Sequence[str], None] = "2d6a8f4c1e93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "user_tutorial_counts",
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("tutorial_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.execute(
+        "INSERT INTO user_tutorial_counts (user_id, tutorial_count) "
+        "SELECT user_id, COUNT(*) FROM tutorials GROUP BY user_id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("user_tutorial_counts")
@@ -0,0 +1,36 @@
+"""Update DB schema
+
+Revision ID: 9c1e4b7d2a60
+Revises: b404fa5bb2a5
+Create Date: 2026-10-17 09:12:41.305518
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c1e4b7d2a60"
+down_revision: Union[str, Sequence[str], None] = "b404fa5bb2a5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "transcript_segments",
+        sa.Column("transcript_id", sa.String(), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("phrases", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("transcript_id", "position"),
+    )
+    op.add_column("transcripts", sa.Column("segment_count", sa.Integer(), server_default="0", nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("transcripts", "segment_count")
+    op.drop_table("transcript_segments")
@@ -0,0 +1,169 @@
+"""Update DB schema
+
+Revision ID: a3c8e5f1d927
+Revises: 6a2f9d3b8e14
+Create Date: 2026-10-18 09:41:52.306714
+
+"""
+
+import json
+import struct
+import sys
+import zlib
+from array import array
+from typing import Any, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3c8e5f1d927"
+down_revision: Union[str, Sequence[str], None] = "6a2f9d3b8e14"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 500
+
+# Frozen copy of version 2 of the stored segment format (see the transcript_content_codec module as of this
+# revision), so that replaying this migration does not depend on how the application encodes segments later on.
+_MAGIC = b"STC"
+_FORMAT_VERSION = 2
+_COMPRESSION_LEVEL = 6
+_COUNTS = struct.Struct("<IH")
+_DURATIONS_TYPECODE = struct.Struct("<c")
+_LOCALE_LENGTH = struct.Struct("<H")
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+# Phrase columns in stored order: offsets, durations, speakers, locale indexes, confidences, display ends.
+_COLUMN_TYPECODES = ("q", None, "i", "H", "d", "q")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("transcript_segments", sa.Column("encoded_phrases", sa.LargeBinary(), nullable=True))
+    segments = _segments_table(sa.String(), sa.LargeBinary(), "phrases", "encoded_phrases")
+    _backfill(segments, "phrases", "encoded_phrases", _encode_segment)
+    op.drop_column("transcript_segments", "phrases")
+    op.alter_column("transcript_segments", "encoded_phrases", new_column_name="phrases", nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column("transcript_segments", sa.Column("json_phrases", sa.String(), nullable=True))
+    segments = _segments_table(sa.LargeBinary(), sa.String(), "phrases", "json_phrases")
+    _backfill(segments, "phrases", "json_phrases", _decode_segment)
+    op.drop_column("transcript_segments", "phrases")
+    op.alter_column("transcript_segments", "json_phrases", new_column_name="phrases", nullable=False)
+
+
+def _segments_table(source_type: sa.types.TypeEngine, target_type: sa.types.TypeEngine, source: str, target: str):
+    return sa.table(
+        "transcript_segments",
+        sa.column("transcript_id", sa.String()),
+        sa.column("position", sa.Integer()),
+        sa.column(source, source_type),
+        sa.column(target, target_type),
+    )
+
+
+def _backfill(segments: sa.TableClause, source: str, target: str, convert) -> None:
+    # Converted in batches so that large tables are never loaded at once.
+    connection = op.get_bind()
+    while True:
+        rows = connection.execute(
+            sa.select(segments.c.transcript_id, segments.c.position, segments.c[source])
+            .where(segments.c[target].is_(None))
+            .order_by(segments.c.transcript_id, segments.c.position)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+        for transcript_id, position, value in rows:
+            connection.execute(
+                segments.update()
+                .where(segments.c.transcript_id == transcript_id, segments.c.position == position)
+                .values({target: convert(value)})
+            )
+
+
+def _encode_segment(phrases: str) -> bytes:
+    payload = _encode_phrases(json.loads(phrases))
+    return _MAGIC + bytes([_FORMAT_VERSION]) + zlib.compress(payload, _COMPRESSION_LEVEL)
+
+
+def _decode_segment(data: bytes) -> str:
+    if data[: len(_MAGIC)] != _MAGIC or data[len(_MAGIC)] != _FORMAT_VERSION:
+        raise ValueError("Unsupported transcript segment storage format.")
+    return json.dumps(_decode_phrases(zlib.decompress(data[len(_MAGIC) + 1 :])))
+
+
+def _encode_phrases(phrases: list[dict[str, Any]]) -> bytes:
+    integer_durations = all(
+        isinstance(phrase["duration_in_ticks"], int) and _INT64_MIN <= phrase["duration_in_ticks"] <= _INT64_MAX
+        for phrase in phrases
+    )
+    durations_typecode = "q" if integer_durations else "d"
+    columns = tuple(array(typecode or durations_typecode) for typecode in _COLUMN_TYPECODES)
+    offsets, durations, speakers, locale_indexes, confidences, display_ends = columns
+    locale_index_by_name: dict[str, int] = {}
+    displays = []
+    display_length = 0
+    for phrase in phrases:
+        offsets.append(phrase["offset_milliseconds"])
+        durations.append(phrase["duration_in_ticks"])
+        speakers.append(phrase["speaker"])
+        locale_indexes.append(locale_index_by_name.setdefault(phrase["locale"], len(locale_index_by_name)))
+        confidences.append(phrase["confidence"])
+        displays.append(phrase["display"])
+        display_length += len(phrase["display"])
+        display_ends.append(display_length)
+    parts = [
+        _COUNTS.pack(len(phrases), len(locale_index_by_name)),
+        _DURATIONS_TYPECODE.pack(durations_typecode.encode("ascii")),
+    ]
+    for locale in locale_index_by_name:
+        encoded_locale = locale.encode("utf-8")
+        parts.append(_LOCALE_LENGTH.pack(len(encoded_locale)))
+        parts.append(encoded_locale)
+    for column in columns:
+        if sys.byteorder == "big":
+            column.byteswap()
+        parts.append(column.tobytes())
+    parts.append("".join(displays).encode("utf-8"))
+    return b"".join(parts)
+
+
+def _decode_phrases(data: bytes) -> list[dict[str, Any]]:
+    count, locale_count = _COUNTS.unpack_from(data)
+    position = _COUNTS.size
+    (encoded_typecode,) = _DURATIONS_TYPECODE.unpack_from(data, position)
+    durations_typecode = encoded_typecode.decode("ascii")
+    position += _DURATIONS_TYPECODE.size
+    locales = []
+    for _ in range(locale_count):
+        (length,) = _LOCALE_LENGTH.unpack_from(data, position)
+        position += _LOCALE_LENGTH.size
+        locales.append(data[position : position + length].decode("utf-8"))
+        position += length
+    columns = []
+    for typecode in _COLUMN_TYPECODES:
+        column = array(typecode or durations_typecode)
+        end = position + count * column.itemsize
+        column.frombytes(data[position:end])
+        if sys.byteorder == "big":
+            column.byteswap()
+        columns.append(column)
+        position = end
+    offsets, durations, speakers, locale_indexes, confidences, display_ends = columns
+    display_text = data[position:].decode("utf-8")
+    return [
+        {
+            "offset_milliseconds": offsets[index],
+            "duration_in_ticks": durations[index],
+            "display": display_text[display_ends[index - 1] if index > 0 else 0 : display_ends[index]],
+            "speaker": speakers[index],
+            "locale": locales[locale_indexes[index]],
+            "confidence": confidences[index],
+        }
+        for index in range(count)
+    ]
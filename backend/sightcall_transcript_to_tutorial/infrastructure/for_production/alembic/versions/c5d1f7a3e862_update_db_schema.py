@@ -0,0 +1,38 @@
+"""Update DB schema
+
+Revision ID: c5d1f7a3e862
+Revises: 7b3e9c05a1d8
+Create Date: 2026-10-17 16:04:19.377150
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d1f7a3e862"
+down_revision: Union[str, Sequence[str], None] = "7b3e9c05a1d8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "generated_tutorial_cache",
+        sa.Column("cache_key", sa.String(), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("content", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_used_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("cache_key"),
+    )
+    op.create_index("ix_generated_tutorial_cache_last_used_at", "generated_tutorial_cache", ["last_used_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_generated_tutorial_cache_last_used_at", table_name="generated_tutorial_cache")
+    op.drop_table("generated_tutorial_cache")
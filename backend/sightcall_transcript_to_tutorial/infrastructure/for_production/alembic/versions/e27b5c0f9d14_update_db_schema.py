@@ -0,0 +1,29 @@
+"""Update DB schema
+
+Revision ID: e27b5c0f9d14
+Revises: 4f8a2d91c3b7
+Create Date: 2026-10-17 13:47:05.218934
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e27b5c0f9d14"
+down_revision: Union[str, Sequence[str], None] = "4f8a2d91c3b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows were validated under the current rules, on upload or by the previous backfill.
+    op.add_column("transcripts", sa.Column("schema_version", sa.Integer(), server_default="1", nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("transcripts", "schema_version")
@@ -0,0 +1,27 @@
+"""Update DB schema
+
+Revision ID: f3a9c2e6b7d1
+Revises: 8e4b1c7d2f05
+Create Date: 2026-10-17 19:41:09.382517
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3a9c2e6b7d1"
+down_revision: Union[str, Sequence[str], None] = "8e4b1c7d2f05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_tutorials_user_id_updated_at", "tutorials", ["user_id", "updated_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_tutorials_user_id_updated_at", table_name="tutorials")
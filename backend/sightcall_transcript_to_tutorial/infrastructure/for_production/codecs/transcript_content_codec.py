@@ -0,0 +1,92 @@
+import struct
+import zlib
+
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_content import TranscriptContent
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_phrases import TranscriptPhrases
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_phrases_builder import TranscriptPhrasesBuilder
+
+# Stored layout: MAGIC, FORMAT_VERSION, then the zlib-compressed payload. The payload starts with the duration
+# (a kind flag then an int64 or a float64) and the length-prefixed UTF-8 timestamp, followed by the phrase columns
+# as serialized by TranscriptPhrases.to_bytes. Segments of transcripts ingested in chunks have the same layout, their
+# payload holding the phrase columns only.
+MAGIC = b"STC"
+FORMAT_VERSION = 2
+# Version 1 stored every phrase duration as a float, without the type code of the column.
+_FLOAT_DURATIONS_FORMAT_VERSION = 1
+_READABLE_FORMAT_VERSIONS = (_FLOAT_DURATIONS_FORMAT_VERSION, FORMAT_VERSION)
+_DURATION_KIND = struct.Struct("<B")
+_INT_DURATION = struct.Struct("<q")
+_FLOAT_DURATION = struct.Struct("<d")
+_TIMESTAMP_LENGTH = struct.Struct("<I")
+_INT_KIND = 0
+_FLOAT_KIND = 1
+_COMPRESSION_LEVEL = 6
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+
+def encode_transcript_content(content: TranscriptContent) -> bytes:
+    """Encode a transcript's fields and phrase columns into the compact stored format."""
+    return _encode(content.timestamp, content.duration_in_ticks, content.phrases)
+
+
+def decode_transcript_content(data: bytes) -> TranscriptContent:
+    """Decode a stored transcript; the content was validated at upload and is not validated again."""
+    timestamp, duration_in_ticks, phrases = _decode(data)
+    return TranscriptContent.from_trusted(timestamp, duration_in_ticks, phrases)
+
+
+def encode_transcript_header(timestamp: str, duration_in_ticks: int | float) -> bytes:
+    """Encode the top-level fields of a transcript whose phrases are stored in segments."""
+    return _encode(timestamp, duration_in_ticks, TranscriptPhrasesBuilder().build())
+
+
+def decode_transcript_header(data: bytes) -> tuple[str, int | float]:
+    """Decode the top-level fields stored by `encode_transcript_header` (or `encode_transcript_content`)."""
+    timestamp, duration_in_ticks, _ = _decode(data)
+    return timestamp, duration_in_ticks
+
+
+def encode_transcript_segment(phrases: TranscriptPhrases) -> bytes:
+    """Encode the phrase columns of one segment of a transcript ingested in chunks."""
+    return _envelope(phrases.to_bytes())
+
+
+def decode_transcript_segment(data: bytes) -> TranscriptPhrases:
+    """Decode a segment stored by `encode_transcript_segment`; its phrases are not validated again."""
+    if data[: len(MAGIC)] != MAGIC or data[len(MAGIC)] != FORMAT_VERSION:
+        raise ValueError("Unsupported transcript segment storage format.")
+    return TranscriptPhrases.from_bytes(zlib.decompress(data[len(MAGIC) + 1 :]))
+
+
+def _encode(timestamp: str, duration_in_ticks: int | float, phrases: TranscriptPhrases) -> bytes:
+    if isinstance(duration_in_ticks, int) and _INT64_MIN <= duration_in_ticks <= _INT64_MAX:
+        duration = _DURATION_KIND.pack(_INT_KIND) + _INT_DURATION.pack(duration_in_ticks)
+    else:
+        duration = _DURATION_KIND.pack(_FLOAT_KIND) + _FLOAT_DURATION.pack(duration_in_ticks)
+    encoded_timestamp = timestamp.encode("utf-8")
+    payload = b"".join(
+        [duration, _TIMESTAMP_LENGTH.pack(len(encoded_timestamp)), encoded_timestamp, phrases.to_bytes()]
+    )
+    return _envelope(payload)
+
+
+def _envelope(payload: bytes) -> bytes:
+    return MAGIC + bytes([FORMAT_VERSION]) + zlib.compress(payload, _COMPRESSION_LEVEL)
+
+
+def _decode(data: bytes) -> tuple[str, int | float, TranscriptPhrases]:
+    if data[: len(MAGIC)] != MAGIC or data[len(MAGIC)] not in _READABLE_FORMAT_VERSIONS:
+        raise ValueError("Unsupported transcript storage format.")
+    durations_typecode = "d" if data[len(MAGIC)] == _FLOAT_DURATIONS_FORMAT_VERSION else None
+    payload = zlib.decompress(data[len(MAGIC) + 1 :])
+    (kind,) = _DURATION_KIND.unpack_from(payload)
+    position = _DURATION_KIND.size
+    duration_struct = _INT_DURATION if kind == _INT_KIND else _FLOAT_DURATION
+    (duration_in_ticks,) = duration_struct.unpack_from(payload, position)
+    position += duration_struct.size
+    (timestamp_length,) = _TIMESTAMP_LENGTH.unpack_from(payload, position)
+    position += _TIMESTAMP_LENGTH.size
+    timestamp = payload[position : position + timestamp_length].decode("utf-8")
+    position += timestamp_length
+    return timestamp, duration_in_ticks, TranscriptPhrases.from_bytes(payload[position:], durations_typecode)
@@ -1,5 +1,5 @@
-import asyncio
-from typing import Any
+from contextlib import nullcontext
+from typing import Any, ContextManager
 from urllib.parse import urlencode
 
 import httpx
@@ -36,10 +36,13 @@ class GitHubAuthenticationGateway(AuthenticationGatewayInterface):
     """
     Production gateway for GitHub OAuth 2.0 and JWT handling.
     Implements AuthenticationGatewayInterface.
+    GitHub calls go through `http_client` when given, so that its connections are reused across gateways; otherwise
+    each call opens a client of its own.
     """
 
-    def __init__(self, user_repository: UserRepositoryInterface):
+    def __init__(self, user_repository: UserRepositoryInterface, http_client: httpx.Client | None = None):
         self._user_repository = user_repository
+        self._http_client = http_client
         self._initialize_configuration()
 
     def get_login_url(self) -> str:
@@ -156,7 +159,7 @@ class GitHubAuthenticationGateway(AuthenticationGatewayInterface):
     def _exchange_code_for_access_token(self, code: str) -> str:
         """Exchange the OAuth code for an access token using GitHub's API."""
         try:
-            token_data = asyncio.run(self._perform_token_exchange(code))
+            token_data = self._perform_token_exchange(code)
         except Exception as error:
             raise GitHubOAuthError(f"Failed to exchange code for access token: {error}") from error
 
@@ -168,14 +171,14 @@ class GitHubAuthenticationGateway(AuthenticationGatewayInterface):
     def _fetch_github_user_profile(self, access_token: str) -> dict[str, Any]:
         """Fetch the GitHub user profile using the access token."""
         try:
-            return asyncio.run(self._perform_user_profile_fetch(access_token))
+            return self._perform_user_profile_fetch(access_token)
         except Exception as error:
             raise GitHubOAuthError(f"Failed to fetch GitHub user profile: {error}") from error
 
     def _fetch_primary_email(self, access_token: str) -> str:
         """Fetch the user's primary email from the /user/emails endpoint."""
         try:
-            emails = asyncio.run(self._perform_emails_fetch(access_token))
+            emails = self._perform_emails_fetch(access_token)
             return self._extract_primary_verified_email(emails)
         except Exception:
             return ""
@@ -206,10 +209,10 @@ class GitHubAuthenticationGateway(AuthenticationGatewayInterface):
         except (KeyError, ValueError) as error:
             raise GitHubOAuthError(f"Malformed GitHub user data: {error}") from error
 
-    async def _perform_token_exchange(self, code: str) -> dict[str, Any]:
-        """Perform async token exchange with GitHub."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
+    def _perform_token_exchange(self, code: str) -> dict[str, Any]:
+        """Perform token exchange with GitHub."""
+        with self._client() as client:
+            response = client.post(
                 GITHUB_TOKEN_URL,
                 data=self._build_token_exchange_data(code),
                 headers={"Accept": JSON_ACCEPT_HEADER},
@@ -217,26 +220,32 @@ class GitHubAuthenticationGateway(AuthenticationGatewayInterface):
             response.raise_for_status()
             return response.json()
 
-    async def _perform_user_profile_fetch(self, access_token: str) -> dict[str, Any]:
-        """Perform async user profile fetch from GitHub."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
+    def _perform_user_profile_fetch(self, access_token: str) -> dict[str, Any]:
+        """Perform user profile fetch from GitHub."""
+        with self._client() as client:
+            response = client.get(
                 GITHUB_USER_API_URL,
                 headers={"Authorization": AUTHORIZATION_HEADER_TEMPLATE.format(access_token)},
             )
             response.raise_for_status()
             return response.json()
 
-    async def _perform_emails_fetch(self, access_token: str) -> list[dict[str, Any]]:
-        """Perform async emails fetch from GitHub."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
+    def _perform_emails_fetch(self, access_token: str) -> list[dict[str, Any]]:
+        """Perform emails fetch from GitHub."""
+        with self._client() as client:
+            response = client.get(
                 GITHUB_USER_EMAILS_API_URL,
                 headers={"Authorization": AUTHORIZATION_HEADER_TEMPLATE.format(access_token)},
             )
             response.raise_for_status()
             return response.json()
 
+    def _client(self) -> ContextManager[httpx.Client]:
+        """Return the shared HTTP client, or a client to close after the call when none was given."""
+        if self._http_client is not None:
+            return nullcontext(self._http_client)
+        return httpx.Client()
+
     def _build_token_exchange_data(self, code: str) -> dict[str, str]:
         """Build data payload for token exchange request."""
         return {
@@ -0,0 +1,40 @@
+import threading
+
+from sightcall_transcript_to_tutorial.domain.entities.tutorial import Tutorial
+from sightcall_transcript_to_tutorial.domain.gateways.tutorial_generation_lock_interface import (
+    TutorialGenerationLockInterface,
+)
+
+
+class InProcessTutorialGenerationLock(TutorialGenerationLockInterface):
+    """
+    One lock per key for the threads of this process. A key's lock, and the tutorial handed over under it, are dropped
+    once nobody holds or waits for it, so that memory does not grow with the number of transcripts ever generated.
+    """
+
+    def __init__(self) -> None:
+        self._locks: dict[str, threading.Lock] = {}
+        self._users: dict[str, int] = {}
+        self._tutorials: dict[str, Tutorial] = {}
+        self._guard = threading.Lock()
+
+    def acquire(self, key: str) -> Tutorial | None:
+        with self._guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+            self._users[key] = self._users.get(key, 0) + 1
+        lock.acquire()
+        with self._guard:
+            return self._tutorials.get(key)
+
+    def release(self, key: str, tutorial: Tutorial | None = None) -> None:
+        with self._guard:
+            lock = self._locks[key]
+            self._users[key] -= 1
+            if not self._users[key]:
+                del self._locks[key]
+                del self._users[key]
+                self._tutorials.pop(key, None)
+            elif tutorial is not None:
+                self._tutorials[key] = tutorial
+        # A plain Lock, unlike an RLock, can be released by another thread than the one that acquired it.
+        lock.release()
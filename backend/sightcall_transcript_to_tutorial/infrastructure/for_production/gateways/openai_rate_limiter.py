@@ -0,0 +1,209 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Awaitable, Callable, Mapping, Protocol, TypeVar
+
+from openai import APIConnectionError, APIStatusError, RateLimitError
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth sending a request again for, besides 429: the ones the OpenAI SDK retries itself.
+_TRANSIENT_STATUS_CODES = frozenset({408, 409})
+
+
+class _ResponseWithHeaders(Protocol):
+    @property
+    def headers(self) -> Mapping[str, str]: ...
+
+
+ResponseT = TypeVar("ResponseT", bound=_ResponseWithHeaders)
+
+
+class _TokenBucket:
+    """A bucket of `capacity` units per minute, refilled continuously."""
+
+    def __init__(self, capacity: float, now: float):
+        self.capacity = capacity
+        self.level = capacity
+        self._updated_at = now
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self._updated_at) * self.capacity / 60)
+        self._updated_at = now
+
+    def seconds_until(self, amount: float) -> float:
+        missing = min(amount, self.capacity) - self.level
+        return max(0.0, missing * 60 / self.capacity)
+
+    def take(self, amount: float) -> None:
+        self.level -= min(amount, self.capacity)
+
+
+class OpenAIRateLimiter:
+    """
+    Client-side scheduler keeping OpenAI calls within the requests and tokens per minute of the account.
+    Each call first reserves one request and its estimated tokens (prompt plus `max_tokens`, as OpenAI counts them),
+    waiting for the buckets to refill if needed. The buckets are resynchronized from the `x-ratelimit-*` headers of
+    every answer, so that calls made by other processes with the same key are accounted for.
+    Concurrency adapts to the answers: it grows by one call per round of successes while the quota is not nearly
+    exhausted, and halves on a 429. Rate-limited calls are retried with jittered exponential backoff, waiting at least
+    as long as `Retry-After` asks. Transient failures (connection errors, timeouts, 408, 409 and 5xx answers) are
+    retried with the same backoff, as the SDK's own retries are turned off in favor of these.
+    Thread-safe, and usable from threads (`call`) and event loops (`call_async`) at once.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        max_concurrency: int,
+        max_retries: int = 5,
+        base_backoff_seconds: float = 0.5,
+        max_backoff_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        now = clock()
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_backoff_seconds = base_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self._requests = _TokenBucket(requests_per_minute, now)
+        self._tokens = _TokenBucket(tokens_per_minute, now)
+        self._concurrency_limit = float(max_concurrency)
+        self._in_flight = 0
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        # How long to wait before checking again when every concurrency slot is taken.
+        self._slot_poll_seconds = 0.05
+
+    @property
+    def concurrency_limit(self) -> int:
+        return max(1, int(self._concurrency_limit))
+
+    def call(self, send: Callable[[], ResponseT], estimated_tokens: int) -> ResponseT:
+        """Send a request with `send` once the quota allows it, retrying it while it is rate limited."""
+        attempt = 0
+        while True:
+            while (wait := self._reserve(estimated_tokens)) > 0:
+                self._sleep(wait)
+            try:
+                response = send()
+            except RateLimitError as error:
+                wait = self._on_rate_limited(error, attempt)
+            except (APIConnectionError, APIStatusError) as error:
+                wait = self._on_failed(error, attempt)
+            else:
+                self._on_success(response.headers)
+                return response
+            finally:
+                self._release()
+            self._sleep(wait)
+            attempt += 1
+
+    async def call_async(self, send: Callable[[], Awaitable[ResponseT]], estimated_tokens: int) -> ResponseT:
+        """Same as `call`, awaiting instead of blocking the thread."""
+        attempt = 0
+        while True:
+            while (wait := self._reserve(estimated_tokens)) > 0:
+                await asyncio.sleep(wait)
+            try:
+                response = await send()
+            except RateLimitError as error:
+                wait = self._on_rate_limited(error, attempt)
+            except (APIConnectionError, APIStatusError) as error:
+                wait = self._on_failed(error, attempt)
+            else:
+                self._on_success(response.headers)
+                return response
+            finally:
+                self._release()
+            await asyncio.sleep(wait)
+            attempt += 1
+
+    def _reserve(self, estimated_tokens: int) -> float:
+        """Take a slot, a request and the tokens and return 0, or return how long to wait before trying again."""
+        with self._lock:
+            if self._in_flight >= self.concurrency_limit:
+                return self._slot_poll_seconds
+            now = self._clock()
+            self._requests.refill(now)
+            self._tokens.refill(now)
+            wait = max(self._requests.seconds_until(1), self._tokens.seconds_until(estimated_tokens))
+            if wait > 0:
+                return wait
+            self._requests.take(1)
+            self._tokens.take(estimated_tokens)
+            self._in_flight += 1
+            return 0.0
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def _on_success(self, headers: Mapping[str, str]) -> None:
+        with self._lock:
+            nearly_exhausted = self._sync_buckets(headers)
+            if not nearly_exhausted:
+                self._concurrency_limit = min(
+                    self.max_concurrency, self._concurrency_limit + 1 / self._concurrency_limit
+                )
+
+    def _on_rate_limited(self, error: RateLimitError, attempt: int) -> float:
+        """Slow down and return how long to wait before retrying, or raise when out of retries or retrying is pointless."""
+        # An exhausted billing quota is also a 429, but waiting does not help.
+        if error.code == "insufficient_quota" or attempt >= self.max_retries:
+            raise error
+        headers = error.response.headers
+        with self._lock:
+            self._sync_buckets(headers)
+            self._concurrency_limit = max(1.0, self._concurrency_limit / 2)
+        backoff = random.uniform(0, min(self.max_backoff_seconds, self.base_backoff_seconds * 2**attempt))
+        wait = max(backoff, _retry_after_seconds(headers) or 0.0)
+        logger.warning(
+            "OpenAI rate limit hit, retrying in %.2fs with at most %d calls at once", wait, self.concurrency_limit
+        )
+        return wait
+
+    def _on_failed(self, error: APIConnectionError | APIStatusError, attempt: int) -> float:
+        """Return how long to wait before retrying a transient failure, or raise when out of retries or not transient."""
+        transient = isinstance(error, APIConnectionError) or (
+            error.status_code in _TRANSIENT_STATUS_CODES or error.status_code >= 500
+        )
+        if not transient or attempt >= self.max_retries:
+            raise error
+        backoff = random.uniform(0, min(self.max_backoff_seconds, self.base_backoff_seconds * 2**attempt))
+        retry_after = _retry_after_seconds(error.response.headers) if isinstance(error, APIStatusError) else None
+        wait = max(backoff, retry_after or 0.0)
+        logger.warning("OpenAI call failed (%r), retrying in %.2fs", error, wait)
+        return wait
+
+    def _sync_buckets(self, headers: Mapping[str, str]) -> bool:
+        """Align the buckets with what OpenAI reports and tell whether either is below a tenth of its capacity."""
+        nearly_exhausted = False
+        for bucket, kind in ((self._requests, "requests"), (self._tokens, "tokens")):
+            limit = _header_number(headers, f"x-ratelimit-limit-{kind}")
+            if limit:
+                bucket.capacity = limit
+            remaining = _header_number(headers, f"x-ratelimit-remaining-{kind}")
+            if remaining is not None:
+                bucket.level = min(bucket.level, remaining)
+            nearly_exhausted = nearly_exhausted or bucket.level < bucket.capacity / 10
+        return nearly_exhausted
+
+
+def _retry_after_seconds(headers: Mapping[str, str]) -> float | None:
+    retry_after_milliseconds = _header_number(headers, "retry-after-ms")
+    if retry_after_milliseconds is not None:
+        return retry_after_milliseconds / 1000
+    return _header_number(headers, "retry-after")
+
+
+def _header_number(headers: Mapping[str, str], name: str) -> float | None:
+    try:
+        return float(headers[name])
+    except (KeyError, ValueError):
+        return None
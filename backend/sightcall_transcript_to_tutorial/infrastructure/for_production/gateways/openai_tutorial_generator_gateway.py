@@ -1,70 +1,352 @@
-from openai import OpenAI
+import asyncio
+import hashlib
+import json
+import logging
+import re
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from openai import AsyncOpenAI, OpenAI
+from openai.types.shared_params import ResponseFormatJSONSchema
 
 from sightcall_transcript_to_tutorial.domain.config.settings import settings
+from sightcall_transcript_to_tutorial.domain.config.tutorial_title_mode import TutorialTitleMode
 from sightcall_transcript_to_tutorial.domain.entities.transcript import Transcript
 from sightcall_transcript_to_tutorial.domain.entities.tutorial import Tutorial
 from sightcall_transcript_to_tutorial.domain.exceptions.tutorial_generation_error import TutorialGenerationError
 from sightcall_transcript_to_tutorial.domain.gateways.tutorial_generator_gateway_interface import (
     TutorialGeneratorGatewayInterface,
 )
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_content import TranscriptContent
 from sightcall_transcript_to_tutorial.domain.value_objects.tutorial_id import TutorialId
 from sightcall_transcript_to_tutorial.domain.value_objects.user_id import UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_production.gateways.openai_rate_limiter import (
+    OpenAIRateLimiter,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_production.prompts.transcript_prompt_compactor import (
+    TranscriptPromptCompactor,
+    estimate_tokens,
+)
+
+logger = logging.getLogger(__name__)
+
+# Part of the generation cache key: bump it whenever the prompts or the response format change, so that tutorials
+# generated from the previous prompts are not served again.
+PROMPT_VERSION = 2
+SYSTEM_PROMPT = (
+    "You are a helpful assistant that generates clear, concise, and actionable tutorials. "
+    "Given a transcript of a support or troubleshooting session, your job is to extract only the meaningful steps "
+    "that contributed to resolving or handling the issue. Ignore trivial dialogue, greetings, or unrelated conversation. "
+    "Summarize the process as a step-by-step tutorial that someone else could follow to resolve a similar issue. "
+    "Each step should be clear, actionable, and only included if it adds value."
+)
+EXTRACT_STEPS_PROMPT = (
+    "Extract relevant steps from the transcript below. "
+    "Generate a clear, step-by-step tutorial summarizing how the issue was resolved or handled. "
+    "Include steps only when meaningful (avoid trivial dialogue).\n\n"
+)
+MAP_SYSTEM_PROMPT = (
+    "You are a helpful assistant that extracts the meaningful steps of a support or troubleshooting session. "
+    "You are given one part of a long session transcript. List, in order, the actions that were taken in this part "
+    "to resolve or handle the issue, as a short numbered list. Ignore trivial dialogue, greetings, or unrelated "
+    "conversation. Answer 'No steps.' if this part has none."
+)
+REDUCE_PROMPT = (
+    "The steps below were extracted, in order, from consecutive parts of a long support session. "
+    "Merge them into a single clear, step-by-step tutorial summarizing how the issue was resolved or handled. "
+    "Remove duplicates and steps that were undone later on.\n\n"
+)
+STRUCTURED_OUTPUT_INSTRUCTIONS = (
+    "\n\nReturn a JSON object with a short, descriptive `title` for the tutorial "
+    "and its step-by-step `content` in Markdown."
+)
+STREAMED_OUTPUT_INSTRUCTIONS = (
+    "\n\nWrite the tutorial in Markdown, starting with a level 1 heading holding its short, descriptive title."
+)
+TUTORIAL_RESPONSE_FORMAT: ResponseFormatJSONSchema = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "tutorial",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"title": {"type": "string"}, "content": {"type": "string"}},
+            "required": ["title", "content"],
+            "additionalProperties": False,
+        },
+    },
+}
+DEFAULT_TUTORIAL_TITLE = "Untitled tutorial"
+MAX_EXTRACTED_TITLE_LENGTH = 120
+_HEADING_PATTERN = re.compile(r"^\s{0,3}#{1,6}\s+(.+?)\s*#*\s*$")
 
 
 class OpenAITutorialGeneratorGateway(TutorialGeneratorGatewayInterface):
-    def __init__(self):
-        api_key = settings.openai_api_key
-        if not api_key:
-            raise TutorialGenerationError("OPENAI_API_KEY not set in environment/config")
-        self.openai_client = OpenAI(api_key=api_key)
+    """
+    Generate tutorials with OpenAI chat completions, through a sync client for the worker threads and an async client
+    for the event loop. Both clients keep a connection pool: build the gateway once per process and `close` it on
+    shutdown.
+    Every call goes through the rate limiter, which also owns retries: the clients' own retries are turned off.
+    """
+
+    def __init__(
+        self,
+        openai_client: OpenAI | None = None,
+        title_mode: TutorialTitleMode | None = None,
+        prompt_compactor: TranscriptPromptCompactor | None = None,
+        async_openai_client: AsyncOpenAI | None = None,
+        rate_limiter: OpenAIRateLimiter | None = None,
+    ):
+        if openai_client is None or async_openai_client is None:
+            api_key = settings.openai_api_key
+            if not api_key:
+                raise TutorialGenerationError("OPENAI_API_KEY not set in environment/config")
+            openai_client = openai_client or OpenAI(api_key=api_key)
+            async_openai_client = async_openai_client or AsyncOpenAI(api_key=api_key)
+        self.openai_client = openai_client.with_options(max_retries=0)
+        self.async_openai_client = async_openai_client.with_options(max_retries=0)
+        self.rate_limiter = rate_limiter or OpenAIRateLimiter(
+            requests_per_minute=settings.openai_requests_per_minute,
+            tokens_per_minute=settings.openai_tokens_per_minute,
+            max_concurrency=settings.openai_max_concurrency,
+            max_retries=settings.openai_max_retries,
+        )
+        self.title_mode = title_mode or settings.tutorial_title_mode
+        if prompt_compactor is None and settings.transcript_prompt_compaction:
+            prompt_compactor = TranscriptPromptCompactor(min_confidence=settings.transcript_prompt_min_confidence)
+        self.prompt_compactor = prompt_compactor
         self.model = "gpt-4o-mini"
         self.max_tokens = 10_000
         self.temperature = 0.1
+        # Transcripts longer than this are summarized part by part (map) before the parts are merged (reduce).
+        self.map_reduce_threshold_tokens = settings.transcript_map_reduce_threshold_tokens
+        self.chunk_max_tokens = settings.transcript_chunk_max_tokens
+        self.chunk_window_seconds = settings.transcript_chunk_window_seconds
+        self.map_concurrency = settings.transcript_map_concurrency
 
     def generate_tutorial(self, transcript: Transcript, user_id: UserId) -> Tutorial:
         try:
-            system_prompt = (
-                "You are a helpful assistant that generates clear, concise, and actionable tutorials. "
-                "Given a transcript of a support or troubleshooting session, your job is to extract only the meaningful steps "
-                "that contributed to resolving or handling the issue. Ignore trivial dialogue, greetings, or unrelated conversation. "
-                "Summarize the process as a step-by-step tutorial that someone else could follow to resolve a similar issue. "
-                "Each step should be clear, actionable, and only included if it adds value."
-            )
-            user_prompt = (
-                "Extract relevant steps from the transcript below. "
-                "Generate a clear, step-by-step tutorial summarizing how the issue was resolved or handled. "
-                "Include steps only when meaningful (avoid trivial dialogue).\n\n"
-                f"Transcript:\n{transcript.content}"
-            )
-            response = self.openai_client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-            )
-            content = response.choices[0].message.content.strip()
-            return Tutorial(
-                tutorial_id=TutorialId.generate(),
-                title=self._generate_tutorial_name_from_content(content),
-                content=content,
-                user_id=user_id,
+            user_prompt = self._build_user_prompt(transcript)
+            if self.title_mode == TutorialTitleMode.STRUCTURED:
+                title, content = _parse_titled_content(self._complete(self._titled_content_request(user_prompt)))
+            else:
+                content = self._complete(self._content_request(user_prompt))
+                title = self._complete(self._tutorial_name_request(content))
+            return Tutorial(tutorial_id=TutorialId.generate(), title=title, content=content, user_id=user_id)
+        except Exception as e:
+            raise TutorialGenerationError(str(e))
+
+    async def generate_tutorial_async(self, transcript: Transcript, user_id: UserId) -> Tutorial:
+        """
+        Same as `generate_tutorial` on the async client, so that waiting for the model does not hold a thread. The
+        prompt is built in a worker thread, as summarizing the parts of a long transcript takes blocking calls.
+        """
+        try:
+            user_prompt = await asyncio.to_thread(self._build_user_prompt, transcript)
+            if self.title_mode == TutorialTitleMode.STRUCTURED:
+                answer = await self._complete_async(self._titled_content_request(user_prompt))
+                title, content = _parse_titled_content(answer)
+            else:
+                content = await self._complete_async(self._content_request(user_prompt))
+                title = await self._complete_async(self._tutorial_name_request(content))
+            return Tutorial(tutorial_id=TutorialId.generate(), title=title, content=content, user_id=user_id)
+        except Exception as e:
+            raise TutorialGenerationError(str(e))
+
+    async def stream_tutorial(self, transcript: Transcript, user_id: UserId) -> AsyncIterator[str | Tutorial]:
+        """
+        Stream the tutorial's Markdown as the model writes it, in a single call whatever the title mode: the title is
+        the heading the model is asked to start with. The prompt is built in a worker thread, as summarizing the parts
+        of a long transcript takes blocking calls.
+        """
+        parts = []
+        try:
+            user_prompt = await asyncio.to_thread(self._build_user_prompt, transcript)
+            request = self._streamed_content_request(user_prompt)
+            response = await self.rate_limiter.call_async(
+                lambda: self.async_openai_client.chat.completions.with_raw_response.create(**request, stream=True),
+                _estimate_request_tokens(request),
             )
+            stream = response.parse()
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    yield delta
         except Exception as e:
             raise TutorialGenerationError(str(e))
+        content = "".join(parts).strip()
+        if not content:
+            raise TutorialGenerationError("The model returned an empty tutorial")
+        yield Tutorial(
+            tutorial_id=TutorialId.generate(),
+            title=_extract_title_from_content(content),
+            content=content,
+            user_id=user_id,
+        )
+
+    def cache_key(self, transcript: Transcript) -> str | None:
+        """
+        Hash the transcript's phrases together with everything else that shapes the answer: model, sampling settings,
+        title mode, prompt compaction, map-reduce settings and prompt version. Phrases are hashed in their columnar
+        form, so the JSON formatting of the upload does not matter.
+        """
+        compaction_fingerprint = (
+            [self.prompt_compactor.min_confidence, sorted(self.prompt_compactor.filler_words)]
+            if self.prompt_compactor
+            else None
+        )
+        settings_fingerprint = json.dumps(
+            [
+                PROMPT_VERSION,
+                self.model,
+                self.temperature,
+                self.max_tokens,
+                self.title_mode.value,
+                compaction_fingerprint,
+                [self.map_reduce_threshold_tokens, self.chunk_max_tokens, self.chunk_window_seconds],
+            ]
+        )
+        digest = hashlib.sha256(settings_fingerprint.encode("utf-8"))
+        content = transcript.content
+        if isinstance(content, TranscriptContent):
+            digest.update(content.phrases.to_bytes())
+        else:
+            digest.update(str(content).encode("utf-8"))
+        return digest.hexdigest()
+
+    async def close(self) -> None:
+        """Close the connection pools of both clients."""
+        self.openai_client.close()
+        await self.async_openai_client.close()
 
-    def _generate_tutorial_name_from_content(self, content: str) -> str:
-        prompt = f"Generate a name for a tutorial from this content:\n{content}"
-        response = self.openai_client.chat.completions.create(
-            model=self.model,
-            messages=[
+    def _build_user_prompt(self, transcript: Transcript) -> str:
+        rendered_transcript = self._render_transcript(transcript)
+        if self._needs_map_reduce(transcript, rendered_transcript):
+            return REDUCE_PROMPT + self._summarize_parts(transcript.content)
+        return EXTRACT_STEPS_PROMPT + f"Transcript:\n{rendered_transcript}"
+
+    def _needs_map_reduce(self, transcript: Transcript, rendered_transcript: str) -> bool:
+        return isinstance(transcript.content, TranscriptContent) and (
+            estimate_tokens(rendered_transcript) > self.map_reduce_threshold_tokens
+        )
+
+    def _render_transcript(self, transcript: Transcript) -> str:
+        if self.prompt_compactor is None or not isinstance(transcript.content, TranscriptContent):
+            return str(transcript.content)
+        compacted = self.prompt_compactor.compact(transcript.content)
+        logger.info(
+            "Compacted transcript %s for the prompt from ~%d to ~%d tokens",
+            transcript.transcript_id.value,
+            compacted.estimated_tokens_before,
+            compacted.estimated_tokens_after,
+        )
+        return compacted.text
+
+    def _summarize_parts(self, content: TranscriptContent) -> str:
+        chunks = self._chunk(content)
+        with ThreadPoolExecutor(max_workers=self.map_concurrency) as executor:
+            summaries = list(
+                executor.map(
+                    lambda position, chunk: self._complete(self._part_summary_request(chunk, len(chunks), position)),
+                    range(1, len(chunks) + 1),
+                    chunks,
+                )
+            )
+        return _join_part_summaries(summaries)
+
+    def _chunk(self, content: TranscriptContent) -> list[str]:
+        compactor = self.prompt_compactor or TranscriptPromptCompactor(min_confidence=0.0, filler_words=())
+        chunks = compactor.chunk(
+            content, window_milliseconds=self.chunk_window_seconds * 1000, max_tokens=self.chunk_max_tokens
+        )
+        logger.info("Summarizing a long transcript in %d parts", len(chunks))
+        return chunks
+
+    def _complete(self, request: dict[str, Any]) -> str:
+        # The raw response carries the rate limit headers the limiter adapts to.
+        response = self.rate_limiter.call(
+            lambda: self.openai_client.chat.completions.with_raw_response.create(**request),
+            _estimate_request_tokens(request),
+        )
+        return (response.parse().choices[0].message.content or "").strip()
+
+    async def _complete_async(self, request: dict[str, Any]) -> str:
+        response = await self.rate_limiter.call_async(
+            lambda: self.async_openai_client.chat.completions.with_raw_response.create(**request),
+            _estimate_request_tokens(request),
+        )
+        return (response.parse().choices[0].message.content or "").strip()
+
+    def _part_summary_request(self, chunk: str, part_count: int, position: int) -> dict[str, Any]:
+        return self._request(MAP_SYSTEM_PROMPT, f"Transcript, part {position} of {part_count}:\n{chunk}")
+
+    def _titled_content_request(self, user_prompt: str) -> dict[str, Any]:
+        return self._request(
+            SYSTEM_PROMPT + STRUCTURED_OUTPUT_INSTRUCTIONS, user_prompt, response_format=TUTORIAL_RESPONSE_FORMAT
+        )
+
+    def _content_request(self, user_prompt: str) -> dict[str, Any]:
+        return self._request(SYSTEM_PROMPT, user_prompt)
+
+    def _streamed_content_request(self, user_prompt: str) -> dict[str, Any]:
+        return self._request(SYSTEM_PROMPT + STREAMED_OUTPUT_INSTRUCTIONS, user_prompt)
+
+    def _tutorial_name_request(self, content: str) -> dict[str, Any]:
+        return {
+            "model": self.model,
+            "messages": [
                 {
                     "role": "system",
                     "content": "You are a helpful assistant that generates clear, concise, and actionable tutorials.",
                 },
-                {"role": "user", "content": prompt},
+                {"role": "user", "content": f"Generate a name for a tutorial from this content:\n{content}"},
             ],
-        )
-        return response.choices[0].message.content.strip()
+        }
+
+    def _request(self, system_prompt: str, user_prompt: str, **options: Any) -> dict[str, Any]:
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            **options,
+        }
+
+
+def _parse_titled_content(answer: str) -> tuple[str, str]:
+    try:
+        tutorial = json.loads(answer)
+        title, content = tutorial["title"].strip(), tutorial["content"].strip()
+    except (ValueError, KeyError, TypeError, AttributeError):
+        # The model did not follow the schema: keep its answer as the content.
+        title, content = "", answer
+    if not content:
+        raise TutorialGenerationError("The model returned an empty tutorial")
+    return title or _extract_title_from_content(content), content
+
+
+def _estimate_request_tokens(request: dict[str, Any]) -> int:
+    """Estimate the tokens a request counts against the quota: its messages plus the tokens it may generate."""
+    prompt = "".join(message["content"] for message in request["messages"])
+    return estimate_tokens(prompt) + request.get("max_tokens", 0)
+
+
+def _join_part_summaries(summaries: list[str]) -> str:
+    return "\n\n".join(f"Part {position}:\n{summary}" for position, summary in enumerate(summaries, start=1))
+
+
+def _extract_title_from_content(content: str) -> str:
+    """Use the first Markdown heading of the content as its title, or else its first line."""
+    lines = [line.strip() for line in content.splitlines() if line.strip()]
+    for line in lines:
+        heading = _HEADING_PATTERN.match(line)
+        if heading:
+            return heading.group(1)[:MAX_EXTRACTED_TITLE_LENGTH]
+    if lines:
+        return lines[0].lstrip("#*-> ").strip()[:MAX_EXTRACTED_TITLE_LENGTH] or DEFAULT_TUTORIAL_TITLE
+    return DEFAULT_TUTORIAL_TITLE
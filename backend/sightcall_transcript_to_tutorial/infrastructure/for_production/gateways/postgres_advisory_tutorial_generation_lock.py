@@ -0,0 +1,73 @@
+import hashlib
+import threading
+
+from sqlalchemy import Connection, Engine, func, select, text
+
+from sightcall_transcript_to_tutorial.domain.entities.tutorial import Tutorial
+from sightcall_transcript_to_tutorial.domain.gateways.tutorial_generation_lock_interface import (
+    TutorialGenerationLockInterface,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_production.gateways.in_process_tutorial_generation_lock import (
+    InProcessTutorialGenerationLock,
+)
+
+
+class PostgresAdvisoryTutorialGenerationLock(TutorialGenerationLockInterface):
+    """
+    Lock a key across every process using the database, with a Postgres session-level advisory lock.
+    Threads of this process first queue on an in-process lock, so that only one of them per key holds a connection
+    while waiting for the advisory lock. The advisory lock is taken on a connection of its own, kept until release:
+    a session would hand its connection back to the pool at its next commit, lock included. Its transaction lifts the
+    statement and idle timeouts of pooled connections: waiting for the lock may take as long as a generation, and so
+    does holding it. Committing on release restores them before the connection goes back to the pool.
+    A thread handed a tutorial by another thread of this process does not take the advisory lock at all; tutorials
+    are not handed over between processes, whose waiters find the tutorial in the generation cache instead.
+    """
+
+    def __init__(self, engine: Engine):
+        self._engine = engine
+        self._in_process_lock = InProcessTutorialGenerationLock()
+        self._connections: dict[str, Connection] = {}
+        self._connections_guard = threading.Lock()
+
+    def acquire(self, key: str) -> Tutorial | None:
+        tutorial = self._in_process_lock.acquire(key)
+        if tutorial is not None:
+            return tutorial
+        try:
+            connection = self._engine.connect()
+            try:
+                connection.execute(text("SET LOCAL statement_timeout = 0"))
+                connection.execute(text("SET LOCAL idle_in_transaction_session_timeout = 0"))
+                connection.execute(select(func.pg_advisory_lock(_advisory_lock_id(key))))
+            except Exception:
+                connection.close()
+                raise
+        except Exception:
+            self._in_process_lock.release(key)
+            raise
+        with self._connections_guard:
+            self._connections[key] = connection
+        return None
+
+    def release(self, key: str, tutorial: Tutorial | None = None) -> None:
+        with self._connections_guard:
+            connection = self._connections.pop(key, None)
+        if connection is None:
+            self._in_process_lock.release(key, tutorial)
+            return
+        try:
+            connection.execute(select(func.pg_advisory_unlock(_advisory_lock_id(key))))
+            connection.commit()
+        except Exception:
+            # Discard the connection instead of pooling it: ending its database session drops the lock.
+            connection.invalidate()
+            raise
+        finally:
+            connection.close()
+            self._in_process_lock.release(key, tutorial)
+
+
+def _advisory_lock_id(key: str) -> int:
+    """Map a key to the signed 64-bit integer advisory locks are identified by."""
+    return int.from_bytes(hashlib.sha256(key.encode("utf-8")).digest()[:8], "big", signed=True)
@@ -1,5 +1,17 @@
+from .sqlalchemy_generated_tutorial_cache_entry import SQLAlchemyGeneratedTutorialCacheEntry
 from .sqlalchemy_transcript import SQLAlchemyTranscript
+from .sqlalchemy_transcript_segment import SQLAlchemyTranscriptSegment
 from .sqlalchemy_tutorial import SQLAlchemyTutorial
+from .sqlalchemy_tutorial_generation_job import SQLAlchemyTutorialGenerationJob
 from .sqlalchemy_user import SQLAlchemyUser
+from .sqlalchemy_user_tutorial_count import SQLAlchemyUserTutorialCount
 
-__all__ = ["SQLAlchemyTranscript", "SQLAlchemyTutorial", "SQLAlchemyUser"]
+__all__ = [
+    "SQLAlchemyGeneratedTutorialCacheEntry",
+    "SQLAlchemyTranscript",
+    "SQLAlchemyTranscriptSegment",
+    "SQLAlchemyTutorial",
+    "SQLAlchemyTutorialGenerationJob",
+    "SQLAlchemyUser",
+    "SQLAlchemyUserTutorialCount",
+]
@@ -1,13 +1,92 @@
-from sqlalchemy import create_engine
+import logging
+from contextlib import AsyncExitStack, ExitStack
+from typing import Any
+
+from sqlalchemy import URL, Engine, create_engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
-from sightcall_transcript_to_tutorial.domain.config.settings import settings
+from sightcall_transcript_to_tutorial.domain.config.settings import Settings, settings
+from sightcall_transcript_to_tutorial.infrastructure.for_production.models.instrumented_pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+)
+
+logger = logging.getLogger(__name__)
+
+# The asyncio driver of each database backend, for the async engine.
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
 
 
 class Base(DeclarativeBase):
     pass
 
 
+def async_database_url(database_url: str) -> URL:
+    """The same database as `database_url`, through the asyncio driver of its backend."""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS.get(backend, url.get_driver_name())}")
+
+
+def engine_options(url: URL, settings: Settings, asynchronous: bool = False) -> dict[str, Any]:
+    """
+    Pool and connection options of an engine on `url`, from the `DATABASE_*` settings.
+    SQLite keeps the pool SQLAlchemy picks for it, as in-memory databases cannot be shared by a queue of connections.
+    """
+    if url.get_backend_name() == "sqlite":
+        return {}
+    options: dict[str, Any] = {
+        "poolclass": InstrumentedAsyncAdaptedQueuePool if asynchronous else InstrumentedQueuePool,
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_timeout": settings.database_pool_timeout_seconds,
+        "pool_recycle": settings.database_pool_recycle_seconds,
+        "pool_pre_ping": settings.database_pool_pre_ping,
+    }
+    if url.get_backend_name() == "postgresql" and settings.database_statement_timeout_milliseconds > 0:
+        # Set by the server on each new connection, so that a runaway query cannot hold a pooled connection forever.
+        statement_timeout = str(settings.database_statement_timeout_milliseconds)
+        options["connect_args"] = (
+            {"server_settings": {"statement_timeout": statement_timeout}}
+            if asynchronous
+            else {"options": f"-c statement_timeout={statement_timeout}"}
+        )
+    return options
+
+
+def warm_up_engine(engine: Engine, connection_count: int) -> None:
+    """
+    Open `connection_count` connections at once and hand them back to the pool, so that the first requests after a
+    start do not pay for the connection handshakes. A database that is not reachable yet is only logged: the pool
+    connects on demand anyway.
+    """
+    try:
+        with ExitStack() as stack:
+            for _ in range(connection_count):
+                stack.enter_context(engine.connect())
+    except Exception:
+        logger.warning("Could not warm up the database connection pool", exc_info=True)
+
+
+async def warm_up_async_engine(engine: AsyncEngine, connection_count: int) -> None:
+    """Same as `warm_up_engine`, for an asyncio engine."""
+    try:
+        async with AsyncExitStack() as stack:
+            for _ in range(connection_count):
+                await stack.enter_async_context(engine.connect())
+    except Exception:
+        logger.warning("Could not warm up the async database connection pool", exc_info=True)
+
+
 # SQLAlchemy engine and session factory for production use
-engine = create_engine(settings.database_url, future=True)
+_database_url = make_url(settings.database_url)
+engine = create_engine(_database_url, future=True, **engine_options(_database_url, settings))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Their asyncio counterparts, for the routes that await the database instead of holding a worker thread. Objects stay
+# readable after a commit, as lazy loads cannot happen outside of an await.
+_async_database_url = async_database_url(settings.database_url)
+async_engine = create_async_engine(
+    _async_database_url, **engine_options(_async_database_url, settings, asynchronous=True)
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
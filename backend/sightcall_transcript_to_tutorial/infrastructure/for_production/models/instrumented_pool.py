@@ -0,0 +1,70 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection, QueuePool
+
+
+@dataclass(frozen=True)
+class PoolStatistics:
+    """State of a connection pool, and what its checkouts cost since it was created."""
+
+    size: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool measuring how long each checkout waits for a connection (including opening or pinging it) and how many
+    give up with a `QueuePool limit` timeout, so that an exhausted pool shows up in the metrics before it shows up as
+    errors.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._statistics_lock = threading.Lock()
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+
+    def connect(self) -> PoolProxiedConnection:
+        started_at = time.perf_counter()
+        timed_out = False
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self._record_checkout(time.perf_counter() - started_at, timed_out)
+
+    def statistics(self) -> PoolStatistics:
+        with self._statistics_lock:
+            return PoolStatistics(
+                size=self.size(),
+                checked_out=self.checkedout(),
+                overflow=max(0, self.overflow()),
+                checkouts=self._checkouts,
+                timeouts=self._timeouts,
+                wait_seconds_total=self._wait_seconds_total,
+                wait_seconds_max=self._wait_seconds_max,
+            )
+
+    def _record_checkout(self, wait_seconds: float, timed_out: bool) -> None:
+        with self._statistics_lock:
+            self._checkouts += 1
+            self._timeouts += timed_out
+            self._wait_seconds_total += wait_seconds
+            self._wait_seconds_max = max(self._wait_seconds_max, wait_seconds)
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """The same measurements, for the pools of asyncio engines."""
@@ -0,0 +1,22 @@
+import datetime
+
+from sqlalchemy import DateTime, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from sightcall_transcript_to_tutorial.domain.value_objects import GeneratedTutorial
+from sightcall_transcript_to_tutorial.infrastructure.for_production.models.base import Base
+
+
+class SQLAlchemyGeneratedTutorialCacheEntry(Base):
+    __tablename__ = "generated_tutorial_cache"
+    # Eviction drops the least recently used entries first.
+    __table_args__ = (Index("ix_generated_tutorial_cache_last_used_at", "last_used_at"),)
+
+    cache_key: Mapped[str] = mapped_column(String, primary_key=True)
+    title: Mapped[str] = mapped_column(String, nullable=False)
+    content: Mapped[str] = mapped_column(String, nullable=False)
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    last_used_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    def to_domain(self) -> GeneratedTutorial:
+        return GeneratedTutorial(title=self.title, content=self.content)
@@ -1,20 +1,54 @@
-from sqlalchemy import String
+from collections.abc import Iterable
+
+from sqlalchemy import Integer, LargeBinary, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from sightcall_transcript_to_tutorial.domain.entities import Transcript
 from sightcall_transcript_to_tutorial.domain.value_objects import TranscriptId
-from sightcall_transcript_to_tutorial.domain.value_objects.transcript_content import TranscriptContent
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_content import (
+    TRANSCRIPT_SCHEMA_VERSION,
+    TranscriptContent,
+)
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_phrases import TranscriptPhrases
+from sightcall_transcript_to_tutorial.infrastructure.for_production.codecs.transcript_content_codec import (
+    decode_transcript_content,
+    decode_transcript_header,
+    decode_transcript_segment,
+    encode_transcript_content,
+)
 from sightcall_transcript_to_tutorial.infrastructure.for_production.models.base import Base
 
 
 class SQLAlchemyTranscript(Base):
     __tablename__ = "transcripts"
     id: Mapped[str] = mapped_column(String, primary_key=True)
-    content: Mapped[str] = mapped_column(String, nullable=False)
+    # Compact binary encoding, see transcript_content_codec.
+    content: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    # Non-zero for transcripts ingested in chunks: `content` then only holds the header, phrases live in segments.
+    segment_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    # Validation rules the content passed when it was stored, see TRANSCRIPT_SCHEMA_VERSION.
+    schema_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=TRANSCRIPT_SCHEMA_VERSION, server_default="1"
+    )
 
     @staticmethod
     def from_domain(transcript: Transcript) -> "SQLAlchemyTranscript":
-        return SQLAlchemyTranscript(id=transcript.transcript_id.value, content=str(transcript.content))
+        return SQLAlchemyTranscript(
+            id=transcript.transcript_id.value, content=encode_transcript_content(transcript.content)
+        )
 
     def to_domain(self) -> Transcript:
-        return Transcript(TranscriptId(self.id), content=TranscriptContent(self.content))
+        content = decode_transcript_content(self.content)
+        if self.schema_version != TRANSCRIPT_SCHEMA_VERSION:
+            content = content.revalidate()
+        return Transcript(TranscriptId(self.id), content=content)
+
+    def to_segmented_domain(self, segments: Iterable[bytes]) -> Transcript:
+        """Rebuild a transcript ingested in chunks from its header and its segments, in order."""
+        # Segments were validated when uploaded: join their columns without checking them again.
+        phrases = TranscriptPhrases.concatenate([decode_transcript_segment(segment) for segment in segments])
+        timestamp, duration_in_ticks = decode_transcript_header(self.content)
+        content = TranscriptContent.from_trusted(timestamp, duration_in_ticks, phrases)
+        if self.schema_version != TRANSCRIPT_SCHEMA_VERSION:
+            content = content.revalidate()
+        return Transcript(TranscriptId(self.id), content=content)
@@ -0,0 +1,12 @@
+from sqlalchemy import Integer, LargeBinary, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from sightcall_transcript_to_tutorial.infrastructure.for_production.models.base import Base
+
+
+class SQLAlchemyTranscriptSegment(Base):
+    __tablename__ = "transcript_segments"
+    transcript_id: Mapped[str] = mapped_column(String, primary_key=True)
+    position: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # Phrase columns of the segment, see transcript_content_codec.
+    phrases: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
@@ -1,15 +1,31 @@
 import datetime
 
-from sqlalchemy import DateTime, String
+from sqlalchemy import Computed, DateTime, Index, String
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from sightcall_transcript_to_tutorial.domain.entities import Tutorial
 from sightcall_transcript_to_tutorial.domain.value_objects import TutorialId, UserId
 from sightcall_transcript_to_tutorial.infrastructure.for_production.models.base import Base
 
+# The language the search vectors are built in; searches must parse their queries in the same one to match them.
+TEXT_SEARCH_CONFIGURATION = "english"
+
 
 class SQLAlchemyTutorial(Base):
     __tablename__ = "tutorials"
+    # The first serves a user's tutorials newest first, by offset or from a cursor (scanned backwards, which matches
+    # the `created_at DESC, id DESC` order); the second, the `updated_at` filter. The GIN indexes serve searches: by
+    # words of the title and content, and by substring of the title (which needs the pg_trgm extension).
+    __table_args__ = (
+        Index("ix_tutorials_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_tutorials_user_id_updated_at", "user_id", "updated_at"),
+        Index("ix_tutorials_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_tutorials_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+    )
+    # Don't read the search vector back on every insert or update: only searches use it.
+    __mapper_args__ = {"eager_defaults": False}
+
     id: Mapped[str] = mapped_column(String, primary_key=True)
     title: Mapped[str] = mapped_column(String, nullable=False)
     content: Mapped[str] = mapped_column(String, nullable=False, default="")
@@ -20,6 +36,17 @@ class SQLAlchemyTutorial(Base):
     updated_at: Mapped[datetime.datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=datetime.datetime.now(datetime.timezone.utc)
     )
+    # Maintained by PostgreSQL from the title and content, the title weighing more in rankings. Deferred, as only
+    # searches need it.
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{TEXT_SEARCH_CONFIGURATION}', title), 'A') || "
+            f"setweight(to_tsvector('{TEXT_SEARCH_CONFIGURATION}', content), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     @staticmethod
     def from_domain(tutorial: Tutorial) -> "SQLAlchemyTutorial":
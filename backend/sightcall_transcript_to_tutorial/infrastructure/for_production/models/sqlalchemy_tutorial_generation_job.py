@@ -0,0 +1,51 @@
+import datetime
+
+from sqlalchemy import DateTime, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from sightcall_transcript_to_tutorial.domain.entities import JobStatus, TutorialGenerationJob
+from sightcall_transcript_to_tutorial.domain.value_objects import JobId, TranscriptId, TutorialId, UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_production.models.base import Base
+
+
+class SQLAlchemyTutorialGenerationJob(Base):
+    __tablename__ = "tutorial_generation_jobs"
+    # Workers poll for the oldest claimable job.
+    __table_args__ = (Index("ix_tutorial_generation_jobs_status_created_at", "status", "created_at"),)
+
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    transcript_id: Mapped[str] = mapped_column(String, nullable=False)
+    user_id: Mapped[str] = mapped_column(String, nullable=False)
+    status: Mapped[str] = mapped_column(String, nullable=False)
+    tutorial_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    error: Mapped[str | None] = mapped_column(String, nullable=True)
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    claim_token: Mapped[str | None] = mapped_column(String, nullable=True)
+
+    @staticmethod
+    def from_domain(job: TutorialGenerationJob) -> "SQLAlchemyTutorialGenerationJob":
+        return SQLAlchemyTutorialGenerationJob(
+            id=job.job_id.value,
+            transcript_id=job.transcript_id.value,
+            user_id=job.user_id.value,
+            status=job.status.value,
+            tutorial_id=job.tutorial_id.value if job.tutorial_id else None,
+            error=job.error,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+            claim_token=job.claim_token,
+        )
+
+    def to_domain(self) -> TutorialGenerationJob:
+        return TutorialGenerationJob(
+            job_id=JobId(self.id),
+            transcript_id=TranscriptId(self.transcript_id),
+            user_id=UserId(self.user_id),
+            status=JobStatus(self.status),
+            tutorial_id=TutorialId(self.tutorial_id) if self.tutorial_id else None,
+            error=self.error,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            claim_token=self.claim_token,
+        )
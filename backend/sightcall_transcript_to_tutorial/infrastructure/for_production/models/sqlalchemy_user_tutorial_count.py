@@ -0,0 +1,13 @@
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from sightcall_transcript_to_tutorial.infrastructure.for_production.models.base import Base
+
+
+class SQLAlchemyUserTutorialCount(Base):
+    """How many tutorials each user has, kept up to date by the tutorial repository so lists don't count them."""
+
+    __tablename__ = "user_tutorial_counts"
+
+    user_id: Mapped[str] = mapped_column(String, primary_key=True)
+    tutorial_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -0,0 +1,153 @@
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_content import TranscriptContent
+
+DEFAULT_MIN_CONFIDENCE = 0.4
+# A phrase made only of these words carries nothing worth a step of the tutorial.
+DEFAULT_FILLER_WORDS = frozenset(
+    {
+        "ah",
+        "alright",
+        "bye",
+        "goodbye",
+        "good",
+        "great",
+        "hello",
+        "hey",
+        "hi",
+        "hmm",
+        "mhm",
+        "nice",
+        "oh",
+        "ok",
+        "okay",
+        "perfect",
+        "so",
+        "thank",
+        "thanks",
+        "uh",
+        "um",
+        "well",
+        "wonderful",
+        "yeah",
+        "yep",
+        "you",
+    }
+)
+# OpenAI's rule of thumb for English text, good enough to report the savings without a tokenizer dependency.
+CHARACTERS_PER_TOKEN = 4
+# Characters a phrase takes in the raw JSON besides its display text: keys, numbers, locale and punctuation.
+RAW_PHRASE_OVERHEAD_CHARACTERS = 120
+_WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass(frozen=True)
+class SpeakerTurn:
+    speaker: int
+    start_milliseconds: int
+    text: str
+
+    @property
+    def line(self) -> str:
+        return f"Speaker {self.speaker}: {self.text}"
+
+
+@dataclass(frozen=True)
+class CompactedTranscript:
+    text: str
+    estimated_tokens_before: int
+    estimated_tokens_after: int
+
+
+class TranscriptPromptCompactor:
+    """
+    Render a transcript for a prompt as one "Speaker N: ..." line per speaker turn, instead of its raw JSON.
+    Timing, locale and confidence fields are dropped, consecutive phrases of the same speaker are merged, and phrases
+    below `min_confidence` or made only of filler words and greetings are left out.
+    """
+
+    def __init__(
+        self, min_confidence: float = DEFAULT_MIN_CONFIDENCE, filler_words: Iterable[str] = DEFAULT_FILLER_WORDS
+    ):
+        self._min_confidence = min_confidence
+        self._filler_words = frozenset(filler_words)
+
+    @property
+    def min_confidence(self) -> float:
+        return self._min_confidence
+
+    @property
+    def filler_words(self) -> frozenset[str]:
+        return self._filler_words
+
+    def compact(self, content: TranscriptContent) -> CompactedTranscript:
+        text = "\n".join(turn.line for turn in self.turns(content))
+        return CompactedTranscript(
+            text=text,
+            estimated_tokens_before=estimate_raw_tokens(content),
+            estimated_tokens_after=estimate_tokens(text),
+        )
+
+    def chunk(self, content: TranscriptContent, window_milliseconds: int, max_tokens: int) -> list[str]:
+        """
+        Split the compacted transcript into chunks of whole speaker turns. A chunk spans at most `window_milliseconds`
+        of the call and about `max_tokens` tokens, unless a single turn is longer than that.
+        """
+        chunks: list[str] = []
+        lines: list[str] = []
+        chunk_start_milliseconds = 0
+        chunk_tokens = 0
+        for turn in self.turns(content):
+            turn_tokens = estimate_tokens(turn.line) + 1
+            if lines and (
+                turn.start_milliseconds - chunk_start_milliseconds >= window_milliseconds
+                or chunk_tokens + turn_tokens > max_tokens
+            ):
+                chunks.append("\n".join(lines))
+                lines = []
+            if not lines:
+                chunk_start_milliseconds = turn.start_milliseconds
+                chunk_tokens = 0
+            lines.append(turn.line)
+            chunk_tokens += turn_tokens
+        if lines:
+            chunks.append("\n".join(lines))
+        return chunks
+
+    def turns(self, content: TranscriptContent) -> list[SpeakerTurn]:
+        """Return the kept phrases grouped into speaker turns, in order."""
+        turns: list[SpeakerTurn] = []
+        displays: list[str] = []
+        speaker = 0
+        start_milliseconds = 0
+        for phrase in content.phrases:
+            if phrase["confidence"] < self._min_confidence or self._is_filler(phrase["display"]):
+                continue
+            if displays and phrase["speaker"] != speaker:
+                turns.append(SpeakerTurn(speaker, start_milliseconds, " ".join(displays)))
+                displays = []
+            if not displays:
+                speaker = phrase["speaker"]
+                start_milliseconds = phrase["offset_milliseconds"]
+            displays.append(phrase["display"])
+        if displays:
+            turns.append(SpeakerTurn(speaker, start_milliseconds, " ".join(displays)))
+        return turns
+
+    def _is_filler(self, display: str) -> bool:
+        # Words of any script count, digits included; a phrase without words is kept, as nothing shows it is filler.
+        words = _WORD_PATTERN.findall(display.lower())
+        return bool(words) and all(word in self._filler_words for word in words)
+
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARACTERS_PER_TOKEN)
+
+
+def estimate_raw_tokens(content: TranscriptContent) -> int:
+    """Estimate the tokens of the raw JSON of a transcript from its phrase columns, without rendering it."""
+    phrases = content.phrases
+    characters = phrases.display_length + len(phrases) * RAW_PHRASE_OVERHEAD_CHARACTERS
+    return -(-characters // CHARACTERS_PER_TOKEN)
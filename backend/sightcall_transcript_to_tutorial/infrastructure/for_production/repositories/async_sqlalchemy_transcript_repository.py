@@ -0,0 +1,48 @@
+from typing import Callable, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sightcall_transcript_to_tutorial.domain.entities import Transcript
+from sightcall_transcript_to_tutorial.domain.repositories import AsyncTranscriptRepositoryInterface
+from sightcall_transcript_to_tutorial.domain.value_objects import TranscriptId
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_phrases import TranscriptPhrases
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.sqlalchemy_transcript_repository import (
+    SQLAlchemyTranscriptRepository,
+)
+
+_Result = TypeVar("_Result")
+
+
+class AsyncSQLAlchemyTranscriptRepository(AsyncTranscriptRepositoryInterface):
+    """SQLAlchemyTranscriptRepository behind an AsyncSession, the same way as AsyncSQLAlchemyTutorialRepository."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def find_by_id(self, transcript_id: TranscriptId) -> Transcript | None:
+        return await self._run(lambda repository: repository.find_by_id(transcript_id))
+
+    async def find_existing_ids(self, transcript_ids: list[TranscriptId]) -> set[TranscriptId]:
+        return await self._run(lambda repository: repository.find_existing_ids(transcript_ids))
+
+    async def save(self, transcript: Transcript) -> None:
+        await self._run(lambda repository: repository.save(transcript))
+
+    async def save_segment(self, transcript_id: TranscriptId, position: int, phrases: TranscriptPhrases) -> None:
+        await self._run(lambda repository: repository.save_segment(transcript_id, position, phrases))
+
+    async def save_segmented(
+        self, transcript_id: TranscriptId, timestamp: str, duration_in_ticks: int | float, segment_count: int
+    ) -> None:
+        await self._run(
+            lambda repository: repository.save_segmented(transcript_id, timestamp, duration_in_ticks, segment_count)
+        )
+
+    async def discard_segmented(self, transcript_id: TranscriptId) -> None:
+        await self._run(lambda repository: repository.discard_segmented(transcript_id))
+
+    async def delete(self, transcript_id: TranscriptId) -> None:
+        await self._run(lambda repository: repository.delete(transcript_id))
+
+    async def _run(self, call: Callable[[SQLAlchemyTranscriptRepository], _Result]) -> _Result:
+        return await self._session.run_sync(lambda session: call(SQLAlchemyTranscriptRepository(session)))
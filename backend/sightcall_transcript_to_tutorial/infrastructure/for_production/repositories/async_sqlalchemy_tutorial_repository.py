@@ -0,0 +1,75 @@
+from typing import Any, Callable, Optional, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sightcall_transcript_to_tutorial.domain.entities import Tutorial
+from sightcall_transcript_to_tutorial.domain.repositories import AsyncTutorialRepositoryInterface, TutorialPage
+from sightcall_transcript_to_tutorial.domain.value_objects import TutorialCursor, TutorialId, UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.sqlalchemy_tutorial_repository import (
+    SQLAlchemyTutorialRepository,
+)
+
+_Result = TypeVar("_Result")
+
+
+class AsyncSQLAlchemyTutorialRepository(AsyncTutorialRepositoryInterface):
+    """
+    SQLAlchemyTutorialRepository behind an AsyncSession: each call runs the sync repository on the session's sync
+    side (`AsyncSession.run_sync`), so the database is awaited without a worker thread and every query is written once.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def find_by_id(self, tutorial_id: TutorialId) -> Tutorial | None:
+        return await self._run(lambda repository: repository.find_by_id(tutorial_id))
+
+    async def save(self, tutorial: Tutorial) -> None:
+        await self._run(lambda repository: repository.save(tutorial))
+
+    async def delete(self, tutorial_id: TutorialId) -> None:
+        await self._run(lambda repository: repository.delete(tutorial_id))
+
+    async def list_tutorials(
+        self,
+        user_id: UserId,
+        filters: Optional[dict[str, Any]] = None,
+        page: int = 1,
+        page_size: int = 20,
+        search: Optional[str] = None,
+        after: Optional[TutorialCursor] = None,
+    ) -> list[Tutorial]:
+        return await self._run(
+            lambda repository: repository.list_tutorials(user_id, filters, page, page_size, search, after)
+        )
+
+    async def list_tutorial_page(
+        self,
+        user_id: UserId,
+        filters: Optional[dict[str, Any]] = None,
+        page: int = 1,
+        page_size: int = 20,
+        search: Optional[str] = None,
+        after: Optional[TutorialCursor] = None,
+    ) -> TutorialPage:
+        return await self._run(
+            lambda repository: repository.list_tutorial_page(user_id, filters, page, page_size, search, after)
+        )
+
+    async def update_tutorial(
+        self,
+        tutorial_id: TutorialId,
+        user_id: UserId,
+        title: Optional[str] = None,
+        content: Optional[str] = None,
+        updated_at: Any = None,
+    ) -> Tutorial | None:
+        return await self._run(
+            lambda repository: repository.update_tutorial(tutorial_id, user_id, title, content, updated_at)
+        )
+
+    async def validate_ownership(self, tutorial_id: TutorialId, user_id: UserId) -> bool:
+        return await self._run(lambda repository: repository.validate_ownership(tutorial_id, user_id))
+
+    async def _run(self, call: Callable[[SQLAlchemyTutorialRepository], _Result]) -> _Result:
+        return await self._session.run_sync(lambda session: call(SQLAlchemyTutorialRepository(session)))
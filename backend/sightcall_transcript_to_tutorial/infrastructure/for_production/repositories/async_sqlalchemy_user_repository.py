@@ -0,0 +1,48 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sightcall_transcript_to_tutorial.domain.entities import User
+from sightcall_transcript_to_tutorial.domain.repositories import AsyncUserRepositoryInterface
+from sightcall_transcript_to_tutorial.domain.value_objects import UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_production.models.sqlalchemy_user import SQLAlchemyUser
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.in_memory_user_cache import (
+    InMemoryUserCache,
+)
+
+
+class AsyncSQLAlchemyUserRepository(AsyncUserRepositoryInterface):
+    def __init__(self, session: AsyncSession, cache: InMemoryUserCache | None = None):
+        self._session = session
+        self._cache = cache
+
+    async def find_by_id(self, user_id: UserId) -> User | None:
+        user = self._cache.find_by_id(user_id) if self._cache is not None else None
+        if user is None:
+            row = await self._session.get(SQLAlchemyUser, user_id.value)
+            user = row.to_domain() if row else None
+            if user is not None and self._cache is not None:
+                self._cache.save(user)
+        return user
+
+    async def save(self, user: User) -> None:
+        obj = await self._session.get(SQLAlchemyUser, user.user_id.value)
+        if obj:
+            obj.name = user.name
+            obj.github_id = user.github_id
+        else:
+            self._session.add(SQLAlchemyUser.from_domain(user))
+        await self._session.commit()
+        if self._cache is not None:
+            self._cache.delete(user.user_id)
+
+    async def delete(self, user_id: UserId) -> None:
+        obj = await self._session.get(SQLAlchemyUser, user_id.value)
+        if obj:
+            await self._session.delete(obj)
+            await self._session.commit()
+        if self._cache is not None:
+            self._cache.delete(user_id)
+
+    async def find_by_github_id(self, github_id: int) -> User | None:
+        row = await self._session.scalar(select(SQLAlchemyUser).filter_by(github_id=github_id).limit(1))
+        return row.to_domain() if row else None
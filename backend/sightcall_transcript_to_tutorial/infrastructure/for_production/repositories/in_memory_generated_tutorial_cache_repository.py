@@ -0,0 +1,63 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from sightcall_transcript_to_tutorial.domain.repositories import GeneratedTutorialCacheRepositoryInterface
+from sightcall_transcript_to_tutorial.domain.value_objects import GeneratedTutorial
+
+
+class InMemoryGeneratedTutorialCacheRepository(GeneratedTutorialCacheRepositoryInterface):
+    """
+    Process-local LRU cache of generated tutorials with a time to live, safe to share between worker threads.
+    Used as the front tier of the database cache, see `TieredGeneratedTutorialCacheRepository`.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        # Least recently used first; values are (expires_at, generated tutorial).
+        self._entries: OrderedDict[str, tuple[float, GeneratedTutorial]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def find_by_key(self, cache_key: str) -> GeneratedTutorial | None:
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return None
+            expires_at, generated_tutorial = entry
+            if expires_at <= self._clock():
+                del self._entries[cache_key]
+                return None
+            self._entries.move_to_end(cache_key)
+            return generated_tutorial
+
+    def save(self, cache_key: str, generated_tutorial: GeneratedTutorial) -> None:
+        with self._lock:
+            self._entries[cache_key] = (self._clock() + self._ttl_seconds, generated_tutorial)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+class TieredGeneratedTutorialCacheRepository(GeneratedTutorialCacheRepositoryInterface):
+    """Look a key up in a fast front tier first, then in the backing tier, promoting what the latter finds."""
+
+    def __init__(
+        self, front: GeneratedTutorialCacheRepositoryInterface, back: GeneratedTutorialCacheRepositoryInterface
+    ):
+        self._front = front
+        self._back = back
+
+    def find_by_key(self, cache_key: str) -> GeneratedTutorial | None:
+        generated_tutorial = self._front.find_by_key(cache_key)
+        if generated_tutorial is None:
+            generated_tutorial = self._back.find_by_key(cache_key)
+            if generated_tutorial is not None:
+                self._front.save(cache_key, generated_tutorial)
+        return generated_tutorial
+
+    def save(self, cache_key: str, generated_tutorial: GeneratedTutorial) -> None:
+        self._back.save(cache_key, generated_tutorial)
+        self._front.save(cache_key, generated_tutorial)
@@ -0,0 +1,46 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from sightcall_transcript_to_tutorial.domain.entities import User
+from sightcall_transcript_to_tutorial.domain.value_objects import UserId
+
+
+class InMemoryUserCache:
+    """
+    Process-local LRU cache of users by id with a time to live, safe to share between worker threads and event loops.
+    Filled and invalidated by the SQLAlchemy user repositories; the time to live bounds how long a change made by
+    another process can go unnoticed.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        # Least recently used first; values are (expires_at, user).
+        self._entries: OrderedDict[str, tuple[float, User]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def find_by_id(self, user_id: UserId) -> User | None:
+        with self._lock:
+            entry = self._entries.get(user_id.value)
+            if entry is None:
+                return None
+            expires_at, user = entry
+            if expires_at <= self._clock():
+                del self._entries[user_id.value]
+                return None
+            self._entries.move_to_end(user_id.value)
+            return user
+
+    def save(self, user: User) -> None:
+        with self._lock:
+            self._entries[user.user_id.value] = (self._clock() + self._ttl_seconds, user)
+            self._entries.move_to_end(user.user_id.value)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, user_id: UserId) -> None:
+        with self._lock:
+            self._entries.pop(user_id.value, None)
@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from sightcall_transcript_to_tutorial.domain.repositories import GeneratedTutorialCacheRepositoryInterface
+from sightcall_transcript_to_tutorial.domain.value_objects import GeneratedTutorial
+from sightcall_transcript_to_tutorial.infrastructure.for_production.models.sqlalchemy_generated_tutorial_cache_entry import (
+    SQLAlchemyGeneratedTutorialCacheEntry,
+)
+
+
+class SQLAlchemyGeneratedTutorialCacheRepository(GeneratedTutorialCacheRepositoryInterface):
+    """
+    Generation cache shared by all processes. Entries expire `ttl_seconds` after they were generated, and once there
+    are more than `max_entries` the expired then least recently used ones are evicted.
+    """
+
+    def __init__(self, session: Session, max_entries: int, ttl_seconds: int):
+        self._session = session
+        self._max_entries = max_entries
+        self._ttl = timedelta(seconds=ttl_seconds)
+
+    def find_by_key(self, cache_key: str) -> GeneratedTutorial | None:
+        now = datetime.now(timezone.utc)
+        row = (
+            self._session.query(SQLAlchemyGeneratedTutorialCacheEntry)
+            .filter(
+                SQLAlchemyGeneratedTutorialCacheEntry.cache_key == cache_key,
+                SQLAlchemyGeneratedTutorialCacheEntry.created_at > now - self._ttl,
+            )
+            .first()
+        )
+        if row is not None:
+            row.last_used_at = now
+        # Ends the read transaction on a miss too, so that the connection does not sit idle in a transaction.
+        self._session.commit()
+        return None if row is None else row.to_domain()
+
+    def save(self, cache_key: str, generated_tutorial: GeneratedTutorial) -> None:
+        now = datetime.now(timezone.utc)
+        entries = SQLAlchemyGeneratedTutorialCacheEntry
+        values = {
+            "title": generated_tutorial.title,
+            "content": generated_tutorial.content,
+            "created_at": now,
+            "last_used_at": now,
+        }
+        # An expired entry for this key is replaced, while a live one means another worker generated the same
+        # tutorial meanwhile: keep its entry.
+        self._session.execute(
+            insert(entries)
+            .values(cache_key=cache_key, **values)
+            .on_conflict_do_update(
+                index_elements=[entries.cache_key], set_=values, where=entries.created_at <= now - self._ttl
+            )
+        )
+        self._session.commit()
+        if self._is_over_max_entries():
+            self._evict(now)
+
+    def _is_over_max_entries(self) -> bool:
+        # Reads at most `max_entries` + 1 keys of the last used index, instead of counting the whole table.
+        entries = SQLAlchemyGeneratedTutorialCacheEntry
+        over_max_entries = self._session.execute(
+            select(entries.cache_key).order_by(entries.last_used_at.desc()).offset(self._max_entries).limit(1)
+        ).first()
+        self._session.commit()
+        return over_max_entries is not None
+
+    def _evict(self, now: datetime) -> None:
+        entries = SQLAlchemyGeneratedTutorialCacheEntry
+        least_recently_used = select(entries.cache_key).order_by(entries.last_used_at.desc()).offset(self._max_entries)
+        self._session.execute(
+            delete(entries).where(
+                or_(entries.created_at <= now - self._ttl, entries.cache_key.in_(least_recently_used))
+            )
+        )
+        self._session.commit()
@@ -1,11 +1,22 @@
+from sqlalchemy import Select, delete, select
 from sqlalchemy.orm import Session
 
 from sightcall_transcript_to_tutorial.domain.entities import Transcript
 from sightcall_transcript_to_tutorial.domain.repositories import TranscriptRepositoryInterface
 from sightcall_transcript_to_tutorial.domain.value_objects import TranscriptId
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_content import TRANSCRIPT_SCHEMA_VERSION
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_phrases import TranscriptPhrases
+from sightcall_transcript_to_tutorial.infrastructure.for_production.codecs.transcript_content_codec import (
+    encode_transcript_content,
+    encode_transcript_header,
+    encode_transcript_segment,
+)
 from sightcall_transcript_to_tutorial.infrastructure.for_production.models.sqlalchemy_transcript import (
     SQLAlchemyTranscript,
 )
+from sightcall_transcript_to_tutorial.infrastructure.for_production.models.sqlalchemy_transcript_segment import (
+    SQLAlchemyTranscriptSegment,
+)
 
 
 class SQLAlchemyTranscriptRepository(TranscriptRepositoryInterface):
@@ -14,19 +25,74 @@ class SQLAlchemyTranscriptRepository(TranscriptRepositoryInterface):
 
     def find_by_id(self, transcript_id: TranscriptId) -> Transcript | None:
         row = self._session.query(SQLAlchemyTranscript).filter_by(id=transcript_id.value).first()
-        return row.to_domain() if row else None
+        if row is None:
+            return None
+        if row.segment_count:
+            return row.to_segmented_domain(self._session.scalars(segments_of(row.id)))
+        return row.to_domain()
+
+    def find_existing_ids(self, transcript_ids: list[TranscriptId]) -> set[TranscriptId]:
+        rows = self._session.scalars(
+            select(SQLAlchemyTranscript.id).where(
+                SQLAlchemyTranscript.id.in_([transcript_id.value for transcript_id in transcript_ids])
+            )
+        )
+        return {TranscriptId(row) for row in rows}
 
     def save(self, transcript: Transcript) -> None:
         obj = self._session.query(SQLAlchemyTranscript).filter_by(id=transcript.transcript_id.value).first()
         if obj:
-            obj.content = str(transcript.content)
+            obj.content = encode_transcript_content(transcript.content)
+            obj.schema_version = TRANSCRIPT_SCHEMA_VERSION
+            if obj.segment_count:
+                obj.segment_count = 0
+                self._delete_segments(transcript.transcript_id)
         else:
             obj = SQLAlchemyTranscript.from_domain(transcript)
             self._session.add(obj)
         self._session.commit()
 
+    def save_segment(self, transcript_id: TranscriptId, position: int, phrases: TranscriptPhrases) -> None:
+        # Committed one by one so that a long upload never holds more than one pending segment in the session.
+        self._session.add(
+            SQLAlchemyTranscriptSegment(
+                transcript_id=transcript_id.value, position=position, phrases=encode_transcript_segment(phrases)
+            )
+        )
+        self._session.commit()
+
+    def save_segmented(
+        self, transcript_id: TranscriptId, timestamp: str, duration_in_ticks: int | float, segment_count: int
+    ) -> None:
+        encoded_header = encode_transcript_header(timestamp, duration_in_ticks)
+        self._session.add(
+            SQLAlchemyTranscript(id=transcript_id.value, content=encoded_header, segment_count=segment_count)
+        )
+        self._session.commit()
+
+    def discard_segmented(self, transcript_id: TranscriptId) -> None:
+        # The failure may have been a database error, which leaves the session unusable until rolled back.
+        self._session.rollback()
+        self.delete(transcript_id)
+
     def delete(self, transcript_id: TranscriptId) -> None:
         obj = self._session.query(SQLAlchemyTranscript).filter_by(id=transcript_id.value).first()
         if obj:
             self._session.delete(obj)
-            self._session.commit()
+        # Segments may exist without a transcript row when a chunked upload failed half way.
+        self._delete_segments(transcript_id)
+        self._session.commit()
+
+    def _delete_segments(self, transcript_id: TranscriptId) -> None:
+        self._session.execute(
+            delete(SQLAlchemyTranscriptSegment).where(SQLAlchemyTranscriptSegment.transcript_id == transcript_id.value)
+        )
+
+
+def segments_of(transcript_id: str) -> Select[tuple[bytes]]:
+    """The phrases of each segment of a transcript ingested in chunks, in order."""
+    return (
+        select(SQLAlchemyTranscriptSegment.phrases)
+        .filter_by(transcript_id=transcript_id)
+        .order_by(SQLAlchemyTranscriptSegment.position)
+    )
@@ -0,0 +1,92 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from sightcall_transcript_to_tutorial.domain.entities import JobStatus, TutorialGenerationJob
+from sightcall_transcript_to_tutorial.domain.repositories import TutorialGenerationJobRepositoryInterface
+from sightcall_transcript_to_tutorial.domain.value_objects import JobId, TutorialId
+from sightcall_transcript_to_tutorial.infrastructure.for_production.models.sqlalchemy_tutorial_generation_job import (
+    SQLAlchemyTutorialGenerationJob,
+)
+
+
+class SQLAlchemyTutorialGenerationJobRepository(TutorialGenerationJobRepositoryInterface):
+    def __init__(self, session: Session):
+        self._session = session
+
+    def find_by_id(self, job_id: JobId) -> TutorialGenerationJob | None:
+        row = self._session.query(SQLAlchemyTutorialGenerationJob).filter_by(id=job_id.value).first()
+        return row.to_domain() if row else None
+
+    def save(self, job: TutorialGenerationJob) -> None:
+        self._session.add(SQLAlchemyTutorialGenerationJob.from_domain(job))
+        self._session.commit()
+
+    def save_many(self, jobs: list[TutorialGenerationJob]) -> None:
+        self._session.add_all([SQLAlchemyTutorialGenerationJob.from_domain(job) for job in jobs])
+        self._session.commit()
+
+    def claim_next(self, lease_seconds: int) -> TutorialGenerationJob | None:
+        now = datetime.now(timezone.utc)
+        lease_expired_before = now - timedelta(seconds=lease_seconds)
+        # SKIP LOCKED lets concurrent workers each lock a different row instead of queueing behind one another.
+        row = (
+            self._session.query(SQLAlchemyTutorialGenerationJob)
+            .filter(
+                or_(
+                    SQLAlchemyTutorialGenerationJob.status == JobStatus.PENDING.value,
+                    and_(
+                        SQLAlchemyTutorialGenerationJob.status == JobStatus.RUNNING.value,
+                        SQLAlchemyTutorialGenerationJob.updated_at < lease_expired_before,
+                    ),
+                )
+            )
+            .order_by(SQLAlchemyTutorialGenerationJob.created_at)
+            .with_for_update(skip_locked=True)
+            .first()
+        )
+        if row is None:
+            self._session.commit()
+            return None
+        row.status = JobStatus.RUNNING.value
+        row.updated_at = now
+        row.claim_token = uuid.uuid4().hex
+        self._session.commit()
+        return row.to_domain()
+
+    def renew_lease(self, job_id: JobId, claim_token: str) -> bool:
+        return self._update_claimed(job_id, claim_token, {})
+
+    def mark_succeeded(self, job_id: JobId, claim_token: str, tutorial_id: TutorialId) -> bool:
+        return self._update_claimed(
+            job_id,
+            claim_token,
+            {
+                SQLAlchemyTutorialGenerationJob.status: JobStatus.SUCCEEDED.value,
+                SQLAlchemyTutorialGenerationJob.tutorial_id: tutorial_id.value,
+                SQLAlchemyTutorialGenerationJob.error: None,
+            },
+        )
+
+    def mark_failed(self, job_id: JobId, claim_token: str, error: str) -> bool:
+        return self._update_claimed(
+            job_id,
+            claim_token,
+            {
+                SQLAlchemyTutorialGenerationJob.status: JobStatus.FAILED.value,
+                SQLAlchemyTutorialGenerationJob.tutorial_id: None,
+                SQLAlchemyTutorialGenerationJob.error: error,
+            },
+        )
+
+    def _update_claimed(self, job_id: JobId, claim_token: str, values: dict) -> bool:
+        """Update a job still running under `claim_token`, touching its lease, and tell whether there was one."""
+        updated = (
+            self._session.query(SQLAlchemyTutorialGenerationJob)
+            .filter_by(id=job_id.value, status=JobStatus.RUNNING.value, claim_token=claim_token)
+            .update({**values, SQLAlchemyTutorialGenerationJob.updated_at: datetime.now(timezone.utc)})
+        )
+        self._session.commit()
+        return updated == 1
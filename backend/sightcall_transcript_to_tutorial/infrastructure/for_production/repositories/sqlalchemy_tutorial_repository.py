@@ -1,13 +1,28 @@
 from typing import Any, Optional
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from sightcall_transcript_to_tutorial.domain.entities import Tutorial
-from sightcall_transcript_to_tutorial.domain.repositories import TutorialRepositoryInterface
-from sightcall_transcript_to_tutorial.domain.value_objects import TutorialId, UserId
+from sightcall_transcript_to_tutorial.domain.repositories import TutorialPage, TutorialRepositoryInterface
+from sightcall_transcript_to_tutorial.domain.value_objects import TutorialCursor, TutorialId, UserId
 from sightcall_transcript_to_tutorial.infrastructure.for_production.models.sqlalchemy_tutorial import (
     SQLAlchemyTutorial,
 )
+from sightcall_transcript_to_tutorial.infrastructure.for_production.models.sqlalchemy_user_tutorial_count import (
+    SQLAlchemyUserTutorialCount,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.sqlalchemy_tutorial_statements import (
+    Explain,
+    add_to_tutorial_count,
+    count_of,
+    estimated_row_count,
+    matching_tutorials,
+    tutorial_page,
+)
+
+# Up to this many tutorials for a user, filtered totals are counted exactly; beyond, the planner's estimate is used.
+EXACT_TOTAL_MAX_TUTORIALS = 10_000
 
 
 class SQLAlchemyTutorialRepository(TutorialRepositoryInterface):
@@ -21,6 +36,9 @@ class SQLAlchemyTutorialRepository(TutorialRepositoryInterface):
     def save(self, tutorial: Tutorial) -> None:
         obj = self._session.query(SQLAlchemyTutorial).filter_by(id=tutorial.tutorial_id.value).first()
         if obj:
+            if obj.user_id != tutorial.user_id.value:
+                self._session.execute(add_to_tutorial_count(obj.user_id, -1, self._dialect_name()))
+                self._session.execute(add_to_tutorial_count(tutorial.user_id.value, 1, self._dialect_name()))
             obj.title = tutorial.title
             obj.content = tutorial.content
             obj.user_id = tutorial.user_id.value
@@ -29,12 +47,14 @@ class SQLAlchemyTutorialRepository(TutorialRepositoryInterface):
         else:
             obj = SQLAlchemyTutorial.from_domain(tutorial)
             self._session.add(obj)
+            self._session.execute(add_to_tutorial_count(tutorial.user_id.value, 1, self._dialect_name()))
         self._session.commit()
 
     def delete(self, tutorial_id: TutorialId) -> None:
         obj = self._session.query(SQLAlchemyTutorial).filter_by(id=tutorial_id.value).first()
         if obj:
             self._session.delete(obj)
+            self._session.execute(add_to_tutorial_count(obj.user_id, -1, self._dialect_name()))
             self._session.commit()
 
     def list_tutorials(
@@ -44,20 +64,43 @@ class SQLAlchemyTutorialRepository(TutorialRepositoryInterface):
         page: int = 1,
         page_size: int = 20,
         search: Optional[str] = None,
+        after: Optional[TutorialCursor] = None,
     ) -> list[Tutorial]:
-        query = self._session.query(SQLAlchemyTutorial).filter_by(user_id=user_id.value)
-        if filters:
-            if "created_at" in filters:
-                query = query.filter(SQLAlchemyTutorial.created_at >= filters["created_at"])
-            if "updated_at" in filters:
-                query = query.filter(SQLAlchemyTutorial.updated_at >= filters["updated_at"])
-        if search:
-            query = query.filter(SQLAlchemyTutorial.title.ilike(f"%{search}%"))
-        query = query.order_by(SQLAlchemyTutorial.created_at.desc())
-        offset = (page - 1) * page_size
-        rows = query.offset(offset).limit(page_size).all()
+        dialect_name = self._dialect_name()
+        matching = matching_tutorials(user_id, filters, search, dialect_name)
+        rows = self._session.scalars(tutorial_page(matching, page, page_size, after, search, dialect_name))
         return [row.to_domain() for row in rows]
 
+    def list_tutorial_page(
+        self,
+        user_id: UserId,
+        filters: Optional[dict[str, Any]] = None,
+        page: int = 1,
+        page_size: int = 20,
+        search: Optional[str] = None,
+        after: Optional[TutorialCursor] = None,
+    ) -> TutorialPage:
+        dialect_name = self._dialect_name()
+        matching = matching_tutorials(user_id, filters, search, dialect_name)
+        tutorial_count = self._session.get(SQLAlchemyUserTutorialCount, user_id.value)
+        user_total = tutorial_count.tutorial_count if tutorial_count else 0
+        if not filters and not search:
+            # Everything the user has matches, and the counter tells how much that is.
+            return TutorialPage(self.list_tutorials(user_id, page=page, page_size=page_size, after=after), user_total)
+        if user_total > EXACT_TOTAL_MAX_TUTORIALS and dialect_name == "postgresql":
+            tutorials = self.list_tutorials(user_id, filters, page, page_size, search, after)
+            plan = self._session.execute(Explain(matching)).scalar_one()
+            return TutorialPage(tutorials, estimated_row_count(plan), total_is_estimate=True)
+        if after is None:
+            # Counted in the same query as the page; a cursor would leave the tutorials before it out of the count.
+            counted = matching.add_columns(func.count().over())
+            rows = self._session.execute(tutorial_page(counted, page, page_size, after, search, dialect_name)).all()
+            if rows or page == 1:
+                return TutorialPage([row.to_domain() for row, _ in rows], rows[0][1] if rows else 0)
+        # A cursor, or an offset past the last page: counting separately is cheap as there are few tutorials to count.
+        tutorials = self.list_tutorials(user_id, filters, page, page_size, search, after)
+        return TutorialPage(tutorials, self._session.execute(count_of(matching)).scalar_one())
+
     def update_tutorial(
         self,
         tutorial_id: TutorialId,
@@ -81,3 +124,6 @@ class SQLAlchemyTutorialRepository(TutorialRepositoryInterface):
     def validate_ownership(self, tutorial_id: TutorialId, user_id: UserId) -> bool:
         obj = self._session.query(SQLAlchemyTutorial).filter_by(id=tutorial_id.value, user_id=user_id.value).first()
         return obj is not None
+
+    def _dialect_name(self) -> str:
+        return self._session.get_bind().dialect.name
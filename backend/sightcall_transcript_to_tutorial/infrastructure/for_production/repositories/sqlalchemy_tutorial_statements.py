@@ -0,0 +1,113 @@
+import json
+from typing import Any, Optional
+
+from sqlalchemy import ClauseElement, ColumnElement, Executable, Insert, Select, func, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.compiler import compiles
+
+from sightcall_transcript_to_tutorial.domain.value_objects import TutorialCursor, UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_production.models.sqlalchemy_tutorial import (
+    TEXT_SEARCH_CONFIGURATION,
+    SQLAlchemyTutorial,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_production.models.sqlalchemy_user_tutorial_count import (
+    SQLAlchemyUserTutorialCount,
+)
+
+# Statements shared by the blocking and the asyncio tutorial repositories, which only differ in how they run them.
+
+
+def matching_tutorials(
+    user_id: UserId, filters: Optional[dict[str, Any]], search: Optional[str], dialect_name: str
+) -> Select[tuple[SQLAlchemyTutorial]]:
+    statement = select(SQLAlchemyTutorial).filter_by(user_id=user_id.value)
+    if filters:
+        if "created_at" in filters:
+            statement = statement.where(SQLAlchemyTutorial.created_at >= filters["created_at"])
+        if "updated_at" in filters:
+            statement = statement.where(SQLAlchemyTutorial.updated_at >= filters["updated_at"])
+        if "created_after" in filters:
+            statement = statement.where(SQLAlchemyTutorial.created_at > filters["created_after"])
+        if "created_before" in filters:
+            statement = statement.where(SQLAlchemyTutorial.created_at < filters["created_before"])
+    if search and dialect_name == "postgresql":
+        # Words anywhere in the title or content, through the tsvector index, or a substring of the title, through
+        # the trigram index.
+        statement = statement.where(
+            or_(
+                SQLAlchemyTutorial.search_vector.bool_op("@@")(_text_search_query(search)),
+                SQLAlchemyTutorial.title.ilike(f"%{search}%"),
+            )
+        )
+    elif search:
+        statement = statement.where(SQLAlchemyTutorial.title.ilike(f"%{search}%"))
+    return statement
+
+
+def tutorial_page(
+    statement: Select,
+    page: int,
+    page_size: int,
+    after: Optional[TutorialCursor],
+    search: Optional[str],
+    dialect_name: str,
+) -> Select:
+    if search and dialect_name == "postgresql":
+        # Most relevant first: matched words, weighted towards the title, plus how close the title is to the search.
+        rank = func.ts_rank_cd(SQLAlchemyTutorial.search_vector, _text_search_query(search)) + func.similarity(
+            SQLAlchemyTutorial.title, search
+        )
+        statement = statement.order_by(rank.desc(), SQLAlchemyTutorial.created_at.desc(), SQLAlchemyTutorial.id.desc())
+        return statement.offset((page - 1) * page_size).limit(page_size)
+    # The id breaks ties between tutorials created at the same time, so that cursors are unambiguous.
+    statement = statement.order_by(SQLAlchemyTutorial.created_at.desc(), SQLAlchemyTutorial.id.desc())
+    if after:
+        # A row comparison, which walks the (user_id, created_at, id) index from the cursor on.
+        statement = statement.where(
+            tuple_(SQLAlchemyTutorial.created_at, SQLAlchemyTutorial.id) < (after.created_at, after.tutorial_id)
+        )
+    else:
+        statement = statement.offset((page - 1) * page_size)
+    return statement.limit(page_size)
+
+
+def count_of(statement: Select) -> Select[tuple[int]]:
+    return statement.with_only_columns(func.count(), maintain_column_froms=True).order_by(None)
+
+
+def add_to_tutorial_count(user_id: str, delta: int, dialect_name: str) -> Insert:
+    # An upsert, so that concurrent first tutorials of a user don't both try to create the counter.
+    insert = postgresql_insert if dialect_name == "postgresql" else sqlite_insert
+    statement = insert(SQLAlchemyUserTutorialCount).values(user_id=user_id, tutorial_count=delta)
+    return statement.on_conflict_do_update(
+        index_elements=[SQLAlchemyUserTutorialCount.user_id],
+        set_={"tutorial_count": SQLAlchemyUserTutorialCount.tutorial_count + delta},
+    )
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN of a statement, in JSON: the planner's estimates without running the statement (PostgreSQL only)."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+def estimated_row_count(plan: Any) -> int:
+    """The number of rows the planner expects from the result of an `Explain`."""
+    # psycopg decodes JSON results, asyncpg leaves them as text.
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler: Any, **kwargs: Any) -> str:
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kwargs)}"
+
+
+def _text_search_query(search: str) -> ColumnElement:
+    # Accepts any user input, with web search engine syntax ("quoted phrases", -excluded, or).
+    return func.websearch_to_tsquery(TEXT_SEARCH_CONFIGURATION, search)
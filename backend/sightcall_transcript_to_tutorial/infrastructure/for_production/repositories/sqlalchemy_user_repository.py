@@ -4,15 +4,24 @@ from sightcall_transcript_to_tutorial.domain.entities import User
 from sightcall_transcript_to_tutorial.domain.repositories import UserRepositoryInterface
 from sightcall_transcript_to_tutorial.domain.value_objects import UserId
 from sightcall_transcript_to_tutorial.infrastructure.for_production.models.sqlalchemy_user import SQLAlchemyUser
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.in_memory_user_cache import (
+    InMemoryUserCache,
+)
 
 
 class SQLAlchemyUserRepository(UserRepositoryInterface):
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, cache: InMemoryUserCache | None = None):
         self._session = session
+        self._cache = cache
 
     def find_by_id(self, user_id: UserId) -> User | None:
-        row = self._session.query(SQLAlchemyUser).filter_by(id=user_id.value).first()
-        return row.to_domain() if row else None
+        user = self._cache.find_by_id(user_id) if self._cache is not None else None
+        if user is None:
+            row = self._session.query(SQLAlchemyUser).filter_by(id=user_id.value).first()
+            user = row.to_domain() if row else None
+            if user is not None and self._cache is not None:
+                self._cache.save(user)
+        return user
 
     def save(self, user: User) -> None:
         obj = self._session.query(SQLAlchemyUser).filter_by(id=user.user_id.value).first()
@@ -23,12 +32,16 @@ class SQLAlchemyUserRepository(UserRepositoryInterface):
             obj = SQLAlchemyUser.from_domain(user)
             self._session.add(obj)
         self._session.commit()
+        if self._cache is not None:
+            self._cache.delete(user.user_id)
 
     def delete(self, user_id: UserId) -> None:
         obj = self._session.query(SQLAlchemyUser).filter_by(id=user_id.value).first()
         if obj:
             self._session.delete(obj)
             self._session.commit()
+        if self._cache is not None:
+            self._cache.delete(user_id)
 
     def find_by_github_id(self, github_id: int) -> User | None:
         obj = self._session.query(SQLAlchemyUser).filter_by(github_id=github_id).first()
@@ -0,0 +1,57 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+from sightcall_transcript_to_tutorial.domain.entities import TutorialGenerationJob
+
+logger = logging.getLogger(__name__)
+
+
+class TutorialGenerationWorkerPool:
+    """
+    Background tasks draining the tutorial generation queue, on the event loop the pool is started from.
+    Each worker awaits `process_next_job` in a loop and sleeps for `poll_interval_seconds` whenever the queue is empty.
+    Jobs generate on the async OpenAI client, so a worker waiting for the model holds neither a thread nor a request
+    thread of the API.
+    """
+
+    def __init__(
+        self,
+        worker_count: int,
+        process_next_job: Callable[[], Awaitable[TutorialGenerationJob | None]],
+        poll_interval_seconds: float = 1.0,
+    ):
+        self._worker_count = worker_count
+        self._process_next_job = process_next_job
+        self._poll_interval_seconds = poll_interval_seconds
+        self._stop_event = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        """Start the workers; must be called from a running event loop."""
+        self._stop_event.clear()
+        for index in range(self._worker_count):
+            self._tasks.append(asyncio.create_task(self._run(), name=f"tutorial-generation-worker-{index}"))
+
+    async def stop(self, timeout_seconds: float | None = None) -> None:
+        """Ask the workers to stop once their current job is done, and wait for them, cancelling them on timeout."""
+        self._stop_event.set()
+        if self._tasks:
+            _, pending = await asyncio.wait(self._tasks, timeout=timeout_seconds)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        self._tasks = []
+
+    async def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                job = await self._process_next_job()
+            except Exception:
+                logger.exception("Tutorial generation worker failed to process the queue")
+                job = None
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), self._poll_interval_seconds)
+                except TimeoutError:
+                    pass
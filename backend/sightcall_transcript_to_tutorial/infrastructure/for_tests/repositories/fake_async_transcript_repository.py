@@ -0,0 +1,37 @@
+from sightcall_transcript_to_tutorial.domain.entities import Transcript
+from sightcall_transcript_to_tutorial.domain.repositories import AsyncTranscriptRepositoryInterface
+from sightcall_transcript_to_tutorial.domain.value_objects import TranscriptId
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_phrases import TranscriptPhrases
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_transcript_repository import (
+    FakeTranscriptRepository,
+)
+
+
+class FakeAsyncTranscriptRepository(AsyncTranscriptRepositoryInterface):
+    """Async view of a FakeTranscriptRepository, so that sync and async code under test see the same transcripts."""
+
+    def __init__(self, transcripts: FakeTranscriptRepository | None = None):
+        self._transcripts = transcripts or FakeTranscriptRepository()
+
+    async def find_by_id(self, transcript_id: TranscriptId) -> Transcript | None:
+        return self._transcripts.find_by_id(transcript_id)
+
+    async def find_existing_ids(self, transcript_ids: list[TranscriptId]) -> set[TranscriptId]:
+        return self._transcripts.find_existing_ids(transcript_ids)
+
+    async def save(self, transcript: Transcript) -> None:
+        self._transcripts.save(transcript)
+
+    async def save_segment(self, transcript_id: TranscriptId, position: int, phrases: TranscriptPhrases) -> None:
+        self._transcripts.save_segment(transcript_id, position, phrases)
+
+    async def save_segmented(
+        self, transcript_id: TranscriptId, timestamp: str, duration_in_ticks: int | float, segment_count: int
+    ) -> None:
+        self._transcripts.save_segmented(transcript_id, timestamp, duration_in_ticks, segment_count)
+
+    async def discard_segmented(self, transcript_id: TranscriptId) -> None:
+        self._transcripts.discard_segmented(transcript_id)
+
+    async def delete(self, transcript_id: TranscriptId) -> None:
+        self._transcripts.delete(transcript_id)
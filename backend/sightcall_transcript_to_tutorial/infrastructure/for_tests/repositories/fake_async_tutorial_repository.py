@@ -0,0 +1,59 @@
+from typing import Any, Optional
+
+from sightcall_transcript_to_tutorial.domain.entities import Tutorial
+from sightcall_transcript_to_tutorial.domain.repositories import AsyncTutorialRepositoryInterface, TutorialPage
+from sightcall_transcript_to_tutorial.domain.value_objects import TutorialCursor, TutorialId, UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_tutorial_repository import (
+    FakeTutorialRepository,
+)
+
+
+class FakeAsyncTutorialRepository(AsyncTutorialRepositoryInterface):
+    """Async view of a FakeTutorialRepository, so that sync and async code under test see the same tutorials."""
+
+    def __init__(self, tutorials: FakeTutorialRepository | None = None):
+        self._tutorials = tutorials or FakeTutorialRepository()
+
+    async def find_by_id(self, tutorial_id: TutorialId) -> Tutorial | None:
+        return self._tutorials.find_by_id(tutorial_id)
+
+    async def save(self, tutorial: Tutorial) -> None:
+        self._tutorials.save(tutorial)
+
+    async def delete(self, tutorial_id: TutorialId) -> None:
+        self._tutorials.delete(tutorial_id)
+
+    async def list_tutorials(
+        self,
+        user_id: UserId,
+        filters: Optional[dict[str, Any]] = None,
+        page: int = 1,
+        page_size: int = 20,
+        search: Optional[str] = None,
+        after: Optional[TutorialCursor] = None,
+    ) -> list[Tutorial]:
+        return self._tutorials.list_tutorials(user_id, filters, page, page_size, search, after)
+
+    async def list_tutorial_page(
+        self,
+        user_id: UserId,
+        filters: Optional[dict[str, Any]] = None,
+        page: int = 1,
+        page_size: int = 20,
+        search: Optional[str] = None,
+        after: Optional[TutorialCursor] = None,
+    ) -> TutorialPage:
+        return self._tutorials.list_tutorial_page(user_id, filters, page, page_size, search, after)
+
+    async def update_tutorial(
+        self,
+        tutorial_id: TutorialId,
+        user_id: UserId,
+        title: Optional[str] = None,
+        content: Optional[str] = None,
+        updated_at: Any = None,
+    ) -> Tutorial | None:
+        return self._tutorials.update_tutorial(tutorial_id, user_id, title, content, updated_at)
+
+    async def validate_ownership(self, tutorial_id: TutorialId, user_id: UserId) -> bool:
+        return self._tutorials.validate_ownership(tutorial_id, user_id)
@@ -0,0 +1,25 @@
+from sightcall_transcript_to_tutorial.domain.entities import User
+from sightcall_transcript_to_tutorial.domain.repositories import AsyncUserRepositoryInterface
+from sightcall_transcript_to_tutorial.domain.value_objects import UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_user_repository import (
+    FakeUserRepository,
+)
+
+
+class FakeAsyncUserRepository(AsyncUserRepositoryInterface):
+    """Async view of a FakeUserRepository, so that sync and async code under test see the same users."""
+
+    def __init__(self, users: FakeUserRepository | None = None):
+        self._users = users or FakeUserRepository()
+
+    async def find_by_id(self, user_id: UserId) -> User | None:
+        return self._users.find_by_id(user_id)
+
+    async def save(self, user: User) -> None:
+        self._users.save(user)
+
+    async def delete(self, user_id: UserId) -> None:
+        self._users.delete(user_id)
+
+    async def find_by_github_id(self, github_id: int) -> User | None:
+        return self._users.find_by_github_id(github_id)
@@ -0,0 +1,15 @@
+from sightcall_transcript_to_tutorial.domain.repositories import GeneratedTutorialCacheRepositoryInterface
+from sightcall_transcript_to_tutorial.domain.value_objects import GeneratedTutorial
+
+
+class FakeGeneratedTutorialCacheRepository(GeneratedTutorialCacheRepositoryInterface):
+    """In-memory fake generation cache, without expiry nor eviction."""
+
+    def __init__(self):
+        self._entries: dict[str, GeneratedTutorial] = {}
+
+    def find_by_key(self, cache_key: str) -> GeneratedTutorial | None:
+        return self._entries.get(cache_key)
+
+    def save(self, cache_key: str, generated_tutorial: GeneratedTutorial) -> None:
+        self._entries[cache_key] = generated_tutorial
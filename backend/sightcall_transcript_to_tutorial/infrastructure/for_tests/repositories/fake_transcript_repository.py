@@ -1,22 +1,55 @@
 from sightcall_transcript_to_tutorial.domain.entities import Transcript
 from sightcall_transcript_to_tutorial.domain.repositories import TranscriptRepositoryInterface
 from sightcall_transcript_to_tutorial.domain.value_objects import TranscriptId
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_content import TranscriptContent
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_phrases import TranscriptPhrases
 
 
 class FakeTranscriptRepository(TranscriptRepositoryInterface):
     """
     In-memory fake repository for Transcript entities.
     Stores TranscriptContent as value object, keyed by transcript_id.value.
+    Segmented transcripts are kept as header and segments and rebuilt on lookup, as the SQL repository does.
     """
 
     def __init__(self):
         self._transcripts: dict[str, Transcript] = {}
+        self._segmented_headers: dict[str, tuple[str, int | float]] = {}
+        self._segments: dict[str, dict[int, TranscriptPhrases]] = {}
 
     def find_by_id(self, transcript_id: TranscriptId) -> Transcript | None:
+        if transcript_id.value in self._segmented_headers:
+            segments = self._segments.get(transcript_id.value, {})
+            phrases = TranscriptPhrases.concatenate([segments[position] for position in sorted(segments)])
+            timestamp, duration_in_ticks = self._segmented_headers[transcript_id.value]
+            return Transcript(transcript_id, TranscriptContent.from_trusted(timestamp, duration_in_ticks, phrases))
         return self._transcripts.get(transcript_id.value)
 
+    def find_existing_ids(self, transcript_ids: list[TranscriptId]) -> set[TranscriptId]:
+        return {
+            transcript_id
+            for transcript_id in transcript_ids
+            if transcript_id.value in self._transcripts or transcript_id.value in self._segmented_headers
+        }
+
     def save(self, transcript: Transcript) -> None:
+        self._segmented_headers.pop(transcript.transcript_id.value, None)
+        self._segments.pop(transcript.transcript_id.value, None)
         self._transcripts[transcript.transcript_id.value] = transcript
 
+    def save_segment(self, transcript_id: TranscriptId, position: int, phrases: TranscriptPhrases) -> None:
+        self._segments.setdefault(transcript_id.value, {})[position] = phrases
+
+    def save_segmented(
+        self, transcript_id: TranscriptId, timestamp: str, duration_in_ticks: int | float, segment_count: int
+    ) -> None:
+        self._transcripts.pop(transcript_id.value, None)
+        self._segmented_headers[transcript_id.value] = (timestamp, duration_in_ticks)
+
+    def discard_segmented(self, transcript_id: TranscriptId) -> None:
+        self.delete(transcript_id)
+
     def delete(self, transcript_id: TranscriptId) -> None:
         self._transcripts.pop(transcript_id.value, None)
+        self._segmented_headers.pop(transcript_id.value, None)
+        self._segments.pop(transcript_id.value, None)
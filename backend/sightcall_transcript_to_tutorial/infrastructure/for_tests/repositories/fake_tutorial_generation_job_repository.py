@@ -0,0 +1,104 @@
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sightcall_transcript_to_tutorial.domain.entities import JobStatus, TutorialGenerationJob
+from sightcall_transcript_to_tutorial.domain.repositories import TutorialGenerationJobRepositoryInterface
+from sightcall_transcript_to_tutorial.domain.value_objects import JobId, TutorialId
+
+
+class FakeTutorialGenerationJobRepository(TutorialGenerationJobRepositoryInterface):
+    """
+    In-memory fake repository for tutorial generation jobs.
+    A lock stands in for the row locks of the real queue, so it can be shared by several worker threads.
+    """
+
+    def __init__(self):
+        self._jobs: dict[str, TutorialGenerationJob] = {}
+        self._lock = threading.Lock()
+
+    def find_by_id(self, job_id: JobId) -> TutorialGenerationJob | None:
+        return self._jobs.get(job_id.value)
+
+    def save(self, job: TutorialGenerationJob) -> None:
+        with self._lock:
+            self._jobs[job.job_id.value] = job
+
+    def save_many(self, jobs: list[TutorialGenerationJob]) -> None:
+        with self._lock:
+            for job in jobs:
+                self._jobs[job.job_id.value] = job
+
+    def claim_next(self, lease_seconds: int) -> TutorialGenerationJob | None:
+        now = datetime.now(timezone.utc)
+        lease_expired_before = now - timedelta(seconds=lease_seconds)
+        with self._lock:
+            claimable = [
+                job
+                for job in self._jobs.values()
+                if job.status == JobStatus.PENDING
+                or (job.status == JobStatus.RUNNING and job.updated_at < lease_expired_before)
+            ]
+            if not claimable:
+                return None
+            job = min(claimable, key=lambda candidate: candidate.created_at)
+            claimed = self._with_status(job, JobStatus.RUNNING, now, claim_token=uuid.uuid4().hex)
+            self._jobs[job.job_id.value] = claimed
+            return claimed
+
+    def renew_lease(self, job_id: JobId, claim_token: str) -> bool:
+        with self._lock:
+            job = self._claimed_job(job_id, claim_token)
+            if job is None:
+                return False
+            self._jobs[job_id.value] = self._with_status(
+                job, JobStatus.RUNNING, datetime.now(timezone.utc), claim_token=claim_token
+            )
+            return True
+
+    def mark_succeeded(self, job_id: JobId, claim_token: str, tutorial_id: TutorialId) -> bool:
+        with self._lock:
+            job = self._claimed_job(job_id, claim_token)
+            if job is None:
+                return False
+            self._jobs[job_id.value] = self._with_status(
+                job, JobStatus.SUCCEEDED, datetime.now(timezone.utc), tutorial_id=tutorial_id, claim_token=claim_token
+            )
+            return True
+
+    def mark_failed(self, job_id: JobId, claim_token: str, error: str) -> bool:
+        with self._lock:
+            job = self._claimed_job(job_id, claim_token)
+            if job is None:
+                return False
+            self._jobs[job_id.value] = self._with_status(
+                job, JobStatus.FAILED, datetime.now(timezone.utc), error=error, claim_token=claim_token
+            )
+            return True
+
+    def _claimed_job(self, job_id: JobId, claim_token: str) -> TutorialGenerationJob | None:
+        job = self._jobs.get(job_id.value)
+        if job is None or job.status != JobStatus.RUNNING or job.claim_token != claim_token:
+            return None
+        return job
+
+    @staticmethod
+    def _with_status(
+        job: TutorialGenerationJob,
+        status: JobStatus,
+        updated_at: datetime,
+        tutorial_id: TutorialId | None = None,
+        error: str | None = None,
+        claim_token: str | None = None,
+    ) -> TutorialGenerationJob:
+        return TutorialGenerationJob(
+            job_id=job.job_id,
+            transcript_id=job.transcript_id,
+            user_id=job.user_id,
+            status=status,
+            tutorial_id=tutorial_id,
+            error=error,
+            created_at=job.created_at,
+            updated_at=updated_at,
+            claim_token=claim_token,
+        )
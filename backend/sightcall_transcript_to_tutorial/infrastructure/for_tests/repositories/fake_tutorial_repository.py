@@ -1,8 +1,8 @@
 from typing import Any, Optional
 
 from sightcall_transcript_to_tutorial.domain.entities import Tutorial
-from sightcall_transcript_to_tutorial.domain.repositories import TutorialRepositoryInterface
-from sightcall_transcript_to_tutorial.domain.value_objects import TutorialId, UserId
+from sightcall_transcript_to_tutorial.domain.repositories import TutorialPage, TutorialRepositoryInterface
+from sightcall_transcript_to_tutorial.domain.value_objects import TutorialCursor, TutorialId, UserId
 
 
 class FakeTutorialRepository(TutorialRepositoryInterface):
@@ -25,13 +25,25 @@ class FakeTutorialRepository(TutorialRepositoryInterface):
         page: int = 1,
         page_size: int = 20,
         search: Optional[str] = None,
+        after: Optional[TutorialCursor] = None,
     ) -> list[Tutorial]:
+        return self.list_tutorial_page(user_id, filters, page, page_size, search, after).tutorials
+
+    def list_tutorial_page(
+        self,
+        user_id: UserId,
+        filters: Optional[dict[str, Any]] = None,
+        page: int = 1,
+        page_size: int = 20,
+        search: Optional[str] = None,
+        after: Optional[TutorialCursor] = None,
+    ) -> TutorialPage:
         # Filter by user
         tutorials = [t for t in self._tutorials.values() if t.user_id == user_id]
-        # Search by title (case-insensitive)
+        # Search in title and content (case-insensitive)
         if search:
             search_lower = search.lower()
-            tutorials = [t for t in tutorials if search_lower in t.title.lower()]
+            tutorials = [t for t in tutorials if search_lower in t.title.lower() or search_lower in t.content.lower()]
         # Apply filters (e.g., created_at)
         if filters:
             for key, value in filters.items():
@@ -39,10 +51,21 @@ class FakeTutorialRepository(TutorialRepositoryInterface):
                     tutorials = [t for t in tutorials if t.created_at > value]
                 if key == "created_before":
                     tutorials = [t for t in tutorials if t.created_at < value]
+        # Newest first, as the real repository
+        tutorials.sort(key=lambda t: (t.created_at, t.tutorial_id.value), reverse=True)
+        if search:
+            # Ranked, as the real repository: title matches first (the sort is stable)
+            tutorials.sort(key=lambda t: search.lower() not in t.title.lower())
+        total = len(tutorials)
         # Pagination
+        if after:
+            tutorials = [
+                t for t in tutorials if (t.created_at, t.tutorial_id.value) < (after.created_at, after.tutorial_id)
+            ]
+            return TutorialPage(tutorials[:page_size], total)
         start = (page - 1) * page_size
         end = start + page_size
-        return tutorials[start:end]
+        return TutorialPage(tutorials[start:end], total)
 
     def update_tutorial(
         self,
@@ -1,11 +1,53 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from sightcall_transcript_to_tutorial import __version__
+from sightcall_transcript_to_tutorial.domain.config.settings import settings
+from sightcall_transcript_to_tutorial.infrastructure.for_production.models.base import (
+    async_engine,
+    engine,
+    warm_up_async_engine,
+    warm_up_engine,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_production.workers.tutorial_generation_worker_pool import (
+    TutorialGenerationWorkerPool,
+)
+from sightcall_transcript_to_tutorial.presentation.api.dependencies import (
+    build_tutorial_generation_job_processor,
+    container,
+)
 from sightcall_transcript_to_tutorial.presentation.api.middlewares.jwt_middleware import JWTMiddleware
-from sightcall_transcript_to_tutorial.presentation.api.routers import auth, tutorial
+from sightcall_transcript_to_tutorial.presentation.api.routers import auth, metrics, tutorial
 from sightcall_transcript_to_tutorial.presentation.api.routers.transcripts import router as transcripts_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.database_pool_warm_up:
+        await asyncio.to_thread(warm_up_engine, engine, settings.database_pool_size)
+        await warm_up_async_engine(async_engine, settings.database_pool_size)
+    # Tutorial generation runs in background workers polling the jobs table, see POST /tutorials/generate.
+    # Setting TUTORIAL_GENERATION_WORKERS to 0 disables them, e.g. on replicas that should only serve requests.
+    if settings.tutorial_generation_workers <= 0:
+        yield
+        await container.close()
+        await async_engine.dispose()
+        return
+    worker_pool = TutorialGenerationWorkerPool(
+        worker_count=settings.tutorial_generation_workers,
+        process_next_job=build_tutorial_generation_job_processor(),
+        poll_interval_seconds=settings.tutorial_generation_poll_interval_seconds,
+    )
+    worker_pool.start()
+    yield
+    await worker_pool.stop()
+    await container.close()
+    await async_engine.dispose()
+
+
 app = FastAPI(
     title="Sightcall Transcript to Tutorial API",
     description="An API that converts a Sightcall transcripts to tutorials",
@@ -14,6 +56,7 @@ app = FastAPI(
         "name": "AGPL-3.0-or-later",
         "url": "https://www.gnu.org/licenses/agpl-3.0.en.html",
     },
+    lifespan=lifespan,
 )
 
 # Add CORS middleware to allow requests from localhost:3000
@@ -31,6 +74,7 @@ app.add_middleware(JWTMiddleware)
 app.include_router(auth.router)
 app.include_router(tutorial.router)
 app.include_router(transcripts_router)
+app.include_router(metrics.router)
 
 
 @app.get("/")
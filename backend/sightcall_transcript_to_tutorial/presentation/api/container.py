@@ -0,0 +1,85 @@
+import threading
+from typing import Callable
+
+import httpx
+
+from sightcall_transcript_to_tutorial.domain.gateways.tutorial_generation_lock_interface import (
+    TutorialGenerationLockInterface,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_production.gateways.in_process_tutorial_generation_lock import (
+    InProcessTutorialGenerationLock,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_production.gateways.openai_tutorial_generator_gateway import (
+    OpenAITutorialGeneratorGateway,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_production.gateways.postgres_advisory_tutorial_generation_lock import (
+    PostgresAdvisoryTutorialGenerationLock,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_production.models.base import engine
+
+GITHUB_HTTP_TIMEOUT_SECONDS = 10.0
+
+
+class DependencyContainer:
+    """
+    Gateways and HTTP clients that are expensive to set up (settings reads, connection pools, TLS handshakes): each is
+    built on first use, then shared by every request of the process until `close` is called on app shutdown.
+    Tests can hand in their own factories, or override the `dependencies` getters as usual.
+    """
+
+    def __init__(
+        self,
+        tutorial_generator_gateway_factory: Callable[[], OpenAITutorialGeneratorGateway] | None = None,
+        github_http_client_factory: Callable[[], httpx.Client] | None = None,
+        tutorial_generation_lock_factory: Callable[[], TutorialGenerationLockInterface] | None = None,
+    ):
+        self._tutorial_generator_gateway_factory = tutorial_generator_gateway_factory or OpenAITutorialGeneratorGateway
+        self._github_http_client_factory = github_http_client_factory or _build_github_http_client
+        self._tutorial_generation_lock_factory = tutorial_generation_lock_factory or _build_tutorial_generation_lock
+        self._tutorial_generator_gateway: OpenAITutorialGeneratorGateway | None = None
+        self._github_http_client: httpx.Client | None = None
+        self._tutorial_generation_lock: TutorialGenerationLockInterface | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def tutorial_generator_gateway(self) -> OpenAITutorialGeneratorGateway:
+        with self._lock:
+            if self._tutorial_generator_gateway is None:
+                self._tutorial_generator_gateway = self._tutorial_generator_gateway_factory()
+            return self._tutorial_generator_gateway
+
+    @property
+    def github_http_client(self) -> httpx.Client:
+        with self._lock:
+            if self._github_http_client is None:
+                self._github_http_client = self._github_http_client_factory()
+            return self._github_http_client
+
+    @property
+    def tutorial_generation_lock(self) -> TutorialGenerationLockInterface:
+        with self._lock:
+            if self._tutorial_generation_lock is None:
+                self._tutorial_generation_lock = self._tutorial_generation_lock_factory()
+            return self._tutorial_generation_lock
+
+    async def close(self) -> None:
+        """Close what was built so far. The container can be used again afterwards: it then builds new instances."""
+        with self._lock:
+            tutorial_generator_gateway, self._tutorial_generator_gateway = self._tutorial_generator_gateway, None
+            github_http_client, self._github_http_client = self._github_http_client, None
+        if tutorial_generator_gateway is not None:
+            await tutorial_generator_gateway.close()
+        if github_http_client is not None:
+            github_http_client.close()
+
+
+def _build_github_http_client() -> httpx.Client:
+    return httpx.Client(timeout=GITHUB_HTTP_TIMEOUT_SECONDS)
+
+
+def _build_tutorial_generation_lock() -> TutorialGenerationLockInterface:
+    # Advisory locks coalesce generations across every process sharing the database; other databases, such as SQLite
+    # in development, only get coalescing within this process.
+    if engine.dialect.name == "postgresql":
+        return PostgresAdvisoryTutorialGenerationLock(engine)
+    return InProcessTutorialGenerationLock()
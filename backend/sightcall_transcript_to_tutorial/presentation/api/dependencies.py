@@ -1,20 +1,56 @@
+import asyncio
+from contextlib import (
+    AbstractAsyncContextManager,
+    AbstractContextManager,
+    asynccontextmanager,
+    contextmanager,
+)
 from http import HTTPStatus
-from typing import Any, Dict, Generator
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, Dict, Generator, Iterator
 
 from fastapi import Depends, HTTPException, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import Pool
 
+from sightcall_transcript_to_tutorial.application.commands.generate_tutorial_command import (
+    GenerateTutorialCommandHandler,
+)
+from sightcall_transcript_to_tutorial.application.commands.process_next_tutorial_generation_job_command import (
+    ProcessNextTutorialGenerationJobCommand,
+    ProcessNextTutorialGenerationJobCommandHandler,
+)
+from sightcall_transcript_to_tutorial.domain.config.settings import settings
+from sightcall_transcript_to_tutorial.domain.entities.tutorial_generation_job import TutorialGenerationJob
 from sightcall_transcript_to_tutorial.domain.entities.user import User
 from sightcall_transcript_to_tutorial.domain.gateways.authentication_gateway_interface import (
     AuthenticationGatewayInterface,
 )
+from sightcall_transcript_to_tutorial.domain.gateways.tutorial_generation_lock_interface import (
+    TutorialGenerationLockInterface,
+)
 from sightcall_transcript_to_tutorial.domain.gateways.tutorial_generator_gateway_interface import (
     TutorialGeneratorGatewayInterface,
 )
+from sightcall_transcript_to_tutorial.domain.repositories.async_transcript_repository_interface import (
+    AsyncTranscriptRepositoryInterface,
+)
+from sightcall_transcript_to_tutorial.domain.repositories.async_tutorial_repository_interface import (
+    AsyncTutorialRepositoryInterface,
+)
+from sightcall_transcript_to_tutorial.domain.repositories.async_user_repository_interface import (
+    AsyncUserRepositoryInterface,
+)
+from sightcall_transcript_to_tutorial.domain.repositories.generated_tutorial_cache_repository_interface import (
+    GeneratedTutorialCacheRepositoryInterface,
+)
 from sightcall_transcript_to_tutorial.domain.repositories.transcript_repository_interface import (
     TranscriptRepositoryInterface,
 )
+from sightcall_transcript_to_tutorial.domain.repositories.tutorial_generation_job_repository_interface import (
+    TutorialGenerationJobRepositoryInterface,
+)
 from sightcall_transcript_to_tutorial.domain.repositories.tutorial_repository_interface import (
     TutorialRepositoryInterface,
 )
@@ -23,21 +59,58 @@ from sightcall_transcript_to_tutorial.domain.value_objects.user_id import UserId
 from sightcall_transcript_to_tutorial.infrastructure.for_production.gateways.github_authentication_gateway import (
     GitHubAuthenticationGateway,
 )
-from sightcall_transcript_to_tutorial.infrastructure.for_production.gateways.openai_tutorial_generator_gateway import (
-    OpenAITutorialGeneratorGateway,
+from sightcall_transcript_to_tutorial.infrastructure.for_production.models.base import (
+    AsyncSessionLocal,
+    SessionLocal,
+    async_engine,
+    engine,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.async_sqlalchemy_transcript_repository import (
+    AsyncSQLAlchemyTranscriptRepository,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.async_sqlalchemy_tutorial_repository import (
+    AsyncSQLAlchemyTutorialRepository,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.async_sqlalchemy_user_repository import (
+    AsyncSQLAlchemyUserRepository,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.in_memory_generated_tutorial_cache_repository import (
+    InMemoryGeneratedTutorialCacheRepository,
+    TieredGeneratedTutorialCacheRepository,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.in_memory_user_cache import (
+    InMemoryUserCache,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.sqlalchemy_generated_tutorial_cache_repository import (
+    SQLAlchemyGeneratedTutorialCacheRepository,
 )
-from sightcall_transcript_to_tutorial.infrastructure.for_production.models.base import SessionLocal
 from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.sqlalchemy_transcript_repository import (
     SQLAlchemyTranscriptRepository,
 )
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.sqlalchemy_tutorial_generation_job_repository import (
+    SQLAlchemyTutorialGenerationJobRepository,
+)
 from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.sqlalchemy_tutorial_repository import (
     SQLAlchemyTutorialRepository,
 )
 from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.sqlalchemy_user_repository import (
     SQLAlchemyUserRepository,
 )
+from sightcall_transcript_to_tutorial.presentation.api.container import DependencyContainer
+from sightcall_transcript_to_tutorial.presentation.api.middlewares.jwt_middleware import verified_token_cache
+from sightcall_transcript_to_tutorial.presentation.api.middlewares.verified_token_cache import VerifiedTokenCache
 
 security = HTTPBearer()
+# Front tier of the generation cache, shared by every worker of this process.
+generated_tutorial_memory_cache = InMemoryGeneratedTutorialCacheRepository(
+    max_entries=settings.tutorial_cache_memory_max_entries, ttl_seconds=settings.tutorial_cache_ttl_seconds
+)
+# Users looked up by the authenticated routes, shared by every request of this process.
+user_cache = InMemoryUserCache(
+    max_entries=settings.user_cache_max_entries, ttl_seconds=settings.user_cache_ttl_seconds
+)
+# Shared gateways and HTTP clients, closed by the app lifespan on shutdown.
+container = DependencyContainer()
 
 
 def get_session() -> Generator[Session, None, None]:
@@ -48,24 +121,137 @@ def get_session() -> Generator[Session, None, None]:
         session.close()
 
 
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+def get_database_pools() -> Dict[str, Pool]:
+    return {"sync": engine.pool, "async": async_engine.pool}
+
+
+def get_verified_token_cache() -> VerifiedTokenCache:
+    return verified_token_cache
+
+
 def get_transcript_repository(session: Session = Depends(get_session)) -> TranscriptRepositoryInterface:
     return SQLAlchemyTranscriptRepository(session)
 
 
+def get_async_transcript_repository(
+    session: AsyncSession = Depends(get_async_session),
+) -> AsyncTranscriptRepositoryInterface:
+    return AsyncSQLAlchemyTranscriptRepository(session)
+
+
 def get_tutorial_generator_gateway() -> TutorialGeneratorGatewayInterface:
-    return OpenAITutorialGeneratorGateway()
+    return container.tutorial_generator_gateway
 
 
 def get_tutorial_repository(session: Session = Depends(get_session)) -> TutorialRepositoryInterface:
     return SQLAlchemyTutorialRepository(session)
 
 
+def get_async_tutorial_repository(
+    session: AsyncSession = Depends(get_async_session),
+) -> AsyncTutorialRepositoryInterface:
+    return AsyncSQLAlchemyTutorialRepository(session)
+
+
+def get_generated_tutorial_cache_repository(
+    session: Session = Depends(get_session),
+) -> GeneratedTutorialCacheRepositoryInterface:
+    return TieredGeneratedTutorialCacheRepository(
+        front=generated_tutorial_memory_cache,
+        back=SQLAlchemyGeneratedTutorialCacheRepository(
+            session, max_entries=settings.tutorial_cache_max_entries, ttl_seconds=settings.tutorial_cache_ttl_seconds
+        ),
+    )
+
+
+@asynccontextmanager
+async def open_async_tutorial_repository() -> AsyncIterator[AsyncTutorialRepositoryInterface]:
+    async with AsyncSessionLocal() as session:
+        yield AsyncSQLAlchemyTutorialRepository(session)
+
+
+@contextmanager
+def open_generated_tutorial_cache_repository() -> Iterator[GeneratedTutorialCacheRepositoryInterface]:
+    session = SessionLocal()
+    try:
+        yield get_generated_tutorial_cache_repository(session)
+    finally:
+        session.close()
+
+
+def get_async_tutorial_repository_opener() -> Callable[
+    [], AbstractAsyncContextManager[AsyncTutorialRepositoryInterface]
+]:
+    """
+    Open a tutorial repository on a session of its own, for streamed responses: their body runs once the request's
+    dependencies, sessions included, are torn down.
+    """
+    return open_async_tutorial_repository
+
+
+def get_generated_tutorial_cache_repository_opener() -> Callable[
+    [], AbstractContextManager[GeneratedTutorialCacheRepositoryInterface]
+]:
+    """Same as `get_async_tutorial_repository_opener`, for the generation cache."""
+    return open_generated_tutorial_cache_repository
+
+
+def get_tutorial_generation_lock() -> TutorialGenerationLockInterface:
+    return container.tutorial_generation_lock
+
+
+def get_tutorial_generation_job_repository(
+    session: Session = Depends(get_session),
+) -> TutorialGenerationJobRepositoryInterface:
+    return SQLAlchemyTutorialGenerationJobRepository(session)
+
+
+def build_tutorial_generation_job_processor() -> Callable[[], Awaitable[TutorialGenerationJob | None]]:
+    """
+    Build the coroutine function run in a loop by the generation workers: it processes the next queued job, if any,
+    in a session of its own. The OpenAI gateway is shared with the API routes.
+    """
+    tutorial_generator_gateway = get_tutorial_generator_gateway()
+    command = ProcessNextTutorialGenerationJobCommand(lease_seconds=settings.tutorial_generation_job_lease_seconds)
+
+    async def process_next_job() -> TutorialGenerationJob | None:
+        session = SessionLocal()
+        lease_session = SessionLocal()
+        try:
+            handler = ProcessNextTutorialGenerationJobCommandHandler(
+                SQLAlchemyTutorialGenerationJobRepository(session),
+                GenerateTutorialCommandHandler(
+                    SQLAlchemyTranscriptRepository(session),
+                    tutorial_generator_gateway,
+                    SQLAlchemyTutorialRepository(session),
+                    get_generated_tutorial_cache_repository(session),
+                    get_tutorial_generation_lock(),
+                ),
+                lease_repository=SQLAlchemyTutorialGenerationJobRepository(lease_session),
+            )
+            return await handler.handle(command)
+        finally:
+            await asyncio.to_thread(lease_session.close)
+            await asyncio.to_thread(session.close)
+
+    return process_next_job
+
+
 def get_authentication_gateway(user_repository: UserRepositoryInterface) -> AuthenticationGatewayInterface:
-    return GitHubAuthenticationGateway(user_repository)
+    return GitHubAuthenticationGateway(user_repository, http_client=container.github_http_client)
 
 
 def get_user_repository(session: Session = Depends(get_session)) -> UserRepositoryInterface:
-    return SQLAlchemyUserRepository(session)
+    return SQLAlchemyUserRepository(session, cache=user_cache)
+
+
+def get_async_user_repository(session: AsyncSession = Depends(get_async_session)) -> AsyncUserRepositoryInterface:
+    return AsyncSQLAlchemyUserRepository(session, cache=user_cache)
 
 
 def get_current_user_from_request_state(
@@ -74,11 +260,49 @@ def get_current_user_from_request_state(
     """
     Extract user from request state (set by JWT middleware from cookie).
     This replaces the HTTPBearer dependency for cookie-based authentication.
+    For sync routes, which already take a session from the sync pool: see `get_async_current_user_from_request_state`
+    for async routes.
+    """
+    user_payload = _extract_user_payload_from_request(request)
+    return _build_user_from_payload(user_payload, user_repository)
+
+
+async def get_async_current_user_from_request_state(
+    request: Request, user_repository: AsyncUserRepositoryInterface = Depends(get_async_user_repository)
+) -> User:
+    """
+    Same as `get_current_user_from_request_state`, for async routes: looking the user up does not take a threadpool
+    worker nor a connection of the sync pool.
+    """
+    user_payload = _extract_user_payload_from_request(request)
+    return await _build_user_from_payload_async(user_payload, user_repository)
+
+
+def get_current_user_for_reads(
+    request: Request, user_repository: UserRepositoryInterface = Depends(get_user_repository)
+) -> User:
+    """
+    Same as `get_current_user_from_request_state`, for routes that only read the user's own data. With
+    TRUST_TOKEN_CLAIMS_ON_READS on, the user is rebuilt from the claims of the token, which the middleware already
+    verified the signature of, without looking it up: a user deleted since the token was issued can then still read
+    until the token expires. Off by default, so that such a user is refused like on every other route.
     """
     user_payload = _extract_user_payload_from_request(request)
+    if settings.trust_token_claims_on_reads:
+        return _build_user_from_claims(user_payload)
     return _build_user_from_payload(user_payload, user_repository)
 
 
+async def get_async_current_user_for_reads(
+    request: Request, user_repository: AsyncUserRepositoryInterface = Depends(get_async_user_repository)
+) -> User:
+    """Same as `get_current_user_for_reads`, for async routes."""
+    user_payload = _extract_user_payload_from_request(request)
+    if settings.trust_token_claims_on_reads:
+        return _build_user_from_claims(user_payload)
+    return await _build_user_from_payload_async(user_payload, user_repository)
+
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     user_repository=Depends(get_user_repository),
@@ -98,15 +322,38 @@ def _extract_user_payload_from_request(request: Request) -> Dict[str, Any]:
     return payload
 
 
-def _build_user_from_payload(payload: Dict[str, Any], user_repository: UserRepositoryInterface) -> User:
-    """Build User entity from JWT payload."""
+def _build_user_from_claims(payload: Dict[str, Any]) -> User:
+    """Build User entity from the JWT payload alone."""
     user_id = payload.get("user_id")
     name = payload.get("username")
 
     if not user_id or not name:
         raise HTTPException(status_code=HTTPStatus.UNAUTHORIZED.value, detail="Invalid token payload")
+    return User(UserId(user_id), name=name, github_id=payload.get("github_id"))
 
-    user = user_repository.find_by_id(UserId(user_id))
+
+def _build_user_from_payload(payload: Dict[str, Any], user_repository: UserRepositoryInterface) -> User:
+    """Build User entity from JWT payload."""
+    user = user_repository.find_by_id(_user_id_from_payload(payload))
     if not user:
         raise HTTPException(status_code=HTTPStatus.UNAUTHORIZED.value, detail="Invalid token payload")
     return user
+
+
+async def _build_user_from_payload_async(
+    payload: Dict[str, Any], user_repository: AsyncUserRepositoryInterface
+) -> User:
+    """Build User entity from JWT payload."""
+    user = await user_repository.find_by_id(_user_id_from_payload(payload))
+    if not user:
+        raise HTTPException(status_code=HTTPStatus.UNAUTHORIZED.value, detail="Invalid token payload")
+    return user
+
+
+def _user_id_from_payload(payload: Dict[str, Any]) -> UserId:
+    user_id = payload.get("user_id")
+    name = payload.get("username")
+
+    if not user_id or not name:
+        raise HTTPException(status_code=HTTPStatus.UNAUTHORIZED.value, detail="Invalid token payload")
+    return UserId(user_id)
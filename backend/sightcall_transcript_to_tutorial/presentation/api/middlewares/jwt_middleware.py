@@ -1,51 +1,90 @@
-from fastapi import Request
 from fastapi.responses import JSONResponse
 from jose import jwt
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import HTTPConnection
 from starlette.status import HTTP_401_UNAUTHORIZED
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from sightcall_transcript_to_tutorial.domain.config.settings import settings
+from sightcall_transcript_to_tutorial.presentation.api.middlewares.verified_token_cache import VerifiedTokenCache
 
 PUBLIC_ENDPOINTS = ["/auth/github/login", "/auth/github/callback", "/docs", "/openapi.json"]
+# Matched in one call with `str.startswith`, rather than trying each endpoint in turn.
+_PUBLIC_ENDPOINT_PREFIXES = tuple(PUBLIC_ENDPOINTS)
 
+# Payloads of the tokens verified so far, shared by every request of this process.
+verified_token_cache = VerifiedTokenCache(max_entries=settings.jwt_cache_max_entries)
+
+
+class JWTMiddleware:
+    """
+    Pure ASGI middleware rejecting requests to protected routes without a valid token, and attaching the payload of
+    the token to the request state (`request.state.user`) otherwise.
+    Once a request is let through, its messages are passed along untouched: no task or stream is wrapped around the
+    app, so streamed responses (server-sent events, files) reach the client chunk by chunk.
+    """
+
+    def __init__(self, app: ASGIApp, token_cache: VerifiedTokenCache | None = None):
+        self.app = app
+        self._token_cache = token_cache or verified_token_cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Only HTTP requests are authenticated; lifespan and websocket scopes go straight through
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-class JWTMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
         # Allow OPTIONS requests (CORS preflight) to pass through without authentication
-        if request.method == "OPTIONS":
-            return await call_next(request)
+        if scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
 
         # Allow public endpoints without JWT
-        if any(map(request.url.path.startswith, PUBLIC_ENDPOINTS)) or request.url.path == "/":
-            return await call_next(request)
+        path = scope["path"]
+        if path == "/" or path.startswith(_PUBLIC_ENDPOINT_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        connection = HTTPConnection(scope)
 
         # Try to get token from Authorization header first (for API calls)
-        token = self._extract_token_from_header(request)
+        token = self._extract_token_from_header(connection)
 
         # If no header token, try to get from cookie (for browser requests)
         if not token:
-            token = self._extract_token_from_cookie(request)
+            token = self._extract_token_from_cookie(connection)
 
         if not token:
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=HTTP_401_UNAUTHORIZED, content={"detail": "Missing or invalid authentication token"}
             )
+            await response(scope, receive, send)
+            return
 
         try:
-            payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
-            request.state.user = payload  # Attach user info to request.state
+            payload = self._verify_token(token)
         except Exception as e:
-            return JSONResponse(status_code=HTTP_401_UNAUTHORIZED, content={"detail": f"Invalid token: {repr(e)}"})
+            response = JSONResponse(status_code=HTTP_401_UNAUTHORIZED, content={"detail": f"Invalid token: {repr(e)}"})
+            await response(scope, receive, send)
+            return
 
-        return await call_next(request)
+        connection.state.user = payload  # Attach user info to the request state
+        await self.app(scope, receive, send)
+
+    def _verify_token(self, token: str) -> dict:
+        """Decode and verify the token, unless it was already verified and has not expired since"""
+        payload = self._token_cache.find(token)
+        if payload is None:
+            payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
+            self._token_cache.save(token, payload)
+        return payload
 
-    def _extract_token_from_header(self, request: Request) -> str | None:
+    def _extract_token_from_header(self, connection: HTTPConnection) -> str | None:
         """Extract JWT token from Authorization header"""
-        auth_header = request.headers.get("Authorization")
+        auth_header = connection.headers.get("Authorization")
         if not auth_header or not auth_header.startswith("Bearer "):
             return None
         return auth_header.split(" ", 1)[1]
 
-    def _extract_token_from_cookie(self, request: Request) -> str | None:
+    def _extract_token_from_cookie(self, connection: HTTPConnection) -> str | None:
         """Extract JWT token from HttpOnly cookie"""
-        return request.cookies.get("access_token")
+        return connection.cookies.get("access_token")
@@ -0,0 +1,64 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict
+
+
+@dataclass(frozen=True)
+class VerifiedTokenCacheStatistics:
+    entries: int
+    hits: int
+    misses: int
+
+
+class VerifiedTokenCache:
+    """
+    Process-local LRU cache of the payloads of tokens whose signature was verified, keyed by a hash of the token, so
+    that a token presented on every request of a session is only decoded and verified once. An entry is dropped when
+    the `exp` claim of its token passes, if it has one: the token is then verified again, and rejected.
+    """
+
+    def __init__(self, max_entries: int, clock: Callable[[], float] = time.time):
+        self._max_entries = max_entries
+        self._clock = clock
+        # Least recently used first; values are (expires_at, payload).
+        self._entries: OrderedDict[str, tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def find(self, token: str) -> Dict[str, Any] | None:
+        key = _key_of(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self._clock():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            # A copy, so that a request changing its payload does not change it for the next ones.
+            return dict(entry[1])
+
+    def save(self, token: str, payload: Dict[str, Any]) -> None:
+        expires_at = payload.get("exp")
+        if not isinstance(expires_at, (int, float)):
+            expires_at = float("inf")
+        key = _key_of(token)
+        with self._lock:
+            self._entries[key] = (expires_at, dict(payload))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def statistics(self) -> VerifiedTokenCacheStatistics:
+        with self._lock:
+            return VerifiedTokenCacheStatistics(entries=len(self._entries), hits=self._hits, misses=self._misses)
+
+
+def _key_of(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
@@ -9,13 +9,16 @@ from sightcall_transcript_to_tutorial.application.commands.login_command import
 from sightcall_transcript_to_tutorial.application.queries.get_authenticated_user_query import GetAuthenticatedUserQuery
 from sightcall_transcript_to_tutorial.domain.config import settings
 from sightcall_transcript_to_tutorial.infrastructure.for_production.gateways.github_authentication_gateway import (
-    GitHubAuthenticationGateway,
     GitHubOAuthError,
 )
 from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.sqlalchemy_user_repository import (
     SQLAlchemyUserRepository,
 )
-from sightcall_transcript_to_tutorial.presentation.api.dependencies import get_session
+from sightcall_transcript_to_tutorial.presentation.api.dependencies import (
+    get_authentication_gateway,
+    get_session,
+    user_cache,
+)
 from sightcall_transcript_to_tutorial.presentation.api.schemas.auth import AuthResponseSchema
 
 router = APIRouter(prefix="/auth/github", tags=["auth"])
@@ -56,16 +59,16 @@ def logout():
 
 def _execute_login_command(db: Session) -> str:
     """Execute the login command to get GitHub OAuth URL."""
-    user_repo = SQLAlchemyUserRepository(db)
-    gateway = GitHubAuthenticationGateway(user_repo)
+    user_repo = SQLAlchemyUserRepository(db, cache=user_cache)
+    gateway = get_authentication_gateway(user_repo)
     command = LoginCommand(gateway)
     return command.execute()
 
 
 def _authenticate_user_with_code(code: str, db: Session) -> str:
     """Authenticate user with OAuth code and return JWT token."""
-    user_repo = SQLAlchemyUserRepository(db)
-    gateway = GitHubAuthenticationGateway(user_repo)
+    user_repo = SQLAlchemyUserRepository(db, cache=user_cache)
+    gateway = get_authentication_gateway(user_repo)
     query = GetAuthenticatedUserQuery(gateway, user_repo)
 
     try:
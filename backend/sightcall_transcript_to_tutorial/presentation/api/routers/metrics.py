@@ -0,0 +1,72 @@
+from typing import Dict
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.pool import Pool
+
+from sightcall_transcript_to_tutorial.infrastructure.for_production.models.instrumented_pool import (
+    InstrumentedQueuePool,
+    PoolStatistics,
+)
+from sightcall_transcript_to_tutorial.presentation.api.dependencies import get_database_pools, get_verified_token_cache
+from sightcall_transcript_to_tutorial.presentation.api.middlewares.verified_token_cache import (
+    VerifiedTokenCache,
+    VerifiedTokenCacheStatistics,
+)
+
+router = APIRouter(tags=["metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Name, type, help and value of each metric exposed for every connection pool.
+_POOL_METRICS = (
+    ("db_pool_size", "gauge", "Connections the pool keeps open.", lambda s: s.size),
+    ("db_pool_checked_out", "gauge", "Connections currently in use.", lambda s: s.checked_out),
+    ("db_pool_overflow", "gauge", "Connections currently open beyond the pool size.", lambda s: s.overflow),
+    ("db_pool_checkouts_total", "counter", "Connections handed out by the pool.", lambda s: s.checkouts),
+    ("db_pool_timeouts_total", "counter", "Checkouts that gave up waiting for a connection.", lambda s: s.timeouts),
+    (
+        "db_pool_wait_seconds_total",
+        "counter",
+        "Time spent waiting for a connection, summed over checkouts.",
+        lambda s: s.wait_seconds_total,
+    ),
+    ("db_pool_wait_seconds_max", "gauge", "Longest wait for a connection.", lambda s: s.wait_seconds_max),
+)
+
+
+# Name, type, help and value of each metric exposed for the cache of verified tokens.
+_TOKEN_CACHE_METRICS = (
+    ("jwt_cache_entries", "gauge", "Verified tokens currently cached.", lambda s: s.entries),
+    ("jwt_cache_hits_total", "counter", "Tokens found verified in the cache.", lambda s: s.hits),
+    ("jwt_cache_misses_total", "counter", "Tokens that had to be decoded and verified.", lambda s: s.misses),
+)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def get_metrics(
+    pools: Dict[str, Pool] = Depends(get_database_pools),
+    token_cache: VerifiedTokenCache = Depends(get_verified_token_cache),
+):
+    """Connection pool and token cache metrics, in the Prometheus text format."""
+    statistics = {name: pool.statistics() for name, pool in pools.items() if isinstance(pool, InstrumentedQueuePool)}
+    body = _render_pool_metrics(statistics) + _render_token_cache_metrics(token_cache.statistics())
+    return PlainTextResponse(body, media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+def _render_pool_metrics(statistics: Dict[str, PoolStatistics]) -> str:
+    lines = []
+    for metric, kind, description, value_of in _POOL_METRICS:
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} {kind}")
+        lines.extend(f'{metric}{{engine="{name}"}} {value_of(pool)}' for name, pool in statistics.items())
+    return "\n".join(lines) + "\n"
+
+
+def _render_token_cache_metrics(statistics: VerifiedTokenCacheStatistics) -> str:
+    lines = []
+    for metric, kind, description, value_of in _TOKEN_CACHE_METRICS:
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} {kind}")
+        lines.append(f"{metric} {value_of(statistics)}")
+    return "\n".join(lines) + "\n"
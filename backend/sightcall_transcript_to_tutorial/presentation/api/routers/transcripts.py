@@ -1,17 +1,24 @@
 from http import HTTPStatus
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
 
 from sightcall_transcript_to_tutorial.application.commands.upload_transcript_command import (
     UploadTranscriptCommand,
     UploadTranscriptCommandHandler,
 )
+from sightcall_transcript_to_tutorial.application.commands.upload_transcript_in_segments_command import (
+    UploadTranscriptInSegmentsCommand,
+    UploadTranscriptInSegmentsCommandHandler,
+)
 from sightcall_transcript_to_tutorial.domain.entities.user import User
 from sightcall_transcript_to_tutorial.domain.exceptions.tutorial_generation_error import InvalidTranscriptError
 from sightcall_transcript_to_tutorial.domain.repositories.transcript_repository_interface import (
     TranscriptRepositoryInterface,
 )
-from sightcall_transcript_to_tutorial.domain.value_objects.transcript_content import TranscriptContent
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_content import (
+    MAX_TRANSCRIPT_SIZE_BYTES,
+    TranscriptContent,
+)
 from sightcall_transcript_to_tutorial.presentation.api.dependencies import (
     get_current_user_from_request_state,
     get_transcript_repository,
@@ -23,6 +30,8 @@ from sightcall_transcript_to_tutorial.presentation.api.schemas.transcript import
 
 router = APIRouter(prefix="/transcripts", tags=["transcripts"])
 
+UPLOAD_CHUNK_SIZE_BYTES = 64 * 1024  # 64KB
+
 
 @router.post(
     "",
@@ -36,15 +45,20 @@ router = APIRouter(prefix="/transcripts", tags=["transcripts"])
 )
 def upload_transcript(
     file: UploadFile = File(...),
+    chunked: bool = Query(
+        False, description="Stream the file in chunks and store it in segments, lifting the single-shot size limit."
+    ),
     user: User = Depends(get_current_user_from_request_state),
     repository: TranscriptRepositoryInterface = Depends(get_transcript_repository),
 ):
     if file.content_type != "application/json":
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST.value, detail="File must be a JSON transcript.")
+    if chunked:
+        return _upload_transcript_in_segments(file, repository)
     try:
-        content_bytes = file.file.read()
-        content_str = content_bytes.decode()
-        transcript_content = TranscriptContent(content_str)
+        # Reading one byte past the limit is enough to reject oversized uploads without buffering them whole.
+        content_bytes = file.file.read(MAX_TRANSCRIPT_SIZE_BYTES + 1)
+        transcript_content = TranscriptContent.from_bytes(content_bytes)
     except InvalidTranscriptError as e:
         raise HTTPException(status_code=HTTPStatus.UNPROCESSABLE_ENTITY.value, detail=str(e))
     except Exception:
@@ -56,3 +70,18 @@ def upload_transcript(
     except Exception as e:
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST.value, detail=f"Failed to save transcript: {e}")
     return TranscriptUploadResponse(id=transcript_id.value)
+
+
+def _upload_transcript_in_segments(
+    file: UploadFile, repository: TranscriptRepositoryInterface
+) -> TranscriptUploadResponse:
+    handler = UploadTranscriptInSegmentsCommandHandler(repository)
+    chunks = iter(lambda: file.file.read(UPLOAD_CHUNK_SIZE_BYTES), b"")
+    command = UploadTranscriptInSegmentsCommand(chunks=chunks)
+    try:
+        transcript_id = handler.handle(command)
+    except InvalidTranscriptError as e:
+        raise HTTPException(status_code=HTTPStatus.UNPROCESSABLE_ENTITY.value, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST.value, detail=f"Failed to save transcript: {e}")
+    return TranscriptUploadResponse(id=transcript_id.value)
@@ -1,10 +1,22 @@
+import json
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, AbstractContextManager, aclosing
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
-from sightcall_transcript_to_tutorial.application.commands.generate_tutorial_command import (
-    GenerateTutorialCommand,
-    GenerateTutorialCommandHandler,
+from sightcall_transcript_to_tutorial.application.commands.enqueue_tutorial_generation_batch_command import (
+    EnqueueTutorialGenerationBatchCommand,
+    EnqueueTutorialGenerationBatchCommandHandler,
+)
+from sightcall_transcript_to_tutorial.application.commands.enqueue_tutorial_generation_command import (
+    EnqueueTutorialGenerationCommand,
+    EnqueueTutorialGenerationCommandHandler,
+)
+from sightcall_transcript_to_tutorial.application.commands.stream_tutorial_command import (
+    StreamTutorialCommand,
+    StreamTutorialCommandHandler,
 )
 from sightcall_transcript_to_tutorial.application.commands.update_tutorial_command import (
     UpdateTutorialCommand,
@@ -14,67 +26,210 @@ from sightcall_transcript_to_tutorial.application.queries.get_tutorial_by_id_que
     GetTutorialByIdQuery,
     GetTutorialByIdQueryHandler,
 )
+from sightcall_transcript_to_tutorial.application.queries.get_tutorial_generation_job_query import (
+    GetTutorialGenerationJobQuery,
+    GetTutorialGenerationJobQueryHandler,
+)
 from sightcall_transcript_to_tutorial.application.queries.get_tutorials_query import (
     GetTutorialsQuery,
     GetTutorialsQueryHandler,
 )
+from sightcall_transcript_to_tutorial.domain.entities.job_status import JobStatus
+from sightcall_transcript_to_tutorial.domain.entities.tutorial import Tutorial
 from sightcall_transcript_to_tutorial.domain.entities.user import User
+from sightcall_transcript_to_tutorial.domain.gateways.tutorial_generation_lock_interface import (
+    TutorialGenerationLockInterface,
+)
 from sightcall_transcript_to_tutorial.domain.gateways.tutorial_generator_gateway_interface import (
     TutorialGeneratorGatewayInterface,
 )
+from sightcall_transcript_to_tutorial.domain.repositories.async_transcript_repository_interface import (
+    AsyncTranscriptRepositoryInterface,
+)
+from sightcall_transcript_to_tutorial.domain.repositories.async_tutorial_repository_interface import (
+    AsyncTutorialRepositoryInterface,
+)
+from sightcall_transcript_to_tutorial.domain.repositories.generated_tutorial_cache_repository_interface import (
+    GeneratedTutorialCacheRepositoryInterface,
+)
 from sightcall_transcript_to_tutorial.domain.repositories.transcript_repository_interface import (
     TranscriptRepositoryInterface,
 )
+from sightcall_transcript_to_tutorial.domain.repositories.tutorial_generation_job_repository_interface import (
+    TutorialGenerationJobRepositoryInterface,
+)
 from sightcall_transcript_to_tutorial.domain.repositories.tutorial_repository_interface import (
     TutorialRepositoryInterface,
 )
+from sightcall_transcript_to_tutorial.domain.value_objects.job_id import JobId
+from sightcall_transcript_to_tutorial.domain.value_objects.tutorial_cursor import TutorialCursor
 from sightcall_transcript_to_tutorial.domain.value_objects.tutorial_id import TutorialId
 from sightcall_transcript_to_tutorial.presentation.api.dependencies import (
+    get_async_current_user_for_reads,
+    get_async_current_user_from_request_state,
+    get_async_transcript_repository,
+    get_async_tutorial_repository,
+    get_async_tutorial_repository_opener,
+    get_current_user_for_reads,
     get_current_user_from_request_state,
+    get_generated_tutorial_cache_repository_opener,
     get_transcript_repository,
+    get_tutorial_generation_job_repository,
+    get_tutorial_generation_lock,
     get_tutorial_generator_gateway,
     get_tutorial_repository,
 )
 from sightcall_transcript_to_tutorial.presentation.api.schemas.tutorial import (
+    GenerateTutorialBatchRequest,
     GenerateTutorialRequest,
     TutorialDetailResponse,
+    TutorialGenerationBatchItemResponse,
+    TutorialGenerationBatchResponse,
+    TutorialGenerationJobResponse,
     TutorialListResponse,
-    TutorialResponse,
     TutorialUpdateRequest,
 )
 
 router = APIRouter()
 
 
-@router.post("/tutorials/generate", response_model=TutorialResponse)
+@router.post("/tutorials/generate", response_model=TutorialGenerationJobResponse, status_code=status.HTTP_202_ACCEPTED)
 def generate_tutorial_endpoint(
     payload: GenerateTutorialRequest,
     user: User = Depends(get_current_user_from_request_state),
     transcript_repository: TranscriptRepositoryInterface = Depends(get_transcript_repository),
+    job_repository: TutorialGenerationJobRepositoryInterface = Depends(get_tutorial_generation_job_repository),
+):
+    command = EnqueueTutorialGenerationCommand(transcript_id=payload.transcript_id, user_id=user.user_id)
+    enqueue_tutorial_generation = EnqueueTutorialGenerationCommandHandler(transcript_repository, job_repository)
+    try:
+        job = enqueue_tutorial_generation.handle(command)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={"error": str(e)})
+    return TutorialGenerationJobResponse(job_id=job.job_id.value, status=job.status.value)
+
+
+@router.post(
+    "/tutorials/generate/batch", response_model=TutorialGenerationBatchResponse, status_code=status.HTTP_202_ACCEPTED
+)
+def generate_tutorial_batch_endpoint(
+    payload: GenerateTutorialBatchRequest,
+    user: User = Depends(get_current_user_from_request_state),
+    transcript_repository: TranscriptRepositoryInterface = Depends(get_transcript_repository),
+    job_repository: TutorialGenerationJobRepositoryInterface = Depends(get_tutorial_generation_job_repository),
+):
+    """
+    Queue a generation job per transcript. Each item tells the job to poll with GET /tutorials/jobs/{job_id}, or why
+    its transcript was rejected; the other transcripts of the batch are queued anyway.
+    """
+    command = EnqueueTutorialGenerationBatchCommand(transcript_ids=payload.transcript_ids, user_id=user.user_id)
+    enqueue_tutorial_generation_batch = EnqueueTutorialGenerationBatchCommandHandler(
+        transcript_repository, job_repository
+    )
+    try:
+        results = enqueue_tutorial_generation_batch.handle(command)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={"error": str(e)})
+    return TutorialGenerationBatchResponse(
+        items=[
+            TutorialGenerationBatchItemResponse(
+                transcript_id=result.transcript_id,
+                job_id=result.job.job_id.value if result.job else None,
+                status=result.job.status.value if result.job else "rejected",
+                error=result.error,
+            )
+            for result in results
+        ]
+    )
+
+
+@router.post("/tutorials/generate/stream")
+async def generate_tutorial_stream_endpoint(
+    payload: GenerateTutorialRequest,
+    user: User = Depends(get_async_current_user_from_request_state),
+    transcript_repository: AsyncTranscriptRepositoryInterface = Depends(get_async_transcript_repository),
     tutorial_generator_gateway: TutorialGeneratorGatewayInterface = Depends(get_tutorial_generator_gateway),
-    tutorial_repository: TutorialRepositoryInterface = Depends(get_tutorial_repository),
+    open_tutorial_repository: Callable[[], AbstractAsyncContextManager[AsyncTutorialRepositoryInterface]] = Depends(
+        get_async_tutorial_repository_opener
+    ),
+    open_generated_tutorial_cache: Callable[[], AbstractContextManager[GeneratedTutorialCacheRepositoryInterface]] = (
+        Depends(get_generated_tutorial_cache_repository_opener)
+    ),
+    generation_lock: TutorialGenerationLockInterface = Depends(get_tutorial_generation_lock),
 ):
-    command = GenerateTutorialCommand(transcript_id=payload.transcript_id, user_id=user.user_id)
-    generate_tutorial = GenerateTutorialCommandHandler(
-        transcript_repository, tutorial_generator_gateway, tutorial_repository
+    """
+    Generate a tutorial as server-sent events: `token` events carry pieces of its content as the model writes them,
+    then a `done` event carries the saved tutorial, or an `error` event tells why generation failed.
+    The route runs on the event loop: a pending generation only holds a coroutine, not a threadpool worker, except
+    while it waits for a concurrent generation of the same tutorial. The transcript is looked up in the request's
+    session, while the tutorial is saved in sessions the stream opens itself, as the request's are closed by then.
+    """
+    command = StreamTutorialCommand(transcript_id=payload.transcript_id, user_id=user.user_id)
+    stream_tutorial = StreamTutorialCommandHandler(
+        transcript_repository,
+        tutorial_generator_gateway,
+        open_tutorial_repository,
+        open_generated_tutorial_cache,
+        generation_lock,
     )
     try:
-        tutorial = generate_tutorial.handle(command)
-        return TutorialResponse(title=tutorial.title, content=tutorial.content)
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail={"error": str(e)})
+        items = await stream_tutorial.handle(command)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={"error": str(e)})
+    return StreamingResponse(
+        _tutorial_stream_events(items),
+        media_type="text/event-stream",
+        # Keep proxies from buffering the stream, which would defeat its purpose.
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/tutorials/jobs/{job_id}", response_model=TutorialGenerationJobResponse)
+def get_tutorial_generation_job_endpoint(
+    job_id: str,
+    user: User = Depends(get_current_user_for_reads),
+    job_repository: TutorialGenerationJobRepositoryInterface = Depends(get_tutorial_generation_job_repository),
+    tutorial_repository: TutorialRepositoryInterface = Depends(get_tutorial_repository),
+):
+    query = GetTutorialGenerationJobQuery(job_id=JobId(job_id), user_id=user.user_id)
+    job = GetTutorialGenerationJobQueryHandler(job_repository).handle(query)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    response = TutorialGenerationJobResponse(job_id=job.job_id.value, status=job.status.value, error=job.error)
+    if job.status == JobStatus.SUCCEEDED and job.tutorial_id:
+        tutorial = tutorial_repository.find_by_id(job.tutorial_id)
+        if tutorial:
+            response.tutorial = TutorialDetailResponse(
+                id=tutorial.tutorial_id.value,
+                title=tutorial.title,
+                content=tutorial.content,
+                user_id=tutorial.user_id.value,
+                created_at=tutorial.created_at,
+                updated_at=tutorial.updated_at,
+            )
+    return response
 
 
 @router.get("/tutorials", response_model=TutorialListResponse)
-def list_tutorials_endpoint(
+async def list_tutorials_endpoint(
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
     search: str = Query(None),
     created_from: datetime = Query(None),
     created_to: datetime = Query(None),
-    user: User = Depends(get_current_user_from_request_state),
-    tutorial_repository: TutorialRepositoryInterface = Depends(get_tutorial_repository),
+    after: str = Query(None, description="`next_cursor` of the previous page; `page` is then ignored"),
+    user: User = Depends(get_async_current_user_for_reads),
+    tutorial_repository: AsyncTutorialRepositoryInterface = Depends(get_async_tutorial_repository),
 ):
+    if after and search:
+        # Search results are ranked by relevance, not in the order cursors follow.
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail={"error": "Search results are paged with `page` only"}
+        )
+    try:
+        cursor = TutorialCursor.decode(after) if after else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={"error": str(e)})
     filters = {}
     if created_from:
         filters["created_after"] = created_from
@@ -86,10 +241,11 @@ def list_tutorials_endpoint(
         page=page,
         page_size=page_size,
         search=search,
+        after=cursor,
     )
     handler = GetTutorialsQueryHandler(tutorial_repository)
-    tutorials = handler.handle(query)
-    total = len(tutorials)
+    tutorial_page = await handler.handle(query)
+    tutorials = tutorial_page.tutorials
     items = [
         TutorialDetailResponse(
             id=tutorial.tutorial_id.value,
@@ -101,23 +257,29 @@ def list_tutorials_endpoint(
         )
         for tutorial in tutorials
     ]
+    next_cursor = None
+    if len(tutorials) == page_size and not search:
+        last = tutorials[-1]
+        next_cursor = TutorialCursor(last.created_at, last.tutorial_id.value).encode()
     return TutorialListResponse(
-        total=total,
+        total=tutorial_page.total,
+        total_is_estimate=tutorial_page.total_is_estimate,
         page=page,
         page_size=page_size,
         items=items,
+        next_cursor=next_cursor,
     )
 
 
 @router.get("/tutorials/{tutorial_id}", response_model=TutorialDetailResponse)
-def get_tutorial_by_id_endpoint(
+async def get_tutorial_by_id_endpoint(
     tutorial_id: str,
-    user: User = Depends(get_current_user_from_request_state),
-    tutorial_repository: TutorialRepositoryInterface = Depends(get_tutorial_repository),
+    user: User = Depends(get_async_current_user_for_reads),
+    tutorial_repository: AsyncTutorialRepositoryInterface = Depends(get_async_tutorial_repository),
 ):
     query = GetTutorialByIdQuery(tutorial_id=TutorialId(tutorial_id), user_id=user.user_id)
     handler = GetTutorialByIdQueryHandler(tutorial_repository)
-    tutorial = handler.handle(query)
+    tutorial = await handler.handle(query)
     if not tutorial:
         raise HTTPException(status_code=404, detail="Tutorial not found")
     return TutorialDetailResponse(
@@ -131,11 +293,11 @@ def get_tutorial_by_id_endpoint(
 
 
 @router.patch("/tutorials/{tutorial_id}", response_model=TutorialDetailResponse)
-def update_tutorial_endpoint(
+async def update_tutorial_endpoint(
     tutorial_id: str,
     payload: TutorialUpdateRequest,
-    user: User = Depends(get_current_user_from_request_state),
-    tutorial_repository: TutorialRepositoryInterface = Depends(get_tutorial_repository),
+    user: User = Depends(get_async_current_user_from_request_state),
+    tutorial_repository: AsyncTutorialRepositoryInterface = Depends(get_async_tutorial_repository),
 ):
     command = UpdateTutorialCommand(
         tutorial_id=TutorialId(tutorial_id),
@@ -144,7 +306,7 @@ def update_tutorial_endpoint(
         content=payload.content,
     )
     handler = UpdateTutorialCommandHandler(tutorial_repository)
-    updated = handler.handle(command)
+    updated = await handler.handle(command)
     if not updated:
         raise HTTPException(status_code=404, detail="Tutorial not found or not owned by user")
     return TutorialDetailResponse(
@@ -155,3 +317,34 @@ def update_tutorial_endpoint(
         created_at=updated.created_at,
         updated_at=updated.updated_at,
     )
+
+
+async def _tutorial_stream_events(items: AsyncGenerator[str | Tutorial, None]) -> AsyncIterator[str]:
+    tutorial = None
+    try:
+        # Closed as soon as the client goes away, so that the generation lock it may hold is released right away.
+        async with aclosing(items):
+            async for item in items:
+                if isinstance(item, Tutorial):
+                    tutorial = item
+                else:
+                    yield _server_sent_event("token", {"delta": item})
+    except Exception as e:
+        yield _server_sent_event("error", {"error": str(e)})
+        return
+    if tutorial is None:
+        yield _server_sent_event("error", {"error": "Generation ended without a tutorial"})
+        return
+    response = TutorialDetailResponse(
+        id=tutorial.tutorial_id.value,
+        title=tutorial.title,
+        content=tutorial.content,
+        user_id=tutorial.user_id.value,
+        created_at=tutorial.created_at,
+        updated_at=tutorial.updated_at,
+    )
+    yield _server_sent_event("done", response.model_dump(mode="json"))
+
+
+def _server_sent_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
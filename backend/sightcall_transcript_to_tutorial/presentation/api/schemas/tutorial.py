@@ -3,14 +3,33 @@ from typing import Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+MAX_GENERATION_BATCH_SIZE = 500
+
 
 class GenerateTutorialRequest(BaseModel):
     transcript_id: str
 
 
-class TutorialResponse(BaseModel):
-    title: str
-    content: str
+class GenerateTutorialBatchRequest(BaseModel):
+    transcript_ids: list[str] = Field(..., min_length=1, max_length=MAX_GENERATION_BATCH_SIZE)
+
+
+class TutorialGenerationJobResponse(BaseModel):
+    job_id: str
+    status: str
+    tutorial: Optional["TutorialDetailResponse"] = None
+    error: Optional[str] = None
+
+
+class TutorialGenerationBatchItemResponse(BaseModel):
+    transcript_id: str
+    job_id: Optional[str] = None
+    status: str
+    error: Optional[str] = None
+
+
+class TutorialGenerationBatchResponse(BaseModel):
+    items: list[TutorialGenerationBatchItemResponse]
 
 
 class TutorialDetailResponse(BaseModel):
@@ -24,9 +43,14 @@ class TutorialDetailResponse(BaseModel):
 
 class TutorialListResponse(BaseModel):
     total: int
+    # True when `total` is the database's estimate, which happens when filtering or searching a very large set.
+    total_is_estimate: bool = False
     page: int
     page_size: int
     items: list[TutorialDetailResponse]
+    # Pass as `after` to get the next page; None on a page that is not full, as there is nothing after it, and on
+    # search results, which are ranked.
+    next_cursor: Optional[str] = None
 
 
 class TutorialUpdateRequest(BaseModel):
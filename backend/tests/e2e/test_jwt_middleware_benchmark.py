@@ -0,0 +1,100 @@
+import asyncio
+import os
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+from jose import jwt
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from sightcall_transcript_to_tutorial.domain.config.settings import settings
+from sightcall_transcript_to_tutorial.domain.entities.user import User
+from sightcall_transcript_to_tutorial.domain.value_objects.user_id import UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_async_tutorial_repository import (
+    FakeAsyncTutorialRepository,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_async_user_repository import (
+    FakeAsyncUserRepository,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_user_repository import (
+    FakeUserRepository,
+)
+from sightcall_transcript_to_tutorial.presentation.api.dependencies import (
+    get_async_tutorial_repository,
+    get_async_user_repository,
+)
+from sightcall_transcript_to_tutorial.presentation.api.middlewares.jwt_middleware import JWTMiddleware
+from sightcall_transcript_to_tutorial.presentation.api.middlewares.verified_token_cache import VerifiedTokenCache
+from sightcall_transcript_to_tutorial.presentation.api.routers import tutorial
+
+REQUEST_COUNT = 500
+# Wall-clock comparisons depend on the machine and its load, so this benchmark only runs when asked for.
+RUN_BENCHMARKS = os.environ.get("RUN_BENCHMARKS") == "1"
+
+
+class _BaseHTTPJWTMiddleware(BaseHTTPMiddleware):
+    """The same checks as `JWTMiddleware`, in the BaseHTTPMiddleware form it replaced."""
+
+    def __init__(self, app):
+        super().__init__(app)
+        self._middleware = JWTMiddleware(app, token_cache=VerifiedTokenCache(max_entries=10))
+
+    async def dispatch(self, request: Request, call_next):
+        token = self._middleware._extract_token_from_cookie(request)
+        request.state.user = self._middleware._verify_token(token)
+        return await call_next(request)
+
+
+def _build_app(middleware_class, **options) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(middleware_class, **options)
+    app.include_router(tutorial.router)
+    user_repository = FakeUserRepository()
+    user_repository.save(User(UserId("bench-user"), name="bench", github_id=1))
+    app.dependency_overrides[get_async_user_repository] = lambda: FakeAsyncUserRepository(user_repository)
+    app.dependency_overrides[get_async_tutorial_repository] = lambda: FakeAsyncTutorialRepository()
+    return app
+
+
+async def _seconds_per_request(apps: dict[str, FastAPI]) -> dict[str, float]:
+    """Time GET /tutorials on each app in the same event loop, alternating rounds and keeping the best of each."""
+    token = jwt.encode(
+        {"user_id": "bench-user", "github_id": 1, "username": "bench"},
+        settings.jwt_secret,
+        algorithm=settings.jwt_algorithm,
+    )
+    clients = {
+        name: httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test", cookies={"access_token": token}
+        )
+        for name, app in apps.items()
+    }
+    best = {name: float("inf") for name in apps}
+    for name, client in clients.items():
+        for _ in range(50):
+            assert (await client.get("/tutorials")).status_code == 200
+    for _ in range(5):
+        for name, client in clients.items():
+            started_at = time.perf_counter()
+            for _ in range(REQUEST_COUNT):
+                await client.get("/tutorials")
+            best[name] = min(best[name], (time.perf_counter() - started_at) / REQUEST_COUNT)
+    for client in clients.values():
+        await client.aclose()
+    return best
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not RUN_BENCHMARKS, reason="set RUN_BENCHMARKS=1 to run benchmarks")
+def test_pure_asgi_jwt_middleware_should_be_faster_than_base_http_middleware():
+    timings = asyncio.run(
+        _seconds_per_request(
+            {
+                "BaseHTTPMiddleware": _build_app(_BaseHTTPJWTMiddleware),
+                "pure ASGI": _build_app(JWTMiddleware, token_cache=VerifiedTokenCache(max_entries=10)),
+            }
+        )
+    )
+    print("\nGET /tutorials: " + ", ".join(f"{name} {seconds * 1e6:.0f}µs" for name, seconds in timings.items()))
+    assert timings["pure ASGI"] < timings["BaseHTTPMiddleware"]
@@ -0,0 +1,54 @@
+import sqlite3
+
+from fastapi.testclient import TestClient
+from jose import jwt
+
+from sightcall_transcript_to_tutorial.domain.config.settings import settings
+from sightcall_transcript_to_tutorial.infrastructure.for_production.models.instrumented_pool import (
+    InstrumentedQueuePool,
+)
+from sightcall_transcript_to_tutorial.main import app
+from sightcall_transcript_to_tutorial.presentation.api.dependencies import get_database_pools
+
+client = TestClient(app)
+client.cookies.set(
+    "access_token",
+    jwt.encode({"user_id": "metrics-user", "username": "ops"}, settings.jwt_secret, algorithm=settings.jwt_algorithm),
+)
+
+
+class TestMetricsEndpoint:
+    def test_should_expose_pool_metrics(self):
+        # Given
+        pool = InstrumentedQueuePool(lambda: sqlite3.connect(":memory:", check_same_thread=False), pool_size=3)
+        connection = pool.connect()
+        app.dependency_overrides[get_database_pools] = lambda: {"sync": pool}
+
+        # When
+        response = client.get("/metrics")
+        connection.close()
+        app.dependency_overrides = {}
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'db_pool_size{engine="sync"} 3' in response.text
+        assert 'db_pool_checked_out{engine="sync"} 1' in response.text
+        assert "# TYPE db_pool_checkouts_total counter" in response.text
+        assert "# TYPE jwt_cache_hits_total counter" in response.text
+
+    def test_should_expose_pools_of_production_engines(self):
+        # When
+        response = client.get("/metrics")
+
+        # Then
+        assert response.status_code == 200
+        assert 'db_pool_checked_out{engine="sync"}' in response.text
+        assert 'db_pool_checked_out{engine="async"}' in response.text
+
+    def test_should_require_authentication(self):
+        # When
+        responses = [TestClient(app).get(path) for path in ("/metrics", "/metrics-and-more")]
+
+        # Then
+        assert [response.status_code for response in responses] == [401, 401]
@@ -7,6 +7,9 @@ from jose import jwt
 from sightcall_transcript_to_tutorial.domain.config.settings import settings
 from sightcall_transcript_to_tutorial.domain.entities.user import User
 from sightcall_transcript_to_tutorial.domain.value_objects.user_id import UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_async_user_repository import (
+    FakeAsyncUserRepository,
+)
 from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_transcript_repository import (
     FakeTranscriptRepository,
 )
@@ -15,6 +18,7 @@ from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake
 )
 from sightcall_transcript_to_tutorial.main import app
 from sightcall_transcript_to_tutorial.presentation.api.dependencies import (
+    get_async_user_repository,
     get_transcript_repository,
     get_user_repository,
 )
@@ -46,6 +50,7 @@ def setup_test_user():
     user_repo = FakeUserRepository()
     user_repo.save(User(user_id=UserId(TEST_USER_ID), name=TEST_USER_NAME, github_id=TEST_GITHUB_ID))
     app.dependency_overrides[get_user_repository] = lambda: user_repo
+    app.dependency_overrides[get_async_user_repository] = lambda: FakeAsyncUserRepository(user_repo)
 
 
 @pytest.fixture(autouse=True)
@@ -67,6 +72,20 @@ class TestTranscriptUploadAPI:
         assert response.status_code == 201
         assert "id" in response.json()
 
+    def test_should_look_the_user_up_without_the_async_session(self):
+        # Given
+        app.dependency_overrides[get_async_user_repository] = self._fail_to_open_async_session
+
+        # When
+        response = client.post(
+            "/transcripts",
+            files={"file": ("transcript.json", io.BytesIO(VALID_TRANSCRIPT_JSON.encode()), "application/json")},
+            cookies=get_auth_cookies(),
+        )
+
+        # Then
+        assert response.status_code == 201
+
     def test_should_reject_invalid_transcript_json(self):
         response = client.post(
             "/transcripts",
@@ -92,3 +111,28 @@ class TestTranscriptUploadAPI:
         )
         assert response.status_code == 401
         assert "error" in response.json() or "detail" in response.json()
+
+    def test_should_upload_transcript_over_size_limit_in_chunked_mode(self):
+        phrase = VALID_TRANSCRIPT_JSON[VALID_TRANSCRIPT_JSON.index("[") + 1 : VALID_TRANSCRIPT_JSON.rindex("]")]
+        long_transcript = VALID_TRANSCRIPT_JSON.replace(phrase, ", ".join([phrase] * 2000))
+        response = client.post(
+            "/transcripts?chunked=true",
+            files={"file": ("transcript.json", io.BytesIO(long_transcript.encode()), "application/json")},
+            cookies=get_auth_cookies(),
+        )
+        assert len(long_transcript) > 100 * 1024
+        assert response.status_code == 201
+        assert "id" in response.json()
+
+    def test_should_reject_oversized_phrase_in_chunked_mode(self):
+        response = client.post(
+            "/transcripts?chunked=true",
+            files={"file": ("transcript.json", io.BytesIO(OVERSIZED_TRANSCRIPT_JSON.encode()), "application/json")},
+            cookies=get_auth_cookies(),
+        )
+        assert response.status_code == 422
+        assert "detail" in response.json()
+
+    @staticmethod
+    def _fail_to_open_async_session():
+        raise AssertionError("a sync route should not open an async session")
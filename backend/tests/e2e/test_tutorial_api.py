@@ -1,15 +1,49 @@
+import asyncio
+import json
+from contextlib import nullcontext
+
 import pytest
 from fastapi.testclient import TestClient
 from jose import jwt
 
+from sightcall_transcript_to_tutorial.application.commands.generate_tutorial_command import (
+    GenerateTutorialCommandHandler,
+)
+from sightcall_transcript_to_tutorial.application.commands.process_next_tutorial_generation_job_command import (
+    ProcessNextTutorialGenerationJobCommand,
+    ProcessNextTutorialGenerationJobCommandHandler,
+)
 from sightcall_transcript_to_tutorial.domain.config.settings import settings
 from sightcall_transcript_to_tutorial.domain.entities.transcript import Transcript
+from sightcall_transcript_to_tutorial.domain.entities.tutorial_generation_job import TutorialGenerationJob
 from sightcall_transcript_to_tutorial.domain.entities.user import User
 from sightcall_transcript_to_tutorial.domain.value_objects.transcript_id import TranscriptId
+from sightcall_transcript_to_tutorial.domain.value_objects.tutorial_id import TutorialId
 from sightcall_transcript_to_tutorial.domain.value_objects.user_id import UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_production.gateways.in_process_tutorial_generation_lock import (
+    InProcessTutorialGenerationLock,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.gateways.fake_tutorial_generator_gateway import (
+    FakeTutorialGeneratorGateway,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_async_transcript_repository import (
+    FakeAsyncTranscriptRepository,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_async_tutorial_repository import (
+    FakeAsyncTutorialRepository,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_async_user_repository import (
+    FakeAsyncUserRepository,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_generated_tutorial_cache_repository import (
+    FakeGeneratedTutorialCacheRepository,
+)
 from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_transcript_repository import (
     FakeTranscriptRepository,
 )
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_tutorial_generation_job_repository import (
+    FakeTutorialGenerationJobRepository,
+)
 from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_tutorial_repository import (
     FakeTutorialRepository,
 )
@@ -18,7 +52,16 @@ from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake
 )
 from sightcall_transcript_to_tutorial.main import app
 from sightcall_transcript_to_tutorial.presentation.api.dependencies import (
+    get_async_transcript_repository,
+    get_async_tutorial_repository,
+    get_async_tutorial_repository_opener,
+    get_async_user_repository,
+    get_generated_tutorial_cache_repository,
+    get_generated_tutorial_cache_repository_opener,
     get_transcript_repository,
+    get_tutorial_generation_job_repository,
+    get_tutorial_generation_lock,
+    get_tutorial_generator_gateway,
     get_tutorial_repository,
     get_user_repository,
 )
@@ -41,7 +84,50 @@ def get_auth_cookies(user_id=TEST_USER_ID, github_id=TEST_GITHUB_ID, username=TE
 def setup_test_user():
     user_repo = FakeUserRepository()
     user_repo.save(User(user_id=UserId(TEST_USER_ID), name=TEST_USER_NAME, github_id=TEST_GITHUB_ID))
-    app.dependency_overrides[get_user_repository] = lambda: user_repo
+    _use_user_repository(user_repo)
+
+
+def _use_user_repository(user_repository):
+    app.dependency_overrides[get_user_repository] = lambda: user_repository
+    app.dependency_overrides[get_async_user_repository] = lambda: FakeAsyncUserRepository(user_repository)
+
+
+def _use_transcript_repository(transcript_repository):
+    app.dependency_overrides[get_transcript_repository] = lambda: transcript_repository
+    app.dependency_overrides[get_async_transcript_repository] = lambda: FakeAsyncTranscriptRepository(
+        transcript_repository
+    )
+
+
+def _use_generation_cache_and_lock():
+    app.dependency_overrides[get_generated_tutorial_cache_repository] = lambda: FakeGeneratedTutorialCacheRepository()
+    app.dependency_overrides[get_generated_tutorial_cache_repository_opener] = lambda: lambda: nullcontext(
+        FakeGeneratedTutorialCacheRepository()
+    )
+    app.dependency_overrides[get_tutorial_generation_lock] = lambda: InProcessTutorialGenerationLock()
+
+
+def _use_tutorial_repository(tutorial_repository):
+    app.dependency_overrides[get_tutorial_repository] = lambda: tutorial_repository
+    app.dependency_overrides[get_async_tutorial_repository] = lambda: FakeAsyncTutorialRepository(tutorial_repository)
+    app.dependency_overrides[get_async_tutorial_repository_opener] = lambda: lambda: nullcontext(
+        FakeAsyncTutorialRepository(tutorial_repository)
+    )
+
+
+def _given_generation_queue(tutorial_generator_gateway):
+    transcript_repository = FakeTranscriptRepository()
+    tutorial_repository = FakeTutorialRepository()
+    job_repository = FakeTutorialGenerationJobRepository()
+    _use_transcript_repository(transcript_repository)
+    _use_tutorial_repository(tutorial_repository)
+    app.dependency_overrides[get_tutorial_generation_job_repository] = lambda: job_repository
+    # Stands in for the worker pool, which the test client does not start.
+    worker = ProcessNextTutorialGenerationJobCommandHandler(
+        job_repository,
+        GenerateTutorialCommandHandler(transcript_repository, tutorial_generator_gateway, tutorial_repository),
+    )
+    return transcript_repository, worker
 
 
 @pytest.mark.e2e
@@ -51,10 +137,7 @@ def test_should_generate_tutorial_success():
     transcript_id = "test-transcript-1"
     transcript_content = "How to reset password in Gmail?"
     transcript = Transcript(TranscriptId(transcript_id), content=transcript_content)
-    transcript_repository = FakeTranscriptRepository()
-    tutorial_repository = FakeTutorialRepository()
-    app.dependency_overrides[get_transcript_repository] = lambda: transcript_repository
-    app.dependency_overrides[get_tutorial_repository] = lambda: tutorial_repository
+    transcript_repository, worker = _given_generation_queue(get_tutorial_generator_gateway())
     transcript_repository.save(transcript)
 
     response = client.post(
@@ -62,12 +145,193 @@ def test_should_generate_tutorial_success():
         json={"transcript_id": transcript_id},
         cookies=get_auth_cookies(),
     )
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+    asyncio.run(worker.handle(ProcessNextTutorialGenerationJobCommand()))
+
+    response = client.get(f"/tutorials/jobs/{job_id}", cookies=get_auth_cookies())
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()["tutorial"]
     assert isinstance(data["title"], str) and data["title"].strip() != ""
     assert isinstance(data["content"], str) and data["content"].strip() != ""
 
 
+@pytest.mark.e2e
+def test_should_queue_generation_and_report_job_progress():
+    transcript_repository, worker = _given_generation_queue(FakeTutorialGeneratorGateway())
+    transcript_repository.save(Transcript(TranscriptId("test-transcript-1"), content="How to reset password?"))
+
+    response = client.post(
+        "/tutorials/generate", json={"transcript_id": "test-transcript-1"}, cookies=get_auth_cookies()
+    )
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+    assert response.json()["status"] == "pending"
+
+    response = client.get(f"/tutorials/jobs/{job_id}", cookies=get_auth_cookies())
+    assert response.status_code == 200
+    assert response.json()["status"] == "pending"
+    assert response.json()["tutorial"] is None
+
+    asyncio.run(worker.handle(ProcessNextTutorialGenerationJobCommand()))
+    response = client.get(f"/tutorials/jobs/{job_id}", cookies=get_auth_cookies())
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "succeeded"
+    assert data["tutorial"]["title"] == "Fake Tutorial"
+
+
+@pytest.mark.e2e
+def test_should_report_failed_generation_job():
+    transcript_repository, worker = _given_generation_queue(FakeTutorialGeneratorGateway(should_fail=True))
+    transcript_repository.save(Transcript(TranscriptId("test-transcript-1"), content="How to reset password?"))
+    response = client.post(
+        "/tutorials/generate", json={"transcript_id": "test-transcript-1"}, cookies=get_auth_cookies()
+    )
+    job_id = response.json()["job_id"]
+
+    asyncio.run(worker.handle(ProcessNextTutorialGenerationJobCommand()))
+    response = client.get(f"/tutorials/jobs/{job_id}", cookies=get_auth_cookies())
+    assert response.json()["status"] == "failed"
+    assert response.json()["error"]
+
+
+@pytest.mark.e2e
+def test_get_generation_job_should_return_404_if_not_found_or_not_owner():
+    _given_generation_queue(FakeTutorialGeneratorGateway())
+    job_repository = app.dependency_overrides[get_tutorial_generation_job_repository]()
+    other_user_job = TutorialGenerationJob.create(transcript_id=TranscriptId("tr2"), user_id=UserId("other-user"))
+    job_repository.save(other_user_job)
+
+    response = client.get("/tutorials/jobs/nonexistent", cookies=get_auth_cookies())
+    assert response.status_code == 404
+    response = client.get(f"/tutorials/jobs/{other_user_job.job_id.value}", cookies=get_auth_cookies())
+    assert response.status_code == 404
+
+
+@pytest.mark.e2e
+def test_should_queue_a_generation_job_per_transcript_of_a_batch():
+    transcript_repository, worker = _given_generation_queue(FakeTutorialGeneratorGateway())
+    transcript_repository.save(Transcript(TranscriptId("test-transcript-1"), content="How to reset password?"))
+    transcript_repository.save(Transcript(TranscriptId("test-transcript-2"), content="How to change my email?"))
+
+    response = client.post(
+        "/tutorials/generate/batch",
+        json={"transcript_ids": ["test-transcript-1", "non-existent-id", "test-transcript-2"]},
+        cookies=get_auth_cookies(),
+    )
+
+    assert response.status_code == 202
+    items = response.json()["items"]
+    assert [(item["transcript_id"], item["status"]) for item in items] == [
+        ("test-transcript-1", "pending"),
+        ("non-existent-id", "rejected"),
+        ("test-transcript-2", "pending"),
+    ]
+    assert items[1]["job_id"] is None and items[1]["error"]
+    asyncio.run(worker.handle(ProcessNextTutorialGenerationJobCommand()))
+    asyncio.run(worker.handle(ProcessNextTutorialGenerationJobCommand()))
+    for item in (items[0], items[2]):
+        response = client.get(f"/tutorials/jobs/{item['job_id']}", cookies=get_auth_cookies())
+        assert response.json()["status"] == "succeeded"
+
+
+@pytest.mark.e2e
+def test_should_reject_empty_generation_batch():
+    _given_generation_queue(FakeTutorialGeneratorGateway())
+
+    response = client.post("/tutorials/generate/batch", json={"transcript_ids": []}, cookies=get_auth_cookies())
+
+    assert response.status_code == 422
+
+
+def _read_server_sent_events(response):
+    events = []
+    for block in response.text.strip().split("\n\n"):
+        event_line, data_line = block.split("\n")
+        events.append((event_line.removeprefix("event: "), json.loads(data_line.removeprefix("data: "))))
+    return events
+
+
+@pytest.mark.e2e
+def test_should_stream_generated_tutorial_as_server_sent_events():
+    transcript_repository = FakeTranscriptRepository()
+    tutorial_repository = FakeTutorialRepository()
+    _use_transcript_repository(transcript_repository)
+    _use_tutorial_repository(tutorial_repository)
+    _use_generation_cache_and_lock()
+    app.dependency_overrides[get_tutorial_generator_gateway] = lambda: FakeTutorialGeneratorGateway()
+    transcript_repository.save(Transcript(TranscriptId("test-transcript-1"), content="How to reset password?"))
+
+    response = client.post(
+        "/tutorials/generate/stream", json={"transcript_id": "test-transcript-1"}, cookies=get_auth_cookies()
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _read_server_sent_events(response)
+    assert [event for event, _ in events] == ["token", "done"]
+    assert events[0][1]["delta"] == "This is a fake tutorial for testing."
+    tutorial = events[1][1]
+    assert tutorial["title"] == "Fake Tutorial"
+    assert tutorial_repository.find_by_id(TutorialId(tutorial["id"])) is not None
+
+
+@pytest.mark.e2e
+def test_should_stream_error_event_when_generation_fails():
+    transcript_repository = FakeTranscriptRepository()
+    _use_transcript_repository(transcript_repository)
+    _use_tutorial_repository(FakeTutorialRepository())
+    _use_generation_cache_and_lock()
+    app.dependency_overrides[get_tutorial_generator_gateway] = lambda: FakeTutorialGeneratorGateway(should_fail=True)
+    transcript_repository.save(Transcript(TranscriptId("test-transcript-1"), content="How to reset password?"))
+
+    response = client.post(
+        "/tutorials/generate/stream", json={"transcript_id": "test-transcript-1"}, cookies=get_auth_cookies()
+    )
+
+    assert response.status_code == 200
+    assert _read_server_sent_events(response) == [("error", {"error": "Simulated failure in fake gateway."})]
+
+
+@pytest.mark.e2e
+def test_should_stream_error_event_when_generation_ends_without_a_tutorial():
+    class _ContentOnlyGateway(FakeTutorialGeneratorGateway):
+        async def stream_tutorial(self, transcript, user_id):
+            yield "Some content"
+
+    transcript_repository = FakeTranscriptRepository()
+    _use_transcript_repository(transcript_repository)
+    _use_tutorial_repository(FakeTutorialRepository())
+    _use_generation_cache_and_lock()
+    app.dependency_overrides[get_tutorial_generator_gateway] = lambda: _ContentOnlyGateway()
+    transcript_repository.save(Transcript(TranscriptId("test-transcript-1"), content="How to reset password?"))
+
+    response = client.post(
+        "/tutorials/generate/stream", json={"transcript_id": "test-transcript-1"}, cookies=get_auth_cookies()
+    )
+
+    assert response.status_code == 200
+    assert _read_server_sent_events(response) == [
+        ("token", {"delta": "Some content"}),
+        ("error", {"error": "Generation ended without a tutorial"}),
+    ]
+
+
+@pytest.mark.e2e
+def test_should_reject_stream_for_missing_transcript():
+    _use_transcript_repository(FakeTranscriptRepository())
+    _use_generation_cache_and_lock()
+    app.dependency_overrides[get_tutorial_generator_gateway] = lambda: FakeTutorialGeneratorGateway()
+
+    response = client.post(
+        "/tutorials/generate/stream", json={"transcript_id": "non-existent-id"}, cookies=get_auth_cookies()
+    )
+
+    assert response.status_code == 400
+    assert response.json().get("detail") is not None
+
+
 @pytest.mark.e2e
 def test_should_return_error_on_generation_failure():
     # Use a non-existent transcript_id
@@ -106,7 +370,7 @@ def _create_tutorial(client, user_id, tutorial_id, title, content):
 def test_list_tutorials_should_return_only_owned_tutorials():
     # Arrange
     tutorial_repository = FakeTutorialRepository()
-    app.dependency_overrides[get_tutorial_repository] = lambda: tutorial_repository
+    _use_tutorial_repository(tutorial_repository)
     _create_tutorial(client, TEST_USER_ID, "tut1", "Title 1", "Content 1")
     _create_tutorial(client, "other-user", "tut2", "Title 2", "Content 2")
     _create_tutorial(client, TEST_USER_ID, "tut3", "Title 3", "Content 3")
@@ -122,7 +386,7 @@ def test_list_tutorials_should_return_only_owned_tutorials():
 
 def test_list_tutorials_should_support_pagination_and_search():
     tutorial_repository = FakeTutorialRepository()
-    app.dependency_overrides[get_tutorial_repository] = lambda: tutorial_repository
+    _use_tutorial_repository(tutorial_repository)
     for i in range(5):
         _create_tutorial(client, TEST_USER_ID, f"tut{i}", f"Special {i}", f"Content {i}")
     # Page 2, page_size 2
@@ -132,17 +396,52 @@ def test_list_tutorials_should_support_pagination_and_search():
     assert data["page"] == 2
     assert data["page_size"] == 2
     assert len(data["items"]) == 2
+    assert data["total"] == 5
+    assert data["total_is_estimate"] is False
     # Search
     response = client.get("/tutorials?search=Special 3", cookies=get_auth_cookies())
     assert response.status_code == 200
     data = response.json()
     assert len(data["items"]) == 1
     assert data["items"][0]["title"] == "Special 3"
+    assert data["total"] == 1
+
+
+def test_list_tutorials_should_page_with_next_cursor():
+    tutorial_repository = FakeTutorialRepository()
+    _use_tutorial_repository(tutorial_repository)
+    for i in range(5):
+        _create_tutorial(client, TEST_USER_ID, f"tut{i}", f"Title {i}", f"Content {i}")
+    ids = []
+    after = None
+    for _ in range(3):
+        params = {"page_size": 2} | ({"after": after} if after else {})
+        response = client.get("/tutorials", params=params, cookies=get_auth_cookies())
+        assert response.status_code == 200
+        data = response.json()
+        ids += [item["id"] for item in data["items"]]
+        after = data["next_cursor"]
+    # Every tutorial once, and no cursor after the last, partial, page
+    assert sorted(ids) == [f"tut{i}" for i in range(5)]
+    assert after is None
+
+
+def test_list_tutorials_should_reject_invalid_cursor():
+    _use_tutorial_repository(FakeTutorialRepository())
+    response = client.get("/tutorials?after=garbage", cookies=get_auth_cookies())
+    assert response.status_code == 400
+
+
+def test_list_tutorials_should_not_page_search_results_with_cursor():
+    _use_tutorial_repository(FakeTutorialRepository())
+    cursor = "WyIyMDI1LTAxLTAxVDAwOjAwOjAwKzAwOjAwIiwidHV0MSJd"  # (2025-01-01, tut1)
+    response = client.get("/tutorials", params={"search": "x", "after": cursor}, cookies=get_auth_cookies())
+    assert response.status_code == 400
 
 
 def test_get_tutorial_by_id_should_return_tutorial_if_owner():
     tutorial_repository = FakeTutorialRepository()
-    app.dependency_overrides[get_tutorial_repository] = lambda: tutorial_repository
+    _use_tutorial_repository(tutorial_repository)
     _create_tutorial(client, TEST_USER_ID, "tut1", "Title 1", "Content 1")
     response = client.get("/tutorials/tut1", cookies=get_auth_cookies())
     assert response.status_code == 200
@@ -155,7 +454,7 @@ def test_get_tutorial_by_id_should_return_tutorial_if_owner():
 
 def test_get_tutorial_by_id_should_return_404_if_not_found_or_not_owner():
     tutorial_repository = FakeTutorialRepository()
-    app.dependency_overrides[get_tutorial_repository] = lambda: tutorial_repository
+    _use_tutorial_repository(tutorial_repository)
     # Not found
     response = client.get("/tutorials/nonexistent", cookies=get_auth_cookies())
     assert response.status_code == 404
@@ -167,7 +466,7 @@ def test_get_tutorial_by_id_should_return_404_if_not_found_or_not_owner():
 
 def test_patch_tutorial_should_update_title_and_content_if_owner():
     tutorial_repository = FakeTutorialRepository()
-    app.dependency_overrides[get_tutorial_repository] = lambda: tutorial_repository
+    _use_tutorial_repository(tutorial_repository)
     _create_tutorial(client, TEST_USER_ID, "tut1", "Old Title", "Old Content")
     patch_data = {"title": "New Title", "content": "New Content"}
     response = client.patch("/tutorials/tut1", json=patch_data, cookies=get_auth_cookies())
@@ -179,7 +478,7 @@ def test_patch_tutorial_should_update_title_and_content_if_owner():
 
 def test_patch_tutorial_should_return_404_if_not_found_or_not_owner():
     tutorial_repository = FakeTutorialRepository()
-    app.dependency_overrides[get_tutorial_repository] = lambda: tutorial_repository
+    _use_tutorial_repository(tutorial_repository)
     # Not found
     patch_data = {"title": "New Title"}
     response = client.patch("/tutorials/nonexistent", json=patch_data, cookies=get_auth_cookies())
@@ -192,7 +491,7 @@ def test_patch_tutorial_should_return_404_if_not_found_or_not_owner():
 
 def test_patch_tutorial_should_validate_input():
     tutorial_repository = FakeTutorialRepository()
-    app.dependency_overrides[get_tutorial_repository] = lambda: tutorial_repository
+    _use_tutorial_repository(tutorial_repository)
     _create_tutorial(client, TEST_USER_ID, "tut1", "Old Title", "Old Content")
     # Empty title
     patch_data = {"title": ""}
@@ -202,3 +501,29 @@ def test_patch_tutorial_should_validate_input():
     patch_data = {"content": ""}
     response = client.patch("/tutorials/tut1", json=patch_data, cookies=get_auth_cookies())
     assert response.status_code == 422 or response.status_code == 400
+
+
+def test_read_routes_should_trust_token_claims_without_looking_user_up_when_enabled(monkeypatch):
+    monkeypatch.setattr(settings, "trust_token_claims_on_reads", True)
+    tutorial_repository = FakeTutorialRepository()
+    _use_tutorial_repository(tutorial_repository)
+    _use_user_repository(FakeUserRepository())
+    _create_tutorial(client, TEST_USER_ID, "tut1", "Title 1", "Content 1")
+    response = client.get("/tutorials/tut1", cookies=get_auth_cookies())
+    assert response.status_code == 200
+    response = client.patch("/tutorials/tut1", json={"title": "New Title"}, cookies=get_auth_cookies())
+    assert response.status_code == 401
+
+
+def test_read_routes_should_refuse_user_deleted_after_the_token_was_issued():
+    tutorial_repository = FakeTutorialRepository()
+    _use_tutorial_repository(tutorial_repository)
+    user_repository = FakeUserRepository()
+    user_repository.save(User(user_id=UserId(TEST_USER_ID), name=TEST_USER_NAME, github_id=TEST_GITHUB_ID))
+    _use_user_repository(user_repository)
+    _create_tutorial(client, TEST_USER_ID, "tut1", "Title 1", "Content 1")
+    cookies = get_auth_cookies()
+    assert client.get("/tutorials/tut1", cookies=cookies).status_code == 200
+    user_repository.delete(UserId(TEST_USER_ID))
+    assert client.get("/tutorials/tut1", cookies=cookies).status_code == 401
+    assert client.get("/tutorials", cookies=cookies).status_code == 401
@@ -0,0 +1,131 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager, contextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+from jose import jwt
+from sqlalchemy.orm import sessionmaker
+
+from sightcall_transcript_to_tutorial.domain.config.settings import settings
+from sightcall_transcript_to_tutorial.domain.entities.transcript import Transcript
+from sightcall_transcript_to_tutorial.domain.entities.user import User
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_id import TranscriptId
+from sightcall_transcript_to_tutorial.domain.value_objects.tutorial_id import TutorialId
+from sightcall_transcript_to_tutorial.domain.value_objects.user_id import UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_production.gateways.in_process_tutorial_generation_lock import (
+    InProcessTutorialGenerationLock,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.async_sqlalchemy_tutorial_repository import (
+    AsyncSQLAlchemyTutorialRepository,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.sqlalchemy_transcript_repository import (
+    SQLAlchemyTranscriptRepository,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.sqlalchemy_user_repository import (
+    SQLAlchemyUserRepository,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.gateways.fake_tutorial_generator_gateway import (
+    FakeTutorialGeneratorGateway,
+)
+from sightcall_transcript_to_tutorial.main import app
+from sightcall_transcript_to_tutorial.presentation.api.dependencies import (
+    get_async_session,
+    get_async_tutorial_repository_opener,
+    get_generated_tutorial_cache_repository,
+    get_generated_tutorial_cache_repository_opener,
+    get_session,
+    get_tutorial_generation_lock,
+    get_tutorial_generator_gateway,
+)
+
+client = TestClient(app)
+
+STREAM_USER_ID = "stream-user"
+STREAM_GITHUB_ID = 4242
+STREAM_USER_NAME = "streamuser"
+
+
+@pytest.fixture
+def real_database(pg_session, pg_async_sessions):
+    """Route every database dependency of the app, the stream's own sessions included, to the test database."""
+    sessions = sessionmaker(bind=pg_session.get_bind())
+
+    def get_test_session():
+        with sessions() as session:
+            yield session
+
+    async def get_test_async_session():
+        async with pg_async_sessions() as session:
+            yield session
+
+    @asynccontextmanager
+    async def open_tutorial_repository():
+        async with pg_async_sessions() as session:
+            yield AsyncSQLAlchemyTutorialRepository(session)
+
+    @contextmanager
+    def open_generated_tutorial_cache():
+        with sessions() as session:
+            yield get_generated_tutorial_cache_repository(session)
+
+    app.dependency_overrides[get_session] = get_test_session
+    app.dependency_overrides[get_async_session] = get_test_async_session
+    app.dependency_overrides[get_async_tutorial_repository_opener] = lambda: open_tutorial_repository
+    app.dependency_overrides[get_generated_tutorial_cache_repository_opener] = lambda: open_generated_tutorial_cache
+    app.dependency_overrides[get_tutorial_generation_lock] = lambda: InProcessTutorialGenerationLock()
+    app.dependency_overrides[get_tutorial_generator_gateway] = lambda: FakeTutorialGeneratorGateway()
+    try:
+        yield
+    finally:
+        app.dependency_overrides.clear()
+
+
+def _auth_cookies() -> dict:
+    payload = {"user_id": STREAM_USER_ID, "github_id": STREAM_GITHUB_ID, "username": STREAM_USER_NAME}
+    return {"access_token": jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)}
+
+
+def _read_server_sent_events(response) -> list[tuple[str, dict]]:
+    events = []
+    for block in response.text.strip().split("\n\n"):
+        event_line, data_line = block.split("\n")
+        events.append((event_line.removeprefix("event: "), json.loads(data_line.removeprefix("data: "))))
+    return events
+
+
+@pytest.mark.integration
+def test_should_save_streamed_tutorial_in_the_database(pg_session, pg_async_sessions, real_database):
+    # Given
+    SQLAlchemyUserRepository(pg_session).save(
+        User(user_id=UserId(STREAM_USER_ID), name=STREAM_USER_NAME, github_id=STREAM_GITHUB_ID)
+    )
+    SQLAlchemyTranscriptRepository(pg_session).save(
+        Transcript(TranscriptId("stream-transcript"), content="How to reset password?")
+    )
+
+    # When
+    response = client.post(
+        "/tutorials/generate/stream", json={"transcript_id": "stream-transcript"}, cookies=_auth_cookies()
+    )
+
+    # Then
+    assert response.status_code == 200
+    events = _read_server_sent_events(response)
+    assert [event for event, _ in events] == ["token", "done"]
+    tutorial_id = events[-1][1]["id"]
+
+    async def find_saved_tutorial():
+        async with pg_async_sessions() as session:
+            return await AsyncSQLAlchemyTutorialRepository(session).find_by_id(TutorialId(tutorial_id))
+
+    saved = asyncio.run(find_saved_tutorial())
+    assert saved is not None
+    assert (saved.title, saved.content, saved.user_id) == (
+        events[-1][1]["title"],
+        events[-1][1]["content"],
+        UserId(STREAM_USER_ID),
+    )
+    read_back = client.get(f"/tutorials/{tutorial_id}", cookies=_auth_cookies())
+    assert read_back.status_code == 200
+    assert read_back.json()["content"] == saved.content
@@ -0,0 +1,34 @@
+import pytest
+from sqlalchemy import NullPool, create_engine, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from testcontainers.postgres import PostgresContainer
+
+from sightcall_transcript_to_tutorial.infrastructure.for_production.models.base import Base, async_database_url
+
+
+@pytest.fixture(scope="session")
+def pg_session():
+    with PostgresContainer("postgres:17") as pg:
+        engine = create_engine(pg.get_connection_url())
+        with engine.begin() as connection:
+            # Tutorial title search indexes use its trigram operators; migrations create it too.
+            connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        session = Session()
+        try:
+            yield session
+        finally:
+            session.close()
+            Base.metadata.drop_all(engine)
+
+
+@pytest.fixture(scope="session")
+def pg_async_sessions(pg_session):
+    """AsyncSession factory on the same database as `pg_session`, for tests running coroutines with asyncio.run."""
+    # Without pooling: asyncpg connections belong to the event loop that opened them, and each test has its own.
+    engine = create_async_engine(
+        async_database_url(pg_session.get_bind().url.render_as_string(False)), poolclass=NullPool
+    )
+    return async_sessionmaker(engine, expire_on_commit=False)
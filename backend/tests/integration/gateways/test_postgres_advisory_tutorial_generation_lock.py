@@ -0,0 +1,70 @@
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from sightcall_transcript_to_tutorial.infrastructure.for_production.gateways.postgres_advisory_tutorial_generation_lock import (
+    PostgresAdvisoryTutorialGenerationLock,
+)
+
+
+class TestPostgresAdvisoryTutorialGenerationLock:
+    @pytest.mark.integration
+    def test_should_make_another_process_wait_for_the_same_key(self, pg_session):
+        """Given two lock instances standing for two processes, when both lock a key, then the second one waits."""
+        # Given
+        engine = pg_session.get_bind()
+        first_process_lock = PostgresAdvisoryTutorialGenerationLock(engine)
+        second_process_lock = PostgresAdvisoryTutorialGenerationLock(engine)
+        events = []
+        first_process_lock.acquire("key-1")
+
+        def second_process() -> None:
+            second_process_lock.acquire("key-1")
+            events.append("second acquired")
+            second_process_lock.release("key-1")
+
+        thread = threading.Thread(target=second_process)
+
+        # When
+        thread.start()
+        time.sleep(0.2)
+        events.append("first released")
+        first_process_lock.release("key-1")
+        thread.join(timeout=5)
+
+        # Then
+        assert events == ["first released", "second acquired"]
+
+    @pytest.mark.integration
+    def test_should_wait_for_the_lock_longer_than_the_statement_timeout(self, pg_session):
+        """Given connections with a short statement timeout, when the lock is held longer, then waiting still works."""
+        # Given
+        url = pg_session.get_bind().url
+        engine = create_engine(url, connect_args={"options": "-c statement_timeout=100"})
+        first_process_lock = PostgresAdvisoryTutorialGenerationLock(engine)
+        second_process_lock = PostgresAdvisoryTutorialGenerationLock(engine)
+        errors = []
+        first_process_lock.acquire("key-2")
+
+        def second_process() -> None:
+            try:
+                second_process_lock.acquire("key-2")
+                second_process_lock.release("key-2")
+            except Exception as error:
+                errors.append(error)
+
+        thread = threading.Thread(target=second_process)
+
+        # When
+        thread.start()
+        time.sleep(0.5)
+        first_process_lock.release("key-2")
+        thread.join(timeout=5)
+
+        # Then
+        assert errors == []
+        with engine.connect() as connection:
+            assert connection.execute(text("SHOW statement_timeout")).scalar() == "100ms"
+        engine.dispose()
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from sightcall_transcript_to_tutorial.domain.entities import Transcript
+from sightcall_transcript_to_tutorial.domain.value_objects import TranscriptId
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_content import TranscriptContent
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_phrases import TranscriptPhrases
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.async_sqlalchemy_transcript_repository import (
+    AsyncSQLAlchemyTranscriptRepository,
+)
+
+PHRASE = '{"offset_milliseconds": 0, "duration_in_ticks": 1.0, "display": "Hello", "speaker": 1, "locale": "en-US", "confidence": 0.9}'
+
+
+@pytest.mark.integration
+def test_async_sqlalchemy_transcript_repository(pg_async_sessions):
+    async def scenario():
+        async with pg_async_sessions() as session:
+            repo = AsyncSQLAlchemyTranscriptRepository(session)
+            content = f'{{"timestamp": "2025-02-26T20:36:06Z", "duration_in_ticks": 12345, "phrases": [{PHRASE}]}}'
+            transcript = Transcript(TranscriptId("async-t1"), content=TranscriptContent(content))
+            await repo.save(transcript)
+            assert await repo.find_by_id(TranscriptId("async-t1")) == transcript
+            assert await repo.find_existing_ids([TranscriptId("async-t1"), TranscriptId("missing")]) == {
+                TranscriptId("async-t1")
+            }
+            await repo.delete(TranscriptId("async-t1"))
+            assert await repo.find_by_id(TranscriptId("async-t1")) is None
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.integration
+def test_async_sqlalchemy_transcript_repository_segments(pg_async_sessions):
+    async def scenario():
+        async with pg_async_sessions() as session:
+            repo = AsyncSQLAlchemyTranscriptRepository(session)
+            await repo.save_segment(TranscriptId("async-t2"), 1, _given_phrases(1))
+            await repo.save_segment(TranscriptId("async-t2"), 0, _given_phrases(2))
+            await repo.save_segmented(TranscriptId("async-t2"), "2025-02-26T20:36:06Z", 12345, 2)
+            fetched = await repo.find_by_id(TranscriptId("async-t2"))
+            assert fetched is not None
+            assert len(fetched.content.phrases) == 3
+            await repo.delete(TranscriptId("async-t2"))
+            assert await repo.find_by_id(TranscriptId("async-t2")) is None
+
+    asyncio.run(scenario())
+
+
+def _given_phrases(count: int) -> TranscriptPhrases:
+    phrase = '{"offset_milliseconds": 0, "duration_in_ticks": 1.0, "display": "Hello", "speaker": 1, "locale": "en-US", "confidence": 0.9}'
+    phrases = ", ".join([phrase] * count)
+    return TranscriptContent(f'{{"timestamp": "t", "duration_in_ticks": 1, "phrases": [{phrases}]}}').phrases
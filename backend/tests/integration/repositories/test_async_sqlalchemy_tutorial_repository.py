@@ -0,0 +1,61 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from sightcall_transcript_to_tutorial.domain.entities import Tutorial
+from sightcall_transcript_to_tutorial.domain.value_objects import TutorialCursor, TutorialId, UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.async_sqlalchemy_tutorial_repository import (
+    AsyncSQLAlchemyTutorialRepository,
+)
+
+
+@pytest.mark.integration
+def test_async_sqlalchemy_tutorial_repository(pg_async_sessions):
+    async def scenario():
+        async with pg_async_sessions() as session:
+            repo = AsyncSQLAlchemyTutorialRepository(session)
+            user_id = UserId("async-user")
+            tutorial = Tutorial(TutorialId("async-tut"), title="Title", content="content", user_id=user_id)
+            await repo.save(tutorial)
+            assert await repo.find_by_id(TutorialId("async-tut")) == tutorial
+            assert await repo.validate_ownership(TutorialId("async-tut"), user_id)
+            assert not await repo.validate_ownership(TutorialId("async-tut"), UserId("other-user"))
+            updated = await repo.update_tutorial(TutorialId("async-tut"), user_id, title="New title")
+            assert updated is not None and updated.title == "New title"
+            assert await repo.update_tutorial(TutorialId("async-tut"), UserId("other-user"), title="X") is None
+            await repo.delete(TutorialId("async-tut"))
+            assert await repo.find_by_id(TutorialId("async-tut")) is None
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.integration
+def test_async_sqlalchemy_tutorial_repository_pages(pg_async_sessions):
+    async def scenario():
+        async with pg_async_sessions() as session:
+            repo = AsyncSQLAlchemyTutorialRepository(session)
+            user_id = UserId("async-pages-user")
+            created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+            for i in range(5):
+                await repo.save(
+                    Tutorial(
+                        TutorialId(f"async-page{i}"),
+                        title=f"Page {i % 2}",
+                        content="content",
+                        user_id=user_id,
+                        created_at=created_at + timedelta(minutes=i),
+                    )
+                )
+            first = await repo.list_tutorial_page(user_id, page_size=3)
+            last = first.tutorials[-1]
+            rest = await repo.list_tutorials(
+                user_id, page_size=3, after=TutorialCursor(last.created_at, last.tutorial_id.value)
+            )
+            searched = await repo.list_tutorial_page(user_id, search="Page 1")
+            return first, rest, searched
+
+    first, rest, searched = asyncio.run(scenario())
+    assert first.total == 5
+    assert [t.tutorial_id.value for t in first.tutorials + rest] == [f"async-page{i}" for i in reversed(range(5))]
+    assert (len(searched.tutorials), searched.total) == (2, 2)
@@ -0,0 +1,24 @@
+import asyncio
+
+import pytest
+
+from sightcall_transcript_to_tutorial.domain.entities import User
+from sightcall_transcript_to_tutorial.domain.value_objects import UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.async_sqlalchemy_user_repository import (
+    AsyncSQLAlchemyUserRepository,
+)
+
+
+@pytest.mark.integration
+def test_async_sqlalchemy_user_repository(pg_async_sessions):
+    async def scenario():
+        async with pg_async_sessions() as session:
+            repo = AsyncSQLAlchemyUserRepository(session)
+            user = User(UserId("async-u1"), name="Alice", github_id=4242)
+            await repo.save(user)
+            assert await repo.find_by_id(UserId("async-u1")) == user
+            assert await repo.find_by_github_id(4242) == user
+            await repo.delete(UserId("async-u1"))
+            assert await repo.find_by_id(UserId("async-u1")) is None
+
+    asyncio.run(scenario())
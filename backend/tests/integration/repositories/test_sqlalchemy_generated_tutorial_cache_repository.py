@@ -0,0 +1,70 @@
+import pytest
+
+from sightcall_transcript_to_tutorial.domain.value_objects import GeneratedTutorial
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.sqlalchemy_generated_tutorial_cache_repository import (
+    SQLAlchemyGeneratedTutorialCacheRepository,
+)
+
+
+class TestSQLAlchemyGeneratedTutorialCacheRepository:
+    @pytest.mark.integration
+    def test_should_evict_least_recently_used_entries(self, pg_session):
+        """Given a full cache, when an entry is added, then the least recently used one is evicted."""
+        # Given
+        repo = SQLAlchemyGeneratedTutorialCacheRepository(pg_session, max_entries=2, ttl_seconds=3600)
+        repo.save("key-1", GeneratedTutorial(title="Title 1", content="Content 1"))
+        repo.save("key-2", GeneratedTutorial(title="Title 2", content="Content 2"))
+        repo.find_by_key("key-1")
+
+        # When
+        repo.save("key-3", GeneratedTutorial(title="Title 3", content="Content 3"))
+
+        # Then
+        assert repo.find_by_key("key-1") == GeneratedTutorial(title="Title 1", content="Content 1")
+        assert repo.find_by_key("key-2") is None
+        assert repo.find_by_key("key-3") == GeneratedTutorial(title="Title 3", content="Content 3")
+
+    @pytest.mark.integration
+    def test_should_not_return_expired_entries(self, pg_session):
+        """Given an entry older than the time to live, when looked up, then it is not returned."""
+        # Given
+        SQLAlchemyGeneratedTutorialCacheRepository(pg_session, max_entries=10, ttl_seconds=3600).save(
+            "key-expired", GeneratedTutorial(title="Title", content="Content")
+        )
+
+        # When
+        found = SQLAlchemyGeneratedTutorialCacheRepository(pg_session, max_entries=10, ttl_seconds=0).find_by_key(
+            "key-expired"
+        )
+
+        # Then
+        assert found is None
+
+    @pytest.mark.integration
+    def test_should_end_the_read_transaction_on_a_miss(self, pg_session):
+        """Given no entry for a key, when looked up, then the session is not left in a transaction."""
+        # Given
+        repo = SQLAlchemyGeneratedTutorialCacheRepository(pg_session, max_entries=10, ttl_seconds=3600)
+
+        # When
+        found = repo.find_by_key("key-missing")
+
+        # Then
+        assert found is None
+        assert not pg_session.in_transaction()
+
+    @pytest.mark.integration
+    def test_should_replace_an_expired_entry_of_the_same_key(self, pg_session):
+        """Given an expired entry, when the same key is saved again, then the new tutorial is returned."""
+        # Given
+        repo = SQLAlchemyGeneratedTutorialCacheRepository(pg_session, max_entries=10, ttl_seconds=0)
+        repo.save("key-replaced", GeneratedTutorial(title="Old title", content="Old content"))
+
+        # When
+        repo.save("key-replaced", GeneratedTutorial(title="New title", content="New content"))
+
+        # Then
+        found = SQLAlchemyGeneratedTutorialCacheRepository(pg_session, max_entries=10, ttl_seconds=3600).find_by_key(
+            "key-replaced"
+        )
+        assert found == GeneratedTutorial(title="New title", content="New content")
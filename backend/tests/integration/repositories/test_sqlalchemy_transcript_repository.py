@@ -1,8 +1,10 @@
 import pytest
+from sqlalchemy.exc import IntegrityError
 
 from sightcall_transcript_to_tutorial.domain.entities import Transcript
 from sightcall_transcript_to_tutorial.domain.value_objects import TranscriptId
 from sightcall_transcript_to_tutorial.domain.value_objects.transcript_content import TranscriptContent
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_phrases import TranscriptPhrases
 from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.sqlalchemy_transcript_repository import (
     SQLAlchemyTranscriptRepository,
 )
@@ -18,3 +20,49 @@ def test_sqlalchemy_transcript_repository(pg_session):
     assert fetched == transcript
     repo.delete(TranscriptId("t1"))
     assert repo.find_by_id(TranscriptId("t1")) is None
+
+
+@pytest.mark.integration
+def test_sqlalchemy_transcript_repository_segments(pg_session):
+    repo = SQLAlchemyTranscriptRepository(pg_session)
+    repo.save_segment(TranscriptId("t2"), 1, _given_phrases(1))
+    repo.save_segment(TranscriptId("t2"), 0, _given_phrases(2))
+    assert repo.find_by_id(TranscriptId("t2")) is None
+    repo.save_segmented(TranscriptId("t2"), "2025-02-26T20:36:06Z", 12345, 2)
+    fetched = repo.find_by_id(TranscriptId("t2"))
+    assert fetched is not None
+    assert len(fetched.content.phrases) == 3
+    repo.delete(TranscriptId("t2"))
+    assert repo.find_by_id(TranscriptId("t2")) is None
+
+
+@pytest.mark.integration
+def test_sqlalchemy_transcript_repository_discard_segmented_after_failed_commit(pg_session):
+    repo = SQLAlchemyTranscriptRepository(pg_session)
+    phrases = _given_phrases(1)
+    repo.save_segment(TranscriptId("t4"), 0, phrases)
+    with pytest.raises(IntegrityError):
+        repo.save_segment(TranscriptId("t4"), 0, phrases)
+    repo.discard_segmented(TranscriptId("t4"))
+    # Saved as if its segment were still there, which the rollback and the cleanup both removed
+    repo.save_segmented(TranscriptId("t4"), "2025-02-26T20:36:06Z", 12345, 1)
+    fetched = repo.find_by_id(TranscriptId("t4"))
+    assert fetched is not None
+    assert len(fetched.content.phrases) == 0
+    repo.delete(TranscriptId("t4"))
+
+
+@pytest.mark.integration
+def test_sqlalchemy_transcript_repository_find_existing_ids(pg_session):
+    repo = SQLAlchemyTranscriptRepository(pg_session)
+    valid_content = '{"timestamp": "2025-02-26T20:36:06Z", "duration_in_ticks": 12345, "phrases": [{"offset_milliseconds": 0, "duration_in_ticks": 1.0, "display": "Hello", "speaker": 1, "locale": "en-US", "confidence": 0.9}]}'
+    repo.save(Transcript(TranscriptId("t3"), content=TranscriptContent(valid_content)))
+    existing = repo.find_existing_ids([TranscriptId("t3"), TranscriptId("missing")])
+    assert existing == {TranscriptId("t3")}
+    repo.delete(TranscriptId("t3"))
+
+
+def _given_phrases(count: int) -> TranscriptPhrases:
+    phrase = '{"offset_milliseconds": 0, "duration_in_ticks": 1.0, "display": "Hello", "speaker": 1, "locale": "en-US", "confidence": 0.9}'
+    phrases = ", ".join([phrase] * count)
+    return TranscriptContent(f'{{"timestamp": "t", "duration_in_ticks": 1, "phrases": [{phrases}]}}').phrases
@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from sightcall_transcript_to_tutorial.domain.entities import JobStatus, TutorialGenerationJob
+from sightcall_transcript_to_tutorial.domain.value_objects import TranscriptId, TutorialId, UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_production.models.sqlalchemy_tutorial_generation_job import (
+    SQLAlchemyTutorialGenerationJob,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.sqlalchemy_tutorial_generation_job_repository import (
+    SQLAlchemyTutorialGenerationJobRepository,
+)
+
+
+class TestSQLAlchemyTutorialGenerationJobRepository:
+    @pytest.mark.integration
+    def test_should_claim_queued_job_and_record_its_outcome(self, pg_session):
+        """Given queued jobs, when claimed and finished, then each job is handed out once and keeps its outcome."""
+        # Given
+        repo = SQLAlchemyTutorialGenerationJobRepository(pg_session)
+        first = TutorialGenerationJob.create(transcript_id=TranscriptId("tr1"), user_id=UserId("user-1"))
+        second = TutorialGenerationJob.create(transcript_id=TranscriptId("tr2"), user_id=UserId("user-1"))
+        repo.save(first)
+        repo.save(second)
+
+        # When
+        claimed_first = repo.claim_next(lease_seconds=600)
+        claimed_second = repo.claim_next(lease_seconds=600)
+        nothing_left = repo.claim_next(lease_seconds=600)
+        repo.mark_succeeded(first.job_id, claimed_first.claim_token, TutorialId("tut1"))
+        repo.mark_failed(second.job_id, claimed_second.claim_token, "AI error")
+
+        # Then
+        assert claimed_first is not None and claimed_first.job_id == first.job_id
+        assert claimed_second is not None and claimed_second.job_id == second.job_id
+        assert nothing_left is None
+        succeeded = repo.find_by_id(first.job_id)
+        assert succeeded is not None and succeeded.status == JobStatus.SUCCEEDED
+        assert succeeded.tutorial_id == TutorialId("tut1")
+        failed = repo.find_by_id(second.job_id)
+        assert failed is not None and failed.status == JobStatus.FAILED
+        assert failed.error == "AI error"
+
+    @pytest.mark.integration
+    def test_should_save_many_jobs_at_once(self, pg_session):
+        """Given a batch of new jobs, when saved at once, then each can be found and claimed."""
+        # Given
+        repo = SQLAlchemyTutorialGenerationJobRepository(pg_session)
+        jobs = [
+            TutorialGenerationJob.create(transcript_id=TranscriptId(f"tr{index}"), user_id=UserId("user-1"))
+            for index in range(3)
+        ]
+
+        # When
+        repo.save_many(jobs)
+
+        # Then
+        assert all(repo.find_by_id(job.job_id) is not None for job in jobs)
+        claimed = {repo.claim_next(lease_seconds=600).job_id for _ in jobs}
+        assert claimed == {job.job_id for job in jobs}
+
+    @pytest.mark.integration
+    def test_should_only_let_the_latest_claim_renew_and_finish_a_job(self, pg_session):
+        """Given a job claimed again once its lease expired, then only the latest claim can renew and finish it."""
+        # Given
+        repo = SQLAlchemyTutorialGenerationJobRepository(pg_session)
+        job = TutorialGenerationJob.create(transcript_id=TranscriptId("tr-lease"), user_id=UserId("user-lease"))
+        repo.save(job)
+        first_claim = self._claim(repo, job)
+        pg_session.query(SQLAlchemyTutorialGenerationJob).filter_by(id=job.job_id.value).update(
+            {SQLAlchemyTutorialGenerationJob.updated_at: datetime.now(timezone.utc) - timedelta(hours=1)}
+        )
+        pg_session.commit()
+        second_claim = self._claim(repo, job)
+
+        # When
+        stale_renewed = repo.renew_lease(job.job_id, first_claim.claim_token)
+        stale_recorded = repo.mark_failed(job.job_id, first_claim.claim_token, "stale")
+        renewed = repo.renew_lease(job.job_id, second_claim.claim_token)
+        recorded = repo.mark_succeeded(job.job_id, second_claim.claim_token, TutorialId("tut-lease"))
+
+        # Then
+        assert (stale_renewed, stale_recorded, renewed, recorded) == (False, False, True, True)
+        finished = repo.find_by_id(job.job_id)
+        assert finished is not None and finished.status == JobStatus.SUCCEEDED
+        assert finished.tutorial_id == TutorialId("tut-lease")
+
+    def _claim(
+        self, repo: SQLAlchemyTutorialGenerationJobRepository, job: TutorialGenerationJob
+    ) -> TutorialGenerationJob:
+        """Claim jobs until `job` is, as the database is shared with other tests."""
+        while (claimed := repo.claim_next(lease_seconds=600)).job_id != job.job_id:
+            pass
+        return claimed
@@ -1,7 +1,9 @@
+from datetime import datetime, timezone
+
 import pytest
 
 from sightcall_transcript_to_tutorial.domain.entities import Tutorial
-from sightcall_transcript_to_tutorial.domain.value_objects import TutorialId, UserId
+from sightcall_transcript_to_tutorial.domain.value_objects import TutorialCursor, TutorialId, UserId
 from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.sqlalchemy_tutorial_repository import (
     SQLAlchemyTutorialRepository,
 )
@@ -48,6 +50,71 @@ class TestSQLAlchemyTutorialRepository:
         self._when_paginate_tutorials_then_should_return_correct_pages(repo, user_1)
         self._when_search_tutorials_then_should_return_matching_results(repo, user_1)
 
+    @pytest.mark.integration
+    def test_should_list_tutorials_from_a_cursor(self, pg_session):
+        """Given tutorials created at the same time, when paging with cursors, then each is listed exactly once."""
+        # Given
+        repo = self._given_repository(pg_session)
+        user_id = UserId("user-cursor")
+        created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        for i in range(5):
+            tutorial = Tutorial(
+                TutorialId(f"cursor{i}"), title=f"Title {i}", content="content", user_id=user_id, created_at=created_at
+            )
+            repo.save(tutorial)
+
+        # When
+        first_page = repo.list_tutorials(user_id=user_id, page_size=3)
+        last = first_page[-1]
+        second_page = repo.list_tutorials(
+            user_id=user_id, page_size=3, after=TutorialCursor(last.created_at, last.tutorial_id.value)
+        )
+
+        # Then
+        ids = [tutorial.tutorial_id.value for tutorial in first_page + second_page]
+        assert ids == ["cursor4", "cursor3", "cursor2", "cursor1", "cursor0"]
+
+    @pytest.mark.integration
+    def test_should_count_all_matching_tutorials_across_pages(self, pg_session):
+        """Given tutorials saved, re-saved and deleted, when listing a page, then the total counts every match."""
+        # Given
+        repo = self._given_repository(pg_session)
+        user_id = UserId("user-counted")
+        for i in range(5):
+            self._given_tutorial_in_repository(repo, f"counted{i}", user_id, title=f"Counted {i % 2}")
+        self._given_tutorial_in_repository(repo, "counted0", user_id, title="Counted 0")
+        self._given_tutorial_in_repository(repo, "counted-other", UserId("user-other"))
+        repo.delete(TutorialId("counted4"))
+
+        # When
+        unfiltered = repo.list_tutorial_page(user_id=user_id, page_size=2)
+        searched = repo.list_tutorial_page(user_id=user_id, page_size=1, search="Counted 1")
+        past_the_end = repo.list_tutorial_page(user_id=user_id, page=9, page_size=2, search="Counted")
+
+        # Then
+        assert (len(unfiltered.tutorials), unfiltered.total, unfiltered.total_is_estimate) == (2, 4, False)
+        assert (len(searched.tutorials), searched.total, searched.total_is_estimate) == (1, 2, False)
+        assert (len(past_the_end.tutorials), past_the_end.total) == (0, 4)
+
+    @pytest.mark.integration
+    def test_should_search_words_of_content_and_substrings_of_title_ranked(self, pg_session):
+        """Given tutorials matching a search differently, when searching, then the best matches should come first."""
+        # Given
+        repo = self._given_repository(pg_session)
+        user_id = UserId("user-search")
+        self._given_tutorial_in_repository(repo, "search-content", user_id, title="Setup", content="Install Python 3")
+        self._given_tutorial_in_repository(repo, "search-title", user_id, title="Python basics", content="Hello")
+        self._given_tutorial_in_repository(repo, "search-substring", user_id, title="Jython on the JVM", content="x")
+        self._given_tutorial_in_repository(repo, "search-unrelated", user_id, title="Setup", content="Install Node")
+
+        # When
+        by_word = repo.list_tutorials(user_id=user_id, search="python")
+        by_substring = repo.list_tutorials(user_id=user_id, search="ytho")
+
+        # Then
+        assert [t.tutorial_id.value for t in by_word] == ["search-title", "search-content"]
+        assert {t.tutorial_id.value for t in by_substring} == {"search-title", "search-substring"}
+
     @pytest.mark.integration
     def test_should_update_tutorial_for_owner_only(self, pg_session):
         """Given a tutorial, when updated by owner, then fields should change; non-owner cannot update."""
@@ -0,0 +1,111 @@
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event, insert, text
+
+from sightcall_transcript_to_tutorial.domain.value_objects import TutorialCursor, UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_production.models.sqlalchemy_tutorial import (
+    SQLAlchemyTutorial,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.sqlalchemy_tutorial_repository import (
+    SQLAlchemyTutorialRepository,
+)
+
+SEEDED_USERS = 200
+TUTORIALS_PER_USER = 250
+SEEDED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class TestSQLAlchemyTutorialRepositoryQueryPlans:
+    """Seeds a large table, then checks that the planner serves listings from the indexes instead of scanning it."""
+
+    @pytest.mark.integration
+    @pytest.mark.slow
+    def test_should_list_a_page_from_the_created_at_index(self, pg_session):
+        # Given
+        repo = self._given_seeded_repository(pg_session)
+
+        # When
+        plan = self._when_explaining(pg_session, lambda: repo.list_tutorials(UserId("plan-user-7"), page_size=20))
+
+        # Then
+        self._then_plan_should_use_index(plan, "ix_tutorials_user_id_created_at_id")
+
+    @pytest.mark.integration
+    @pytest.mark.slow
+    def test_should_list_a_page_after_a_cursor_from_the_created_at_index(self, pg_session):
+        # Given
+        repo = self._given_seeded_repository(pg_session)
+        cursor = TutorialCursor(SEEDED_AT + timedelta(minutes=100), "plan-7-100")
+
+        # When
+        plan = self._when_explaining(
+            pg_session, lambda: repo.list_tutorials(UserId("plan-user-7"), page_size=20, after=cursor)
+        )
+
+        # Then
+        self._then_plan_should_use_index(plan, "ix_tutorials_user_id_created_at_id")
+
+    @pytest.mark.integration
+    @pytest.mark.slow
+    def test_should_filter_on_updated_at_from_its_index(self, pg_session):
+        # Given
+        repo = self._given_seeded_repository(pg_session)
+        recently = SEEDED_AT + timedelta(minutes=TUTORIALS_PER_USER - 5)
+
+        # When
+        plan = self._when_explaining(
+            pg_session, lambda: repo.list_tutorials(UserId("plan-user-7"), filters={"updated_at": recently})
+        )
+
+        # Then
+        self._then_plan_should_use_index(plan, "ix_tutorials_user_id_updated_at")
+
+    def _given_seeded_repository(self, pg_session) -> SQLAlchemyTutorialRepository:
+        if not pg_session.query(SQLAlchemyTutorial).filter_by(user_id="plan-user-0").first():
+            rows = [
+                {
+                    "id": f"plan-{user}-{index}",
+                    "title": f"Tutorial {index}",
+                    "content": "content",
+                    "user_id": f"plan-user-{user}",
+                    "created_at": SEEDED_AT + timedelta(minutes=index),
+                    "updated_at": SEEDED_AT + timedelta(minutes=index),
+                }
+                for user in range(SEEDED_USERS)
+                for index in range(TUTORIALS_PER_USER)
+            ]
+            pg_session.execute(insert(SQLAlchemyTutorial), rows)
+            pg_session.commit()
+            pg_session.execute(text("ANALYZE tutorials"))
+            pg_session.commit()
+        return SQLAlchemyTutorialRepository(pg_session)
+
+    def _when_explaining(self, pg_session, list_tutorials: Callable[[], object]) -> dict:
+        """Run the listing, then ask the planner how it would run the last statement it sent."""
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        engine = pg_session.get_bind()
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            list_tutorials()
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+        statement, parameters = statements[-1]
+        result = pg_session.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        return result.scalar_one()[0]["Plan"]
+
+    def _then_plan_should_use_index(self, plan: dict, index_name: str) -> None:
+        nodes = list(_plan_nodes(plan))
+        assert index_name in {node.get("Index Name") for node in nodes}, plan
+        assert not any(node["Node Type"] == "Seq Scan" for node in nodes), plan
+
+
+def _plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
@@ -2,6 +2,9 @@ import pytest
 
 from sightcall_transcript_to_tutorial.domain.entities import User
 from sightcall_transcript_to_tutorial.domain.value_objects import UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.in_memory_user_cache import (
+    InMemoryUserCache,
+)
 from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.sqlalchemy_user_repository import (
     SQLAlchemyUserRepository,
 )
@@ -16,3 +19,17 @@ def test_sqlalchemy_user_repository(pg_session):
     assert fetched == user
     repo.delete(UserId("u1"))
     assert repo.find_by_id(UserId("u1")) is None
+
+
+@pytest.mark.integration
+def test_sqlalchemy_user_repository_should_serve_cached_users_until_saved_or_deleted(pg_session):
+    cache = InMemoryUserCache(max_entries=10, ttl_seconds=60)
+    repo = SQLAlchemyUserRepository(pg_session, cache=cache)
+    repo.save(User(UserId("cached-u1"), name="Alice"))
+    assert repo.find_by_id(UserId("cached-u1")) == User(UserId("cached-u1"), name="Alice")
+    assert cache.find_by_id(UserId("cached-u1")) == User(UserId("cached-u1"), name="Alice")
+    repo.save(User(UserId("cached-u1"), name="Alicia"))
+    assert cache.find_by_id(UserId("cached-u1")) is None
+    assert repo.find_by_id(UserId("cached-u1")) == User(UserId("cached-u1"), name="Alicia")
+    repo.delete(UserId("cached-u1"))
+    assert repo.find_by_id(UserId("cached-u1")) is None
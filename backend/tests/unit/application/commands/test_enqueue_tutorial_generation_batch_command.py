@@ -0,0 +1,71 @@
+from sightcall_transcript_to_tutorial.application.commands.enqueue_tutorial_generation_batch_command import (
+    EnqueueTutorialGenerationBatchCommand,
+    EnqueueTutorialGenerationBatchCommandHandler,
+)
+from sightcall_transcript_to_tutorial.domain.entities import JobStatus, Transcript
+from sightcall_transcript_to_tutorial.domain.value_objects import TranscriptId, UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_transcript_repository import (
+    FakeTranscriptRepository,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_tutorial_generation_job_repository import (
+    FakeTutorialGenerationJobRepository,
+)
+
+
+class TestEnqueueTutorialGenerationBatchCommandHandler:
+    def test_should_queue_a_job_per_existing_transcript_and_reject_the_others(self):
+        # Given
+        job_repo = FakeTutorialGenerationJobRepository()
+        handler = self._given_handler(job_repo, "tr1", "tr2")
+        command = EnqueueTutorialGenerationBatchCommand(
+            transcript_ids=["tr1", "missing", "tr2"], user_id=UserId("user-1")
+        )
+
+        # When
+        results = handler.handle(command)
+
+        # Then
+        assert [result.transcript_id for result in results] == ["tr1", "missing", "tr2"]
+        queued = [results[0].job, results[2].job]
+        assert all(job is not None and job.status == JobStatus.PENDING for job in queued)
+        assert [job.transcript_id for job in queued if job] == [TranscriptId("tr1"), TranscriptId("tr2")]
+        assert all(job_repo.find_by_id(job.job_id) == job for job in queued if job)
+        assert results[1].job is None
+        assert results[1].error == "Transcript with id missing not found"
+
+    def test_should_queue_a_single_job_for_a_transcript_listed_twice(self):
+        # Given
+        job_repo = FakeTutorialGenerationJobRepository()
+        handler = self._given_handler(job_repo, "tr1")
+
+        # When
+        results = handler.handle(
+            EnqueueTutorialGenerationBatchCommand(transcript_ids=["tr1", "tr1"], user_id=UserId("user-1"))
+        )
+
+        # Then
+        assert len(results) == 1
+        assert job_repo.claim_next(lease_seconds=60) is not None
+        assert job_repo.claim_next(lease_seconds=60) is None
+
+    def test_should_queue_nothing_when_no_transcript_exists(self):
+        # Given
+        job_repo = FakeTutorialGenerationJobRepository()
+        handler = self._given_handler(job_repo)
+
+        # When
+        results = handler.handle(
+            EnqueueTutorialGenerationBatchCommand(transcript_ids=["missing"], user_id=UserId("user-1"))
+        )
+
+        # Then
+        assert results[0].error is not None
+        assert job_repo.claim_next(lease_seconds=60) is None
+
+    def _given_handler(
+        self, job_repo: FakeTutorialGenerationJobRepository, *transcript_ids: str
+    ) -> EnqueueTutorialGenerationBatchCommandHandler:
+        transcript_repo = FakeTranscriptRepository()
+        for transcript_id in transcript_ids:
+            transcript_repo.save(Transcript(TranscriptId(transcript_id), "Sample transcript"))
+        return EnqueueTutorialGenerationBatchCommandHandler(transcript_repo, job_repo)
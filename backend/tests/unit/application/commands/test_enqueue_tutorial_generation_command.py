@@ -0,0 +1,41 @@
+import pytest
+
+from sightcall_transcript_to_tutorial.application.commands.enqueue_tutorial_generation_command import (
+    EnqueueTutorialGenerationCommand,
+    EnqueueTutorialGenerationCommandHandler,
+)
+from sightcall_transcript_to_tutorial.domain.entities import JobStatus, Transcript
+from sightcall_transcript_to_tutorial.domain.value_objects import TranscriptId, UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_transcript_repository import (
+    FakeTranscriptRepository,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_tutorial_generation_job_repository import (
+    FakeTutorialGenerationJobRepository,
+)
+
+
+class TestEnqueueTutorialGenerationCommandHandler:
+    def test_should_queue_pending_job_for_existing_transcript(self):
+        # Given
+        transcript_repo = FakeTranscriptRepository()
+        transcript_repo.save(Transcript(TranscriptId("tr1"), "Sample transcript"))
+        job_repo = FakeTutorialGenerationJobRepository()
+        handler = EnqueueTutorialGenerationCommandHandler(transcript_repo, job_repo)
+
+        # When
+        job = handler.handle(EnqueueTutorialGenerationCommand(transcript_id="tr1", user_id=UserId("user-1")))
+
+        # Then
+        assert job.status == JobStatus.PENDING
+        assert job.transcript_id == TranscriptId("tr1")
+        assert job_repo.find_by_id(job.job_id) == job
+
+    def test_should_raise_error_when_transcript_does_not_exist(self):
+        # Given
+        job_repo = FakeTutorialGenerationJobRepository()
+        handler = EnqueueTutorialGenerationCommandHandler(FakeTranscriptRepository(), job_repo)
+
+        # When & Then
+        with pytest.raises(ValueError):
+            handler.handle(EnqueueTutorialGenerationCommand(transcript_id="missing", user_id=UserId("user-1")))
+        assert job_repo.claim_next(lease_seconds=60) is None
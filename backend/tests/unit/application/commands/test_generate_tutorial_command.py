@@ -1,3 +1,7 @@
+import asyncio
+import threading
+import time
+
 import pytest
 
 from sightcall_transcript_to_tutorial.application.commands.generate_tutorial_command import (
@@ -7,9 +11,16 @@ from sightcall_transcript_to_tutorial.application.commands.generate_tutorial_com
 from sightcall_transcript_to_tutorial.domain.entities.transcript import Transcript
 from sightcall_transcript_to_tutorial.domain.entities.tutorial import Tutorial
 from sightcall_transcript_to_tutorial.domain.exceptions.tutorial_generation_error import TutorialGenerationError
+from sightcall_transcript_to_tutorial.domain.value_objects.generated_tutorial import GeneratedTutorial
 from sightcall_transcript_to_tutorial.domain.value_objects.transcript_id import TranscriptId
 from sightcall_transcript_to_tutorial.domain.value_objects.tutorial_id import TutorialId
 from sightcall_transcript_to_tutorial.domain.value_objects.user_id import UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_production.gateways.in_process_tutorial_generation_lock import (
+    InProcessTutorialGenerationLock,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_generated_tutorial_cache_repository import (
+    FakeGeneratedTutorialCacheRepository,
+)
 from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_transcript_repository import (
     FakeTranscriptRepository,
 )
@@ -19,12 +30,20 @@ from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake
 
 
 class _FakeTutorialGeneratorGateway:
-    def __init__(self, should_fail: bool = False):
+    def __init__(self, should_fail: bool = False, cache_key: str | None = None, seconds_per_generation: float = 0):
         self._should_fail = should_fail
+        self._cache_key = cache_key
+        self._seconds_per_generation = seconds_per_generation
         self.called_with = None
         self.called_with_user_id = None
+        self.call_count = 0
+
+    def cache_key(self, transcript: Transcript) -> str | None:
+        return self._cache_key
 
     def generate_tutorial(self, transcript: Transcript, user_id: UserId) -> Tutorial:
+        self.call_count += 1
+        time.sleep(self._seconds_per_generation)
         self.called_with = transcript
         self.called_with_user_id = user_id
         if self._should_fail:
@@ -36,6 +55,9 @@ class _FakeTutorialGeneratorGateway:
             user_id=user_id,
         )
 
+    async def generate_tutorial_async(self, transcript: Transcript, user_id: UserId) -> Tutorial:
+        return await asyncio.to_thread(self.generate_tutorial, transcript, user_id)
+
 
 class TestGenerateTutorialCommandHandler:
     def test_should_generate_tutorial_with_correct_user_id(self):
@@ -102,6 +124,165 @@ class TestGenerateTutorialCommandHandler:
         # Then
         self._then_tutorial_should_be_persisted(tutorial_repo, tutorial)
 
+    def test_should_reuse_cached_tutorial_without_calling_gateway(self):
+        # Given
+        user_id = UserId("user-123")
+        transcript_repo = self._given_transcript_repository_with_transcript(self._given_transcript())
+        tutorial_generator_gateway = _FakeTutorialGeneratorGateway(cache_key="key-1")
+        tutorial_repo = self._given_tutorial_repository()
+        cache = FakeGeneratedTutorialCacheRepository()
+        cache.save("key-1", GeneratedTutorial(title="Cached Tutorial", content="Cached content"))
+        handler = GenerateTutorialCommandHandler(transcript_repo, tutorial_generator_gateway, tutorial_repo, cache)
+        command = GenerateTutorialCommand(transcript_id="tr1", user_id=user_id)
+
+        # When
+        tutorial = self._when_handle_command(handler, command)
+
+        # Then
+        assert tutorial_generator_gateway.call_count == 0
+        self._then_tutorial_should_be_generated(tutorial, "Cached Tutorial", "Cached content")
+        self._then_tutorial_should_be_generated_with_user_id(tutorial, user_id)
+        self._then_tutorial_should_be_persisted(tutorial_repo, tutorial)
+
+    def test_should_cache_generated_tutorial_for_next_requests(self):
+        # Given
+        transcript_repo = self._given_transcript_repository_with_transcript(self._given_transcript())
+        tutorial_generator_gateway = _FakeTutorialGeneratorGateway(cache_key="key-1")
+        tutorial_repo = self._given_tutorial_repository()
+        cache = FakeGeneratedTutorialCacheRepository()
+        handler = GenerateTutorialCommandHandler(transcript_repo, tutorial_generator_gateway, tutorial_repo, cache)
+        command = GenerateTutorialCommand(transcript_id="tr1", user_id=UserId("user-123"))
+
+        # When
+        first = self._when_handle_command(handler, command)
+        second = self._when_handle_command(handler, command)
+
+        # Then
+        assert tutorial_generator_gateway.call_count == 1
+        assert cache.find_by_key("key-1") == GeneratedTutorial(
+            title="Generated Tutorial", content="AI generated content"
+        )
+        assert second.tutorial_id != first.tutorial_id
+        self._then_tutorial_should_be_generated(second, "Generated Tutorial", "AI generated content")
+
+    def test_should_generate_and_persist_tutorial_asynchronously(self):
+        # Given
+        user_id = UserId("user-123")
+        transcript_repo = self._given_transcript_repository_with_transcript(self._given_transcript())
+        tutorial_generator_gateway = self._given_tutorial_generator_gateway()
+        tutorial_repo = self._given_tutorial_repository()
+        handler = self._given_handler(transcript_repo, tutorial_generator_gateway, tutorial_repo)
+        command = GenerateTutorialCommand(transcript_id="tr1", user_id=user_id)
+
+        # When
+        tutorial = asyncio.run(handler.handle_async(command))
+
+        # Then
+        self._then_tutorial_should_be_generated(tutorial, "Generated Tutorial", "AI generated content")
+        self._then_tutorial_should_be_persisted(tutorial_repo, tutorial)
+
+    def test_should_reuse_cached_tutorial_asynchronously(self):
+        # Given
+        transcript_repo = self._given_transcript_repository_with_transcript(self._given_transcript())
+        tutorial_generator_gateway = _FakeTutorialGeneratorGateway(cache_key="key-1")
+        cache = FakeGeneratedTutorialCacheRepository()
+        cache.save("key-1", GeneratedTutorial(title="Cached Tutorial", content="Cached content"))
+        handler = GenerateTutorialCommandHandler(
+            transcript_repo, tutorial_generator_gateway, self._given_tutorial_repository(), cache
+        )
+        command = GenerateTutorialCommand(transcript_id="tr1", user_id=UserId("user-123"))
+
+        # When
+        tutorial = asyncio.run(handler.handle_async(command))
+
+        # Then
+        assert tutorial_generator_gateway.call_count == 0
+        self._then_tutorial_should_be_generated(tutorial, "Cached Tutorial", "Cached content")
+
+    def test_should_generate_once_for_concurrent_async_commands_on_the_same_transcript(self):
+        # Given
+        transcript_repo = self._given_transcript_repository_with_transcript(self._given_transcript())
+        tutorial_generator_gateway = _FakeTutorialGeneratorGateway(cache_key="key-1", seconds_per_generation=0.1)
+        handler = GenerateTutorialCommandHandler(
+            transcript_repo,
+            tutorial_generator_gateway,
+            self._given_tutorial_repository(),
+            FakeGeneratedTutorialCacheRepository(),
+            InProcessTutorialGenerationLock(),
+        )
+
+        async def generate_concurrently() -> list[Tutorial]:
+            return await asyncio.gather(
+                *(
+                    handler.handle_async(GenerateTutorialCommand(transcript_id="tr1", user_id=UserId(f"user-{index}")))
+                    for index in range(3)
+                )
+            )
+
+        # When
+        tutorials = asyncio.run(generate_concurrently())
+
+        # Then
+        assert tutorial_generator_gateway.call_count == 1
+        assert [tutorial.user_id for tutorial in tutorials] == [UserId(f"user-{index}") for index in range(3)]
+
+    def test_should_generate_once_for_concurrent_commands_on_the_same_transcript(self):
+        # Given
+        transcript_repo = self._given_transcript_repository_with_transcript(self._given_transcript())
+        tutorial_generator_gateway = _FakeTutorialGeneratorGateway(cache_key="key-1", seconds_per_generation=0.1)
+        tutorial_repo = self._given_tutorial_repository()
+        handler = GenerateTutorialCommandHandler(
+            transcript_repo,
+            tutorial_generator_gateway,
+            tutorial_repo,
+            FakeGeneratedTutorialCacheRepository(),
+            InProcessTutorialGenerationLock(),
+        )
+        tutorials = []
+
+        def generate(user_id: str) -> None:
+            tutorials.append(handler.handle(GenerateTutorialCommand(transcript_id="tr1", user_id=UserId(user_id))))
+
+        threads = [threading.Thread(target=generate, args=(f"user-{index}",)) for index in range(4)]
+
+        # When
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        # Then
+        assert tutorial_generator_gateway.call_count == 1
+        assert len(tutorials) == 4
+        assert {tutorial.content for tutorial in tutorials} == {"AI generated content"}
+        assert len({tutorial.tutorial_id for tutorial in tutorials}) == 4
+
+    def test_should_save_one_tutorial_for_concurrent_commands_of_the_same_user_without_a_cache(self):
+        # Given
+        transcript_repo = self._given_transcript_repository_with_transcript(self._given_transcript())
+        tutorial_generator_gateway = _FakeTutorialGeneratorGateway(seconds_per_generation=0.1)
+        tutorial_repo = self._given_tutorial_repository()
+        handler = GenerateTutorialCommandHandler(
+            transcript_repo,
+            tutorial_generator_gateway,
+            tutorial_repo,
+            generation_lock=InProcessTutorialGenerationLock(),
+        )
+        command = GenerateTutorialCommand(transcript_id="tr1", user_id=UserId("user-123"))
+        tutorials = []
+        threads = [threading.Thread(target=lambda: tutorials.append(handler.handle(command))) for _ in range(2)]
+
+        # When
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        # Then
+        assert tutorial_generator_gateway.call_count == 1
+        assert [tutorial.tutorial_id for tutorial in tutorials] == [TutorialId("tut1")] * 2
+        assert len(tutorial_repo._tutorials) == 1
+
     def _given_transcript(self) -> Transcript:
         return Transcript(TranscriptId("tr1"), "Sample transcript")
 
@@ -0,0 +1,202 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from sightcall_transcript_to_tutorial.application.commands.generate_tutorial_command import (
+    GenerateTutorialCommandHandler,
+)
+from sightcall_transcript_to_tutorial.application.commands.process_next_tutorial_generation_job_command import (
+    ProcessNextTutorialGenerationJobCommand,
+    ProcessNextTutorialGenerationJobCommandHandler,
+)
+from sightcall_transcript_to_tutorial.domain.entities import JobStatus, Transcript, TutorialGenerationJob
+from sightcall_transcript_to_tutorial.domain.value_objects import JobId, TranscriptId, TutorialId, UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.gateways.fake_tutorial_generator_gateway import (
+    FakeTutorialGeneratorGateway,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_transcript_repository import (
+    FakeTranscriptRepository,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_tutorial_generation_job_repository import (
+    FakeTutorialGenerationJobRepository,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_tutorial_repository import (
+    FakeTutorialRepository,
+)
+
+
+class _SlowGenerateTutorialHandler:
+    """Runs `during_generation` and takes `seconds` before handing the wrapped handler's tutorial."""
+
+    def __init__(self, handler: GenerateTutorialCommandHandler, seconds: float, during_generation=lambda: None):
+        self._handler = handler
+        self._seconds = seconds
+        self._during_generation = during_generation
+
+    async def handle_async(self, command):
+        self._during_generation()
+        await asyncio.sleep(self._seconds)
+        return await self._handler.handle_async(command)
+
+
+class _LeaseRenewalsSpy(FakeTutorialGenerationJobRepository):
+    def __init__(self, job_repo: FakeTutorialGenerationJobRepository):
+        super().__init__()
+        self._job_repo = job_repo
+        self.renewals = 0
+
+    def renew_lease(self, job_id, claim_token):
+        self.renewals += 1
+        return self._job_repo.renew_lease(job_id, claim_token)
+
+
+class TestProcessNextTutorialGenerationJobCommandHandler:
+    def test_should_return_none_when_queue_is_empty(self):
+        # Given
+        handler, _, _ = self._given_handler(FakeTutorialGenerationJobRepository())
+
+        # When
+        job = asyncio.run(handler.handle(ProcessNextTutorialGenerationJobCommand()))
+
+        # Then
+        assert job is None
+
+    def test_should_generate_tutorial_and_mark_job_succeeded(self):
+        # Given
+        job_repo = FakeTutorialGenerationJobRepository()
+        queued_job = self._given_queued_job(job_repo)
+        handler, tutorial_repo, _ = self._given_handler(job_repo)
+
+        # When
+        claimed_job = asyncio.run(handler.handle(ProcessNextTutorialGenerationJobCommand()))
+
+        # Then
+        assert claimed_job is not None and claimed_job.job_id == queued_job.job_id
+        finished_job = job_repo.find_by_id(queued_job.job_id)
+        assert finished_job is not None
+        assert finished_job.status == JobStatus.SUCCEEDED
+        assert finished_job.tutorial_id == TutorialId("fake-tut-1")
+        assert tutorial_repo.find_by_id(TutorialId("fake-tut-1")) is not None
+
+    def test_should_mark_job_failed_when_generation_fails(self):
+        # Given
+        job_repo = FakeTutorialGenerationJobRepository()
+        queued_job = self._given_queued_job(job_repo)
+        handler, _, _ = self._given_handler(job_repo, should_fail=True)
+
+        # When
+        asyncio.run(handler.handle(ProcessNextTutorialGenerationJobCommand()))
+
+        # Then
+        finished_job = job_repo.find_by_id(queued_job.job_id)
+        assert finished_job is not None
+        assert finished_job.status == JobStatus.FAILED
+        assert finished_job.error == "Simulated failure in fake gateway."
+
+    def test_should_reclaim_running_job_once_its_lease_expired(self):
+        # Given
+        job_repo = FakeTutorialGenerationJobRepository()
+        an_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
+        job_repo.save(
+            TutorialGenerationJob(
+                job_id=JobId("job-1"),
+                transcript_id=TranscriptId("tr1"),
+                user_id=UserId("user-1"),
+                status=JobStatus.RUNNING,
+                created_at=an_hour_ago,
+                updated_at=an_hour_ago,
+            )
+        )
+        handler, _, _ = self._given_handler(job_repo)
+
+        # When
+        claimed_job = asyncio.run(handler.handle(ProcessNextTutorialGenerationJobCommand(lease_seconds=600)))
+
+        # Then
+        assert claimed_job is not None and claimed_job.job_id == JobId("job-1")
+
+    def test_should_renew_the_lease_while_the_job_runs(self):
+        # Given
+        job_repo = FakeTutorialGenerationJobRepository()
+        queued_job = self._given_queued_job(job_repo)
+        lease_repo = _LeaseRenewalsSpy(job_repo)
+        slow_handler = ProcessNextTutorialGenerationJobCommandHandler(
+            job_repo, _SlowGenerateTutorialHandler(self._given_generate_tutorial_handler(), seconds=0.35), lease_repo
+        )
+
+        # When
+        asyncio.run(slow_handler.handle(ProcessNextTutorialGenerationJobCommand(lease_seconds=0.3)))
+
+        # Then
+        assert lease_repo.renewals >= 2
+        finished_job = job_repo.find_by_id(queued_job.job_id)
+        assert finished_job is not None and finished_job.status == JobStatus.SUCCEEDED
+
+    def test_should_drop_the_outcome_of_a_job_claimed_again_by_another_worker(self):
+        # Given
+        job_repo = FakeTutorialGenerationJobRepository()
+        queued_job = self._given_queued_job(job_repo)
+        other_worker_claims = []
+        slow_handler = ProcessNextTutorialGenerationJobCommandHandler(
+            job_repo,
+            _SlowGenerateTutorialHandler(
+                self._given_generate_tutorial_handler(),
+                seconds=0,
+                during_generation=lambda: other_worker_claims.append(job_repo.claim_next(lease_seconds=0)),
+            ),
+        )
+
+        # When
+        asyncio.run(slow_handler.handle(ProcessNextTutorialGenerationJobCommand()))
+
+        # Then
+        running_job = job_repo.find_by_id(queued_job.job_id)
+        assert running_job is not None and running_job.status == JobStatus.RUNNING
+        assert running_job.claim_token == other_worker_claims[0].claim_token
+
+    def test_should_not_save_the_tutorial_of_a_job_claimed_again_by_another_worker(self):
+        # Given
+        job_repo = FakeTutorialGenerationJobRepository()
+        queued_job = self._given_queued_job(job_repo)
+        transcript_repo = FakeTranscriptRepository()
+        transcript_repo.save(Transcript(TranscriptId("tr1"), "Sample transcript"))
+        tutorial_repo = FakeTutorialRepository()
+        slow_handler = ProcessNextTutorialGenerationJobCommandHandler(
+            job_repo,
+            _SlowGenerateTutorialHandler(
+                GenerateTutorialCommandHandler(transcript_repo, FakeTutorialGeneratorGateway(), tutorial_repo),
+                seconds=0,
+                during_generation=lambda: job_repo.claim_next(lease_seconds=0),
+            ),
+        )
+
+        # When
+        asyncio.run(slow_handler.handle(ProcessNextTutorialGenerationJobCommand()))
+
+        # Then
+        assert tutorial_repo.find_by_id(TutorialId("fake-tut-1")) is None
+        running_job = job_repo.find_by_id(queued_job.job_id)
+        assert running_job is not None and running_job.status == JobStatus.RUNNING
+
+    def _given_queued_job(self, job_repo: FakeTutorialGenerationJobRepository) -> TutorialGenerationJob:
+        job = TutorialGenerationJob.create(transcript_id=TranscriptId("tr1"), user_id=UserId("user-1"))
+        job_repo.save(job)
+        return job
+
+    def _given_generate_tutorial_handler(self) -> GenerateTutorialCommandHandler:
+        transcript_repo = FakeTranscriptRepository()
+        transcript_repo.save(Transcript(TranscriptId("tr1"), "Sample transcript"))
+        return GenerateTutorialCommandHandler(
+            transcript_repo, FakeTutorialGeneratorGateway(), FakeTutorialRepository()
+        )
+
+    def _given_handler(self, job_repo: FakeTutorialGenerationJobRepository, should_fail: bool = False):
+        transcript_repo = FakeTranscriptRepository()
+        transcript_repo.save(Transcript(TranscriptId("tr1"), "Sample transcript"))
+        tutorial_repo = FakeTutorialRepository()
+        gateway = FakeTutorialGeneratorGateway(should_fail=should_fail)
+        generate_tutorial_handler = GenerateTutorialCommandHandler(transcript_repo, gateway, tutorial_repo)
+        return (
+            ProcessNextTutorialGenerationJobCommandHandler(job_repo, generate_tutorial_handler),
+            tutorial_repo,
+            gateway,
+        )
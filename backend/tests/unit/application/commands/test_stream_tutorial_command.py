@@ -0,0 +1,240 @@
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, nullcontext
+
+import pytest
+
+from sightcall_transcript_to_tutorial.application.commands.stream_tutorial_command import (
+    StreamTutorialCommand,
+    StreamTutorialCommandHandler,
+)
+from sightcall_transcript_to_tutorial.domain.entities.transcript import Transcript
+from sightcall_transcript_to_tutorial.domain.exceptions.tutorial_generation_error import TutorialGenerationError
+from sightcall_transcript_to_tutorial.domain.value_objects.generated_tutorial import GeneratedTutorial
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_id import TranscriptId
+from sightcall_transcript_to_tutorial.domain.value_objects.user_id import UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_production.gateways.in_process_tutorial_generation_lock import (
+    InProcessTutorialGenerationLock,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.gateways.fake_tutorial_generator_gateway import (
+    FakeTutorialGeneratorGateway,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_async_transcript_repository import (
+    FakeAsyncTranscriptRepository,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_async_tutorial_repository import (
+    FakeAsyncTutorialRepository,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_generated_tutorial_cache_repository import (
+    FakeGeneratedTutorialCacheRepository,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_transcript_repository import (
+    FakeTranscriptRepository,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_tutorial_repository import (
+    FakeTutorialRepository,
+)
+
+
+class _CachedFakeTutorialGeneratorGateway(FakeTutorialGeneratorGateway):
+    def __init__(self, seconds_per_generation: float = 0):
+        super().__init__()
+        self._seconds_per_generation = seconds_per_generation
+        self.call_count = 0
+
+    def generate_tutorial(self, transcript, user_id):
+        self.call_count += 1
+        time.sleep(self._seconds_per_generation)
+        return super().generate_tutorial(transcript, user_id)
+
+    def cache_key(self, transcript):
+        return "key-1"
+
+
+class TestStreamTutorialCommandHandler:
+    def test_should_stream_content_then_save_tutorial(self):
+        # Given
+        tutorial_repo = FakeTutorialRepository()
+        handler = self._given_handler(tutorial_repo)
+
+        # When
+        *streamed, tutorial = self._when_stream(
+            handler, StreamTutorialCommand(transcript_id="tr1", user_id=UserId("user-1"))
+        )
+
+        # Then
+        assert "".join(streamed) == tutorial.content
+        assert tutorial_repo.find_by_id(tutorial.tutorial_id) == tutorial
+
+    def test_should_raise_error_before_streaming_when_transcript_does_not_exist(self):
+        # Given
+        handler = self._given_handler(FakeTutorialRepository())
+
+        # When & Then
+        with pytest.raises(ValueError):
+            asyncio.run(handler.handle(StreamTutorialCommand(transcript_id="missing", user_id=UserId("user-1"))))
+
+    def test_should_not_save_tutorial_when_generation_fails(self):
+        # Given
+        tutorial_repo = FakeTutorialRepository()
+        handler = self._given_handler(tutorial_repo, should_fail=True)
+
+        # When & Then
+        with pytest.raises(TutorialGenerationError):
+            self._when_stream(handler, StreamTutorialCommand(transcript_id="tr1", user_id=UserId("user-1")))
+        assert tutorial_repo.list_tutorials(UserId("user-1")) == []
+
+    def test_should_stream_cached_tutorial_without_generating_it(self):
+        # Given
+        tutorial_repo = FakeTutorialRepository()
+        gateway = _CachedFakeTutorialGeneratorGateway()
+        cache = FakeGeneratedTutorialCacheRepository()
+        cache.save("key-1", GeneratedTutorial(title="Cached Tutorial", content="Cached content"))
+        handler = self._given_handler(tutorial_repo, gateway=gateway, generated_tutorial_cache=cache)
+
+        # When
+        streamed, tutorial = self._when_stream(
+            handler, StreamTutorialCommand(transcript_id="tr1", user_id=UserId("user-1"))
+        )
+
+        # Then
+        assert gateway.call_count == 0
+        assert streamed == "Cached content"
+        assert (tutorial.title, tutorial.user_id) == ("Cached Tutorial", UserId("user-1"))
+        assert tutorial_repo.find_by_id(tutorial.tutorial_id) == tutorial
+
+    def test_should_cache_streamed_tutorial(self):
+        # Given
+        cache = FakeGeneratedTutorialCacheRepository()
+        handler = self._given_handler(
+            FakeTutorialRepository(), gateway=_CachedFakeTutorialGeneratorGateway(), generated_tutorial_cache=cache
+        )
+
+        # When
+        *_, tutorial = self._when_stream(handler, StreamTutorialCommand(transcript_id="tr1", user_id=UserId("user-1")))
+
+        # Then
+        assert cache.find_by_key("key-1") == GeneratedTutorial(title=tutorial.title, content=tutorial.content)
+
+    def test_should_generate_once_for_concurrent_streams_of_the_same_transcript(self):
+        # Given
+        gateway = _CachedFakeTutorialGeneratorGateway(seconds_per_generation=0.1)
+        handler = self._given_handler(
+            FakeTutorialRepository(),
+            gateway=gateway,
+            generated_tutorial_cache=FakeGeneratedTutorialCacheRepository(),
+            generation_lock=InProcessTutorialGenerationLock(),
+        )
+
+        async def stream(user_id: str) -> list:
+            command = StreamTutorialCommand(transcript_id="tr1", user_id=UserId(user_id))
+            return [item async for item in await handler.handle(command)]
+
+        async def stream_concurrently() -> list[list]:
+            return await asyncio.gather(*(stream(f"user-{index}") for index in range(3)))
+
+        # When
+        streams = asyncio.run(stream_concurrently())
+
+        # Then
+        assert gateway.call_count == 1
+        assert [items[-1].user_id for items in streams] == [UserId(f"user-{index}") for index in range(3)]
+        assert {items[-1].content for items in streams} == {"This is a fake tutorial for testing."}
+
+    def test_should_save_one_tutorial_for_concurrent_streams_of_the_same_user(self):
+        # Given
+        tutorial_repo = FakeTutorialRepository()
+        gateway = _CachedFakeTutorialGeneratorGateway(seconds_per_generation=0.1)
+        handler = self._given_handler(
+            tutorial_repo, gateway=gateway, generation_lock=InProcessTutorialGenerationLock()
+        )
+        command = StreamTutorialCommand(transcript_id="tr1", user_id=UserId("user-1"))
+
+        async def stream() -> list:
+            return [item async for item in await handler.handle(command)]
+
+        async def stream_concurrently() -> list[list]:
+            return await asyncio.gather(stream(), stream())
+
+        # When
+        streams = asyncio.run(stream_concurrently())
+
+        # Then
+        assert gateway.call_count == 1
+        assert streams[0][-1] is streams[1][-1]
+        assert len(tutorial_repo._tutorials) == 1
+
+    def test_should_release_generation_lock_when_stream_is_closed_early(self):
+        # Given
+        lock = InProcessTutorialGenerationLock()
+        handler = self._given_handler(
+            FakeTutorialRepository(),
+            gateway=_CachedFakeTutorialGeneratorGateway(),
+            generated_tutorial_cache=FakeGeneratedTutorialCacheRepository(),
+            generation_lock=lock,
+        )
+
+        async def read_first_item_then_close() -> None:
+            items = await handler.handle(StreamTutorialCommand(transcript_id="tr1", user_id=UserId("user-1")))
+            await anext(items)
+            await items.aclose()
+
+        # When
+        asyncio.run(read_first_item_then_close())
+
+        # Then
+        acquired = threading.Event()
+        threading.Thread(target=lambda: (lock.acquire("key-1"), acquired.set()), daemon=True).start()
+        assert acquired.wait(timeout=5)
+
+    def test_should_open_the_tutorial_repository_only_while_streaming(self):
+        # Given
+        tutorial_repo = FakeTutorialRepository()
+        events = []
+
+        @asynccontextmanager
+        async def open_tutorial_repository():
+            events.append("opened")
+            yield FakeAsyncTutorialRepository(tutorial_repo)
+            events.append("closed")
+
+        handler = self._given_handler(tutorial_repo, open_tutorial_repository=open_tutorial_repository)
+
+        async def stream() -> list:
+            items = await handler.handle(StreamTutorialCommand(transcript_id="tr1", user_id=UserId("user-1")))
+            events.append("returned")
+            return [item async for item in items]
+
+        # When
+        *_, tutorial = asyncio.run(stream())
+
+        # Then
+        assert events == ["returned", "opened", "closed"]
+        assert tutorial_repo.find_by_id(tutorial.tutorial_id) == tutorial
+
+    def _given_handler(
+        self,
+        tutorial_repo: FakeTutorialRepository,
+        should_fail: bool = False,
+        gateway: FakeTutorialGeneratorGateway | None = None,
+        **options,
+    ):
+        transcript_repo = FakeTranscriptRepository()
+        transcript_repo.save(Transcript(TranscriptId("tr1"), "Sample transcript"))
+        gateway = gateway or FakeTutorialGeneratorGateway(should_fail=should_fail)
+        if "generated_tutorial_cache" in options:
+            generated_tutorial_cache = options.pop("generated_tutorial_cache")
+            options["open_generated_tutorial_cache"] = lambda: nullcontext(generated_tutorial_cache)
+        open_tutorial_repository = options.pop(
+            "open_tutorial_repository", lambda: nullcontext(FakeAsyncTutorialRepository(tutorial_repo))
+        )
+        return StreamTutorialCommandHandler(
+            FakeAsyncTranscriptRepository(transcript_repo), gateway, open_tutorial_repository, **options
+        )
+
+    def _when_stream(self, handler: StreamTutorialCommandHandler, command: StreamTutorialCommand) -> list:
+        async def stream() -> list:
+            return [item async for item in await handler.handle(command)]
+
+        return asyncio.run(stream())
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timezone
 
 from sightcall_transcript_to_tutorial.application.commands.update_tutorial_command import (
@@ -6,6 +7,9 @@ from sightcall_transcript_to_tutorial.application.commands.update_tutorial_comma
 )
 from sightcall_transcript_to_tutorial.domain.entities import Tutorial
 from sightcall_transcript_to_tutorial.domain.value_objects import TutorialId, UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_async_tutorial_repository import (
+    FakeAsyncTutorialRepository,
+)
 from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_tutorial_repository import (
     FakeTutorialRepository,
 )
@@ -105,7 +109,7 @@ class TestUpdateTutorialCommandHandler:
         return tutorial
 
     def _given_handler(self, repo: FakeTutorialRepository) -> UpdateTutorialCommandHandler:
-        return UpdateTutorialCommandHandler(repo)
+        return UpdateTutorialCommandHandler(FakeAsyncTutorialRepository(repo))
 
     def _given_update_command(
         self, tutorial_id: str, user_id: UserId, title: str | None = None, content: str | None = None
@@ -117,7 +121,7 @@ class TestUpdateTutorialCommandHandler:
     def _when_handle_command(
         self, handler: UpdateTutorialCommandHandler, command: UpdateTutorialCommand
     ) -> Tutorial | None:
-        return handler.handle(command)
+        return asyncio.run(handler.handle(command))
 
     def _then_tutorial_should_be_updated(
         self, tutorial: Tutorial | None, expected_title: str, expected_content: str, expected_user_id: UserId
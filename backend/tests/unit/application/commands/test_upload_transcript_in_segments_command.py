@@ -0,0 +1,82 @@
+import pytest
+
+from sightcall_transcript_to_tutorial.application.commands.upload_transcript_in_segments_command import (
+    UploadTranscriptInSegmentsCommand,
+    UploadTranscriptInSegmentsCommandHandler,
+)
+from sightcall_transcript_to_tutorial.domain.exceptions.tutorial_generation_error import InvalidTranscriptError
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_content import TranscriptContent
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_phrases import TranscriptPhrases
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_transcript_repository import (
+    FakeTranscriptRepository,
+)
+
+PHRASE = '{"offset_milliseconds": 0, "duration_in_ticks": 1.0, "display": "Hello", "speaker": 1, "locale": "en-US", "confidence": 0.9}'
+
+
+class RecordingTranscriptRepository(FakeTranscriptRepository):
+    def __init__(self):
+        super().__init__()
+        self.saved_segments: list[TranscriptPhrases] = []
+        self.discarded = False
+
+    def save_segment(self, transcript_id, position, phrases):
+        self.saved_segments.append(phrases)
+        super().save_segment(transcript_id, position, phrases)
+
+    def discard_segmented(self, transcript_id):
+        self.discarded = True
+        super().discard_segmented(transcript_id)
+
+
+class TestUploadTranscriptInSegmentsCommandHandler:
+    def given_chunks(self, content: str, chunk_size: int):
+        raw = content.encode()
+        return (raw[start : start + chunk_size] for start in range(0, len(raw), chunk_size))
+
+    def given_transcript(self, phrase_count: int, last_phrase: str = PHRASE):
+        phrases = ", ".join([PHRASE] * (phrase_count - 1) + [last_phrase])
+        return f'{{"timestamp": "2025-02-26T20:36:06Z", "duration_in_ticks": 12345, "phrases": [{phrases}]}}'
+
+    def test_should_store_transcript_in_bounded_segments(self):
+        # Given
+        repo = RecordingTranscriptRepository()
+        handler = UploadTranscriptInSegmentsCommandHandler(repo, segment_max_bytes=500)
+        content = self.given_transcript(20)
+        command = UploadTranscriptInSegmentsCommand(chunks=self.given_chunks(content, chunk_size=100))
+        # When
+        transcript_id = handler.handle(command)
+        # Then
+        assert len(repo.saved_segments) > 1
+        # 43 bytes per phrase: its numeric columns and its 5 characters of display text.
+        assert all(len(segment) <= 500 // 43 + 1 for segment in repo.saved_segments)
+        stored = repo.find_by_id(transcript_id)
+        assert stored is not None
+        assert stored.content == TranscriptContent(content)
+        assert stored.content.phrases[19]["display"] == "Hello"
+
+    def test_should_accept_transcript_over_single_shot_size_limit(self):
+        # Given
+        repo = FakeTranscriptRepository()
+        handler = UploadTranscriptInSegmentsCommandHandler(repo)
+        content = self.given_transcript(2000)
+        command = UploadTranscriptInSegmentsCommand(chunks=self.given_chunks(content, 64 * 1024))
+        # When
+        transcript_id = handler.handle(command)
+        # Then
+        assert len(content) > 100 * 1024
+        stored = repo.find_by_id(transcript_id)
+        assert stored is not None
+        assert len(stored.content.phrases) == 2000
+
+    def test_should_clean_up_segments_when_transcript_is_invalid(self):
+        # Given
+        repo = RecordingTranscriptRepository()
+        handler = UploadTranscriptInSegmentsCommandHandler(repo, segment_max_bytes=200)
+        content = self.given_transcript(10, last_phrase=PHRASE.replace('"speaker": 1', '"speaker": "one"'))
+        command = UploadTranscriptInSegmentsCommand(chunks=self.given_chunks(content, 50))
+        # When & Then
+        with pytest.raises(InvalidTranscriptError):
+            handler.handle(command)
+        assert repo.saved_segments
+        assert repo.discarded
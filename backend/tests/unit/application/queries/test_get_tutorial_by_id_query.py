@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timezone
 
 from sightcall_transcript_to_tutorial.application.queries.get_tutorial_by_id_query import (
@@ -7,6 +8,9 @@ from sightcall_transcript_to_tutorial.application.queries.get_tutorial_by_id_que
 from sightcall_transcript_to_tutorial.domain.entities import Tutorial
 from sightcall_transcript_to_tutorial.domain.repositories import TutorialRepositoryInterface
 from sightcall_transcript_to_tutorial.domain.value_objects import TutorialId, UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_async_tutorial_repository import (
+    FakeAsyncTutorialRepository,
+)
 from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_tutorial_repository import (
     FakeTutorialRepository,
 )
@@ -72,14 +76,14 @@ class TestGetTutorialByIdQueryHandler:
         repo.save(tutorial)
         return tutorial
 
-    def _given_handler(self, repo: TutorialRepositoryInterface) -> GetTutorialByIdQueryHandler:
-        return GetTutorialByIdQueryHandler(repo)
+    def _given_handler(self, repo: FakeTutorialRepository) -> GetTutorialByIdQueryHandler:
+        return GetTutorialByIdQueryHandler(FakeAsyncTutorialRepository(repo))
 
     def _given_query(self, tutorial_id: str, user_id: UserId) -> GetTutorialByIdQuery:
         return GetTutorialByIdQuery(tutorial_id=TutorialId(tutorial_id), user_id=user_id)
 
     def _when_handle_query(self, handler: GetTutorialByIdQueryHandler, query: GetTutorialByIdQuery) -> Tutorial | None:
-        return handler.handle(query)
+        return asyncio.run(handler.handle(query))
 
     def _then_tutorial_should_equal(self, actual: Tutorial | None, expected: Tutorial) -> None:
         assert actual == expected
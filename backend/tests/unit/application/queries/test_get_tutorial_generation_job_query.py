@@ -0,0 +1,56 @@
+from sightcall_transcript_to_tutorial.application.queries.get_tutorial_generation_job_query import (
+    GetTutorialGenerationJobQuery,
+    GetTutorialGenerationJobQueryHandler,
+)
+from sightcall_transcript_to_tutorial.domain.entities import TutorialGenerationJob
+from sightcall_transcript_to_tutorial.domain.value_objects import JobId, TranscriptId, UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_tutorial_generation_job_repository import (
+    FakeTutorialGenerationJobRepository,
+)
+
+
+class TestGetTutorialGenerationJobQueryHandler:
+    def test_should_return_job_when_user_is_owner(self):
+        # Given
+        repo = FakeTutorialGenerationJobRepository()
+        job = self._given_job_in_repository(repo, UserId("user-1"))
+
+        # When
+        result = GetTutorialGenerationJobQueryHandler(repo).handle(
+            GetTutorialGenerationJobQuery(job_id=job.job_id, user_id=UserId("user-1"))
+        )
+
+        # Then
+        assert result == job
+
+    def test_should_return_none_when_user_is_not_owner(self):
+        # Given
+        repo = FakeTutorialGenerationJobRepository()
+        job = self._given_job_in_repository(repo, UserId("user-1"))
+
+        # When
+        result = GetTutorialGenerationJobQueryHandler(repo).handle(
+            GetTutorialGenerationJobQuery(job_id=job.job_id, user_id=UserId("other-user"))
+        )
+
+        # Then
+        assert result is None
+
+    def test_should_return_none_when_job_not_found(self):
+        # Given
+        repo = FakeTutorialGenerationJobRepository()
+
+        # When
+        result = GetTutorialGenerationJobQueryHandler(repo).handle(
+            GetTutorialGenerationJobQuery(job_id=JobId("missing"), user_id=UserId("user-1"))
+        )
+
+        # Then
+        assert result is None
+
+    def _given_job_in_repository(
+        self, repo: FakeTutorialGenerationJobRepository, user_id: UserId
+    ) -> TutorialGenerationJob:
+        job = TutorialGenerationJob.create(transcript_id=TranscriptId("tr1"), user_id=user_id)
+        repo.save(job)
+        return job
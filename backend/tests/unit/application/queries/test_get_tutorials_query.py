@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
 
 from sightcall_transcript_to_tutorial.application.queries.get_tutorials_query import (
@@ -5,8 +6,11 @@ from sightcall_transcript_to_tutorial.application.queries.get_tutorials_query im
     GetTutorialsQueryHandler,
 )
 from sightcall_transcript_to_tutorial.domain.entities import Tutorial
-from sightcall_transcript_to_tutorial.domain.repositories import TutorialRepositoryInterface
-from sightcall_transcript_to_tutorial.domain.value_objects import TutorialId, UserId
+from sightcall_transcript_to_tutorial.domain.repositories import TutorialPage, TutorialRepositoryInterface
+from sightcall_transcript_to_tutorial.domain.value_objects import TutorialCursor, TutorialId, UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_async_tutorial_repository import (
+    FakeAsyncTutorialRepository,
+)
 from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_tutorial_repository import (
     FakeTutorialRepository,
 )
@@ -40,6 +44,7 @@ class TestGetTutorialsQueryHandler:
 
         # Then
         self._then_result_should_have_count(result, 2)
+        self._then_total_should_be(result, 5)
 
     def test_should_search_tutorials_by_title(self):
         # Given
@@ -56,6 +61,24 @@ class TestGetTutorialsQueryHandler:
         self._then_result_should_have_count(result, 1)
         self._then_first_tutorial_should_have_title(result, "Special 1")
 
+    def test_should_search_content_and_rank_title_matches_first(self):
+        # Given
+        repo = self._given_repository()
+        user_id = UserId("user-1")
+        now = datetime.now(timezone.utc)
+        repo.save(Tutorial(TutorialId("in-content"), "Setup", "Install python", user_id, created_at=now))
+        repo.save(
+            Tutorial(TutorialId("in-title"), "Python basics", "Hello", user_id, created_at=now - timedelta(days=1))
+        )
+        repo.save(Tutorial(TutorialId("unrelated"), "Setup", "Install node", user_id, created_at=now))
+        handler = self._given_handler(repo)
+
+        # When
+        result = self._when_handle_query(handler, self._given_query(user_id, search="python"))
+
+        # Then
+        self._then_tutorial_ids_should_be(result.tutorials, ["in-title", "in-content"])
+
     def test_should_filter_tutorials_by_created_at(self):
         # Given
         repo = self._given_repository()
@@ -72,6 +95,24 @@ class TestGetTutorialsQueryHandler:
         # Then
         self._then_all_tutorials_should_be_created_after(result, filters["created_after"])
 
+    def test_should_page_tutorials_from_a_cursor(self):
+        # Given
+        repo = self._given_repository()
+        user_id = UserId("user-1")
+        self._given_tutorials_in_repository(repo, user_id, count=5)
+        handler = self._given_handler(repo)
+        first_page = self._when_handle_query(handler, self._given_query(user_id, page_size=2)).tutorials
+        last = first_page[-1]
+        query = self._given_query(user_id, page_size=2, after=TutorialCursor(last.created_at, last.tutorial_id.value))
+
+        # When
+        result = self._when_handle_query(handler, query)
+
+        # Then
+        self._then_tutorial_ids_should_be(first_page, ["tut0", "tut1"])
+        self._then_tutorial_ids_should_be(result.tutorials, ["tut2", "tut3"])
+        self._then_total_should_be(result, 5)
+
     def _given_repository(self) -> FakeTutorialRepository:
         return FakeTutorialRepository()
 
@@ -104,8 +145,8 @@ class TestGetTutorialsQueryHandler:
             )
             repo.save(tutorial)
 
-    def _given_handler(self, repo: TutorialRepositoryInterface) -> GetTutorialsQueryHandler:
-        return GetTutorialsQueryHandler(repo)
+    def _given_handler(self, repo: FakeTutorialRepository) -> GetTutorialsQueryHandler:
+        return GetTutorialsQueryHandler(FakeAsyncTutorialRepository(repo))
 
     def _given_query(
         self,
@@ -114,18 +155,28 @@ class TestGetTutorialsQueryHandler:
         page_size: int = 10,
         search: str | None = None,
         filters: dict | None = None,
+        after: TutorialCursor | None = None,
     ) -> GetTutorialsQuery:
-        return GetTutorialsQuery(user_id=user_id, page=page, page_size=page_size, search=search, filters=filters)
+        return GetTutorialsQuery(
+            user_id=user_id, page=page, page_size=page_size, search=search, filters=filters, after=after
+        )
+
+    def _when_handle_query(self, handler: GetTutorialsQueryHandler, query: GetTutorialsQuery) -> TutorialPage:
+        return asyncio.run(handler.handle(query))
+
+    def _then_result_should_have_count(self, result: TutorialPage, expected_count: int) -> None:
+        assert len(result.tutorials) == expected_count
 
-    def _when_handle_query(self, handler: GetTutorialsQueryHandler, query: GetTutorialsQuery) -> list[Tutorial]:
-        return handler.handle(query)
+    def _then_total_should_be(self, result: TutorialPage, expected_total: int) -> None:
+        assert result.total == expected_total
+        assert not result.total_is_estimate
 
-    def _then_result_should_have_count(self, result: list[Tutorial], expected_count: int) -> None:
-        assert len(result) == expected_count
+    def _then_first_tutorial_should_have_title(self, result: TutorialPage, expected_title: str) -> None:
+        assert len(result.tutorials) > 0
+        assert result.tutorials[0].title == expected_title
 
-    def _then_first_tutorial_should_have_title(self, result: list[Tutorial], expected_title: str) -> None:
-        assert len(result) > 0
-        assert result[0].title == expected_title
+    def _then_all_tutorials_should_be_created_after(self, result: TutorialPage, threshold: datetime) -> None:
+        assert all(tutorial.created_at > threshold for tutorial in result.tutorials)
 
-    def _then_all_tutorials_should_be_created_after(self, result: list[Tutorial], threshold: datetime) -> None:
-        assert all(tutorial.created_at > threshold for tutorial in result)
+    def _then_tutorial_ids_should_be(self, result: list[Tutorial], expected_ids: list[str]) -> None:
+        assert [tutorial.tutorial_id.value for tutorial in result] == expected_ids
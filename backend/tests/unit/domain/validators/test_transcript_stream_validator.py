@@ -0,0 +1,136 @@
+import json
+
+import pytest
+
+from sightcall_transcript_to_tutorial.domain.exceptions.tutorial_generation_error import InvalidTranscriptError
+from sightcall_transcript_to_tutorial.domain.validators.transcript_stream_validator import TranscriptStreamValidator
+
+VALID_PHRASE = '{"offset_milliseconds": 0, "duration_in_ticks": 1.0, "display": "Héllo", "speaker": 1, "locale": "en-US", "confidence": 0.9}'
+VALID_TRANSCRIPT = (
+    '{"timestamp": "2025-02-26T20:36:06Z", "duration_in_ticks": 12345, "phrases": ['
+    + ", ".join([VALID_PHRASE] * 3)
+    + "]}"
+)
+
+
+class TestTranscriptStreamValidator:
+    def test_should_validate_transcript_fed_at_once(self):
+        # Given
+        validator = TranscriptStreamValidator()
+
+        # When
+        validator.feed(VALID_TRANSCRIPT.encode())
+        data = validator.close()
+
+        # Then
+        assert data["timestamp"] == "2025-02-26T20:36:06Z"
+        assert data["duration_in_ticks"] == 12345
+        assert len(data["phrases"]) == 3
+        assert data["phrases"][0]["display"] == "Héllo"
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+    def test_should_validate_transcript_fed_in_chunks_of_any_size(self, chunk_size: int):
+        # Given
+        validator = TranscriptStreamValidator()
+        content = VALID_TRANSCRIPT.encode()
+
+        # When
+        for start in range(0, len(content), chunk_size):
+            validator.feed(content[start : start + chunk_size])
+        data = validator.close()
+
+        # Then
+        assert data["duration_in_ticks"] == 12345
+        assert [phrase["display"] for phrase in data["phrases"]] == ["Héllo"] * 3
+
+    def test_should_hand_phrases_to_callback_instead_of_collecting_them(self):
+        # Given
+        received = []
+        validator = TranscriptStreamValidator(on_phrase=received.append)
+
+        # When
+        validator.feed(VALID_TRANSCRIPT.encode())
+        data = validator.close()
+
+        # Then
+        assert len(received) == 3
+        assert data["phrases"] == []
+        assert validator.phrase_count == 3
+
+    def test_should_fail_on_first_invalid_phrase_without_reading_the_rest(self):
+        # Given
+        received = []
+        validator = TranscriptStreamValidator(on_phrase=received.append)
+        invalid_phrase = VALID_PHRASE.replace('"speaker": 1', '"speaker": "one"')
+
+        # When & Then
+        with pytest.raises(InvalidTranscriptError, match="'speaker' at index 1"):
+            validator.feed_text(
+                f'{{"timestamp": "t", "duration_in_ticks": 1, "phrases": [{VALID_PHRASE}, {invalid_phrase}, {{"truncated'
+            )
+        assert len(received) == 1
+
+    def test_should_not_decode_a_large_buffered_phrases_array_before_validating_its_first_phrase(self):
+        # Given
+        decoded_objects = []
+        validator = TranscriptStreamValidator()
+        validator._json_decoder = json.JSONDecoder(object_hook=lambda value: decoded_objects.append(value) or value)
+        invalid_phrase = VALID_PHRASE.replace('"speaker": 1', '"speaker": "one"')
+        phrases = ", ".join([invalid_phrase] + [VALID_PHRASE] * 1000)
+
+        # When & Then
+        with pytest.raises(InvalidTranscriptError, match="'speaker' at index 0"):
+            validator.feed_text(f'{{"timestamp": "t", "duration_in_ticks": 1, "phrases": [{phrases}]}}')
+        assert len(decoded_objects) == 1
+
+    def test_should_reject_content_over_size_limit(self):
+        # Given
+        validator = TranscriptStreamValidator(max_size_bytes=10)
+
+        # When & Then
+        with pytest.raises(InvalidTranscriptError, match="maximum allowed size"):
+            validator.feed(VALID_TRANSCRIPT.encode())
+
+    def test_should_reject_single_value_over_token_size_limit(self):
+        # Given
+        validator = TranscriptStreamValidator(on_phrase=lambda phrase: None, max_token_size=180)
+        content = VALID_TRANSCRIPT.replace("Héllo", "H" * 300).encode()
+
+        # When & Then
+        with pytest.raises(InvalidTranscriptError, match="value exceeding the maximum allowed size"):
+            for start in range(0, len(content), 16):
+                validator.feed(content[start : start + 16])
+
+    @pytest.mark.parametrize(
+        "content, message",
+        [
+            ("[1, 2]", "JSON object at the top level"),
+            ('{"timestamp": "t", "duration_in_ticks": 1}', "Missing required field: 'phrases'"),
+            ('{"timestamp": " ", "duration_in_ticks": 1, "phrases": []}', "'timestamp' must be a non-empty string"),
+            ('{"timestamp": "t", "duration_in_ticks": "1", "phrases": []}', "'duration_in_ticks' must be a number"),
+            ('{"timestamp": "t", "duration_in_ticks": 1, "phrases": []}', "'phrases' must be a non-empty list"),
+            ('{"timestamp": "t", "duration_in_ticks": 1, "phrases": {}}', "'phrases' must be a non-empty list"),
+            ('{"timestamp": "t", "duration_in_ticks": 1, "phrases": [1]}', "must be a JSON object"),
+            ('{"timestamp": "t", "duration_in_ticks": 1, "phrases": [{}]}', "missing required field"),
+            ('{"timestamp": "t", "duration_in_ticks": 1, "phrases": [', "must be valid JSON"),
+            ('{"timestamp": "t",}', "must be valid JSON"),
+            ('{"timestamp": "t"} trailing', "must be valid JSON"),
+        ],
+    )
+    def test_should_reject_invalid_transcripts(self, content: str, message: str):
+        # Given
+        validator = TranscriptStreamValidator()
+
+        # When & Then
+        with pytest.raises(InvalidTranscriptError, match=message):
+            validator.feed(content.encode())
+            validator.close()
+
+    def test_should_reject_invalid_utf8(self):
+        # Given
+        validator = TranscriptStreamValidator()
+
+        # When & Then
+        with pytest.raises(InvalidTranscriptError, match="UTF-8"):
+            validator.feed(b'{"timestamp": "\xff"}')
+            validator.close()
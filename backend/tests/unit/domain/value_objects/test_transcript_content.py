@@ -1,7 +1,13 @@
+import json
+from collections.abc import Sequence
+
 import pytest
 
 from sightcall_transcript_to_tutorial.domain.exceptions.tutorial_generation_error import InvalidTranscriptError
-from sightcall_transcript_to_tutorial.domain.value_objects.transcript_content import TranscriptContent
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_content import (
+    MAX_TRANSCRIPT_SIZE_BYTES,
+    TranscriptContent,
+)
 
 
 class TestTranscriptContent:
@@ -10,7 +16,7 @@ class TestTranscriptContent:
         tc = TranscriptContent(valid_content)
         assert tc.timestamp == "2025-02-26T20:36:06Z"
         assert tc.duration_in_ticks == 12345
-        assert isinstance(tc.phrases, list)
+        assert isinstance(tc.phrases, Sequence)
         assert tc.phrases[0]["display"] == "Hello"
 
     def test_should_raise_if_missing_required_fields(self):
@@ -42,3 +48,35 @@ class TestTranscriptContent:
         tc = TranscriptContent(content)
         with pytest.raises(AttributeError):
             tc.timestamp = "2026-01-01T00:00:00Z"
+
+    def test_should_create_from_uploaded_bytes(self):
+        content = '{"timestamp": "2025-02-26T20:36:06Z", "duration_in_ticks": 12345, "phrases": [{"offset_milliseconds": 0, "duration_in_ticks": 1.0, "display": "Hello", "speaker": 1, "locale": "en-US", "confidence": 0.9}]}'
+        tc = TranscriptContent.from_bytes(content.encode())
+        assert tc == TranscriptContent(content)
+        assert tc.phrases[0]["display"] == "Hello"
+
+    def test_should_raise_if_uploaded_bytes_too_large(self):
+        with pytest.raises(InvalidTranscriptError):
+            TranscriptContent.from_bytes(b" " * (MAX_TRANSCRIPT_SIZE_BYTES + 1))
+
+    def test_should_raise_if_uploaded_bytes_not_utf8(self):
+        with pytest.raises(InvalidTranscriptError):
+            TranscriptContent.from_bytes(b'{"timestamp": "\xff"}')
+
+    def test_should_be_equal_whatever_the_json_formatting(self):
+        content = '{"timestamp": "2025-02-26T20:36:06Z", "duration_in_ticks": 12345, "phrases": [{"offset_milliseconds": 0, "duration_in_ticks": 1.0, "display": "Hello", "speaker": 1, "locale": "en-US", "confidence": 0.9}]}'
+        assert TranscriptContent(content) == TranscriptContent(json.dumps(json.loads(content), indent=2))
+
+    def test_should_render_json_for_trusted_content(self):
+        content = '{"timestamp": "2025-02-26T20:36:06Z", "duration_in_ticks": 12345, "phrases": [{"offset_milliseconds": 0, "duration_in_ticks": 1.0, "display": "Hello", "speaker": 1, "locale": "en-US", "confidence": 0.9}]}'
+        validated = TranscriptContent(content)
+        trusted = TranscriptContent.from_trusted(validated.timestamp, validated.duration_in_ticks, validated.phrases)
+        assert trusted == validated
+        assert json.loads(str(trusted)) == json.loads(content)
+
+    def test_should_not_keep_the_uploaded_json(self):
+        content = '{"timestamp": "2025-02-26T20:36:06Z", "duration_in_ticks": 12345, "phrases": [{"offset_milliseconds": 0, "duration_in_ticks": 1.0, "display": "Hello", "speaker": 1, "locale": "en-US", "confidence": 0.9}]}'
+        indented = json.dumps(json.loads(content), indent=2)
+        tc = TranscriptContent.from_bytes(indented.encode())
+        assert indented not in vars(tc).values()
+        assert str(tc) == content
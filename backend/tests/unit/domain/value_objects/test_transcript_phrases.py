@@ -0,0 +1,129 @@
+import pytest
+
+from sightcall_transcript_to_tutorial.domain.exceptions.tutorial_generation_error import InvalidTranscriptError
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_phrases import TranscriptPhrases
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_phrases_builder import TranscriptPhrasesBuilder
+
+PHRASES = [
+    {
+        "offset_milliseconds": 0,
+        "duration_in_ticks": 1.5,
+        "display": "Hello",
+        "speaker": 1,
+        "locale": "en-US",
+        "confidence": 0.9,
+    },
+    {
+        "offset_milliseconds": 1200,
+        "duration_in_ticks": 3.0,
+        "display": "Bonjour à tous",
+        "speaker": 2,
+        "locale": "fr-FR",
+        "confidence": 0.75,
+    },
+    {
+        "offset_milliseconds": 2500,
+        "duration_in_ticks": 2.0,
+        "display": "",
+        "speaker": 1,
+        "locale": "en-US",
+        "confidence": 0.5,
+    },
+]
+
+
+class TestTranscriptPhrases:
+    def test_should_return_phrase_dicts_equal_to_the_originals(self):
+        phrases = self._given_built_phrases(PHRASES)
+
+        assert len(phrases) == 3
+        assert list(phrases) == PHRASES
+        assert phrases[1] == PHRASES[1]
+        assert phrases[-1] == PHRASES[-1]
+        assert phrases[1:] == PHRASES[1:]
+
+    def test_should_return_display_without_building_the_phrase(self):
+        phrases = self._given_built_phrases(PHRASES)
+
+        assert [phrases.display(i) for i in range(len(phrases))] == ["Hello", "Bonjour à tous", ""]
+
+    def test_should_raise_index_error_out_of_range(self):
+        phrases = self._given_built_phrases(PHRASES)
+
+        with pytest.raises(IndexError):
+            phrases[3]
+
+    def test_should_be_equal_when_built_from_same_phrases(self):
+        assert self._given_built_phrases(PHRASES) == self._given_built_phrases(PHRASES)
+        assert self._given_built_phrases(PHRASES) != self._given_built_phrases(PHRASES[:2])
+
+    def test_should_raise_if_numeric_field_out_of_range(self):
+        builder = TranscriptPhrasesBuilder()
+
+        with pytest.raises(InvalidTranscriptError):
+            builder.append({**PHRASES[0], "speaker": 2**40})
+
+    def test_should_raise_if_duration_out_of_range(self):
+        builder = TranscriptPhrasesBuilder()
+
+        with pytest.raises(InvalidTranscriptError):
+            builder.append({**PHRASES[0], "duration_in_ticks": 2**63})
+
+    def test_should_keep_integer_durations_as_integers(self):
+        # Given
+        integer_phrases = [{**phrase, "duration_in_ticks": 10_000_000 + index} for index, phrase in enumerate(PHRASES)]
+
+        # When
+        phrases = self._given_built_phrases(integer_phrases)
+
+        # Then
+        assert list(phrases) == integer_phrases
+        assert all(type(phrase["duration_in_ticks"]) is int for phrase in phrases)
+
+    def test_should_keep_float_durations_after_integer_ones(self):
+        # Given
+        mixed_phrases = [{**PHRASES[0], "duration_in_ticks": 2}, PHRASES[1]]
+
+        # When
+        phrases = self._given_built_phrases(mixed_phrases)
+
+        # Then
+        assert [phrase["duration_in_ticks"] for phrase in phrases] == [2.0, 3.0]
+
+    def test_should_round_trip_through_bytes(self):
+        for durations in ([1, 2, 3], [1.5, 2.0, 2.5]):
+            phrases = self._given_built_phrases(
+                [{**phrase, "duration_in_ticks": duration} for phrase, duration in zip(PHRASES, durations)]
+            )
+
+            decoded = TranscriptPhrases.from_bytes(phrases.to_bytes())
+
+            assert decoded == phrases
+            assert [phrase["duration_in_ticks"] for phrase in decoded] == durations
+
+    def test_should_concatenate_parts_with_their_own_locales(self):
+        # Given
+        integer_duration_phrase = {**PHRASES[0], "duration_in_ticks": 4, "locale": "de-DE"}
+        parts = [
+            self._given_built_phrases(PHRASES[1:2]),
+            self._given_built_phrases([integer_duration_phrase, PHRASES[2]]),
+            self._given_built_phrases(PHRASES[0:1]),
+        ]
+
+        # When
+        phrases = TranscriptPhrases.concatenate(parts)
+
+        # Then
+        expected = [PHRASES[1], integer_duration_phrase, PHRASES[2], PHRASES[0]]
+        assert phrases == self._given_built_phrases(expected)
+        assert list(phrases) == expected
+
+    def test_should_concatenate_no_parts(self):
+        assert len(TranscriptPhrases.concatenate([])) == 0
+
+    @staticmethod
+    def _given_built_phrases(phrases: list[dict]):
+        builder = TranscriptPhrasesBuilder()
+        for phrase in phrases:
+            builder.append(phrase)
+        return builder.build()
@@ -0,0 +1,20 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from sightcall_transcript_to_tutorial.domain.value_objects import TutorialCursor
+
+
+class TestTutorialCursor:
+    def test_should_decode_what_it_encodes(self):
+        cursor = TutorialCursor(datetime(2025, 1, 2, 3, 4, 5, 678, tzinfo=timezone.utc), "tut-1")
+        assert TutorialCursor.decode(cursor.encode()) == cursor
+
+    def test_should_encode_to_a_url_safe_token(self):
+        token = TutorialCursor(datetime(2025, 1, 2, tzinfo=timezone.utc), "tut/1?").encode()
+        assert all(c.isalnum() or c in "-_" for c in token)
+
+    @pytest.mark.parametrize("token", ["", "not a cursor", "e30", "WyJub3QgYSBkYXRlIiwgInR1dCJd"])
+    def test_should_reject_invalid_token(self, token):
+        with pytest.raises(ValueError):
+            TutorialCursor.decode(token)
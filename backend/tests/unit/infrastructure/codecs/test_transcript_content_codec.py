@@ -0,0 +1,93 @@
+import json
+import zlib
+
+import pytest
+
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_content import TranscriptContent
+from sightcall_transcript_to_tutorial.infrastructure.for_production.codecs.transcript_content_codec import (
+    MAGIC,
+    decode_transcript_content,
+    decode_transcript_header,
+    decode_transcript_segment,
+    encode_transcript_content,
+    encode_transcript_header,
+    encode_transcript_segment,
+)
+
+PHRASE = '{"offset_milliseconds": 120, "duration_in_ticks": 1.5, "display": "Héllo wörld", "speaker": 2, "locale": "fr-FR", "confidence": 0.87}'
+TRANSCRIPT_JSON = (
+    '{"timestamp": "2025-02-26T20:36:06Z", "duration_in_ticks": 12345, "phrases": ['
+    + ", ".join([PHRASE, PHRASE.replace("fr-FR", "en-US")] * 50)
+    + "]}"
+)
+
+
+class TestTranscriptContentCodec:
+    def test_should_round_trip_transcript_content(self):
+        # Given
+        content = TranscriptContent(TRANSCRIPT_JSON)
+
+        # When
+        decoded = decode_transcript_content(encode_transcript_content(content))
+
+        # Then
+        assert decoded == content
+        assert decoded.duration_in_ticks == 12345
+        assert isinstance(decoded.duration_in_ticks, int)
+        assert list(decoded.phrases) == list(content.phrases)
+        assert json.loads(str(decoded)) == json.loads(TRANSCRIPT_JSON)
+
+    def test_should_round_trip_integer_phrase_durations(self):
+        # Given
+        content = TranscriptContent(
+            TRANSCRIPT_JSON.replace('"duration_in_ticks": 1.5', '"duration_in_ticks": 15000000')
+        )
+
+        # When
+        decoded = decode_transcript_content(encode_transcript_content(content))
+
+        # Then
+        assert decoded.phrases[0]["duration_in_ticks"] == 15000000
+        assert isinstance(decoded.phrases[0]["duration_in_ticks"], int)
+        assert json.loads(str(decoded)) == json.loads(str(content))
+
+    def test_should_decode_format_version_1(self):
+        # Given
+        content = TranscriptContent(TRANSCRIPT_JSON)
+        encoded = self._given_encoded_in_format_version_1(content)
+
+        # When
+        decoded = decode_transcript_content(encoded)
+
+        # Then
+        assert decoded == content
+        assert json.loads(str(decoded)) == json.loads(TRANSCRIPT_JSON)
+
+    def test_should_be_smaller_than_the_json_text(self):
+        content = TranscriptContent(TRANSCRIPT_JSON)
+
+        assert len(encode_transcript_content(content)) < len(TRANSCRIPT_JSON.encode()) / 4
+
+    def test_should_round_trip_header_only(self):
+        encoded = encode_transcript_header("2025-02-26T20:36:06Z", 12.5)
+
+        assert decode_transcript_header(encoded) == ("2025-02-26T20:36:06Z", 12.5)
+
+    def test_should_round_trip_segment_phrases(self):
+        phrases = TranscriptContent(TRANSCRIPT_JSON).phrases
+
+        assert decode_transcript_segment(encode_transcript_segment(phrases)) == phrases
+
+    def test_should_reject_unknown_format(self):
+        with pytest.raises(ValueError):
+            decode_transcript_content(b'{"timestamp": "2025-02-26T20:36:06Z"}')
+
+    @staticmethod
+    def _given_encoded_in_format_version_1(content: TranscriptContent) -> bytes:
+        """Version 1 had no type code for the phrase durations, which were always floats."""
+        payload = zlib.decompress(encode_transcript_content(content)[len(MAGIC) + 1 :])
+        phrases_start = 1 + 8 + 4 + len(content.timestamp.encode())
+        typecode_position = phrases_start + 6
+        assert payload[typecode_position : typecode_position + 1] == b"d"
+        payload = payload[:typecode_position] + payload[typecode_position + 1 :]
+        return MAGIC + bytes([1]) + zlib.compress(payload)
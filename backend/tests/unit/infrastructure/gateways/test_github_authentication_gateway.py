@@ -0,0 +1,33 @@
+import httpx
+
+from sightcall_transcript_to_tutorial.infrastructure.for_production.gateways.github_authentication_gateway import (
+    GITHUB_TOKEN_URL,
+    GITHUB_USER_API_URL,
+    GitHubAuthenticationGateway,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_user_repository import (
+    FakeUserRepository,
+)
+
+
+class TestGitHubAuthenticationGateway:
+    def test_should_authenticate_callback_through_the_shared_http_client(self):
+        # Given
+        requested_urls = []
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            requested_urls.append(str(request.url))
+            if str(request.url) == GITHUB_TOKEN_URL:
+                return httpx.Response(200, json={"access_token": "token-1"})
+            return httpx.Response(200, json={"id": 42, "login": "octocat", "email": "octocat@example.com"})
+
+        http_client = httpx.Client(transport=httpx.MockTransport(handle))
+        gateway = GitHubAuthenticationGateway(FakeUserRepository(), http_client=http_client)
+
+        # When
+        authenticated_user = gateway.authenticate_callback("code-1")
+
+        # Then
+        assert requested_urls == [GITHUB_TOKEN_URL, GITHUB_USER_API_URL]
+        assert authenticated_user.github_id == 42
+        assert not http_client.is_closed
@@ -0,0 +1,86 @@
+import threading
+import time
+
+from sightcall_transcript_to_tutorial.domain.entities.tutorial import Tutorial
+from sightcall_transcript_to_tutorial.domain.value_objects.tutorial_id import TutorialId
+from sightcall_transcript_to_tutorial.domain.value_objects.user_id import UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_production.gateways.in_process_tutorial_generation_lock import (
+    InProcessTutorialGenerationLock,
+)
+
+
+class TestInProcessTutorialGenerationLock:
+    def test_should_make_a_second_holder_of_the_same_key_wait(self):
+        # Given
+        lock = InProcessTutorialGenerationLock()
+        events = []
+        lock.acquire("key-1")
+
+        def second_holder() -> None:
+            lock.acquire("key-1")
+            events.append("second acquired")
+            lock.release("key-1")
+
+        thread = threading.Thread(target=second_holder)
+
+        # When
+        thread.start()
+        time.sleep(0.05)
+        events.append("first released")
+        lock.release("key-1")
+        thread.join(timeout=1)
+
+        # Then
+        assert events == ["first released", "second acquired"]
+
+    def test_should_not_make_other_keys_wait(self):
+        # Given
+        lock = InProcessTutorialGenerationLock()
+        lock.acquire("key-1")
+        acquired = threading.Event()
+
+        def other_key_holder() -> None:
+            lock.acquire("key-2")
+            acquired.set()
+            lock.release("key-2")
+
+        # When
+        threading.Thread(target=other_key_holder).start()
+
+        # Then
+        assert acquired.wait(timeout=1)
+        lock.release("key-1")
+
+    def test_should_hand_the_released_tutorial_to_the_waiting_holder(self):
+        # Given
+        lock = InProcessTutorialGenerationLock()
+        tutorial = Tutorial(TutorialId("tut-1"), title="Title", content="Content", user_id=UserId("user-1"))
+        handed_over = []
+        lock.acquire("key-1")
+
+        def second_holder() -> None:
+            handed_over.append(lock.acquire("key-1"))
+            lock.release("key-1")
+
+        thread = threading.Thread(target=second_holder)
+
+        # When
+        thread.start()
+        time.sleep(0.05)
+        lock.release("key-1", tutorial)
+        thread.join(timeout=1)
+
+        # Then
+        assert handed_over == [tutorial]
+        assert lock.acquire("key-1") is None
+
+    def test_should_forget_keys_nobody_holds(self):
+        # Given
+        lock = InProcessTutorialGenerationLock()
+
+        # When
+        lock.acquire("key-1")
+        lock.release("key-1")
+
+        # Then
+        assert lock._locks == {}
@@ -0,0 +1,235 @@
+import asyncio
+
+import httpx
+import pytest
+from openai import APIConnectionError, APITimeoutError, BadRequestError, InternalServerError, RateLimitError
+
+from sightcall_transcript_to_tutorial.infrastructure.for_production.gateways.openai_rate_limiter import (
+    OpenAIRateLimiter,
+)
+
+
+class _FakeClock:
+    """A clock that only moves when the limiter sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class _Answer:
+    def __init__(self, headers: dict[str, str] | None = None):
+        self.headers = httpx.Headers(headers or {})
+
+
+class _RateLimitedSend:
+    """Fails every call with a 429 and counts the calls."""
+
+    def __init__(self, headers: dict[str, str] | None = None, code: str | None = None):
+        self._error = _rate_limit_error(headers, code)
+        self.calls = 0
+
+    def __call__(self) -> _Answer:
+        self.calls += 1
+        raise self._error
+
+
+class _FailingSend:
+    """Fails the first calls with the given errors, then answers."""
+
+    def __init__(self, *errors: Exception):
+        self._errors = list(errors)
+        self.calls = 0
+
+    def __call__(self) -> _Answer:
+        self.calls += 1
+        if self._errors:
+            raise self._errors.pop(0)
+        return _Answer()
+
+
+def _status_error(error_class: type, status_code: int):
+    request = httpx.Request("POST", "http://stub-openai/v1/chat/completions")
+    return error_class("Failed", response=httpx.Response(status_code, request=request), body=None)
+
+
+def _rate_limit_error(headers: dict[str, str] | None = None, code: str | None = None) -> RateLimitError:
+    request = httpx.Request("POST", "http://stub-openai/v1/chat/completions")
+    response = httpx.Response(429, headers=headers or {}, request=request)
+    return RateLimitError("Rate limit reached", response=response, body={"code": code} if code else None)
+
+
+class TestOpenAIRateLimiter:
+    def test_should_wait_for_tokens_to_refill_before_sending(self):
+        # Given
+        clock = _FakeClock()
+        limiter = self._given_limiter(clock, tokens_per_minute=600)
+
+        # When
+        limiter.call(_Answer, estimated_tokens=600)
+        limiter.call(_Answer, estimated_tokens=300)
+
+        # Then
+        assert sum(clock.sleeps) == pytest.approx(30)
+
+    def test_should_follow_remaining_requests_reported_by_openai(self):
+        # Given
+        clock = _FakeClock()
+        limiter = self._given_limiter(clock, requests_per_minute=60)
+
+        # When
+        limiter.call(lambda: _Answer({"x-ratelimit-remaining-requests": "0"}), estimated_tokens=1)
+        limiter.call(_Answer, estimated_tokens=1)
+
+        # Then
+        assert sum(clock.sleeps) == pytest.approx(1)
+
+    def test_should_retry_after_the_delay_asked_by_openai_and_halve_concurrency(self):
+        # Given
+        clock = _FakeClock()
+        limiter = self._given_limiter(clock, max_concurrency=8)
+        answers = [_rate_limit_error({"retry-after": "7"}), _Answer()]
+
+        def send() -> _Answer:
+            answer = answers.pop(0)
+            if isinstance(answer, Exception):
+                raise answer
+            return answer
+
+        # When
+        answer = limiter.call(send, estimated_tokens=1)
+
+        # Then
+        assert isinstance(answer, _Answer)
+        assert clock.sleeps[0] >= 7
+        assert limiter.concurrency_limit == 4
+
+    def test_should_grow_concurrency_back_after_successes(self):
+        # Given
+        clock = _FakeClock()
+        limiter = self._given_limiter(clock, max_concurrency=4)
+        with pytest.raises(RateLimitError):
+            limiter.call(_RateLimitedSend(), estimated_tokens=1)
+
+        # When
+        for _ in range(10):
+            limiter.call(_Answer, estimated_tokens=1)
+
+        # Then
+        assert limiter.concurrency_limit == 4
+
+    def test_should_give_up_after_max_retries(self):
+        # Given
+        clock = _FakeClock()
+        limiter = self._given_limiter(clock, max_retries=2)
+        send = _RateLimitedSend()
+
+        # When & Then
+        with pytest.raises(RateLimitError):
+            limiter.call(send, estimated_tokens=1)
+        assert send.calls == 3
+
+    def test_should_not_retry_when_billing_quota_is_exhausted(self):
+        # Given
+        clock = _FakeClock()
+        limiter = self._given_limiter(clock)
+        send = _RateLimitedSend(code="insufficient_quota")
+
+        # When & Then
+        with pytest.raises(RateLimitError):
+            limiter.call(send, estimated_tokens=1)
+        assert send.calls == 1
+
+    def test_should_retry_transient_failures_with_backoff(self):
+        # Given
+        clock = _FakeClock()
+        limiter = self._given_limiter(clock)
+        request = httpx.Request("POST", "http://stub-openai/v1/chat/completions")
+        send = _FailingSend(
+            _status_error(InternalServerError, 503),
+            APIConnectionError(request=request),
+            APITimeoutError(request=request),
+        )
+
+        # When
+        limiter.call(send, estimated_tokens=1)
+
+        # Then
+        assert send.calls == 4
+        assert len(clock.sleeps) == 3
+        assert limiter.concurrency_limit == 4
+
+    def test_should_give_up_on_transient_failures_after_max_retries(self):
+        # Given
+        clock = _FakeClock()
+        limiter = self._given_limiter(clock, max_retries=1)
+        send = _FailingSend(*(_status_error(InternalServerError, 500) for _ in range(3)))
+
+        # When & Then
+        with pytest.raises(InternalServerError):
+            limiter.call(send, estimated_tokens=1)
+        assert send.calls == 2
+
+    def test_should_not_retry_client_errors(self):
+        # Given
+        clock = _FakeClock()
+        limiter = self._given_limiter(clock)
+        send = _FailingSend(_status_error(BadRequestError, 400))
+
+        # When & Then
+        with pytest.raises(BadRequestError):
+            asyncio.run(limiter.call_async(self._as_async(send), estimated_tokens=1))
+        assert send.calls == 1
+
+    def test_should_never_run_more_calls_at_once_than_the_concurrency_limit(self):
+        # Given
+        limiter = OpenAIRateLimiter(requests_per_minute=10_000, tokens_per_minute=10_000, max_concurrency=2)
+        in_flight = 0
+        most_in_flight = 0
+
+        async def send() -> _Answer:
+            nonlocal in_flight, most_in_flight
+            in_flight += 1
+            most_in_flight = max(most_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _Answer()
+
+        async def run_all() -> None:
+            await asyncio.gather(*(limiter.call_async(send, estimated_tokens=1) for _ in range(6)))
+
+        # When
+        asyncio.run(run_all())
+
+        # Then
+        assert most_in_flight == 2
+
+    def _as_async(self, send):
+        async def send_async() -> _Answer:
+            return send()
+
+        return send_async
+
+    def _given_limiter(
+        self,
+        clock: _FakeClock,
+        requests_per_minute: int = 1_000,
+        tokens_per_minute: int = 100_000,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+    ) -> OpenAIRateLimiter:
+        return OpenAIRateLimiter(
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute,
+            max_concurrency=max_concurrency,
+            max_retries=max_retries,
+            clock=clock,
+            sleep=clock.sleep,
+        )
@@ -0,0 +1,367 @@
+import asyncio
+import json
+import threading
+from typing import Callable
+
+import httpx
+import pytest
+from openai import AsyncOpenAI, OpenAI
+
+from sightcall_transcript_to_tutorial.domain.config.tutorial_title_mode import TutorialTitleMode
+from sightcall_transcript_to_tutorial.domain.entities.transcript import Transcript
+from sightcall_transcript_to_tutorial.domain.exceptions.tutorial_generation_error import TutorialGenerationError
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_content import TranscriptContent
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_id import TranscriptId
+from sightcall_transcript_to_tutorial.domain.value_objects.user_id import UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_production.gateways.openai_rate_limiter import (
+    OpenAIRateLimiter,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_production.gateways.openai_tutorial_generator_gateway import (
+    OpenAITutorialGeneratorGateway,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_production.prompts.transcript_prompt_compactor import (
+    TranscriptPromptCompactor,
+)
+
+
+class _StubOpenAIServer:
+    """
+    Answers chat completions with canned messages, in order, or with `answer_for(request)` when given, and records the
+    requests it received. The first `rate_limited_requests` requests are refused with a 429 instead.
+    """
+
+    def __init__(
+        self,
+        *answers: str,
+        answer_for: Callable[[dict], str] | None = None,
+        stream_chunk_size: int = 5,
+        rate_limited_requests: int = 0,
+    ):
+        self._answers = list(answers)
+        self._answer_for = answer_for
+        self._stream_chunk_size = stream_chunk_size
+        self._rate_limited_requests = rate_limited_requests
+        self._lock = threading.Lock()
+        self.requests: list[dict] = []
+        self.refused_requests = 0
+
+    def client(self) -> OpenAI:
+        return OpenAI(
+            api_key="test-key",
+            base_url="http://stub-openai/v1",
+            http_client=httpx.Client(transport=httpx.MockTransport(self._handle)),
+        )
+
+    def async_client(self) -> AsyncOpenAI:
+        return AsyncOpenAI(
+            api_key="test-key",
+            base_url="http://stub-openai/v1",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(self._handle)),
+        )
+
+    def gateway(self, title_mode: TutorialTitleMode, **options) -> OpenAITutorialGeneratorGateway:
+        return OpenAITutorialGeneratorGateway(
+            self.client(), title_mode=title_mode, async_openai_client=self.async_client(), **options
+        )
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        with self._lock:
+            if self.refused_requests < self._rate_limited_requests:
+                self.refused_requests += 1
+                return httpx.Response(
+                    429,
+                    headers={"retry-after-ms": "1", "x-ratelimit-remaining-requests": "0"},
+                    json={
+                        "error": {"message": "Rate limit reached", "type": "requests", "code": "rate_limit_exceeded"}
+                    },
+                )
+            self.requests.append(body)
+            answer = self._answer_for(body) if self._answer_for else self._answers[len(self.requests) - 1]
+        if body.get("stream"):
+            return self._stream(answer)
+        return httpx.Response(
+            200,
+            json={
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "gpt-4o-mini",
+                "choices": [
+                    {"index": 0, "message": {"role": "assistant", "content": answer}, "finish_reason": "stop"}
+                ],
+            },
+        )
+
+    def _stream(self, answer: str) -> httpx.Response:
+        events = []
+        for start in range(0, len(answer), self._stream_chunk_size):
+            chunk = {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": "gpt-4o-mini",
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": {"content": answer[start : start + self._stream_chunk_size]},
+                        "finish_reason": None,
+                    }
+                ],
+            }
+            events.append(f"data: {json.dumps(chunk)}\n\n")
+        events.append("data: [DONE]\n\n")
+        return httpx.Response(200, headers={"content-type": "text/event-stream"}, content="".join(events).encode())
+
+
+class TestOpenAITutorialGeneratorGateway:
+    def test_should_get_title_and_content_from_a_single_structured_call(self):
+        # Given
+        server = _StubOpenAIServer(json.dumps({"title": "Reset a password", "content": "1. Open settings"}))
+        gateway = server.gateway(TutorialTitleMode.STRUCTURED)
+
+        # When
+        tutorial = gateway.generate_tutorial(self._given_transcript(), UserId("user-1"))
+
+        # Then
+        assert len(server.requests) == 1
+        assert server.requests[0]["response_format"]["type"] == "json_schema"
+        assert tutorial.title == "Reset a password"
+        assert tutorial.content == "1. Open settings"
+
+    def test_should_fall_back_to_first_heading_when_answer_is_not_structured(self):
+        # Given
+        server = _StubOpenAIServer("Intro\n\n## Reset your password\n\n1. Open settings")
+        gateway = server.gateway(TutorialTitleMode.STRUCTURED)
+
+        # When
+        tutorial = gateway.generate_tutorial(self._given_transcript(), UserId("user-1"))
+
+        # Then
+        assert len(server.requests) == 1
+        assert tutorial.title == "Reset your password"
+        assert tutorial.content == "Intro\n\n## Reset your password\n\n1. Open settings"
+
+    def test_should_fall_back_to_first_heading_when_title_is_empty(self):
+        # Given
+        server = _StubOpenAIServer(json.dumps({"title": " ", "content": "# Password reset\n1. Open settings"}))
+        gateway = server.gateway(TutorialTitleMode.STRUCTURED)
+
+        # When
+        tutorial = gateway.generate_tutorial(self._given_transcript(), UserId("user-1"))
+
+        # Then
+        assert tutorial.title == "Password reset"
+
+    def test_should_name_content_in_a_second_call_in_separate_call_mode(self):
+        # Given
+        server = _StubOpenAIServer("1. Open settings", "Reset a password")
+        gateway = server.gateway(TutorialTitleMode.SEPARATE_CALL)
+
+        # When
+        tutorial = gateway.generate_tutorial(self._given_transcript(), UserId("user-1"))
+
+        # Then
+        assert len(server.requests) == 2
+        assert "response_format" not in server.requests[0]
+        assert tutorial.title == "Reset a password"
+        assert tutorial.content == "1. Open settings"
+
+    def test_should_raise_error_when_answer_is_empty(self):
+        # Given
+        server = _StubOpenAIServer("")
+        gateway = server.gateway(TutorialTitleMode.STRUCTURED)
+
+        # When & Then
+        with pytest.raises(TutorialGenerationError):
+            gateway.generate_tutorial(self._given_transcript(), UserId("user-1"))
+
+    def test_should_send_compacted_transcript_to_the_model(self):
+        # Given
+        server = _StubOpenAIServer(json.dumps({"title": "Settings", "content": "1. Open settings"}))
+        gateway = server.gateway(TutorialTitleMode.STRUCTURED, prompt_compactor=TranscriptPromptCompactor())
+        content = self._given_transcript_content('{"timestamp": "t", "duration_in_ticks": 1, "phrases": [%s]}')
+
+        # When
+        gateway.generate_tutorial(Transcript(TranscriptId("tr1"), content), UserId("user-1"))
+
+        # Then
+        user_prompt = server.requests[0]["messages"][1]["content"]
+        assert user_prompt.endswith("Transcript:\nSpeaker 1: Open settings")
+        assert "confidence" not in user_prompt
+
+    def test_should_summarize_long_transcript_by_parts_then_merge_them(self):
+        # Given
+        def answer_for(request: dict) -> str:
+            user_prompt = request["messages"][1]["content"]
+            if "response_format" in request:
+                return json.dumps({"title": "Long call", "content": "1. Merged steps"})
+            return "1. Step from " + user_prompt.split(":")[0].removeprefix("Transcript, ")
+
+        server = _StubOpenAIServer(answer_for=answer_for)
+        gateway = server.gateway(TutorialTitleMode.STRUCTURED, prompt_compactor=TranscriptPromptCompactor())
+        gateway.map_reduce_threshold_tokens = 10
+        gateway.chunk_max_tokens = 10
+        gateway.map_concurrency = 2
+        phrases = ", ".join(
+            self._given_phrase(display=f"Step number {index} of the call.", speaker=index % 2 + 1)
+            for index in range(3)
+        )
+        content = TranscriptContent(f'{{"timestamp": "t", "duration_in_ticks": 1, "phrases": [{phrases}]}}')
+
+        # When
+        tutorial = gateway.generate_tutorial(Transcript(TranscriptId("tr1"), content), UserId("user-1"))
+
+        # Then
+        assert len(server.requests) == 4
+        reduce_prompt = next(request for request in server.requests if "response_format" in request)
+        assert (
+            "Part 1:\n1. Step from part 1 of 3\n\nPart 2:\n1. Step from part 2 of 3\n\nPart 3:\n1. Step from part 3 of 3"
+            in (reduce_prompt["messages"][1]["content"])
+        )
+        assert tutorial.title == "Long call"
+
+    def test_should_stream_content_and_take_title_from_its_heading(self):
+        # Given
+        server = _StubOpenAIServer("# Reset a password\n\n1. Open settings\n2. Tap Security")
+        gateway = server.gateway(TutorialTitleMode.SEPARATE_CALL)
+
+        # When
+        *streamed, tutorial = asyncio.run(self._when_stream(gateway))
+
+        # Then
+        assert len(server.requests) == 1
+        assert len(streamed) > 1
+        assert "".join(streamed) == tutorial.content
+        assert tutorial.title == "Reset a password"
+
+    def test_should_generate_tutorial_asynchronously(self):
+        # Given
+        server = _StubOpenAIServer(json.dumps({"title": "Reset a password", "content": "1. Open settings"}))
+        gateway = server.gateway(TutorialTitleMode.STRUCTURED)
+
+        # When
+        tutorial = asyncio.run(gateway.generate_tutorial_async(self._given_transcript(), UserId("user-1")))
+
+        # Then
+        assert len(server.requests) == 1
+        assert tutorial.title == "Reset a password"
+        assert tutorial.content == "1. Open settings"
+
+    def test_should_summarize_long_transcript_by_parts_before_streaming(self):
+        # Given
+        def answer_for(request: dict) -> str:
+            if request.get("stream"):
+                return "# Long call\n\n1. Merged steps"
+            return "1. Step"
+
+        server = _StubOpenAIServer(answer_for=answer_for)
+        gateway = server.gateway(TutorialTitleMode.STRUCTURED, prompt_compactor=TranscriptPromptCompactor())
+        gateway.map_reduce_threshold_tokens = 10
+        gateway.chunk_max_tokens = 10
+        phrases = ", ".join(
+            self._given_phrase(display=f"Step number {index} of the call.", speaker=index % 2 + 1)
+            for index in range(3)
+        )
+        content = TranscriptContent(f'{{"timestamp": "t", "duration_in_ticks": 1, "phrases": [{phrases}]}}')
+
+        # When
+        *_, tutorial = asyncio.run(self._when_stream(gateway, Transcript(TranscriptId("tr1"), content)))
+
+        # Then
+        assert len(server.requests) == 4
+        assert "Part 3:\n1. Step" in server.requests[-1]["messages"][1]["content"]
+        assert tutorial.title == "Long call"
+
+    def test_should_retry_rate_limited_calls_until_they_succeed(self):
+        # Given
+        server = _StubOpenAIServer(
+            json.dumps({"title": "Reset a password", "content": "1. Open settings"}), rate_limited_requests=2
+        )
+        gateway = server.gateway(
+            TutorialTitleMode.STRUCTURED,
+            rate_limiter=OpenAIRateLimiter(
+                requests_per_minute=60_000, tokens_per_minute=10_000_000, max_concurrency=4, base_backoff_seconds=0.01
+            ),
+        )
+
+        # When
+        tutorial = gateway.generate_tutorial(self._given_transcript(), UserId("user-1"))
+
+        # Then
+        assert server.refused_requests == 2
+        assert tutorial.title == "Reset a password"
+        assert gateway.rate_limiter.concurrency_limit == 1
+
+    def test_should_raise_error_when_still_rate_limited_after_retries(self):
+        # Given
+        server = _StubOpenAIServer("unused", rate_limited_requests=10)
+        gateway = server.gateway(
+            TutorialTitleMode.STRUCTURED,
+            rate_limiter=OpenAIRateLimiter(
+                requests_per_minute=60_000,
+                tokens_per_minute=10_000_000,
+                max_concurrency=4,
+                max_retries=1,
+                base_backoff_seconds=0.01,
+            ),
+        )
+
+        # When & Then
+        with pytest.raises(TutorialGenerationError):
+            gateway.generate_tutorial(self._given_transcript(), UserId("user-1"))
+        assert server.refused_requests == 2
+
+    def test_cache_key_should_ignore_transcript_formatting(self):
+        # Given
+        gateway = _StubOpenAIServer().gateway(TutorialTitleMode.STRUCTURED)
+        compact = self._given_transcript_content('{"timestamp":"t","duration_in_ticks":1,"phrases":[%s]}')
+        indented = self._given_transcript_content(
+            '{\n  "timestamp": "t",\n  "duration_in_ticks": 1,\n  "phrases": [\n%s\n]}'
+        )
+
+        # When & Then
+        assert gateway.cache_key(Transcript(TranscriptId("tr1"), compact)) == gateway.cache_key(
+            Transcript(TranscriptId("tr2"), indented)
+        )
+
+    def test_cache_key_should_change_with_generation_settings(self):
+        # Given
+        transcript = Transcript(
+            TranscriptId("tr1"),
+            self._given_transcript_content('{"timestamp": "t", "duration_in_ticks": 1, "phrases": [%s]}'),
+        )
+        structured = _StubOpenAIServer().gateway(TutorialTitleMode.STRUCTURED)
+        separate_call = _StubOpenAIServer().gateway(TutorialTitleMode.SEPARATE_CALL)
+        warmer = _StubOpenAIServer().gateway(TutorialTitleMode.STRUCTURED)
+        warmer.temperature = 0.7
+
+        # When
+        keys = {gateway.cache_key(transcript) for gateway in (structured, separate_call, warmer)}
+
+        # Then
+        assert len(keys) == 3
+
+    async def _when_stream(
+        self, gateway: OpenAITutorialGeneratorGateway, transcript: Transcript | None = None
+    ) -> list:
+        transcript = transcript or self._given_transcript()
+        return [item async for item in gateway.stream_tutorial(transcript, UserId("user-1"))]
+
+    def _given_transcript_content(self, template: str) -> TranscriptContent:
+        return TranscriptContent(template % self._given_phrase())
+
+    def _given_phrase(self, display: str = "Open settings", speaker: int = 1) -> str:
+        return json.dumps(
+            {
+                "offset_milliseconds": 0,
+                "duration_in_ticks": 1.0,
+                "display": display,
+                "speaker": speaker,
+                "locale": "en-US",
+                "confidence": 0.9,
+            }
+        )
+
+    def _given_transcript(self) -> Transcript:
+        return Transcript(TranscriptId("tr1"), "How to reset your password in the app.")
@@ -0,0 +1,40 @@
+import pytest
+
+from sightcall_transcript_to_tutorial.domain.exceptions.tutorial_generation_error import InvalidTranscriptError
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_content import (
+    TRANSCRIPT_SCHEMA_VERSION,
+    TranscriptContent,
+)
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_phrases_builder import TranscriptPhrasesBuilder
+from sightcall_transcript_to_tutorial.infrastructure.for_production.codecs.transcript_content_codec import (
+    encode_transcript_content,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_production.models.sqlalchemy_transcript import (
+    SQLAlchemyTranscript,
+)
+
+
+class TestSQLAlchemyTranscript:
+    def test_should_trust_content_stored_under_current_schema_version(self):
+        # Given
+        row = self._given_row_without_phrases(schema_version=TRANSCRIPT_SCHEMA_VERSION)
+
+        # When
+        transcript = row.to_domain()
+
+        # Then
+        assert len(transcript.content.phrases) == 0
+
+    def test_should_revalidate_content_stored_under_older_schema_version(self):
+        # Given
+        row = self._given_row_without_phrases(schema_version=TRANSCRIPT_SCHEMA_VERSION - 1)
+
+        # When & Then
+        with pytest.raises(InvalidTranscriptError, match="'phrases' must be a non-empty list"):
+            row.to_domain()
+
+    @staticmethod
+    def _given_row_without_phrases(schema_version: int) -> SQLAlchemyTranscript:
+        # No phrases breaks the current rules, which only a revalidation would notice.
+        content = TranscriptContent.from_trusted("2025-02-26T20:36:06Z", 12345, TranscriptPhrasesBuilder().build())
+        return SQLAlchemyTranscript(id="t1", content=encode_transcript_content(content), schema_version=schema_version)
@@ -0,0 +1,133 @@
+import json
+
+from sightcall_transcript_to_tutorial.domain.value_objects.transcript_content import TranscriptContent
+from sightcall_transcript_to_tutorial.infrastructure.for_production.prompts.transcript_prompt_compactor import (
+    TranscriptPromptCompactor,
+)
+
+
+class TestTranscriptPromptCompactor:
+    def test_should_merge_consecutive_phrases_of_the_same_speaker(self):
+        # Given
+        content = self._given_content(
+            [(1, "Open the settings.", 0.9), (1, "Then tap Security.", 0.9), (2, "Done.", 0.9)]
+        )
+
+        # When
+        compacted = TranscriptPromptCompactor().compact(content)
+
+        # Then
+        assert compacted.text == "Speaker 1: Open the settings. Then tap Security.\nSpeaker 2: Done."
+
+    def test_should_drop_filler_greetings_and_low_confidence_phrases(self):
+        # Given
+        content = self._given_content(
+            [
+                (1, "Hello, thank you.", 0.9),
+                (2, "Plug the cable in.", 0.9),
+                (1, "Um, OK.", 0.9),
+                (2, "Let's.", 0.1),
+                (2, "Now restart it.", 0.9),
+            ]
+        )
+
+        # When
+        compacted = TranscriptPromptCompactor(min_confidence=0.4).compact(content)
+
+        # Then
+        assert compacted.text == "Speaker 2: Plug the cable in. Now restart it."
+
+    def test_should_keep_non_latin_and_numeric_phrases(self):
+        # Given
+        content = self._given_content(
+            [(1, "設定を開いてください", 0.9), (1, "Откройте настройки", 0.9), (2, "4 2 7 1", 0.9), (2, "OK.", 0.9)]
+        )
+
+        # When
+        compacted = TranscriptPromptCompactor().compact(content)
+
+        # Then
+        assert compacted.text == "Speaker 1: 設定を開いてください Откройте настройки\nSpeaker 2: 4 2 7 1"
+
+    def test_should_accept_custom_filler_words(self):
+        # Given
+        content = self._given_content([(1, "Bitte.", 0.9), (1, "Hello.", 0.9)])
+
+        # When
+        compacted = TranscriptPromptCompactor(filler_words={"bitte"}).compact(content)
+
+        # Then
+        assert compacted.text == "Speaker 1: Hello."
+
+    def test_should_report_fewer_tokens_than_the_raw_transcript(self):
+        # Given
+        content = self._given_content([(1, "Open the settings.", 0.9), (2, "Where are they?", 0.9)] * 20)
+
+        # When
+        compacted = TranscriptPromptCompactor().compact(content)
+
+        # Then
+        assert compacted.estimated_tokens_after * 3 < compacted.estimated_tokens_before
+
+    def test_should_estimate_the_raw_tokens_without_rendering_the_transcript(self, monkeypatch):
+        # Given
+        content = self._given_content([(1, "Open the settings.", 0.9), (2, "Where are they?", 0.9)] * 20)
+        raw_tokens = len(str(content)) / 4
+        monkeypatch.setattr(TranscriptContent, "_render_json", self._fail_to_render)
+
+        # When
+        compacted = TranscriptPromptCompactor().compact(content)
+
+        # Then
+        assert 0.5 * raw_tokens < compacted.estimated_tokens_before < 1.5 * raw_tokens
+
+    def test_should_chunk_along_speaker_turns_within_time_window(self):
+        # Given
+        content = self._given_content(
+            [(1, "First.", 0.9), (1, "Second.", 0.9), (2, "Third.", 0.9), (1, "Fourth.", 0.9), (2, "Fifth.", 0.9)],
+            phrase_interval_milliseconds=60_000,
+        )
+
+        # When
+        chunks = TranscriptPromptCompactor().chunk(content, window_milliseconds=150_000, max_tokens=1_000)
+
+        # Then
+        assert chunks == ["Speaker 1: First. Second.\nSpeaker 2: Third.", "Speaker 1: Fourth.\nSpeaker 2: Fifth."]
+
+    def test_should_chunk_to_bounded_token_counts(self):
+        # Given
+        content = self._given_content([(index % 2 + 1, "Open the settings menu.", 0.9) for index in range(10)])
+
+        # When
+        chunks = TranscriptPromptCompactor().chunk(content, window_milliseconds=3_600_000, max_tokens=20)
+
+        # Then
+        assert len(chunks) == 5
+        assert all(chunk.count("\n") == 1 for chunk in chunks)
+
+    @staticmethod
+    def _fail_to_render(content: TranscriptContent) -> str:
+        raise AssertionError("the transcript should not be rendered")
+
+    def _given_content(
+        self, phrases: list[tuple[int, str, float]], phrase_interval_milliseconds: int = 1000
+    ) -> TranscriptContent:
+        return TranscriptContent(
+            json.dumps(
+                {
+                    "timestamp": "2025-02-26T20:36:06Z",
+                    "duration_in_ticks": 12345,
+                    "phrases": [
+                        {
+                            "offset_milliseconds": index * phrase_interval_milliseconds,
+                            "duration_in_ticks": 1.0,
+                            "display": display,
+                            "speaker": speaker,
+                            "locale": "en-US",
+                            "confidence": confidence,
+                        }
+                        for index, (speaker, display, confidence) in enumerate(phrases)
+                    ],
+                }
+            )
+        )
@@ -0,0 +1,56 @@
+from sightcall_transcript_to_tutorial.domain.entities import JobStatus, TutorialGenerationJob
+from sightcall_transcript_to_tutorial.domain.value_objects import TranscriptId, TutorialId, UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_tutorial_generation_job_repository import (
+    FakeTutorialGenerationJobRepository,
+)
+
+
+class TestFakeTutorialGenerationJobRepository:
+    def test_claim_next_returns_oldest_pending_job_once(self):
+        repo = FakeTutorialGenerationJobRepository()
+        first = TutorialGenerationJob.create(transcript_id=TranscriptId("tr1"), user_id=UserId("u1"))
+        second = TutorialGenerationJob.create(transcript_id=TranscriptId("tr2"), user_id=UserId("u1"))
+        repo.save(first)
+        repo.save(second)
+        claimed = repo.claim_next(lease_seconds=60)
+        assert claimed is not None and claimed.job_id == first.job_id
+        assert claimed.status == JobStatus.RUNNING
+        claimed_again = repo.claim_next(lease_seconds=60)
+        assert claimed_again is not None and claimed_again.job_id == second.job_id
+        assert repo.claim_next(lease_seconds=60) is None
+
+    def test_mark_succeeded(self):
+        repo = FakeTutorialGenerationJobRepository()
+        job = TutorialGenerationJob.create(transcript_id=TranscriptId("tr1"), user_id=UserId("u1"))
+        repo.save(job)
+        claimed = repo.claim_next(lease_seconds=60)
+        assert repo.mark_succeeded(job.job_id, claimed.claim_token, TutorialId("tut1"))
+        finished = repo.find_by_id(job.job_id)
+        assert finished is not None and finished.status == JobStatus.SUCCEEDED
+        assert finished.tutorial_id == TutorialId("tut1")
+        assert finished.is_finished
+
+    def test_mark_failed(self):
+        repo = FakeTutorialGenerationJobRepository()
+        job = TutorialGenerationJob.create(transcript_id=TranscriptId("tr1"), user_id=UserId("u1"))
+        repo.save(job)
+        claimed = repo.claim_next(lease_seconds=60)
+        assert repo.mark_failed(job.job_id, claimed.claim_token, "boom")
+        finished = repo.find_by_id(job.job_id)
+        assert finished is not None and finished.status == JobStatus.FAILED
+        assert finished.error == "boom"
+
+    def test_only_the_latest_claim_renews_the_lease_and_records_the_outcome(self):
+        repo = FakeTutorialGenerationJobRepository()
+        job = TutorialGenerationJob.create(transcript_id=TranscriptId("tr1"), user_id=UserId("u1"))
+        repo.save(job)
+        first_claim = repo.claim_next(lease_seconds=60)
+        second_claim = repo.claim_next(lease_seconds=0)
+        assert first_claim.claim_token != second_claim.claim_token
+        assert not repo.renew_lease(job.job_id, first_claim.claim_token)
+        assert not repo.mark_failed(job.job_id, first_claim.claim_token, "boom")
+        assert repo.renew_lease(job.job_id, second_claim.claim_token)
+        assert repo.mark_succeeded(job.job_id, second_claim.claim_token, TutorialId("tut1"))
+        assert not repo.mark_failed(job.job_id, second_claim.claim_token, "boom")
+        finished = repo.find_by_id(job.job_id)
+        assert finished is not None and finished.status == JobStatus.SUCCEEDED
@@ -0,0 +1,63 @@
+from sightcall_transcript_to_tutorial.domain.value_objects import GeneratedTutorial
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.in_memory_generated_tutorial_cache_repository import (
+    InMemoryGeneratedTutorialCacheRepository,
+    TieredGeneratedTutorialCacheRepository,
+)
+from sightcall_transcript_to_tutorial.infrastructure.for_tests.repositories.fake_generated_tutorial_cache_repository import (
+    FakeGeneratedTutorialCacheRepository,
+)
+
+TUTORIAL = GeneratedTutorial(title="Title", content="Content")
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestInMemoryGeneratedTutorialCacheRepository:
+    def test_save_and_find_by_key(self):
+        cache = InMemoryGeneratedTutorialCacheRepository(max_entries=2, ttl_seconds=60)
+        cache.save("k1", TUTORIAL)
+        assert cache.find_by_key("k1") == TUTORIAL
+        assert cache.find_by_key("missing") is None
+
+    def test_evicts_least_recently_used_entry(self):
+        cache = InMemoryGeneratedTutorialCacheRepository(max_entries=2, ttl_seconds=60)
+        cache.save("k1", TUTORIAL)
+        cache.save("k2", TUTORIAL)
+        cache.find_by_key("k1")
+        cache.save("k3", TUTORIAL)
+        assert cache.find_by_key("k1") == TUTORIAL
+        assert cache.find_by_key("k2") is None
+        assert cache.find_by_key("k3") == TUTORIAL
+
+    def test_expires_entries_after_ttl(self):
+        clock = _Clock()
+        cache = InMemoryGeneratedTutorialCacheRepository(max_entries=2, ttl_seconds=60, clock=clock)
+        cache.save("k1", TUTORIAL)
+        clock.now = 59
+        assert cache.find_by_key("k1") == TUTORIAL
+        clock.now = 60
+        assert cache.find_by_key("k1") is None
+
+
+class TestTieredGeneratedTutorialCacheRepository:
+    def test_promotes_entries_found_in_back_tier(self):
+        front = InMemoryGeneratedTutorialCacheRepository(max_entries=2, ttl_seconds=60)
+        back = FakeGeneratedTutorialCacheRepository()
+        back.save("k1", TUTORIAL)
+        cache = TieredGeneratedTutorialCacheRepository(front, back)
+        assert front.find_by_key("k1") is None
+        assert cache.find_by_key("k1") == TUTORIAL
+        assert front.find_by_key("k1") == TUTORIAL
+
+    def test_saves_to_both_tiers(self):
+        front = InMemoryGeneratedTutorialCacheRepository(max_entries=2, ttl_seconds=60)
+        back = FakeGeneratedTutorialCacheRepository()
+        TieredGeneratedTutorialCacheRepository(front, back).save("k1", TUTORIAL)
+        assert front.find_by_key("k1") == TUTORIAL
+        assert back.find_by_key("k1") == TUTORIAL
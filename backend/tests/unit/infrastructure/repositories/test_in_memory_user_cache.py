@@ -0,0 +1,51 @@
+from sightcall_transcript_to_tutorial.domain.entities import User
+from sightcall_transcript_to_tutorial.domain.value_objects import UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_production.repositories.in_memory_user_cache import (
+    InMemoryUserCache,
+)
+
+ALICE = User(UserId("u1"), name="Alice", github_id=1)
+BOB = User(UserId("u2"), name="Bob", github_id=2)
+CAROL = User(UserId("u3"), name="Carol", github_id=3)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestInMemoryUserCache:
+    def test_save_and_find_by_id(self):
+        cache = InMemoryUserCache(max_entries=2, ttl_seconds=60)
+        cache.save(ALICE)
+        assert cache.find_by_id(UserId("u1")) == ALICE
+        assert cache.find_by_id(UserId("missing")) is None
+
+    def test_delete_invalidates_entry(self):
+        cache = InMemoryUserCache(max_entries=2, ttl_seconds=60)
+        cache.save(ALICE)
+        cache.delete(UserId("u1"))
+        cache.delete(UserId("missing"))
+        assert cache.find_by_id(UserId("u1")) is None
+
+    def test_evicts_least_recently_used_entry(self):
+        cache = InMemoryUserCache(max_entries=2, ttl_seconds=60)
+        cache.save(ALICE)
+        cache.save(BOB)
+        cache.find_by_id(UserId("u1"))
+        cache.save(CAROL)
+        assert cache.find_by_id(UserId("u1")) == ALICE
+        assert cache.find_by_id(UserId("u2")) is None
+        assert cache.find_by_id(UserId("u3")) == CAROL
+
+    def test_expires_entries_after_ttl(self):
+        clock = _Clock()
+        cache = InMemoryUserCache(max_entries=2, ttl_seconds=60, clock=clock)
+        cache.save(ALICE)
+        clock.now = 59
+        assert cache.find_by_id(UserId("u1")) == ALICE
+        clock.now = 60
+        assert cache.find_by_id(UserId("u1")) is None
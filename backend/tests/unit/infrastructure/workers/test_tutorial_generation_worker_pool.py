@@ -0,0 +1,95 @@
+import asyncio
+
+from sightcall_transcript_to_tutorial.domain.entities import TutorialGenerationJob
+from sightcall_transcript_to_tutorial.domain.value_objects import TranscriptId, UserId
+from sightcall_transcript_to_tutorial.infrastructure.for_production.workers.tutorial_generation_worker_pool import (
+    TutorialGenerationWorkerPool,
+)
+
+
+class TestTutorialGenerationWorkerPool:
+    def test_should_drain_queue_until_stopped(self):
+        # Given
+        queue = [
+            TutorialGenerationJob.create(transcript_id=TranscriptId(f"tr{i}"), user_id=UserId("user-1"))
+            for i in range(5)
+        ]
+        processed: list[TutorialGenerationJob] = []
+
+        async def run_pool_until_drained() -> None:
+            drained = asyncio.Event()
+
+            async def process_next_job():
+                await asyncio.sleep(0)
+                if not queue:
+                    drained.set()
+                    return None
+                job = queue.pop()
+                processed.append(job)
+                return job
+
+            pool = TutorialGenerationWorkerPool(
+                worker_count=2, process_next_job=process_next_job, poll_interval_seconds=0.01
+            )
+            pool.start()
+            await asyncio.wait_for(drained.wait(), timeout=5)
+            await pool.stop(timeout_seconds=5)
+
+        # When
+        asyncio.run(run_pool_until_drained())
+
+        # Then
+        assert len(processed) == 5
+
+    def test_should_keep_polling_after_an_error(self):
+        # Given
+        calls = []
+
+        async def run_pool_until_recovered() -> None:
+            recovered = asyncio.Event()
+
+            async def process_next_job():
+                calls.append(None)
+                if len(calls) == 1:
+                    raise RuntimeError("database unavailable")
+                recovered.set()
+                return None
+
+            pool = TutorialGenerationWorkerPool(
+                worker_count=1, process_next_job=process_next_job, poll_interval_seconds=0.01
+            )
+            pool.start()
+            await asyncio.wait_for(recovered.wait(), timeout=5)
+            await pool.stop(timeout_seconds=5)
+
+        # When
+        asyncio.run(run_pool_until_recovered())
+
+        # Then
+        assert len(calls) >= 2
+
+    def test_should_cancel_workers_still_busy_after_the_stop_timeout(self):
+        # Given
+        cancelled = []
+
+        async def run_pool_then_stop() -> None:
+            started = asyncio.Event()
+
+            async def process_next_job():
+                started.set()
+                try:
+                    await asyncio.sleep(60)
+                except asyncio.CancelledError:
+                    cancelled.append(None)
+                    raise
+
+            pool = TutorialGenerationWorkerPool(worker_count=1, process_next_job=process_next_job)
+            pool.start()
+            await started.wait()
+            await pool.stop(timeout_seconds=0.01)
+
+        # When
+        asyncio.run(run_pool_then_stop())
+
+        # Then
+        assert cancelled == [None]
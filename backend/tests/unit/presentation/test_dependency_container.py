@@ -0,0 +1,61 @@
+import asyncio
+
+import httpx
+
+from sightcall_transcript_to_tutorial.presentation.api.container import DependencyContainer
+
+
+class _FakeClosableGateway:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class TestDependencyContainer:
+    def test_should_build_each_dependency_once_and_share_it(self):
+        # Given
+        built = []
+        container = DependencyContainer(
+            tutorial_generator_gateway_factory=lambda: built.append("gateway") or _FakeClosableGateway(),
+            github_http_client_factory=lambda: built.append("client") or httpx.Client(),
+        )
+
+        # When
+        gateways = {id(container.tutorial_generator_gateway) for _ in range(3)}
+        clients = {id(container.github_http_client) for _ in range(3)}
+
+        # Then
+        assert len(gateways) == 1
+        assert len(clients) == 1
+        assert built == ["gateway", "client"]
+
+    def test_should_close_what_was_built_and_rebuild_afterwards(self):
+        # Given
+        container = DependencyContainer(
+            tutorial_generator_gateway_factory=_FakeClosableGateway, github_http_client_factory=httpx.Client
+        )
+        gateway = container.tutorial_generator_gateway
+        client = container.github_http_client
+
+        # When
+        asyncio.run(container.close())
+
+        # Then
+        assert gateway.closed
+        assert client.is_closed
+        assert container.tutorial_generator_gateway is not gateway
+
+    def test_should_not_build_anything_when_closing_unused_container(self):
+        # Given
+        built = []
+        container = DependencyContainer(
+            tutorial_generator_gateway_factory=lambda: built.append("gateway") or _FakeClosableGateway()
+        )
+
+        # When
+        asyncio.run(container.close())
+
+        # Then
+        assert built == []
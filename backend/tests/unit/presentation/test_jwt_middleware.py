@@ -0,0 +1,154 @@
+import asyncio
+
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from jose import jwt
+
+from sightcall_transcript_to_tutorial.domain.config.settings import settings
+from sightcall_transcript_to_tutorial.presentation.api.middlewares.jwt_middleware import JWTMiddleware
+from sightcall_transcript_to_tutorial.presentation.api.middlewares.verified_token_cache import VerifiedTokenCache
+
+
+class TestJWTMiddleware:
+    def test_should_verify_each_token_once(self):
+        # Given
+        client, cache = self._given_client()
+        token = jwt.encode(
+            {"user_id": "u1", "username": "alice"}, settings.jwt_secret, algorithm=settings.jwt_algorithm
+        )
+
+        # When
+        responses = [client.get("/me", headers={"Authorization": f"Bearer {token}"}) for _ in range(3)]
+
+        # Then
+        assert [response.json() for response in responses] == [{"user_id": "u1", "username": "alice"}] * 3
+        statistics = cache.statistics()
+        assert (statistics.entries, statistics.hits, statistics.misses) == (1, 2, 1)
+
+    def test_should_not_cache_invalid_tokens(self):
+        # Given
+        client, cache = self._given_client()
+        token = jwt.encode({"user_id": "u1", "username": "alice"}, "another secret", algorithm=settings.jwt_algorithm)
+
+        # When
+        responses = [client.get("/me", headers={"Authorization": f"Bearer {token}"}) for _ in range(2)]
+
+        # Then
+        assert [response.status_code for response in responses] == [401, 401]
+        assert cache.statistics().entries == 0
+
+    def test_should_pass_streamed_response_messages_through_untouched(self):
+        # Given
+        token = jwt.encode(
+            {"user_id": "u1", "username": "alice"}, settings.jwt_secret, algorithm=settings.jwt_algorithm
+        )
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/stream",
+            "headers": [(b"cookie", f"access_token={token}".encode())],
+        }
+        messages = [
+            {"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/event-stream")]},
+            {"type": "http.response.body", "body": b"data: 1\n\n", "more_body": True},
+            {"type": "http.response.body", "body": b"data: 2\n\n", "more_body": True},
+            {"type": "http.response.body", "body": b"", "more_body": False},
+        ]
+        seen_states = []
+
+        async def app(scope, receive, send):
+            seen_states.append(scope["state"])
+            for message in messages:
+                await send(message)
+
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        # When
+        asyncio.run(JWTMiddleware(app, token_cache=VerifiedTokenCache(max_entries=10))(scope, None, send))
+
+        # Then
+        assert seen_states == [{"user": {"user_id": "u1", "username": "alice"}}]
+        assert len(sent) == len(messages)
+        assert all(sent_message is message for sent_message, message in zip(sent, messages))
+
+    def test_should_stream_response_to_the_client_chunk_by_chunk(self):
+        # Given
+        token = jwt.encode(
+            {"user_id": "u1", "username": "alice"}, settings.jwt_secret, algorithm=settings.jwt_algorithm
+        )
+        first_event_received = asyncio.Event()
+        app = FastAPI()
+        app.add_middleware(JWTMiddleware, token_cache=VerifiedTokenCache(max_entries=10))
+
+        @app.get("/stream")
+        async def stream():
+            async def events():
+                yield b"data: 1\n\n"
+                # Only produced once the client got the first event, which a buffering middleware would hold back
+                await first_event_received.wait()
+                yield b"data: 2\n\n"
+
+            return StreamingResponse(events(), media_type="text/event-stream")
+
+        received = []
+
+        async def send(message):
+            if message["type"] == "http.response.body" and message["body"]:
+                received.append(message["body"])
+                first_event_received.set()
+
+        async def receive():
+            await asyncio.Event().wait()
+
+        # When
+        asyncio.run(asyncio.wait_for(app(self._given_http_scope("/stream", token), receive, send), timeout=5))
+
+        # Then
+        assert received == [b"data: 1\n\n", b"data: 2\n\n"]
+
+    def test_should_let_non_http_scopes_through(self):
+        # Given
+        scopes = []
+
+        async def app(scope, receive, send):
+            scopes.append(scope)
+
+        scope = {"type": "lifespan"}
+
+        # When
+        asyncio.run(JWTMiddleware(app, token_cache=VerifiedTokenCache(max_entries=10))(scope, None, None))
+
+        # Then
+        assert scopes == [scope]
+
+    @staticmethod
+    def _given_http_scope(path: str, token: str) -> dict:
+        return {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"cookie", f"access_token={token}".encode())],
+            "client": ("testclient", 50000),
+            "server": ("testserver", 80),
+        }
+
+    def _given_client(self) -> tuple[TestClient, VerifiedTokenCache]:
+        cache = VerifiedTokenCache(max_entries=10)
+        app = FastAPI()
+        app.add_middleware(JWTMiddleware, token_cache=cache)
+
+        @app.get("/me")
+        def me(request: Request):
+            return request.state.user
+
+        return TestClient(app), cache
@@ -0,0 +1,48 @@
+from sightcall_transcript_to_tutorial.presentation.api.middlewares.verified_token_cache import VerifiedTokenCache
+
+PAYLOAD = {"user_id": "u1", "username": "alice"}
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestVerifiedTokenCache:
+    def test_save_and_find_counting_hits_and_misses(self):
+        cache = VerifiedTokenCache(max_entries=2)
+        assert cache.find("t1") is None
+        cache.save("t1", PAYLOAD)
+        assert cache.find("t1") == PAYLOAD
+        assert cache.find("t1") == PAYLOAD
+        statistics = cache.statistics()
+        assert (statistics.entries, statistics.hits, statistics.misses) == (1, 2, 1)
+
+    def test_evicts_least_recently_used_entry(self):
+        cache = VerifiedTokenCache(max_entries=2)
+        cache.save("t1", PAYLOAD)
+        cache.save("t2", PAYLOAD)
+        cache.find("t1")
+        cache.save("t3", PAYLOAD)
+        assert cache.find("t1") == PAYLOAD
+        assert cache.find("t2") is None
+        assert cache.find("t3") == PAYLOAD
+
+    def test_expires_entries_with_their_token(self):
+        clock = _Clock()
+        cache = VerifiedTokenCache(max_entries=2, clock=clock)
+        cache.save("t1", {**PAYLOAD, "exp": 60})
+        clock.now = 59
+        assert cache.find("t1") is not None
+        clock.now = 60
+        assert cache.find("t1") is None
+        assert cache.statistics().entries == 0
+
+    def test_returns_copies_of_payloads(self):
+        cache = VerifiedTokenCache(max_entries=2)
+        cache.save("t1", PAYLOAD)
+        cache.find("t1")["user_id"] = "u2"
+        assert cache.find("t1") == PAYLOAD
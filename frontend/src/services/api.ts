@@ -3,6 +3,7 @@ import {
   GenerateTutorialRequest,
   TranscriptUploadResponse,
   Tutorial,
+  TutorialGenerationJobResponse,
   TutorialListResponse,
   TutorialResponse,
   TutorialUpdateRequest,
@@ -10,6 +11,7 @@ import {
 } from '../types';
 
 const API_BASE_URL = 'http://localhost:8000';
+const GENERATION_POLL_INTERVAL_MS = 1000;
 
 class ApiService {
   private async handleResponse<T>(response: Response): Promise<T> {
@@ -69,7 +71,23 @@ class ApiService {
       },
       body: JSON.stringify(request)
     });
-    return this.handleResponse<TutorialResponse>(response);
+    let job = await this.handleResponse<TutorialGenerationJobResponse>(response);
+    // Generation runs in a background worker: poll the job until it is done.
+    while (job.status === 'pending' || job.status === 'running') {
+      await new Promise((resolve) => setTimeout(resolve, GENERATION_POLL_INTERVAL_MS));
+      job = await this.getTutorialGenerationJob(job.job_id);
+    }
+    if (job.status === 'failed' || !job.tutorial) {
+      throw new Error(job.error || 'Tutorial generation failed');
+    }
+    return { title: job.tutorial.title, content: job.tutorial.content };
+  }
+
+  async getTutorialGenerationJob(jobId: string): Promise<TutorialGenerationJobResponse> {
+    const response = await fetch(`${API_BASE_URL}/tutorials/jobs/${jobId}`, {
+      credentials: 'include',
+    });
+    return this.handleResponse<TutorialGenerationJobResponse>(response);
   }
 
   async getTutorials(params?: {
@@ -38,6 +38,15 @@ export interface TutorialResponse {
   content: string;
 }
 
+export type TutorialGenerationJobStatus = 'pending' | 'running' | 'succeeded' | 'failed';
+
+export interface TutorialGenerationJobResponse {
+  job_id: string;
+  status: TutorialGenerationJobStatus;
+  tutorial: Tutorial | null;
+  error: string | null;
+}
+
 export interface TranscriptUploadResponse {
   id: string;
 }